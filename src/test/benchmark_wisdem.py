@@ -0,0 +1,344 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+benchmark_wisdem.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+
+Timing and memory benchmarks for the turbine and LCOE assemblies.  Each case runs in a fresh
+process so that construction and first-run costs are measured cold and peak memory is per case.
+
+    python benchmark_wisdem.py                               # run all cases, print a table
+    python benchmark_wisdem.py --save-baseline baseline.json
+    python benchmark_wisdem.py --baseline baseline.json      # exit status 1 on regression
+"""
+
+import os
+import sys
+import imp
+import json
+import time
+import resource
+import argparse
+import multiprocessing
+from collections import OrderedDict
+
+import numpy as np
+
+
+# hub heights of the small sweep run after the first run
+SWEEP_HUB_HEIGHTS = [80.0, 85.0, 95.0, 100.0]
+
+PHASES = ('construct', 'configure_nrel5mw', 'populate', 'run', 'sweep')
+
+
+# --- stand-ins for external tools ---
+
+def ecn_opex_stand_in():
+    """stand-in for the ECN O&M model, which drives an Excel workbook that is not available
+    on benchmark machines.  Same interface as opex_ecn_assembly, fixed-fraction estimates."""
+
+    from openmdao.main.api import Component
+    from openmdao.main.datatypes.api import Int, Float, Str, VarTree
+    from fusedwind.plant_cost.fused_opex import OPEXVarTree
+
+    class ECNOpexStandIn(Component):
+
+        ssfile = Str(iotype='in', desc='unused')
+        machine_rating = Float(iotype='in', units='kW', desc='rated machine power in kW')
+        turbine_number = Int(iotype='in', desc='total number of wind turbines at the plant')
+        turbine_cost = Float(iotype='in', units='USD', desc='turbine system capital costs')
+        project_lifetime = Float(iotype='in', desc='project lifetime for wind plant')
+
+        avg_annual_opex = Float(iotype='out', desc='average annual operating expenditures')
+        opex_breakdown = VarTree(OPEXVarTree(), iotype='out')
+        availability = Float(iotype='out', desc='average annual availability of wind turbines at plant')
+
+        def __init__(self, ssfile=''):
+
+            super(ECNOpexStandIn, self).__init__()
+            self.ssfile = ssfile
+
+        def execute(self):
+
+            self.opex_breakdown.preventative_opex = 0.010*self.turbine_cost*self.turbine_number
+            self.opex_breakdown.corrective_opex = 0.015*self.turbine_cost*self.turbine_number
+            self.opex_breakdown.lease_opex = 8.0*self.machine_rating*self.turbine_number
+            self.opex_breakdown.other_opex = 0.0
+            self.avg_annual_opex = self.opex_breakdown.preventative_opex + self.opex_breakdown.corrective_opex \
+                + self.opex_breakdown.lease_opex + self.opex_breakdown.other_opex
+            self.availability = 0.94
+
+    return ECNOpexStandIn
+
+
+def install_stand_ins():
+    """make the ECN O&M module importable where its Excel automation is unavailable
+    (it is imported by every lcoe assembly module)"""
+
+    stand_in = ecn_opex_stand_in()
+
+    try:
+        import plant_costsse.ecn_offshore_opex.ecn_offshore_opex
+    except ImportError:
+        for name in ('plant_costsse.ecn_offshore_opex', 'plant_costsse.ecn_offshore_opex.ecn_offshore_opex'):
+            module = imp.new_module(name)
+            module.opex_ecn_assembly = stand_in
+            sys.modules[name] = module
+        sys.modules['plant_costsse.ecn_offshore_opex'].ecn_offshore_opex = module
+
+    return stand_in
+
+
+# --- cases ---
+# each case returns (construct, configure_nrel5mw, populate): construct() builds the bare assembly,
+# populate(assembly) sets all inputs needed to run it, and configure_nrel5mw is the name of the
+# reference turbine function called during populate (timed separately), or None
+
+def _turbine_case():
+
+    from wisdem.turbinese.turbine import TurbineSE
+    from wisdem.reference_turbines.nrel5mw import nrel5mw
+
+    def populate(turbine):
+        nrel5mw.configure_nrel5mw_turbine(turbine, 'I', 0.0)
+        turbine.tower_d = [6.0, 4.935, 3.87]
+        turbine.generator_speed = 1173.7
+
+    return TurbineSE, (nrel5mw, 'configure_nrel5mw_turbine'), populate
+
+
+def _turbine_jacket_case():
+
+    from wisdem.turbinese.turbine_jacket import TurbineSE_jacket
+    from wisdem.reference_turbines.nrel5mw import nrel5mw_jacket
+
+    def populate(turbine):
+        nrel5mw_jacket.configure_nrel5mw_turbine_with_jacket(turbine, 'I', 0.0)
+        turbine.tower_dt = 3.87
+        turbine.generator_speed = 1173.7
+
+    return TurbineSE_jacket, (nrel5mw_jacket, 'configure_nrel5mw_turbine_with_jacket'), populate
+
+
+def _lcoe_se_case(with_new_nacelle, with_3pt_drive, flexible_blade):
+
+    def case():
+
+        from wisdem.lcoe.lcoe_se_assembly import lcoe_se_assembly, configure_example_se_assembly
+        from wisdem.reference_turbines.nrel5mw import nrel5mw
+
+        def construct():
+            return lcoe_se_assembly(with_new_nacelle, False, flexible_blade, with_3pt_drive)
+
+        return construct, (nrel5mw, 'configure_nrel5mw_turbine'), configure_example_se_assembly
+
+    return case
+
+
+def _lcoe_csm_case():
+
+    from wisdem.lcoe.lcoe_csm_assembly import lcoe_csm_assembly, set_example_csm_inputs
+
+    return lcoe_csm_assembly, None, set_example_csm_inputs
+
+
+def _lcoe_csm_ecn_case():
+
+    from wisdem.lcoe import lcoe_csm_ecn_assembly as ecn
+
+    # ECN O&M model replaced before the assembly is configured
+    ecn.opex_ecn_assembly = install_stand_ins()
+
+    def construct():
+        return ecn.lcoe_csm_ecn_assembly('ECN O&M Model.xls')
+
+    return construct, None, ecn.set_example_csm_ecn_inputs
+
+
+CASES = OrderedDict([
+    ('TurbineSE', _turbine_case),
+    ('TurbineSE_jacket', _turbine_jacket_case),
+    ('lcoe_se_DriveWPACT_rigid', _lcoe_se_case(False, False, False)),
+    ('lcoe_se_DriveWPACT_flexible', _lcoe_se_case(False, False, True)),
+    ('lcoe_se_Drive4pt_rigid', _lcoe_se_case(True, False, False)),
+    ('lcoe_se_Drive4pt_flexible', _lcoe_se_case(True, False, True)),
+    ('lcoe_se_Drive3pt_rigid', _lcoe_se_case(True, True, False)),
+    ('lcoe_se_Drive3pt_flexible', _lcoe_se_case(True, True, True)),
+    ('lcoe_csm', _lcoe_csm_case),
+    ('lcoe_csm_ecn', _lcoe_csm_ecn_case),
+])
+
+
+# --- measurement ---
+
+def _peak_rss_mb():
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        return rss / 1024.0**2  # bytes
+    return rss / 1024.0  # kilobytes
+
+
+def _measure(name, queue):
+    """run one case in this (fresh) process and put the results on queue"""
+
+    try:
+        # the reference turbine files are found relative to wisdem/lcoe
+        import wisdem
+        os.chdir(os.path.join(os.path.dirname(wisdem.__file__), 'lcoe'))
+
+        result = OrderedDict()
+        memory = OrderedDict()
+        memory['start'] = _peak_rss_mb()
+
+        tt = time.time()
+        install_stand_ins()
+        construct, nrel5mw_function, populate = CASES[name]()
+        result['import'] = time.time() - tt
+
+        tt = time.time()
+        assembly = construct()
+        result['construct'] = time.time() - tt
+        memory['construct'] = _peak_rss_mb()
+
+        # time the reference turbine configuration inside populate
+        timing = {'configure_nrel5mw': None}
+        if nrel5mw_function is not None:
+            module, function_name = nrel5mw_function
+            function = getattr(module, function_name)
+
+            def timed(*args, **kwargs):
+                t0 = time.time()
+                function(*args, **kwargs)
+                timing['configure_nrel5mw'] = time.time() - t0
+
+            setattr(module, function_name, timed)
+
+        tt = time.time()
+        populate(assembly)
+        result['populate'] = time.time() - tt
+        result['configure_nrel5mw'] = timing['configure_nrel5mw']
+        memory['populate'] = _peak_rss_mb()
+
+        tt = time.time()
+        assembly.run()
+        result['run'] = time.time() - tt
+        memory['run'] = _peak_rss_mb()
+
+        tt = time.time()
+        for hub_height in SWEEP_HUB_HEIGHTS:
+            assembly.hub_height = hub_height
+            assembly.run()
+        result['sweep'] = time.time() - tt
+        memory['sweep'] = _peak_rss_mb()
+
+        result['peak_rss_mb'] = memory['sweep']
+        result['memory'] = memory
+
+        queue.put((name, result, None))
+
+    except Exception as e:
+        queue.put((name, None, '%s: %s' % (e.__class__.__name__, e)))
+
+
+def run_case(name, repeat=1):
+    """median timings and peak memory of a case over repeat fresh processes"""
+
+    results = []
+    for i in range(repeat):
+        queue = multiprocessing.Queue()
+        p = multiprocessing.Process(target=_measure, args=(name, queue))
+        p.start()
+        case_name, result, error = queue.get()
+        p.join()
+        if error is not None:
+            return None, error
+        results.append(result)
+
+    summary = OrderedDict()
+    for key in ('import',) + PHASES + ('peak_rss_mb',):
+        values = [r[key] for r in results if r[key] is not None]
+        summary[key] = float(np.median(values)) if values else None
+    summary['repeat'] = repeat
+
+    return summary, None
+
+
+def run_benchmarks(names=None, repeat=1):
+
+    if names is None:
+        names = CASES.keys()
+
+    report = OrderedDict()
+    report['python'] = sys.version.split()[0]
+    report['numpy'] = np.__version__
+    report['sweep_hub_heights'] = SWEEP_HUB_HEIGHTS
+    report['cases'] = OrderedDict()
+    report['errors'] = OrderedDict()
+
+    for name in names:
+        summary, error = run_case(name, repeat)
+        if error is None:
+            report['cases'][name] = summary
+        else:
+            report['errors'][name] = error
+
+    return report
+
+
+def compare(baseline, report, tolerance=0.25):
+    """(case, metric, baseline, current) for every time or memory figure that grew by more than tolerance"""
+
+    regressions = []
+    for name, current in report['cases'].iteritems():
+        before = baseline['cases'].get(name)
+        if before is None:
+            continue
+        for key in PHASES + ('peak_rss_mb',):
+            if before.get(key) is None or current.get(key) is None:
+                continue
+            if current[key] > (1.0 + tolerance)*before[key]:
+                regressions.append((name, key, before[key], current[key]))
+
+    return regressions
+
+
+def print_report(report):
+
+    print '{0:30s} {1:>9s} {2:>9s} {3:>9s} {4:>9s} {5:>9s} {6:>9s}'.format(
+        'case', 'construct', 'nrel5mw', 'populate', 'run', 'sweep', 'peak MB')
+    for name, r in report['cases'].iteritems():
+        values = [r[key] for key in PHASES + ('peak_rss_mb',)]
+        print '{0:30s} '.format(name) + ' '.join(['{0:9.3f}'.format(v) if v is not None else '{0:>9s}'.format('-')
+                                                 for v in values])
+    for name, error in report['errors'].iteritems():
+        print '{0:30s} failed: {1}'.format(name, error)
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='WISDEM timing and memory benchmarks')
+    parser.add_argument('cases', nargs='*', help='cases to run (default: all of %s)' % ', '.join(CASES.keys()))
+    parser.add_argument('--repeat', type=int, default=1, help='number of fresh processes per case (median reported)')
+    parser.add_argument('--save-baseline', metavar='FILE', help='write the results to FILE')
+    parser.add_argument('--baseline', metavar='FILE', help='compare against a saved baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed relative growth before a regression is reported')
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.cases or None, args.repeat)
+    print_report(report)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, report, args.tolerance)
+        for name, key, before, current in regressions:
+            print 'REGRESSION {0} {1}: {2:.3f} -> {3:.3f}'.format(name, key, before, current)
+        if regressions or report['errors']:
+            sys.exit(1)
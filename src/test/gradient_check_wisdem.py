@@ -0,0 +1,236 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+gradient_check_wisdem.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+
+Batched verification of analytic Jacobians.  Each case draws many random valid input points
+(covering both the upwind and downwind precone branches), evaluates the analytic Jacobian at
+all of them, and compares against central finite differences taken one input column at a time
+for the whole batch.
+
+    python gradient_check_wisdem.py                           # all cases, print a table
+    python gradient_check_wisdem.py MaxTipDeflection --samples 1000
+    python gradient_check_wisdem.py --tolerance 1e-5          # exit status 1 on failure
+"""
+
+import sys
+import time
+import argparse
+from collections import OrderedDict
+
+import numpy as np
+
+
+# --- input samplers ---
+
+def _tip_deflection_samples(rng, n, m=6):
+    """random valid MaxTipDeflection inputs, half upwind (precone > 0) and half downwind"""
+
+    samples = OrderedDict()
+    samples['Rtip'] = rng.uniform(30.0, 90.0, n)
+    samples['precurveTip'] = rng.uniform(-5.0, 5.0, n)
+    samples['presweepTip'] = rng.uniform(-3.0, 3.0, n)
+    samples['precone'] = np.where(np.arange(n) % 2 == 0, 1.0, -1.0)*rng.uniform(0.5, 6.0, n)
+    samples['tilt'] = rng.uniform(0.0, 8.0, n)
+    samples['hub_tt'] = np.column_stack([-rng.uniform(3.0, 8.0, n), np.zeros(n), rng.uniform(1.0, 4.0, n)])
+    interior = np.sort(rng.uniform(0.05, 0.95, (n, m-2)), axis=1)
+    samples['tower_z'] = np.column_stack([np.zeros(n), interior, np.ones(n)])
+    base = rng.uniform(5.0, 8.0, n)
+    top = rng.uniform(3.0, 4.5, n)
+    samples['tower_d'] = base[:, np.newaxis] + (top - base)[:, np.newaxis]*samples['tower_z']
+    samples['towerHt'] = samples['Rtip'] + rng.uniform(15.0, 60.0, n)
+
+    return samples
+
+
+# --- evaluators ---
+# an evaluator maps a batch of samples (input -> (n, size) array) to the outputs (n, nout) and,
+# if jacobian is True, the analytic Jacobian (n, nout, nin) with columns in input order
+
+def _component_evaluator(factory, inputs, outputs, setup=None):
+    """evaluate an OpenMDAO component with provideJ point by point (one instance reused)"""
+
+    component = factory()
+
+    def evaluate(samples, jacobian=True):
+
+        n = len(samples[inputs[0]])
+        f = np.zeros((n, len(outputs)))
+        J = None
+        for i in range(n):
+            for name in inputs:
+                value = samples[name][i]
+                setattr(component, name, value if np.ndim(value) else float(value))
+            if setup is not None:
+                setup(component, dict((name, value[i]) for name, value in samples.iteritems()))
+            component.run()
+            f[i] = [getattr(component, name) for name in outputs]
+            if jacobian:
+                Ji = component.provideJ()
+                if J is None:
+                    J = np.zeros((n,) + Ji.shape)
+                J[i] = Ji
+
+        return f, J
+
+    return evaluate
+
+
+def _tip_deflection_case():
+
+    from wisdem.turbinese.turbine import MaxTipDeflection
+
+    inputs, outputs = MaxTipDeflection().list_deriv_vars()
+
+    return inputs, outputs, _tip_deflection_samples, _component_evaluator(MaxTipDeflection, inputs, outputs)
+
+
+def _tip_deflection_jacket_case():
+
+    from wisdem.turbinese.turbine_jacket import MaxTipDeflection
+    from commonse.Tube import Tube
+
+    inputs, outputs = MaxTipDeflection().list_deriv_vars()
+
+    # tower diameters are not a derivative input of the jacket version, they come with the tower object
+    def setup(component, sample):
+        component.Twrouts.TwrObj = Tube(sample['tower_d'], 0.03*np.ones_like(sample['tower_d']))
+
+    return inputs, outputs, _tip_deflection_samples, _component_evaluator(MaxTipDeflection, inputs, outputs, setup)
+
+
+def _tip_deflection_batch_case():
+
+    from wisdem.turbinese.turbine import max_tip_deflection_batch
+
+    inputs = ('Rtip', 'precurveTip', 'presweepTip', 'precone', 'tilt', 'hub_tt', 'tower_z', 'tower_d', 'towerHt')
+    outputs = ('max_tip_deflection', 'ground_clearance')
+
+    def evaluate(samples, jacobian=True):
+        mtd, gc, J = max_tip_deflection_batch(*[samples[name] for name in inputs])
+        return np.column_stack([mtd, gc]), J
+
+    return inputs, outputs, _tip_deflection_samples, evaluate
+
+
+CASES = OrderedDict([
+    ('MaxTipDeflection', _tip_deflection_case),
+    ('MaxTipDeflection_jacket', _tip_deflection_jacket_case),
+    ('max_tip_deflection_batch', _tip_deflection_batch_case),
+])
+
+
+# --- checking ---
+
+def finite_difference(evaluate, samples, inputs, step=1e-5):
+    """central difference Jacobian (n, nout, nin), perturbing one input column for all samples at once"""
+
+    columns = []
+    for name in inputs:
+        value = np.asarray(samples[name], dtype=float)
+        value = value.reshape(len(value), -1)
+        for k in range(value.shape[1]):
+            h = step*np.maximum(np.abs(value[:, k]), 1.0)
+            perturbed = []
+            for sign in (1.0, -1.0):
+                x = dict(samples)
+                x[name] = value.copy()
+                x[name][:, k] += sign*h
+                x[name] = x[name].reshape(np.shape(samples[name]))
+                perturbed.append(evaluate(x, jacobian=False)[0])
+            columns.append((perturbed[0] - perturbed[1])/(2*h[:, np.newaxis]))
+
+    return np.dstack(columns)
+
+
+def _column_names(inputs, samples):
+
+    names = []
+    for name in inputs:
+        size = int(np.prod(np.shape(samples[name])[1:]))
+        names += [name] if size == 1 else ['%s[%d]' % (name, k) for k in range(size)]
+
+    return names
+
+
+def check_case(name, n=200, seed=0, step=1e-5, floor=1e-6):
+    """compare analytic and finite difference Jacobians of a case at n random points
+
+    Returns
+    -------
+    result : OrderedDict
+        samples, max_rel_error (|analytic - fd| / max(|fd|, floor)), worst (output, input column,
+        sample), and the analytic / finite difference times in seconds
+    """
+
+    inputs, outputs, sample, evaluate = CASES[name]()
+    samples = sample(np.random.RandomState(seed), n)
+
+    tt = time.time()
+    f, J = evaluate(samples)
+    t_analytic = time.time() - tt
+
+    tt = time.time()
+    J_fd = finite_difference(evaluate, samples, inputs, step)
+    t_fd = time.time() - tt
+
+    error = np.abs(J - J_fd)/np.maximum(np.abs(J_fd), floor)
+    i, j, k = np.unravel_index(np.argmax(error), error.shape)
+
+    result = OrderedDict()
+    result['samples'] = n
+    result['max_rel_error'] = float(error[i, j, k])
+    result['worst'] = (outputs[j], _column_names(inputs, samples)[k], int(i))
+    result['time_analytic'] = t_analytic
+    result['time_fd'] = t_fd
+
+    return result
+
+
+def check_gradients(names=None, n=200, seed=0, step=1e-5):
+
+    if names is None:
+        names = CASES.keys()
+
+    report = OrderedDict()
+    report['cases'] = OrderedDict()
+    report['errors'] = OrderedDict()
+
+    for name in names:
+        try:
+            report['cases'][name] = check_case(name, n, seed, step)
+        except Exception as e:
+            report['errors'][name] = '%s: %s' % (e.__class__.__name__, e)
+
+    return report
+
+
+def print_report(report):
+
+    print '{0:26s} {1:>8s} {2:>12s} {3:>11s} {4:>9s}  {5}'.format('case', 'samples', 'max rel err', 'analytic s', 'fd s', 'worst entry')
+    for name, r in report['cases'].iteritems():
+        print '{0:26s} {1:8d} {2:12.3e} {3:11.3f} {4:9.3f}  d {5[0]} / d {5[1]} (sample {5[2]})'.format(
+            name, r['samples'], r['max_rel_error'], r['time_analytic'], r['time_fd'], r['worst'])
+    for name, error in report['errors'].iteritems():
+        print '{0:26s} failed: {1}'.format(name, error)
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='WISDEM batched gradient checks')
+    parser.add_argument('cases', nargs='*', help='cases to check (default: all of %s)' % ', '.join(CASES.keys()))
+    parser.add_argument('--samples', type=int, default=200, help='number of random input points per case')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    parser.add_argument('--step', type=float, default=1e-5, help='relative finite difference step')
+    parser.add_argument('--tolerance', type=float, default=1e-5, help='largest acceptable relative error')
+    args = parser.parse_args()
+
+    report = check_gradients(args.cases or None, args.samples, args.seed, args.step)
+    print_report(report)
+
+    failed = [name for name, r in report['cases'].iteritems() if r['max_rel_error'] > args.tolerance]
+    if failed or report['errors']:
+        sys.exit(1)
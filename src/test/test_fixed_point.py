@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+test_fixed_point.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import unittest
+import numpy as np
+from openmdao.main.api import Assembly, Component
+from openmdao.main.datatypes.api import Float, Array
+from openmdao.lib.drivers.api import FixedPointIterator
+from wisdem.turbinese.fixed_point import AcceleratedFixedPointIterator
+
+
+# slowly contracting linear map (spectral radius about 0.9) coupling an array and a scalar,
+# like delta_precurve_sub and delta_bladeLength of the flexible blade
+A = np.array([[0.80, 0.10, 0.05],
+              [0.05, 0.75, 0.10],
+              [0.10, 0.05, 0.70]])
+b = np.array([0.3, -0.2, 0.1])
+
+
+class CoupledMap(Component):
+
+    x = Array(np.zeros(2), iotype='in')
+    s = Float(0.0, iotype='in')
+
+    y = Array(np.zeros(2), iotype='out')
+    t = Float(iotype='out')
+
+    def __init__(self):
+
+        super(CoupledMap, self).__init__()
+        self.evaluations = 0
+
+    def execute(self):
+
+        self.evaluations += 1
+        z = np.dot(A, np.r_[self.x, self.s]) + b
+        self.y = z[:2]
+        self.t = z[2]
+
+
+def toy_assembly(driver):
+
+    assembly = Assembly()
+    assembly.add('comp', CoupledMap())
+    assembly.add('fpi', driver)
+    assembly.fpi.workflow.add(['comp'])
+    assembly.fpi.add_parameter('comp.x', low=-1.e99, high=1.e99)
+    assembly.fpi.add_parameter('comp.s', low=-1.e99, high=1.e99)
+    assembly.fpi.add_constraint('comp.x = comp.y')
+    assembly.fpi.add_constraint('comp.s = comp.t')
+    assembly.fpi.max_iteration = 500
+    assembly.fpi.tolerance = 1e-10
+    assembly.driver.workflow.add(['fpi'])
+
+    return assembly
+
+
+class TestAcceleratedFixedPointIterator(unittest.TestCase):
+
+    def setUp(self):
+
+        self.solution = np.linalg.solve(np.eye(3) - A, b)
+
+        plain = toy_assembly(FixedPointIterator())
+        plain.run()
+        self.plain_evaluations = plain.comp.evaluations
+        np.testing.assert_allclose(np.r_[plain.comp.x, plain.comp.s], self.solution, atol=1e-8)
+
+    def check(self, acceleration):
+
+        driver = AcceleratedFixedPointIterator()
+        driver.acceleration = acceleration
+        assembly = toy_assembly(driver)
+        assembly.run()
+
+        self.assertTrue(assembly.fpi.converged)
+        self.assertEqual(assembly.fpi.iterations, assembly.comp.evaluations)
+        self.assertTrue(assembly.comp.evaluations < self.plain_evaluations)
+        np.testing.assert_allclose(np.r_[assembly.comp.x, assembly.comp.s], self.solution, atol=1e-8)
+        self.assertTrue(assembly.fpi.residual_history[-1] < 1e-10)
+
+    def test_aitken(self):
+
+        self.check('aitken')
+
+    def test_anderson(self):
+
+        self.check('anderson')
+
+
+if __name__ == "__main__":
+    unittest.main()
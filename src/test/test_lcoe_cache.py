@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+test_lcoe_cache.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from openmdao.main.api import Assembly, Component, VariableTree
+from openmdao.main.datatypes.api import Float, Array, VarTree
+from wisdem.lcoe.lcoe_cache import ResultCache, input_hash, enable_result_cache, disable_result_cache
+
+
+class LoadTree(VariableTree):
+
+    a = Float(1.0)
+    b = Array(np.zeros(3))
+
+
+class Summation(Component):
+
+    x = Array(np.zeros(3), iotype='in')
+    loads = VarTree(LoadTree(), iotype='in')
+
+    y = Float(iotype='out')
+
+    def __init__(self):
+
+        super(Summation, self).__init__()
+        self.runs = 0
+
+    def execute(self):
+
+        self.runs += 1
+        self.y = np.sum(self.x) + self.loads.a + np.sum(self.loads.b)
+
+
+class SummationAssembly(Assembly):
+
+    def configure(self):
+
+        self.add('comp', Summation())
+        self.driver.workflow.add(['comp'])
+
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+
+    def test_lru_eviction(self):
+
+        cache = ResultCache(maxsize=2)
+        cache.put('a', {'y': 1})
+        cache.put('b', {'y': 2})
+        self.assertEqual(cache.get('a'), {'y': 1})  # a becomes most recently used
+        cache.put('c', {'y': 3})
+
+        self.assertEqual(len(cache), 2)
+        self.assertTrue(cache.get('b') is None)
+        self.assertEqual(cache.get('a'), {'y': 1})
+        self.assertEqual(cache.get('c'), {'y': 3})
+        self.assertEqual((cache.hits, cache.misses), (3, 1))
+
+    def test_disk_store(self):
+
+        outputs = {'y': ('value', np.arange(3.0))}
+        ResultCache(directory=self.directory).put('key', outputs)
+
+        # a new cache (e.g. in another process) reads the result back from disk
+        cache = ResultCache(maxsize=1, directory=self.directory)
+        np.testing.assert_array_equal(cache.get('key')['y'][1], outputs['y'][1])
+        self.assertEqual(cache.hits, 1)
+        self.assertTrue(cache.get('other') is None)
+
+    def test_input_hash(self):
+
+        comp = Summation()
+        key = input_hash(comp)
+        self.assertEqual(input_hash(Summation()), key)
+        self.assertNotEqual(input_hash(comp, 'other'), key)
+
+        comp.x[1] = 1.0
+        key_x = input_hash(comp)
+        self.assertNotEqual(key_x, key)
+
+        comp.loads.b[2] = 1.0
+        key_b = input_hash(comp)
+        self.assertNotEqual(key_b, key_x)
+
+        comp.loads.a = 2.0
+        self.assertNotEqual(input_hash(comp), key_b)
+
+    def test_enable_disable(self):
+
+        assembly = SummationAssembly()
+        cache = enable_result_cache(assembly, names=['comp', 'missing'])
+        comp = assembly.comp
+
+        comp.x = np.ones(3)
+        comp.execute()
+        comp.y = 0.0
+        comp.execute()
+        self.assertEqual(comp.runs, 1)
+        self.assertEqual(comp.y, 4.0)  # restored from the cache
+
+        comp.loads.b = np.ones(3)
+        comp.execute()
+        self.assertEqual(comp.runs, 2)
+        self.assertEqual(comp.y, 7.0)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+        disable_result_cache(assembly, names=['comp'])
+        self.assertFalse('execute' in comp.__dict__)
+        comp.execute()
+        self.assertEqual(comp.runs, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+test_lcoe_checkpoint.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from wisdem.lcoe.lcoe_checkpoint import Checkpoint, work_key
+
+
+class TestCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, 'sweep.checkpoint')
+        self.key = work_key('sweep', {'hub_height': np.linspace(80.0, 100.0, 21)})
+
+
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+
+
+    def test_resume(self):
+
+        values = np.random.RandomState(0).rand(20, 3)
+        with Checkpoint(self.filename, self.key) as checkpoint:
+            for i in range(20):
+                checkpoint.record_case(i, [values[i]])
+            checkpoint.record_case(20, None, 'RuntimeError: failed')
+            checkpoint.save_state('driver', {'iteration': 3})
+            checkpoint.save_state('driver', {'iteration': 4})
+
+        checkpoint = Checkpoint(self.filename, self.key)
+        self.assertEqual(len(checkpoint.cases), 21)
+        for i in range(20):
+            np.testing.assert_array_equal(checkpoint.cases[i][0][0], values[i])  # bit-for-bit
+        self.assertEqual(checkpoint.cases[20], (None, 'RuntimeError: failed'))
+        self.assertEqual(checkpoint.load_state('driver'), {'iteration': 4})
+        checkpoint.close()
+
+
+    def test_interrupted_write(self):
+
+        with Checkpoint(self.filename, self.key) as checkpoint:
+            for i in range(10):
+                checkpoint.record_case(i, [np.arange(100.0)*i])
+        size = os.path.getsize(self.filename)
+        with open(self.filename, 'r+b') as f:
+            f.truncate(size - 10)
+
+        with Checkpoint(self.filename, self.key) as checkpoint:
+            self.assertEqual(sorted(checkpoint.cases.keys()), range(9))
+            checkpoint.record_case(9, [np.arange(100.0)*9])
+
+        checkpoint = Checkpoint(self.filename, self.key)
+        self.assertEqual(len(checkpoint.cases), 10)
+        checkpoint.close()
+
+        self.assertRaises(ValueError, Checkpoint, self.filename, work_key('another sweep'))
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+test_lcoe_csm_vectorized.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import unittest
+import numpy as np
+from wisdem.lcoe.lcoe_csm_vectorized import lcoe_csm_vectorized, validate_against_assembly
+
+
+class TestLCOECSMVectorized(unittest.TestCase):
+
+    def setUp(self):
+
+        self.samples = dict(machine_rating=np.array([5000.0, 1500.0, 3000.0, 6000.0, 5000.0]),
+                            rotor_diameter=np.array([126.0, 77.0, 100.0, 150.0, 126.0]),
+                            max_tip_speed=np.array([80.0, 75.0, 80.0, 90.0, 80.0]),
+                            hub_height=np.array([90.0, 80.0, 85.0, 110.0, 90.0]),
+                            sea_depth=np.array([20.0, 0.0, 0.0, 40.0, 10.0]),
+                            wind_speed_50m=np.array([8.02, 7.0, 6.5, 9.5, 8.02]),
+                            weibull_k=np.array([2.15, 2.0, 1.8, 2.15, 2.15]),
+                            max_power_coefficient=np.array([0.488, 0.45, 0.47, 0.5, 0.488]),
+                            offshore=np.array([True, False, False, True, True]),
+                            drivetrain_design=np.array(['geared', 'geared', 'single_stage', 'pm_direct_drive', 'geared']),
+                            advanced_blade=np.array([True, False, False, True, False]),
+                            turbine_number=np.array([100, 50, 30, 80, 100]))
+
+
+    def test_broadcast(self):
+
+        results = lcoe_csm_vectorized(chunksize=2, **self.samples)
+
+        for i in range(5):
+            point = lcoe_csm_vectorized(**dict((name, a[i]) for name, a in self.samples.iteritems()))
+            for name in results:
+                self.assertEqual(point[name].shape, ())
+                np.testing.assert_allclose(results[name][i], point[name], rtol=1e-12)
+
+
+    def test_assembly(self):
+
+        errors = validate_against_assembly(self.samples)
+
+        for name, error in errors.iteritems():
+            self.assertLess(error, 1e-6, name)
+
+
+    def test_construction_finance_rate(self):
+
+        self.assertRaises(ValueError, lcoe_csm_vectorized, 5000.0, 126.0, 80.0, 90.0, 20.0,
+                          construction_finance_rate=[0.0, 0.05])
+        results = lcoe_csm_vectorized(5000.0, 126.0, 80.0, 90.0, 20.0, construction_finance_rate=0.0)
+        self.assertTrue(np.isfinite(results['coe']))
+
+
+
+if __name__ == '__main__':
+    unittest.main()
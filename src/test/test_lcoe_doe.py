@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+test_lcoe_doe.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from openmdao.main.api import Assembly, Component
+from openmdao.main.datatypes.api import Float
+from wisdem.lcoe.lcoe_doe import full_factorial, run_doe, _split_cases
+
+
+class Paraboloid(Component):
+
+    x = Float(0.0, iotype='in')
+    y = Float(0.0, iotype='in')
+    offset = Float(0.0, iotype='in')
+
+    f = Float(iotype='out')
+
+    def execute(self):
+
+        if self.x < 0:
+            raise ValueError('x must not be negative')
+        self.f = (self.x - 3.0)**2 + self.x*self.y + (self.y + 4.0)**2 - 3.0 + self.offset
+
+
+class ParaboloidAssembly(Assembly):
+
+    def configure(self):
+
+        self.add('comp', Paraboloid())
+        self.driver.workflow.add(['comp'])
+
+
+# configurations built in this process (serial runs only)
+BUILDS = []
+
+
+def build_paraboloid(offset=0.0):
+
+    BUILDS.append(offset)
+    assembly = ParaboloidAssembly()
+    assembly.comp.offset = offset
+
+    return assembly
+
+
+def paraboloid(x, y, offset):
+
+    return (x - 3.0)**2 + x*y + (y + 4.0)**2 - 3.0 + offset
+
+
+class TestDOE(unittest.TestCase):
+
+    def setUp(self):
+
+        del BUILDS[:]
+        self.cases = full_factorial(**{'comp.x': [0.0, 1.0, 2.0], 'comp.y': [-1.0, 1.0], 'offset': [0.0, 10.0]})
+
+    def test_full_factorial_order(self):
+
+        cases = full_factorial(b=[1, 2], a=['x', 'y', 'z'])
+
+        # columns in sorted order, the last one varying fastest
+        self.assertEqual(cases['a'], ['x', 'x', 'y', 'y', 'z', 'z'])
+        self.assertEqual(cases['b'], [1, 2, 1, 2, 1, 2])
+
+    def test_split_cases(self):
+
+        tasks = _split_cases(self.cases, build_paraboloid)
+
+        self.assertEqual(len(tasks), 12)
+        for index, config, overrides in tasks:
+            self.assertEqual(config, (('offset', self.cases['offset'][index]),))
+            self.assertEqual(overrides, [('comp.x', self.cases['comp.x'][index]),
+                                         ('comp.y', self.cases['comp.y'][index])])
+
+        self.assertRaises(ValueError, _split_cases, {'comp.x': [0.0, 1.0], 'comp.y': [0.0]}, build_paraboloid)
+
+    def test_serial(self):
+
+        results = run_doe(self.cases, build_paraboloid, outputs=['comp.f'], processes=1)
+
+        # one assembly per configuration, reused for all of its cases
+        self.assertEqual(sorted(BUILDS), [0.0, 10.0])
+        self.assertTrue(np.all(results['success']))
+        self.assertEqual(results['errors'], {})
+        np.testing.assert_allclose(results['comp.f'], paraboloid(np.array(self.cases['comp.x']),
+                                                                 np.array(self.cases['comp.y']),
+                                                                 np.array(self.cases['offset'])))
+
+    def test_errors(self):
+
+        cases = {'comp.x': [1.0, -1.0, 2.0], 'comp.y': [0.0, 0.0, 0.0]}
+        results = run_doe(cases, build_paraboloid, outputs=['comp.f'], processes=1)
+
+        np.testing.assert_array_equal(results['success'], [True, False, True])
+        self.assertEqual(results['errors'].keys(), [1])
+        self.assertTrue(results['errors'][1].startswith('ValueError'))
+        self.assertTrue(np.isnan(results['comp.f'][1]))
+        self.assertAlmostEqual(results['comp.f'][2], paraboloid(2.0, 0.0, 0.0))
+
+    def test_parallel_matches_serial(self):
+
+        serial = run_doe(self.cases, build_paraboloid, outputs=['comp.f'], processes=1)
+        parallel = run_doe(self.cases, build_paraboloid, outputs=['comp.f'], processes=3, chunksize=2)
+
+        np.testing.assert_array_equal(parallel['comp.f'], serial['comp.f'])
+        np.testing.assert_array_equal(parallel['success'], serial['success'])
+
+    def test_checkpoint(self):
+
+        directory = tempfile.mkdtemp()
+        try:
+            cases = {'comp.x': [1.0, -1.0, 2.0], 'comp.y': [0.0, 0.0, 0.0]}
+            filename = os.path.join(directory, 'doe.journal')
+            first = run_doe(cases, build_paraboloid, outputs=['comp.f'], processes=1, checkpoint_file=filename)
+
+            # by default only the failed case is run again
+            del BUILDS[:]
+            retried = run_doe(cases, build_paraboloid, outputs=['comp.f'], processes=1, checkpoint_file=filename)
+            self.assertEqual(BUILDS, [0.0])
+
+            # otherwise nothing is run and the recorded error is reported
+            del BUILDS[:]
+            resumed = run_doe(cases, build_paraboloid, outputs=['comp.f'], processes=1, checkpoint_file=filename,
+                              retry_failed=False)
+            self.assertEqual(BUILDS, [])
+
+            for results in (retried, resumed):
+                np.testing.assert_array_equal(results['comp.f'], first['comp.f'])
+                np.testing.assert_array_equal(results['success'], [True, False, True])
+                self.assertEqual(results['errors'], first['errors'])
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+test_lcoe_ecn_opex.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import unittest
+from collections import OrderedDict
+import numpy as np
+from wisdem.lcoe.lcoe_ecn_workbook import WorkbookTable
+from wisdem.lcoe.lcoe_ecn_opex import FormulaEngine, FormulaError, ECNOpexModel, parse_formula
+
+
+def example_workbook():
+    """small O&M workbook: inputs on one sheet, a failure rate table and the costs on another"""
+
+    inputs = np.nan*np.ones((4, 2))
+    inputs[:, 1] = [100.0, 5000.0, 5.9e6, 20.0]
+
+    rates = np.nan*np.ones((4, 6))
+    rates[1:, 0] = [0.0, 3000.0, 6000.0]     # machine rating (kW)
+    rates[1:, 1] = [1.5, 2.0, 3.0]           # failures per turbine and year
+    rates[0, 3] = 0.05                       # repair cost fraction of turbine cost
+
+    formulas = OrderedDict([('Inputs', {}), ('O&M', {
+        (0, 4): '=VLOOKUP(Inputs!$B$2,$A$2:$B$4,2,TRUE)',
+        (0, 5): '=ROUND(E1*Inputs!B1,0)',
+        (1, 4): '=IF(Inputs!B2>4000,0.97,0.98)-E1/1000',
+        (2, 4): "=0.01*Inputs!B3*Inputs!B1",
+        (3, 4): '=F1*D1*Inputs!B3/Inputs!B4*(Inputs!B4>0)',
+        (4, 4): '=8*Inputs!B2*Inputs!B1',
+        (5, 4): '=IFERROR(1/(D2),SUM(A2:A4)/1000)',
+    })])
+    names = {'turbine_number': 'Inputs!$B$1', 'machine_rating': 'Inputs!$B$2', 'turbine_cost': 'Inputs!$B$3',
+             'project_lifetime': 'Inputs!$B$4', 'availability': "'O&M'!$E$2", 'preventative_opex': "'O&M'!$E$3",
+             'corrective_opex': "'O&M'!$E$4", 'lease_opex': "'O&M'!$E$5", 'other_opex': "'O&M'!$E$6"}
+
+    return WorkbookTable(OrderedDict([('Inputs', inputs), ('O&M', rates)]), formulas=formulas, names=names)
+
+
+def reference(turbine_number, machine_rating, turbine_cost, project_lifetime):
+
+    failures = 1.5 if machine_rating < 3000.0 else 2.0 if machine_rating < 6000.0 else 3.0
+    return OrderedDict([
+        ('availability', (0.97 if machine_rating > 4000.0 else 0.98) - failures/1000.0),
+        ('preventative_opex', 0.01*turbine_cost*turbine_number),
+        ('corrective_opex', round(failures*turbine_number)*0.05*turbine_cost/project_lifetime),
+        ('lease_opex', 8.0*machine_rating*turbine_number),
+        ('other_opex', 9.0)])
+
+
+class TestFormulaEngine(unittest.TestCase):
+
+    def test_precedence(self):
+
+        engine = FormulaEngine(WorkbookTable(OrderedDict([('Sheet1', np.zeros((1, 1)))])))
+
+        for formula, expected in [('=-2^2', 4.0), ('=2+3*4^2/8', 8.0), ('=1+50%', 1.5), ('=(1+2)*3=9', 1.0),
+                                  ('=ROUND(2.5,0)+ROUND(-2.5,0)', 0.0), ('=MOD(-7,3)', 2.0), ('="a"&1.5', 'a1.5')]:
+            self.assertEqual(engine.evaluate(parse_formula(formula, 'Sheet1')), expected, formula)
+
+
+class TestECNOpexModel(unittest.TestCase):
+
+    def test_scalar(self):
+
+        model = ECNOpexModel(example_workbook())
+        results = model.evaluate(100, 5000.0, 5.9e6, 20.0)
+        expected = reference(100, 5000.0, 5.9e6, 20.0)
+
+        for name, value in expected.iteritems():
+            self.assertAlmostEqual(results[name], value, delta=1e-9*abs(value))
+        self.assertAlmostEqual(results['avg_annual_opex'], sum(expected.values()[1:]), delta=1e-3)
+
+    def test_vectorized(self):
+
+        model = ECNOpexModel(example_workbook())
+        turbine_number = np.array([20, 60, 100, 150])
+        machine_rating = np.array([2000.0, 3000.0, 5000.0, 7000.0])
+        results = model.evaluate(turbine_number, machine_rating, 4.0e6, 25.0)
+
+        for i in range(len(turbine_number)):
+            expected = reference(turbine_number[i], machine_rating[i], 4.0e6, 25.0)
+            for name, value in expected.iteritems():
+                self.assertAlmostEqual(results[name][i], value, delta=1e-9*abs(value))
+
+        # inputs changed between calls, constant cells reused
+        results = model.evaluate(10, 1000.0, 3.0e6, 20.0)
+        self.assertAlmostEqual(results['corrective_opex'], reference(10, 1000.0, 3.0e6, 20.0)['corrective_opex'])
+
+    def test_missing_name(self):
+
+        self.assertRaises(ValueError, ECNOpexModel, example_workbook(), {'availability': 'uptime'})
+
+        # without defined names every cell must be given
+        table = example_workbook()
+        table.names = {}
+        self.assertRaises(ValueError, ECNOpexModel, table)
+
+    def test_cells(self):
+
+        inputs = np.nan*np.ones((10, 3))
+        outputs = np.nan*np.ones((12, 3))
+        formulas = OrderedDict([('Inputs', {}), ('Outputs', {
+            (4, 2): '=0.95',
+            (8, 2): '=0.01*Inputs!C10*Inputs!C7',
+            (9, 2): '=Inputs!C10/Inputs!C9',
+            (10, 2): '=8*Inputs!C8*Inputs!C7',
+            (11, 2): '=1000',
+        })])
+        table = WorkbookTable(OrderedDict([('Inputs', inputs), ('Outputs', outputs)]), formulas=formulas)
+        cells = {'turbine_number': 'Inputs!C7', 'machine_rating': 'Inputs!C8', 'project_lifetime': 'Inputs!C9',
+                 'turbine_cost': 'Inputs!C10', 'availability': 'Outputs!C5', 'preventative_opex': 'Outputs!C9',
+                 'corrective_opex': 'Outputs!C10', 'lease_opex': 'Outputs!C11', 'other_opex': 'Outputs!C12'}
+
+        results = ECNOpexModel(table, cells).evaluate(100, 5000.0, 5.9e6, 20.0)
+        self.assertAlmostEqual(results['availability'], 0.95)
+        self.assertAlmostEqual(results['preventative_opex'], 5.9e6)
+        self.assertAlmostEqual(results['corrective_opex'], 5.9e6/20.0)
+        self.assertAlmostEqual(results['lease_opex'], 8*5000.0*100)
+        self.assertAlmostEqual(results['other_opex'], 1000.0)
+
+    def test_unsupported_function(self):
+
+        table = example_workbook()
+        table.formulas['O&M'][(5, 4)] = '=XIRR(A2:A4,B2:B4)'
+        model = ECNOpexModel(table)
+
+        try:
+            model.evaluate(100, 5000.0, 5.9e6, 20.0)
+        except FormulaError as e:
+            self.assertTrue(isinstance(e, ValueError))
+            self.assertTrue(str(e).startswith('O&M!R6C5:'))
+            self.assertTrue('XIRR' in str(e))
+        else:
+            self.fail('unsupported function evaluated')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+test_lcoe_ecn_workbook.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from collections import OrderedDict
+import numpy as np
+from wisdem.lcoe.lcoe_ecn_workbook import WorkbookTable, cell_index, export_sidecar, load_sidecar, \
+    load_ecn_workbook, clear_workbook_cache
+
+
+class TestWorkbookSidecar(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, 'ECN O&M Model.xls')
+        with open(self.filename, 'wb') as f:
+            f.write('workbook')
+
+        numbers = np.nan*np.ones((30, 4))
+        numbers[1:, 1] = np.arange(29.0)
+        self.table = WorkbookTable(OrderedDict([('Input', numbers), ('Output', np.eye(3))]),
+                                   OrderedDict([('Input', {(0, 1): u'Turbines'}), ('Output', {})]))
+
+
+    def tearDown(self):
+
+        clear_workbook_cache()
+        shutil.rmtree(self.directory)
+
+
+    def test_cell_index(self):
+
+        self.assertEqual(cell_index('A1'), (0, 0))
+        self.assertEqual(cell_index('$AB$12'), (11, 27))
+
+
+    def test_round_trip(self):
+
+        export_sidecar(self.table, self.filename)
+        table = load_ecn_workbook(self.filename)  # from the sidecar, without parsing the workbook
+
+        self.assertEqual(table.sheet_names(), ['Input', 'Output'])
+        self.assertIsInstance(table.numbers['Input'], np.memmap)
+        self.assertEqual(table.value('Input', 'B1'), u'Turbines')
+        self.assertEqual(table.value('Input', 'B5'), 3.0)
+        self.assertIsNone(table.value('Input', 'A5'))
+        np.testing.assert_array_equal(table.range('Output', 'A1:D3')[:, :3], np.eye(3))
+        self.assertIs(load_ecn_workbook(self.filename), table)
+
+
+    def test_stale_sidecar(self):
+
+        export_sidecar(self.table, self.filename)
+        with open(self.filename, 'ab') as f:
+            f.write('edited')
+
+        self.assertIsNone(load_sidecar(self.filename))
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+test_lcoe_fd.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import warnings
+import unittest
+import numpy as np
+from openmdao.main.api import Assembly, Component
+from openmdao.main.datatypes.api import Float, Array
+from wisdem.lcoe.lcoe_fd import ParallelFiniteDifference
+
+
+class Analytic(Component):
+
+    x = Array(np.array([1.0, 2.0]), iotype='in')
+    y = Float(0.5, iotype='in')
+
+    f = Array(iotype='out')
+
+    def execute(self):
+
+        # float() rejects complex values, like a component wrapping compiled code
+        y = float(self.y)
+        self.f = np.array([self.x[0]**2*self.x[1] + y**3, np.sin(self.x[0])*y])
+
+
+class AnalyticAssembly(Assembly):
+
+    def configure(self):
+
+        self.add('comp', Analytic())
+        self.driver.workflow.add(['comp'])
+
+
+def build_analytic():
+
+    return AnalyticAssembly()
+
+
+def exact_gradient(x, y):
+
+    return {'comp.x': np.array([[2*x[0]*x[1], x[0]**2], [np.cos(x[0])*y, 0.0]]),
+            'comp.y': np.array([3*y**2, np.sin(x[0])])}
+
+
+class TestParallelFiniteDifference(unittest.TestCase):
+
+    def setUp(self):
+
+        self.x = {'comp.x': np.array([0.7, 1.3]), 'comp.y': 0.4}
+        self.exact = exact_gradient(self.x['comp.x'], self.x['comp.y'])
+
+    def gradient(self, form, processes=1):
+
+        with ParallelFiniteDifference(build_analytic, design_vars=['comp.x', 'comp.y'], outputs=['comp.f'],
+                                      form=form, processes=processes) as fd:
+            gradients = fd.gradient(self.x)
+
+        return fd, gradients['comp.f']
+
+    def test_forward(self):
+
+        fd, gradient = self.gradient('forward')
+        np.testing.assert_allclose(fd.values['comp.f'], [0.7**2*1.3 + 0.4**3, np.sin(0.7)*0.4])
+        for name in ('comp.x', 'comp.y'):
+            self.assertEqual(gradient[name].shape, self.exact[name].shape)
+            np.testing.assert_allclose(gradient[name], self.exact[name], rtol=1e-5, atol=1e-8)
+
+    def test_central(self):
+
+        fd, gradient = self.gradient('central')
+        for name in ('comp.x', 'comp.y'):
+            np.testing.assert_allclose(gradient[name], self.exact[name], rtol=1e-8, atol=1e-10)
+
+    def test_complex(self):
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            fd, gradient = self.gradient('complex')
+
+        # exact to round-off for x; y cannot take complex values and is differenced centrally
+        np.testing.assert_allclose(gradient['comp.x'], self.exact['comp.x'], rtol=1e-12, atol=1e-15)
+        np.testing.assert_allclose(gradient['comp.y'], self.exact['comp.y'], rtol=1e-8, atol=1e-10)
+        self.assertEqual(fd.complex_fallbacks, set(['comp.y']))
+        self.assertEqual(len(caught), 1)
+        self.assertTrue('comp.y' in str(caught[0].message))
+
+    def test_parallel_matches_serial(self):
+
+        serial = self.gradient('central')[1]
+        parallel = self.gradient('central', processes=2)[1]
+        for name in ('comp.x', 'comp.y'):
+            np.testing.assert_array_equal(parallel[name], serial[name])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+test_lcoe_gradients.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import warnings
+import unittest
+import numpy as np
+from openmdao.main.api import Assembly, Component
+from openmdao.main.datatypes.api import Float
+from wisdem.lcoe.lcoe_se_assembly import create_example_se_assembly
+from wisdem.lcoe.lcoe_gradients import COE_DESIGN_VARS, coe_gradient, total_derivatives, finite_difference_components
+
+
+class Linear(Component):
+
+    x = Float(1.0, iotype='in')
+    y = Float(iotype='out')
+
+    def execute(self):
+
+        self.y = 2.0*self.x
+
+    def list_deriv_vars(self):
+
+        return ('x',), ('y',)
+
+    def provideJ(self):
+
+        return np.array([[2.0]])
+
+
+class Cube(Component):
+
+    y = Float(1.0, iotype='in')
+    z = Float(iotype='out')
+
+    def execute(self):
+
+        self.z = self.y**3
+
+
+class ChainAssembly(Assembly):
+
+    def configure(self):
+
+        self.add('linear', Linear())
+        self.add('cube', Cube())
+        self.driver.workflow.add(['linear', 'cube'])
+        self.connect('linear.y', 'cube.y')
+
+
+class TestMissingDerivatives(unittest.TestCase):
+
+    def test_detection(self):
+
+        assembly = ChainAssembly()
+        self.assertEqual(finite_difference_components(assembly), ['cube'])
+
+        self.assertRaises(RuntimeError, total_derivatives, assembly, ('linear.x',), ('cube.z',),
+                          missing_derivatives='raise')
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            J = total_derivatives(assembly, ('linear.x',), ('cube.z',))
+        self.assertEqual(len(caught), 1)
+        self.assertTrue('cube' in str(caught[0].message))
+        self.assertAlmostEqual(float(J['cube.z']['linear.x']), 24.0, 4)  # d(2x)^3/dx at x = 1
+
+
+class TestCOEGradient(unittest.TestCase):
+
+    def test_against_finite_differences(self):
+
+        lcoe_se = create_example_se_assembly(with_new_nacelle=True)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            gradient = coe_gradient(lcoe_se)
+
+        for name in COE_DESIGN_VARS:
+            x0 = np.array(lcoe_se.get(name), dtype=float)
+            fd = np.zeros(x0.size)
+            for i in range(x0.size):
+                h = 1e-6*max(abs(x0.flat[i]), 1.0)
+                coe = []
+                for sign in (1.0, -1.0):
+                    x = x0.copy()
+                    x.flat[i] += sign*h
+                    lcoe_se.set(name, x if x0.shape else float(x))
+                    lcoe_se.run()
+                    coe.append(lcoe_se.coe)
+                fd[i] = (coe[0] - coe[1])/(2*h)
+            lcoe_se.set(name, x0 if x0.shape else float(x0))
+
+            scale = max(np.max(np.abs(fd)), 1e-12)
+            np.testing.assert_allclose(np.ravel(gradient[name]), fd, rtol=1e-3, atol=1e-3*scale, err_msg=name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+test_lcoe_multifidelity.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import unittest
+from collections import OrderedDict
+import numpy as np
+from wisdem.lcoe.lcoe_multifidelity import multi_fidelity_ranking
+
+
+def low(candidates):
+
+    x, y = candidates['x'], candidates['y']
+    return 0.05 + 0.01*((x - 0.3)**2 + (y - 0.6)**2)
+
+
+def high(candidates, index):
+
+    x, y = candidates['x'][index], candidates['y'][index]
+    values = 1.2*low(OrderedDict([('x', x), ('y', y)])) + 0.004 + 0.003*np.sin(4*x)*y
+    return values, {}
+
+
+class TestMultiFidelity(unittest.TestCase):
+
+    def test_ranking(self):
+
+        rng = np.random.RandomState(0)
+        candidates = OrderedDict([('x', rng.rand(500)), ('y', rng.rand(500))])
+        truth = high(candidates, np.arange(500))[0]
+
+        results = multi_fidelity_ranking(candidates, budget=30, batch=5, low=low, high=high)
+
+        self.assertEqual(results['evaluated'].sum(), 30)
+
+        # the true best candidate is found, and the unified prediction is accurate everywhere
+        self.assertEqual(results['ranking'][0], np.argmin(truth))
+        self.assertTrue(results['evaluated'][np.argmin(truth)])
+        np.testing.assert_allclose(results['prediction'], truth, rtol=2e-3)
+
+
+
+if __name__ == '__main__':
+    unittest.main()
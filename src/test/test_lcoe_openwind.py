@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+test_lcoe_openwind.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import unittest
+import numpy as np
+from openmdao.main.api import Assembly, Component
+from openmdao.main.datatypes.api import Float
+from wisdem.lcoe.lcoe_openwind import thrust_curve, AEPRequest, LocalWakeService, AEPBatcher, aep_openwind_batched, \
+    run_batched_sweep
+
+
+V = np.linspace(3.0, 25.0, 45)
+P = np.minimum(0.5*1.225*0.25*np.pi*126.0**2*0.45*V**3, 5e6)
+
+
+class CountingService(object):
+
+    key = 'counting'
+
+    def __init__(self):
+
+        self.batches = []
+
+    def evaluate(self, requests):
+
+        self.batches.append(len(requests))
+        return [{'gross_aep': r.rotor_diameter, 'array_aep': 0.9*r.rotor_diameter} for r in requests]
+
+
+class TurbineCost(Component):
+
+    rotor_diameter = Float(126.0, iotype='in')
+    turbine_cost = Float(iotype='out')
+
+    def execute(self):
+
+        if self.rotor_diameter <= 0:
+            raise ValueError('rotor diameter must be positive')
+        self.turbine_cost = 100.0*self.rotor_diameter
+
+
+class Finance(Component):
+
+    turbine_cost = Float(iotype='in')
+    net_aep = Float(iotype='in')
+    coe = Float(iotype='out')
+
+    def execute(self):
+
+        if not np.isfinite(self.net_aep):
+            raise ValueError('net_aep is not finite')
+        self.coe = self.turbine_cost/self.net_aep
+
+
+class BatchedPlant(Assembly):
+
+    rotor_diameter = Float(126.0, iotype='in')
+    coe = Float(iotype='out')
+
+    def __init__(self, batcher):
+
+        self.batcher = batcher
+        super(BatchedPlant, self).__init__()
+
+    def configure(self):
+
+        self.add('tcc_a', TurbineCost())
+        self.add('aep_a', aep_openwind_batched(self.batcher))
+        self.add('fin_a', Finance())
+        self.driver.workflow.add(['tcc_a', 'aep_a', 'fin_a'])
+        self.connect('rotor_diameter', 'tcc_a.rotor_diameter')
+        self.connect('rotor_diameter', 'aep_a.rotor_diameter')
+        self.connect('tcc_a.turbine_cost', 'fin_a.turbine_cost')
+        self.connect('aep_a.net_aep', 'fin_a.net_aep')
+        self.connect('fin_a.coe', 'coe')
+        self.aep_a.hub_height = 90.0
+        self.aep_a.machine_rating = 5000.0
+        self.aep_a.V = V
+        self.aep_a.P = P
+
+
+class TestLocalWakeService(unittest.TestCase):
+
+    def test_thrust_curve(self):
+
+        Ct = thrust_curve(V, P, 126.0)
+        a = 0.5*(1.0 - np.sqrt(1.0 - Ct))
+        np.testing.assert_allclose(4.0*a*(1.0 - a)**2, np.minimum(P/(0.5*1.225*0.25*np.pi*126.0**2*V**3), 16.0/27.0),
+                                   atol=1e-4)
+
+    def test_wake_direction(self):
+
+        # second turbine 7 diameters south of the first
+        layout = np.array([[0.0, 0.0], [0.0, -7*126.0]])
+        request = AEPRequest(90.0, 126.0, 5000.0, V, P, turbine_number=2)
+
+        north = LocalWakeService(layout, directions=[0.0], frequency=[1.0]).evaluate([request])[0]
+        east = LocalWakeService(layout, directions=[90.0], frequency=[1.0]).evaluate([request])[0]
+
+        self.assertAlmostEqual(east['array_aep'], east['gross_aep'], delta=1e-6*east['gross_aep'])
+        self.assertAlmostEqual(north['gross_aep'], east['gross_aep'])
+        losses = 1.0 - north['array_aep']/north['gross_aep']
+        self.assertTrue(0.05 < losses < 0.5)
+
+    def test_grid_losses_grow_with_size(self):
+
+        service = LocalWakeService()
+        small, large = service.evaluate([AEPRequest(90.0, 126.0, 5000.0, V, P, turbine_number=n) for n in (4, 100)])
+
+        self.assertTrue(1.0 - small['array_aep']/small['gross_aep'] < 1.0 - large['array_aep']/large['gross_aep'])
+
+
+class TestAEPBatcher(unittest.TestCase):
+
+    def test_batches_and_cache(self):
+
+        service = CountingService()
+        batcher = AEPBatcher(service, batch_size=4)
+        requests = [AEPRequest(90.0, D, 5000.0, V, P) for D in [110.0, 120.0, 130.0]*3 + [140.0, 150.0, 160.0]]
+
+        results = batcher.evaluate(requests)
+        self.assertEqual(service.batches, [4, 2])
+        self.assertEqual([r['gross_aep'] for r in results], [r.rotor_diameter for r in requests])
+
+        batcher.evaluate(requests[:5])
+        self.assertEqual(service.batches, [4, 2])
+
+    def test_deferred(self):
+
+        service = CountingService()
+        batcher = AEPBatcher(service)
+        batcher.deferred = True
+
+        key = batcher.submit(AEPRequest(90.0, 126.0, 5000.0, V, P))
+        self.assertTrue(batcher.result(key) is None)
+        self.assertEqual(batcher.pending(), 1)
+
+        batcher.flush()
+        self.assertEqual(batcher.result(key)['gross_aep'], 126.0)
+
+    def test_batched_sweep(self):
+
+        service = CountingService()
+        batcher = AEPBatcher(service, batch_size=2)
+        assembly = BatchedPlant(batcher)
+        cases = {'rotor_diameter': [110.0, -1.0, 130.0, 110.0]}
+
+        results = run_batched_sweep(assembly, cases, batcher, outputs=['coe'])
+
+        # the failure upstream of the energy request is recorded, the NaN energy of the first pass is not
+        self.assertEqual(results['errors'].keys(), [1])
+        self.assertTrue(results['errors'][1].startswith('ValueError: rotor diameter'))
+        self.assertEqual(service.batches, [2])
+        np.testing.assert_allclose(results['coe'][[0, 2, 3]], 100.0/(0.9*0.94)*np.ones(3))
+        self.assertTrue(np.isnan(results['coe'][1]))
+
+        # the memoization is removed on return
+        self.assertFalse('execute' in assembly.tcc_a.__dict__)
+
+
+if __name__ == "__main__":
+    unittest.main()
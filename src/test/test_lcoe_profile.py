@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+test_lcoe_profile.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import unittest
+from openmdao.main.api import Assembly, Component
+from openmdao.main.datatypes.api import Float
+from wisdem.lcoe import lcoe_profile
+from wisdem.lcoe.lcoe_profile import Profiler, enable_profiling, disable_profiling, compare_reports
+
+
+class Clock(object):
+    """stands in for the time module of lcoe_profile: time only passes on sleep"""
+
+    def __init__(self):
+
+        self.now = 0.0
+
+    def time(self):
+
+        return self.now
+
+    def sleep(self, duration):
+
+        self.now += duration
+
+
+CLOCK = Clock()
+
+
+class Sleeper(Component):
+
+    duration = Float(0.0, iotype='in')
+
+    def execute(self):
+
+        CLOCK.sleep(self.duration)
+
+
+class SleeperAssembly(Assembly):
+
+    def configure(self):
+
+        self.add('fast', Sleeper())
+        self.add('slow', Sleeper())
+        self.driver.workflow.add(['fast', 'slow'])
+        self.fast.duration = 0.01
+        self.slow.duration = 0.05
+
+
+class TestProfiler(unittest.TestCase):
+
+    def setUp(self):
+
+        self.time = lcoe_profile.time
+        lcoe_profile.time = CLOCK
+
+    def tearDown(self):
+
+        lcoe_profile.time = self.time
+
+    def test_self_time(self):
+
+        profiler = Profiler()
+        profiler.enter('root')
+        profiler.enter('child')
+        CLOCK.sleep(0.05)
+        profiler.exit()
+        CLOCK.sleep(0.02)
+        profiler.exit()
+
+        root, child = profiler.report()['components']
+        self.assertEqual((root['path'], child['path']), ('root', 'root.child'))
+        self.assertEqual((root['calls'], child['calls']), (1, 1))
+        self.assertAlmostEqual(root['time'], 0.07)
+        self.assertAlmostEqual(root['self_time'], 0.02)
+        self.assertAlmostEqual(child['time'], 0.05)
+        self.assertAlmostEqual(child['self_time'], 0.05)
+
+    def test_assembly(self):
+
+        assembly = SleeperAssembly()
+        profiler = enable_profiling(assembly)
+        assembly.run()
+        assembly.fast.duration = 0.02
+        assembly.slow.duration = 0.04
+        assembly.run()
+
+        report = profiler.report()
+        self.assertEqual([entry['path'] for entry in report['components']],
+                         ['SleeperAssembly', 'SleeperAssembly.fast', 'SleeperAssembly.slow'])
+        entries = dict((entry['name'], entry) for entry in report['components'])
+        self.assertEqual(entries['SleeperAssembly']['calls'], 2)
+        self.assertEqual(entries['fast']['calls'], 2)
+        self.assertEqual(entries['slow']['calls'], 2)
+        self.assertAlmostEqual(entries['fast']['mean_time'], 0.015)
+        self.assertAlmostEqual(entries['slow']['mean_time'], 0.045)
+        self.assertAlmostEqual(entries['SleeperAssembly']['self_time'], 0.0)
+        self.assertAlmostEqual(report['total_time'], 0.12)
+
+        disable_profiling(assembly)
+        self.assertFalse('execute' in assembly.slow.__dict__)
+
+    def test_compare_reports(self):
+
+        baseline = {'components': [{'path': 'lcoe.rotor', 'mean_time': 1.0},
+                                   {'path': 'lcoe.tower', 'mean_time': 1.0}]}
+        current = {'components': [{'path': 'lcoe.rotor', 'mean_time': 1.1},
+                                  {'path': 'lcoe.tower', 'mean_time': 1.5},
+                                  {'path': 'lcoe.fpi', 'mean_time': 9.0}]}
+
+        self.assertEqual(compare_reports(baseline, current), [('lcoe.tower', 1.0, 1.5)])
+        self.assertEqual(compare_reports(baseline, current, threshold=0.05),
+                         [('lcoe.rotor', 1.0, 1.1), ('lcoe.tower', 1.0, 1.5)])
+        self.assertEqual(compare_reports(current, baseline), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+test_lcoe_sensitivity.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import unittest
+from collections import OrderedDict
+import numpy as np
+from wisdem.lcoe.lcoe_sensitivity import sensitivity_analysis
+
+
+def ishigami(samples, outputs):
+
+    x1, x2, x3 = samples['x1'], samples['x2'], samples['x3']
+    return (np.sin(x1) + 7*np.sin(x2)**2 + 0.1*x3**4*np.sin(x1))[:, np.newaxis]
+
+
+class TestIshigami(unittest.TestCase):
+
+    def setUp(self):
+
+        self.distributions = OrderedDict((name, ('uniform', -np.pi, np.pi)) for name in ('x1', 'x2', 'x3'))
+        self.S1 = [0.3139, 0.4424, 0.0]
+        self.ST = [0.5576, 0.4424, 0.2437]
+
+
+    def test_sobol(self):
+
+        indices = sensitivity_analysis(self.distributions, 4096, 'sobol', ishigami, outputs=('y',), seed=1)
+
+        for i, name in enumerate(self.distributions):
+            self.assertAlmostEqual(indices['y'][name]['S1'], self.S1[i], delta=0.02)
+            self.assertAlmostEqual(indices['y'][name]['ST'], self.ST[i], delta=0.02)
+
+
+    def test_fast(self):
+
+        indices = sensitivity_analysis(self.distributions, 1000, 'fast', ishigami, outputs=('y',), seed=1)
+
+        for i, name in enumerate(self.distributions):
+            self.assertAlmostEqual(indices['y'][name]['S1'], self.S1[i], delta=0.02)
+            self.assertAlmostEqual(indices['y'][name]['ST'], self.ST[i], delta=0.04)
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+test_lcoe_snapshot.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import warnings
+import unittest
+from openmdao.main.api import Assembly, Component
+from openmdao.main.datatypes.api import Float
+from wisdem.lcoe.lcoe_se_assembly import create_example_se_assembly
+from wisdem.lcoe.lcoe_snapshot import snapshot_assembly, snapshot_key, load_snapshot
+
+
+class Square(Component):
+
+    x = Float(3.0, iotype='in')
+    y = Float(iotype='out')
+
+    def execute(self):
+
+        self.y = self.x**2
+
+
+class SquareAssembly(Assembly):
+
+    def configure(self):
+
+        self.add('comp', Square())
+        self.driver.workflow.add(['comp'])
+
+
+def build_square(x=3.0):
+
+    assembly = SquareAssembly()
+    assembly.comp.x = x
+
+    return assembly
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+
+        fresh = create_example_se_assembly(with_new_nacelle=True)
+        fresh.run()
+
+        snapshot_assembly(create_example_se_assembly, self.directory, with_new_nacelle=True)
+        files = os.listdir(self.directory)
+        self.assertEqual(len(files), 1)
+
+        restored = load_snapshot(os.path.join(self.directory, files[0]))
+        restored.run()
+        self.assertEqual(restored.coe, fresh.coe)
+        self.assertEqual(restored.net_aep, fresh.net_aep)
+
+    def test_key_tracks_package_files(self):
+
+        package = os.path.join(self.directory, 'snapshot_test_package')
+        os.mkdir(package)
+        open(os.path.join(package, '__init__.py'), 'w').close()
+        with open(os.path.join(package, 'blade.inp'), 'w') as f:
+            f.write('1.0\n')
+
+        sys.path.insert(0, self.directory)
+        try:
+            key = snapshot_key(build_square, {'x': 2.0}, packages=('snapshot_test_package',))
+            self.assertEqual(snapshot_key(build_square, {'x': 2.0}, packages=('snapshot_test_package',)), key)
+            self.assertNotEqual(snapshot_key(build_square, {'x': 3.0}, packages=('snapshot_test_package',)), key)
+
+            with open(os.path.join(package, 'blade.inp'), 'a') as f:
+                f.write('2.0\n')
+            self.assertNotEqual(snapshot_key(build_square, {'x': 2.0}, packages=('snapshot_test_package',)), key)
+        finally:
+            sys.path.remove(self.directory)
+
+    def test_truncated_snapshot(self):
+
+        filename = os.path.join(self.directory, snapshot_key(build_square, {'x': 2.0}) + '.snapshot')
+        open(filename, 'wb').close()
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            assembly = snapshot_assembly(build_square, self.directory, x=2.0)
+
+        self.assertEqual(len(caught), 1)
+        self.assertTrue('EOFError' in str(caught[0].message))
+        self.assertEqual(assembly.comp.x, 2.0)
+
+        # the rebuilt snapshot is loaded next time
+        assembly = snapshot_assembly(build_square, self.directory, x=2.0)
+        assembly.run()
+        self.assertEqual(assembly.comp.y, 4.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+test_lcoe_store.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import shutil
+import tempfile
+import unittest
+import multiprocessing
+from collections import OrderedDict
+import numpy as np
+from wisdem.lcoe.lcoe_store import ResultsStore
+
+
+def _write(directory, writer, n):
+
+    with ResultsStore(directory, chunk_rows=7) as store:
+        for i in range(n):
+            store.append(OrderedDict([('case', 1000*writer + i), ('coe', 0.1*i), ('P', np.arange(5.0)*i)]))
+
+
+class TestResultsStore(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory = tempfile.mkdtemp()
+
+
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+
+
+    def test_concurrent_writers(self):
+
+        processes = [multiprocessing.Process(target=_write, args=(self.directory, w, 100)) for w in range(4)]
+        for p in processes:
+            p.start()
+        for p in processes:
+            p.join()
+
+        store = ResultsStore(self.directory)
+        columns = store.read()
+        i = np.asarray(columns['case']) % 1000
+
+        self.assertEqual(len(store), 400)
+        self.assertEqual(len(set(columns['case'])), 400)
+        self.assertIsInstance(columns['P'], np.memmap)
+        np.testing.assert_allclose(columns['coe'], 0.1*i)
+        np.testing.assert_allclose(columns['P'], np.arange(5.0)*i[:, np.newaxis])
+
+
+    def test_schema(self):
+
+        store = ResultsStore(self.directory, chunk_rows=1)
+        store.append({'coe': 0.1, 'P': np.zeros(5)})
+
+        self.assertRaises(ValueError, store.append, {'coe': 0.1})
+        self.assertRaises(ValueError, store.append, {'coe': 0.1, 'P': np.zeros(6)})
+        self.assertEqual(len(store), 1)
+
+
+
+if __name__ == '__main__':
+    unittest.main()
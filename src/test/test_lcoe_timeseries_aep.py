@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+test_lcoe_timeseries_aep.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from wisdem.lcoe.lcoe_wake_aep import HOURS_PER_YEAR
+from wisdem.lcoe.lcoe_timeseries_aep import WindTimeSeries, timeseries_to_npy, timeseries_energy, aep_timeseries
+
+
+V = np.linspace(3.0, 25.0, 45)
+P = np.minimum(0.5*1.225*0.25*np.pi*126.0**2*0.45*V**3, 5e6)
+
+
+class TestTimeSeriesAEP(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, 'wind.csv')
+
+        rng = np.random.RandomState(1)
+        self.speed = 8.0*rng.weibull(2.0, 1000)
+        self.direction = rng.uniform(0.0, 360.0, 1000)
+        self.speed[10] = np.nan
+        with open(self.filename, 'w') as f:
+            f.write('time,speed,direction\n')
+            for i in range(len(self.speed)):
+                f.write('%d,%r,%r\n' % (i, self.speed[i], self.direction[i]))
+
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+
+    def test_chunks(self):
+
+        series = WindTimeSeries(self.filename, 1, 2, skiprows=1, chunk_rows=300)
+        self.assertEqual([len(speed) for speed, _ in series.chunks()], [300, 300, 300, 100])
+
+        npy = timeseries_to_npy(series, os.path.join(self.directory, 'wind.npy'))
+        speed, direction = zip(*npy.chunks())
+        np.testing.assert_array_equal(np.concatenate(speed), self.speed)
+        np.testing.assert_array_equal(np.concatenate(direction), self.direction)
+
+    def test_energy(self):
+
+        series = WindTimeSeries(self.filename, 1, 2, skiprows=1, chunk_rows=128)
+        energy, hours, records, histogram = timeseries_energy(series, V, P, shear=1.1)
+
+        valid = np.isfinite(self.speed)
+        self.assertAlmostEqual(energy, np.sum(np.interp(1.1*self.speed[valid], V, P, left=0.0, right=0.0))/1e3)
+        self.assertEqual((hours, records), (999.0, 1000))
+        self.assertEqual(histogram.sum(), 999.0)
+
+    def test_component(self):
+
+        aep = aep_timeseries(self.filename)
+        aep.speed_column, aep.direction_column, aep.skiprows = 1, 2, 1
+        aep.hub_height = aep.measurement_height
+        aep.V, aep.P = V, P
+        aep.turbine_number = 10
+        aep.execute()
+
+        valid = np.isfinite(self.speed)
+        gross = 10*np.mean(np.interp(self.speed[valid], V, P, left=0.0, right=0.0))/1e3*HOURS_PER_YEAR
+        self.assertAlmostEqual(aep.gross_aep/gross, 1.0)
+        self.assertAlmostEqual(aep.net_aep, gross*(1.0 - aep.array_losses)*aep.availability, delta=1e-9*gross)
+        self.assertAlmostEqual(aep.data_recovery, 0.999)
+
+        aep.wake_model = True
+        aep.execute()
+        self.assertTrue(0.0 < aep.wake_losses < 0.3)
+        self.assertTrue(aep.total_losses > aep.wake_losses)
+
+
+if __name__ == "__main__":
+    unittest.main()
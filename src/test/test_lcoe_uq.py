@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+test_lcoe_uq.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import unittest
+import numpy as np
+from collections import OrderedDict
+from openmdao.main.api import Assembly, Component
+from openmdao.main.datatypes.api import Float
+from wisdem.lcoe.lcoe_sampling import sobol_sequence, sample_chunks
+from wisdem.lcoe.lcoe_uq import StreamingStatistics, run_uq
+
+
+class Square(Component):
+
+    x = Float(0.0, iotype='in')
+
+    f = Float(iotype='out')
+
+    def execute(self):
+
+        self.f = self.x**2
+
+
+class SquareAssembly(Assembly):
+
+    def configure(self):
+
+        self.add('comp', Square())
+        self.driver.workflow.add(['comp'])
+
+
+def build_square():
+
+    return SquareAssembly()
+
+
+class TestSampling(unittest.TestCase):
+
+    def test_sobol_chunks(self):
+
+        u = np.vstack(list(sample_chunks('sobol', 1024, 8, chunksize=100, seed=3)))
+        np.testing.assert_array_equal(u, sobol_sequence(1024, 8, seed=3))
+
+        # every dyadic interval of width 1/1024 holds exactly one point in each dimension
+        for j in range(8):
+            self.assertEqual(len(np.unique(np.floor(1024*u[:, j]))), 1024)
+
+        # without a seed the chunks still share one digital shift
+        u = np.vstack(list(sample_chunks('sobol', 2000, 3, chunksize=1000)))
+        shift = (u*2**30).astype(np.int64) ^ (sobol_sequence(2000, 3, scramble=False)*2**30).astype(np.int64)
+        self.assertEqual(len(np.unique(shift[:, 0])), 1)
+        self.assertEqual(len(np.unique(np.floor(1024*u[:1024, 0]))), 1024)
+
+    def test_lhs_strata(self):
+
+        u = np.vstack(list(sample_chunks('lhs', 500, 4, chunksize=64, seed=1)))
+
+        for j in range(4):
+            self.assertEqual(len(np.unique(np.floor(500*u[:, j]))), 500)
+
+
+
+class TestStreamingStatistics(unittest.TestCase):
+
+    def test_lognormal(self):
+
+        x = np.random.RandomState(0).lognormal(0.0, 0.5, 20000)
+        stats = StreamingStatistics()
+        for value in x:
+            stats.update(value)
+        s = stats.summary()
+
+        self.assertEqual(s['count'], len(x))
+        self.assertAlmostEqual(s['mean'], np.mean(x), 10)
+        self.assertAlmostEqual(s['std'], np.std(x, ddof=1), 10)
+        for p, value in s['percentiles'].iteritems():
+            self.assertAlmostEqual(value, np.percentile(x, p), delta=0.02*np.percentile(x, p))
+
+    def test_parallel_matches_serial(self):
+
+        distributions = OrderedDict([('comp.x', ('uniform', -1.0, 1.0))])
+        indices = []
+
+        def callback(index, inputs, values):
+            indices.append(index)
+
+        serial = run_uq(distributions, n=200, seed=2, builder=build_square, outputs=['comp.f'], processes=1,
+                        cache=False, callback=callback)
+        parallel = run_uq(distributions, n=200, seed=2, builder=build_square, outputs=['comp.f'], processes=3,
+                          chunksize=7, cache=False)
+
+        # results are folded in sample order, so the order dependent percentiles match too
+        self.assertEqual(indices, range(200))
+        self.assertEqual(parallel['comp.f'], serial['comp.f'])
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+test_lcoe_wake_aep.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import unittest
+import numpy as np
+from wisdem.lcoe.lcoe_wake_aep import WakeModel, weibull_probability, _overlap, aep_wake
+from wisdem.lcoe.lcoe_se_assembly import lcoe_se_assembly, configure_example_se_assembly
+
+
+V = np.linspace(3.0, 25.0, 45)
+Ct = np.clip(0.9 - 0.03*(V - 3.0), 0.05, 0.9)
+
+
+def sequential_speeds(layout, direction, speed, D, k):
+    """Jensen wakes turbine by turbine, from upstream to downstream"""
+
+    theta = np.radians(direction)
+    R = 0.5*D
+    u = np.zeros(len(layout))
+    for j in np.argsort(-(layout[:, 0]*np.sin(theta) + layout[:, 1]*np.cos(theta))):
+        total = 0.0
+        for i in range(len(layout)):
+            dx, dy = layout[j] - layout[i]
+            x = -dx*np.sin(theta) - dy*np.cos(theta)
+            if x <= 0:
+                continue
+            r_wake = R + k*x
+            a = 1.0 - np.sqrt(1.0 - np.interp(u[i], V, Ct, left=0.0, right=0.0))
+            total += (a*(R/r_wake)**2*_overlap(abs(dx*np.cos(theta) - dy*np.sin(theta)), r_wake, R))**2
+        u[j] = speed*max(1.0 - np.sqrt(total), 0.0)
+
+    return u
+
+
+class TestWakeModel(unittest.TestCase):
+
+    def test_sequential(self):
+
+        layout = np.random.RandomState(0).uniform(0.0, 3000.0, (30, 2))
+        directions = np.array([0.0, 37.0, 200.0])
+        speeds = np.array([5.0, 9.0, 13.0])
+        u = WakeModel(layout, directions, 0.075).effective_speeds(speeds, 100.0, V, Ct)
+
+        for d in range(len(directions)):
+            for s in range(len(speeds)):
+                np.testing.assert_allclose(u[d, :, s], sequential_speeds(layout, directions[d], speeds[s], 100.0, 0.075),
+                                           rtol=1e-12)
+
+    def test_row(self):
+
+        # three turbines in a west-east row, 5 diameters apart, wind from the west
+        layout = np.array([[0.0, 0.0], [500.0, 0.0], [1000.0, 0.0]])
+        u = WakeModel(layout, [270.0], 0.05).effective_speeds([8.0], 100.0, V, Ct)[0, :, 0]
+
+        a = 1.0 - np.sqrt(1.0 - np.interp(8.0, V, Ct))
+        self.assertEqual(u[0], 8.0)
+        self.assertAlmostEqual(u[1], 8.0*(1.0 - a*(50.0/75.0)**2))
+        self.assertTrue(u[2] < u[1])
+
+    def test_probability(self):
+
+        speeds = np.arange(0.5, 60.0)
+        probability = weibull_probability(speeds, [8.0, 10.0], [2.0, 2.5], [0.25, 0.75])
+
+        np.testing.assert_allclose(probability.sum(axis=1), [0.25, 0.75], rtol=1e-6)
+
+
+class TestAEPWake(unittest.TestCase):
+
+    def setUp(self):
+
+        self.aep = aep_wake()
+        self.aep.V = V
+        self.aep.P = np.minimum(0.5*1.225*0.25*np.pi*126.0**2*0.45*V**3, 5e6)
+        self.aep.availability = 0.95
+        self.aep.other_losses = 0.02
+
+    def test_one_turbine_energy(self):
+
+        self.aep.turbine_number = 9
+        self.aep.execute()
+        array_losses = self.aep.array_losses
+        self.assertTrue(array_losses > 0.0)
+
+        # the gross energy follows the given turbine energy, the wind rose only sets the losses
+        self.aep.AEP_one_turbine = 1.8e7
+        self.aep.execute()
+        self.assertAlmostEqual(self.aep.gross_aep, 9*1.8e7)
+        self.assertAlmostEqual(self.aep.array_losses, array_losses)
+        self.assertAlmostEqual(self.aep.net_aep, 9*1.8e7*(1.0 - array_losses)*0.98*0.95)
+
+        self.aep.turbine_number = 1
+        self.aep.execute()
+        self.assertEqual(self.aep.gross_aep, 1.8e7)
+        self.assertAlmostEqual(self.aep.array_losses, 0.0)
+
+    def test_lcoe_assembly(self):
+
+        lcoe_se = lcoe_se_assembly(with_new_nacelle=True, with_wake_aep=True)
+        configure_example_se_assembly(lcoe_se)
+        lcoe_se.turbine_number = 1
+        lcoe_se.run()
+
+        self.assertAlmostEqual(lcoe_se.aep_a.gross_aep, lcoe_se.turbine_number*lcoe_se.rotor.AEP,
+                               delta=1e-9*lcoe_se.rotor.AEP)
+        self.assertAlmostEqual(lcoe_se.aep_a.array_losses, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+test_precomp_cache.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+import wisdem.reference_turbines
+from wisdem.reference_turbines.precomp_cache import load_precomp_blade, load_profile, clear_precomp_cache
+
+
+BLADE = os.path.join(os.path.dirname(wisdem.reference_turbines.__file__), 'nrel5mw', 'blade')
+
+
+def assert_same_values(a, b):
+    """recursive equality of PreComp objects (which do not define __eq__)"""
+
+    if isinstance(a, (list, tuple)):
+        assert len(a) == len(b)
+        for x, y in zip(a, b):
+            assert_same_values(x, y)
+    elif hasattr(a, '__dict__'):
+        assert type(a) is type(b)
+        assert_same_values(sorted(vars(a).items()), sorted(vars(b).items()))
+    else:
+        np.testing.assert_array_equal(a, b)
+
+
+class TestPreCompCache(unittest.TestCase):
+
+    def setUp(self):
+
+        clear_precomp_cache()
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+
+        clear_precomp_cache()
+        shutil.rmtree(self.directory)
+
+    def test_deep_copy(self):
+
+        first = load_precomp_blade(BLADE, [[]])
+        second = load_precomp_blade(BLADE, [[]])
+        assert_same_values(first, second)
+
+        materials, upper, lower, webs, profile = first
+        self.assertFalse(materials[0] is second[0][0])
+        self.assertFalse(profile[0] is second[4][0])
+
+        # changing one copy leaves the cached objects and later copies untouched
+        profile[0].x[:] = 0.0
+        materials[0].E1 = -1.0
+        assert_same_values(load_precomp_blade(BLADE, [[]]), second)
+
+    def test_file_change(self):
+
+        fname = os.path.join(self.directory, 'shape_1.inp')
+        shutil.copy(os.path.join(BLADE, 'shape_1.inp'), fname)
+        st = os.stat(fname)
+
+        profile = load_profile(fname)
+        self.assertTrue(load_profile(fname) is profile)
+
+        # new modification time
+        os.utime(fname, (st.st_atime, st.st_mtime + 10.0))
+        touched = load_profile(fname)
+        self.assertFalse(touched is profile)
+        assert_same_values(touched, profile)
+
+        # new size, same modification time
+        with open(fname, 'a') as f:
+            f.write('\n')
+        os.utime(fname, (st.st_atime, st.st_mtime + 10.0))
+        self.assertFalse(load_profile(fname) is touched)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+test_rotor_surrogate.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import unittest
+import numpy as np
+from openmdao.main.api import Assembly, Component, VariableTree
+from openmdao.main.datatypes.api import Float, Int, Array, VarTree
+from openmdao.lib.drivers.api import FixedPointIterator
+from wisdem.turbinese.rotor_surrogate import KrigingModel, RotorSurrogate, enable_rotor_surrogate, \
+    disable_rotor_surrogate
+
+
+def branin(X):
+
+    x1, x2 = 15*X[:, 0] - 5, 15*X[:, 1]
+    y = (x2 - 5.1/(4*np.pi**2)*x1**2 + 5/np.pi*x1 - 6)**2 + 10*(1 - 1/(8*np.pi))*np.cos(x1) + 10
+
+    return np.c_[y, 2*X[:, 0] + 1.0]
+
+
+class Control(VariableTree):
+
+    tsr = Float(7.0)
+    pitch = Float(0.0)
+
+
+class CheapRotor(Component):
+
+    bladeLength = Float(60.0, iotype='in')
+    control = VarTree(Control(), iotype='in')
+    nBlades = Int(3, iotype='in')
+
+    mass = Float(iotype='out')
+    loads = Array(iotype='out')
+
+    def __init__(self):
+
+        super(CheapRotor, self).__init__()
+        self.runs = 0
+
+    def execute(self):
+
+        self.runs += 1
+        self.mass = self.nBlades*(0.1*self.bladeLength**2 + self.control.pitch)
+        self.loads = np.array([self.bladeLength*self.control.tsr, np.sin(self.control.tsr)])
+
+
+class RotorAssembly(Assembly):
+
+    def configure(self):
+
+        self.add('rotor', CheapRotor())
+        self.driver.workflow.add(['rotor'])
+
+
+class IteratedRotorAssembly(Assembly):
+
+    def configure(self):
+
+        self.add('rotor', CheapRotor())
+        self.add('fpi', FixedPointIterator())
+        self.fpi.workflow.add(['rotor'])
+        self.driver.workflow.add(['fpi'])
+
+
+class TestKrigingModel(unittest.TestCase):
+
+    def setUp(self):
+
+        rng = np.random.RandomState(0)
+        self.X = rng.rand(80, 2)
+        self.Xtest = rng.rand(200, 2)
+        self.model = KrigingModel()
+        self.model.fit(self.X, branin(self.X))
+
+
+    def test_interpolates(self):
+
+        spread = np.ptp(branin(self.X), axis=0)
+        for x, y in zip(self.X[:10], branin(self.X[:10])):
+            mean, std = self.model.predict(x)
+            np.testing.assert_allclose(mean, y, rtol=1e-3)
+            np.testing.assert_array_less(std, 1e-4*spread)
+
+
+    def test_error_estimate(self):
+
+        prediction = np.array([self.model.predict(x) for x in self.Xtest])
+        error = np.abs(prediction[:, 0, :] - branin(self.Xtest))
+
+        # accurate away from the samples, with errors mostly within three standard errors
+        self.assertLess(np.max(error[:, 0]), 0.05*np.ptp(branin(self.X)[:, 0]))
+        self.assertGreater(np.mean(error <= 3*prediction[:, 1, :] + 1e-8), 0.9)
+
+
+
+class TestRotorSurrogate(unittest.TestCase):
+
+    def setUp(self):
+
+        self.assembly = RotorAssembly()
+        self.rotor = self.assembly.rotor
+        self.surrogate = RotorSurrogate(design_vars=('bladeLength', 'control.tsr'), outputs=('mass', 'loads'),
+                                        tolerance=0.01, min_samples=9)
+        enable_rotor_surrogate(self.assembly, self.surrogate)
+
+
+    def run_rotor(self, blade_length, tsr):
+
+        self.rotor.bladeLength = blade_length
+        self.rotor.control.tsr = tsr
+        self.rotor.execute()
+
+        return self.rotor.mass, np.copy(self.rotor.loads)
+
+
+    def train(self):
+
+        for blade_length in (55.0, 60.0, 65.0):
+            for tsr in (6.0, 7.0, 8.0):
+                self.run_rotor(blade_length, tsr)
+
+
+    def test_min_samples(self):
+
+        self.train()
+        self.assertEqual(self.rotor.runs, 9)
+        self.assertEqual(len(self.surrogate), 9)
+
+        # the ninth run made the model: a point close to the samples is predicted
+        mass, loads = self.run_rotor(59.0, 7.05)
+        self.assertEqual(self.rotor.runs, 9)
+        self.assertEqual(self.surrogate.predictions, 1)
+        self.assertAlmostEqual(mass, 3*0.1*59.0**2, delta=0.01*mass)
+
+        surrogate = RotorSurrogate(design_vars=('bladeLength', 'control.tsr'), min_samples=10)
+        surrogate._samples = self.surrogate._samples
+        surrogate.fit()
+        self.assertEqual(surrogate.predict(self.surrogate.model_key(self.rotor), [59.0, 7.05]), (None, np.inf))
+
+
+    def test_extrapolation(self):
+
+        self.train()
+        key = self.surrogate.model_key(self.rotor)
+        self.assertEqual(self.surrogate.predict(key, [66.0, 7.0]), (None, np.inf))
+        self.assertEqual(self.surrogate.predict(key, [60.0, 5.9]), (None, np.inf))
+
+        fallbacks = self.surrogate.fallbacks
+        self.run_rotor(66.0, 7.0)
+        self.assertEqual(self.rotor.runs, 10)
+        self.assertEqual(self.surrogate.fallbacks, fallbacks + 1)
+
+
+    def test_tolerance(self):
+
+        self.train()
+        key = self.surrogate.model_key(self.rotor)
+        y, error = self.surrogate.predict(key, [57.5, 6.5])
+        self.assertTrue(0.0 < error < np.inf)
+
+        fallbacks = self.surrogate.fallbacks
+        self.surrogate.tolerance = 0.1*error
+        self.run_rotor(57.5, 6.5)
+        self.assertEqual((self.rotor.runs, self.surrogate.fallbacks), (10, fallbacks + 1))
+
+        self.surrogate.tolerance = 10.0*error
+        self.run_rotor(62.5, 7.5)
+        self.assertEqual((self.rotor.runs, self.surrogate.predictions), (10, 1))
+
+
+    def test_refit_after_update(self):
+
+        self.train()
+        key = self.surrogate.model_key(self.rotor)
+        y, error = self.surrogate.predict(key, [57.5, 6.5])
+
+        self.surrogate.tolerance = 0.0
+        exact = self.run_rotor(57.5, 6.5)
+        self.assertEqual(len(self.surrogate), 10)
+
+        # the fall-back run was added and the model refitted: it now (nearly) interpolates that point
+        y_refit, error_refit = self.surrogate.predict(key, [57.5, 6.5])
+        np.testing.assert_allclose(y_refit, np.r_[exact[0], exact[1]], rtol=1e-3)
+        self.assertTrue(np.max(np.abs(y_refit - np.r_[exact[0], exact[1]])/np.abs(y - np.r_[exact[0], exact[1]])) < 0.1)
+        self.assertTrue(error_refit < error)
+
+
+    def test_other_inputs(self):
+
+        self.train()
+        key = self.surrogate.model_key(self.rotor)
+
+        # inputs outside the design variables select another (untrained) model
+        self.rotor.control.pitch = 1.0
+        self.assertNotEqual(self.surrogate.model_key(self.rotor), key)
+        self.run_rotor(60.0, 7.0)
+        self.assertEqual(self.rotor.runs, 10)
+        self.assertEqual(self.rotor.mass, 3*(0.1*60.0**2 + 1.0))
+
+        self.rotor.control.pitch = 0.0
+        self.rotor.nBlades = 2
+        self.assertNotEqual(self.surrogate.model_key(self.rotor), key)
+
+        self.rotor.nBlades = 3
+        self.rotor.bladeLength = 61.0
+        self.assertEqual(self.surrogate.model_key(self.rotor), key)
+
+
+    def test_refuses_iterated_rotor(self):
+
+        disable_rotor_surrogate(self.assembly)
+        self.assertFalse('execute' in self.rotor.__dict__)
+
+        assembly = IteratedRotorAssembly()
+        self.assertRaises(ValueError, enable_rotor_surrogate, assembly)
+        self.assertFalse('execute' in assembly.rotor.__dict__)
+
+
+if __name__ == '__main__':
+    unittest.main()
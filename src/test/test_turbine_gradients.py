@@ -10,7 +10,8 @@ Copyright (c) NREL. All rights reserved.
 import unittest
 import numpy as np
 from commonse.utilities import check_gradient_unit_test, check_for_missing_unit_tests
-from wisdem.turbinese.turbine import MaxTipDeflection
+from wisdem.turbinese.turbine import MaxTipDeflection, max_tip_deflection_batch
+from gradient_check_wisdem import check_case
 
 
 class TestMaxTipDeflection(unittest.TestCase):
@@ -48,6 +49,88 @@ class TestMaxTipDeflection(unittest.TestCase):
 
 
 
+class TestMaxTipDeflectionBatch(unittest.TestCase):
+
+    def test1(self):
+
+        Rtip = np.array([63.0, 63.0, 58.0, 70.0])
+        precurveTip = np.array([5.0, 5.0, 0.0, -3.0])
+        presweepTip = np.array([2.0, 2.0, 0.0, 1.0])
+        precone = np.array([2.5, -2.5, 0.0, 4.0])
+        tilt = np.array([5.0, 5.0, 6.0, 3.0])
+        hub_tt = np.array([-6.29400379597, 0.0, 3.14700189798])
+        tower_z = np.array([0.0, 0.5, 1.0])
+        tower_d = np.array([6.0, 4.935, 3.87])
+        towerHt = np.array([77.5632866084, 77.5632866084, 90.0, 60.0])
+
+        mtd, gc, J = max_tip_deflection_batch(Rtip, precurveTip, presweepTip, precone, tilt,
+            hub_tt, tower_z, tower_d, towerHt)
+
+        for i in range(len(Rtip)):
+            dfl = MaxTipDeflection()
+            dfl.Rtip = Rtip[i]
+            dfl.precurveTip = precurveTip[i]
+            dfl.presweepTip = presweepTip[i]
+            dfl.precone = precone[i]
+            dfl.tilt = tilt[i]
+            dfl.hub_tt = hub_tt
+            dfl.tower_z = tower_z
+            dfl.tower_d = tower_d
+            dfl.towerHt = towerHt[i]
+            dfl.run()
+
+            self.assertAlmostEqual(mtd[i], dfl.max_tip_deflection, 10)
+            self.assertAlmostEqual(gc[i], dfl.ground_clearance, 10)
+            np.testing.assert_allclose(J[i], dfl.provideJ(), rtol=1e-10, atol=1e-12)
+
+
+
+class TestMaxTipDeflectionSparse(unittest.TestCase):
+
+    def test1(self):
+
+        dfl = MaxTipDeflection()
+        dfl.Rtip = 63.0
+        dfl.precurveTip = 5.0
+        dfl.presweepTip = 2.0
+        dfl.precone = 2.5
+        dfl.tilt = 5.0
+        dfl.hub_tt = np.array([-6.29400379597, 0.0, 3.14700189798])
+        dfl.tower_z = np.linspace(0.0, 1.0, 41)
+        dfl.tower_d = np.linspace(6.0, 3.87, 41)
+        dfl.towerHt = 77.5632866084
+        dfl.run()
+
+        J = dfl.provideJ()
+        inputs, outputs = dfl.list_deriv_vars()
+        arg = dict((name, np.random.rand(np.size(dfl.get(name)))) for name in inputs)
+        x = np.concatenate([arg[name] for name in inputs])
+
+        result = dict((name, 0.0) for name in outputs)
+        dfl.apply_deriv(arg, result)
+        np.testing.assert_allclose([result[name] for name in outputs], np.dot(J, x), rtol=1e-12)
+
+        y = np.random.rand(2)
+        result = dict((name, np.zeros(np.size(dfl.get(name)))) for name in inputs)
+        dfl.apply_derivT(dict(zip(outputs, y)), result)
+        np.testing.assert_allclose(np.concatenate([result[name] for name in inputs]), np.dot(J.T, y), rtol=1e-12)
+
+
+
+class TestBatchedGradientCheck(unittest.TestCase):
+
+    def test_component(self):
+
+        result = check_case('MaxTipDeflection', n=50)
+        self.assertLess(result['max_rel_error'], 1e-5)
+
+
+    def test_batch(self):
+
+        result = check_case('max_tip_deflection_batch', n=500)
+        self.assertLess(result['max_rel_error'], 1e-5)
+
+
 
 if __name__ == '__main__':
     import wisdem.turbinese.turbine
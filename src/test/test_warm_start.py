@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+test_warm_start.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import unittest
+import numpy as np
+from wisdem.turbinese.warm_start import WarmStartStore
+
+
+class TestWarmStartStore(unittest.TestCase):
+
+    def test_lru_bound(self):
+
+        store = WarmStartStore(maxsize=2, scales=[1.0])
+        store.add([0.0], 'a')
+        store.add([10.0], 'b')
+        self.assertEqual(store.lookup([0.1])[0], 'a')  # a becomes most recently used
+
+        store.add([20.0], 'c')
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store.lookup([9.0])[0], 'a')  # b was dropped, a is now nearest
+        self.assertEqual(store.lookup([19.0])[0], 'c')
+
+    def test_normalized_nearest(self):
+
+        store = WarmStartStore()
+        store.add([0.0, 0.0], 'origin')
+        store.add([3.0, 1.0], 'corner')
+        store.add([100.0, 0.0], 'far')
+
+        # nearest in absolute terms is 'corner', but the second coordinate spans a much smaller range
+        state, distance = store.lookup([2.0, 0.0])
+        self.assertEqual(state, 'origin')
+        self.assertAlmostEqual(distance, 0.02)
+
+    def test_max_distance(self):
+
+        store = WarmStartStore(max_distance=0.5, scales=[1.0, 1.0])
+        self.assertEqual(store.lookup([0.0, 0.0]), (None, np.inf))
+
+        store.add([0.0, 0.0], 'origin')
+        state, distance = store.lookup([0.3, 0.4])
+        self.assertEqual(state, 'origin')
+        self.assertAlmostEqual(distance, 0.5)
+
+        state, distance = store.lookup([3.0, 4.0])
+        self.assertTrue(state is None)
+        self.assertAlmostEqual(distance, 5.0)
+        self.assertEqual((store.hits, store.misses), (1, 2))
+
+    def test_design_length(self):
+
+        store = WarmStartStore()
+        store.add([0.0, 0.0], 'two')
+        self.assertTrue(store.lookup([0.0, 0.0, 0.0])[0] is None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,217 @@
+"""
+lcoe_cache.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import os
+import tempfile
+import cPickle as pickle
+from collections import OrderedDict
+
+import numpy as np
+
+from openmdao.main.api import VariableTree
+
+from wisdem.turbinese.execute_wrapper import ExecuteWrapper, wrap_execute, unwrap_execute, find_wrapper, input_hash
+
+
+# blocks of lcoe_se_assembly whose results are memoized by default
+SE_CACHED_BLOCKS = ('rotor', 'hub', 'nacelle', 'tower', 'tcc_a', 'bos_a', 'opex_a')
+
+# framework bookkeeping outputs that are never cached or restored
+_IGNORED_OUTPUTS = ('derivative_exec_count', 'exec_count', 'itername')
+
+
+# --- output capture ---
+
+def _capture(value):
+
+    if isinstance(value, VariableTree):
+        return ('vartree', dict((name, _capture(getattr(value, name))) for name in value.list_vars()))
+
+    return ('value', np.copy(value) if isinstance(value, np.ndarray) else value)
+
+
+def _restore(obj, name, stored):
+
+    kind, value = stored
+    if kind == 'vartree':
+        vt = getattr(obj, name)
+        for var, item in value.iteritems():
+            _restore(vt, var, item)
+    else:
+        setattr(obj, name, np.copy(value) if isinstance(value, np.ndarray) else value)
+
+
+def capture_outputs(component):
+    """copy of the current value of every output of component"""
+
+    return dict((name, _capture(getattr(component, name)))
+                for name in component.list_outputs() if name not in _IGNORED_OUTPUTS)
+
+
+def restore_outputs(component, outputs):
+    """set the outputs of component from values previously returned by capture_outputs"""
+
+    for name, stored in outputs.iteritems():
+        _restore(component, name, stored)
+
+
+# --- result cache ---
+
+class ResultCache(object):
+    """bounded LRU store of component outputs keyed on a hash of their inputs
+
+    Parameters
+    ----------
+    maxsize : int
+        maximum number of results held in memory
+    directory : str
+        if given, results are also written to (and read back from) one pickle file per key
+        in this directory, so they survive the process and can be shared by a worker pool
+    """
+
+    def __init__(self, maxsize=128, directory=None):
+
+        self.maxsize = maxsize
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._store = OrderedDict()
+
+        if directory is not None and not os.path.exists(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                if not os.path.isdir(directory):  # may have been created by another worker
+                    raise
+
+    def __len__(self):
+
+        return len(self._store)
+
+    def _path(self, key):
+
+        return os.path.join(self.directory, key + '.pkl')
+
+    def get(self, key):
+        """cached outputs for key, or None"""
+
+        if key in self._store:
+            outputs = self._store.pop(key)
+            self._store[key] = outputs  # most recently used
+            self.hits += 1
+            return outputs
+
+        if self.directory is not None and os.path.exists(self._path(key)):
+            with open(self._path(key), 'rb') as f:
+                outputs = pickle.load(f)
+            self._remember(key, outputs)
+            self.hits += 1
+            return outputs
+
+        self.misses += 1
+        return None
+
+    def put(self, key, outputs):
+
+        self._remember(key, outputs)
+
+        if self.directory is not None:
+            # write then rename so concurrent readers never see a partial file
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(outputs, f, pickle.HIGHEST_PROTOCOL)
+            os.rename(tmp, self._path(key))
+
+    def _remember(self, key, outputs):
+
+        self._store.pop(key, None)
+        self._store[key] = outputs
+        while len(self._store) > self.maxsize:
+            self._store.popitem(last=False)
+
+    def clear(self):
+        """empty the in-memory store (files on disk are kept)"""
+
+        self._store.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class CachedExecute(ExecuteWrapper):
+    """stands in for a component's execute and skips it when its inputs match a cached run"""
+
+    def __init__(self, component, inner, name, cache):
+
+        super(CachedExecute, self).__init__(component, inner)
+        self.name = name
+        self.cache = cache
+
+    def __call__(self):
+
+        key = input_hash(self.component, self.name)
+        outputs = self.cache.get(key)
+
+        if outputs is None:
+            self.run_inner()
+            self.cache.put(key, capture_outputs(self.component))
+        else:
+            restore_outputs(self.component, outputs)
+
+
+def enable_result_cache(assembly, cache=None, names=SE_CACHED_BLOCKS):
+    """memoize the results of the named blocks of an assembly
+
+    Parameters
+    ----------
+    assembly : Assembly
+        e.g. an lcoe_se_assembly
+    cache : ResultCache
+        store to use (a new in-memory cache if None); may be shared between assemblies
+    names : list(str)
+        blocks to memoize.  Blocks that do not exist in the assembly are skipped.
+
+    Returns
+    -------
+    cache : ResultCache
+    """
+
+    if cache is None:
+        cache = ResultCache()
+
+    for name in names:
+        if not hasattr(assembly, name):
+            continue
+        comp = getattr(assembly, name)
+        if find_wrapper(comp, CachedExecute) is None:
+            wrap_execute(comp, CachedExecute, name, cache)
+
+    return cache
+
+
+def disable_result_cache(assembly, names=SE_CACHED_BLOCKS):
+    """restore the normal execute of the named blocks"""
+
+    for name in names:
+        if hasattr(assembly, name):
+            unwrap_execute(getattr(assembly, name), CachedExecute)
+
+
+if __name__ == '__main__':
+
+    import time
+    from wisdem.lcoe.lcoe_se_assembly import create_example_se_assembly
+
+    lcoe_se = create_example_se_assembly(with_new_nacelle=True)
+    cache = enable_result_cache(lcoe_se)
+
+    for fcr in [0.095, 0.10, 0.105, 0.11]:
+        lcoe_se.fixed_charge_rate = fcr
+        tt = time.time()
+        lcoe_se.run()
+        print 'fixed charge rate {0:.3f}: COE ${1:.4f} USD/kWh in {2:.3f} s'.format(fcr, lcoe_se.coe, time.time() - tt)
+
+    print 'cache hits: {0}, misses: {1}'.format(cache.hits, cache.misses)
@@ -0,0 +1,261 @@
+"""
+lcoe_checkpoint.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import os
+import time
+import hashlib
+import cPickle as pickle
+
+from openmdao.main.api import Driver
+
+from wisdem.turbinese.execute_wrapper import ExecuteWrapper, wrap_execute, unwrap_execute, find_wrapper, input_hash, \
+    _update_hash
+from wisdem.lcoe.lcoe_cache import capture_outputs, restore_outputs
+
+
+class Checkpoint(object):
+    """append-only journal of finished work that lets an interrupted sweep or optimization resume
+
+    Three kinds of records are kept: finished cases of a sweep (case index -> outputs or error
+    message), evaluations (key -> result, e.g. the outputs of a block for a hash of its inputs)
+    and named driver states.  Each record is pickled onto the end of the file as soon as it is
+    made, so a checkpoint costs one small write, and values are restored bit-for-bit.  When the
+    file is reopened all records are read back; a record cut short by a crash is discarded.
+
+    Parameters
+    ----------
+    filename : str
+        journal file (created if needed)
+    key : str
+        identifies the work being checkpointed (e.g. a hash of the case table).  Reopening a
+        journal written with a different key raises ValueError rather than mixing results.
+    sync_interval : float
+        minimum time (s) between fsyncs of the journal.  Records are always handed to the
+        operating system immediately; the fsync bounds what a node failure can lose.  0 syncs
+        every record, None never syncs.
+    """
+
+    def __init__(self, filename, key=None, sync_interval=10.0):
+
+        self.filename = filename
+        self.key = key
+        self.sync_interval = sync_interval
+        self.cases = {}
+        self.evaluations = {}
+        self.states = {}
+        self._last_sync = time.time()
+
+        directory = os.path.dirname(os.path.abspath(filename))
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        stored_key = self._load()
+        if stored_key is not None and key is not None and stored_key != key:
+            raise ValueError('checkpoint %s was written for different work (key %s, expected %s)'
+                             % (filename, stored_key, key))
+
+        self._file = open(filename, 'ab')
+        if stored_key is None and os.path.getsize(filename) == 0:
+            self._write(('key', key))
+
+    def _load(self):
+        """read back every complete record, truncating anything after the last one"""
+
+        if not os.path.exists(self.filename):
+            return None
+
+        stored_key = None
+        with open(self.filename, 'r+b') as f:
+            end = 0
+            while True:
+                try:
+                    record = pickle.load(f)
+                except EOFError:
+                    break
+                except Exception:  # partial record left by an interrupted write
+                    break
+                end = f.tell()
+
+                kind = record[0]
+                if kind == 'key':
+                    stored_key = record[1]
+                elif kind == 'case':
+                    self.cases[record[1]] = record[2:]
+                elif kind == 'evaluation':
+                    self.evaluations[record[1]] = record[2]
+                elif kind == 'state':
+                    self.states[record[1]] = record[2]
+
+            f.truncate(end)
+
+        return stored_key
+
+    def _write(self, record):
+
+        pickle.dump(record, self._file, pickle.HIGHEST_PROTOCOL)
+        self._file.flush()
+
+        if self.sync_interval is not None and time.time() - self._last_sync >= self.sync_interval:
+            os.fsync(self._file.fileno())
+            self._last_sync = time.time()
+
+    # --- sweeps ---
+
+    def record_case(self, index, values, error=None):
+        """mark a case as finished, with its output values (or the error that stopped it)"""
+
+        self.cases[index] = (values, error)
+        self._write(('case', index, values, error))
+
+    def finished(self, index):
+
+        return index in self.cases
+
+    # --- evaluations ---
+
+    def record_evaluation(self, key, result):
+
+        self.evaluations[key] = result
+        self._write(('evaluation', key, result))
+
+    def evaluation(self, key):
+        """result recorded for key, or None"""
+
+        return self.evaluations.get(key)
+
+    # --- driver state ---
+
+    def save_state(self, name, state):
+        """record the (picklable) state of a driver; only the latest state of each name is returned"""
+
+        self.states[name] = state
+        self._write(('state', name, state))
+
+    def load_state(self, name, default=None):
+
+        return self.states.get(name, default)
+
+    def close(self):
+
+        if not self._file.closed:
+            self._file.flush()
+            if self.sync_interval is not None:
+                os.fsync(self._file.fileno())
+            self._file.close()
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, *args):
+
+        self.close()
+
+
+def work_key(*args):
+    """digest of args (e.g. builder name, fixed arguments and case table, with arrays hashed on
+    their full contents), used as the key of a Checkpoint"""
+
+    h = hashlib.sha1()
+    _update_hash(h, list(args), set())
+
+    return h.hexdigest()
+
+
+class CheckpointedExecute(ExecuteWrapper):
+    """stands in for a component's execute: runs already in the checkpoint are restored from it,
+    new runs are recorded"""
+
+    def __init__(self, component, inner, name, checkpoint):
+
+        super(CheckpointedExecute, self).__init__(component, inner)
+        self.name = name
+        self.checkpoint = checkpoint
+
+    def __call__(self):
+
+        key = input_hash(self.component, self.name)
+        outputs = self.checkpoint.evaluation(key)
+
+        if outputs is None:
+            self.run_inner()
+            self.checkpoint.record_evaluation(key, capture_outputs(self.component))
+        else:
+            restore_outputs(self.component, outputs)
+
+
+def _workflow_blocks(assembly, driver):
+    """components run by driver, including those run by the drivers nested in its workflow"""
+
+    names = []
+    for name in driver.workflow.get_names():
+        comp = getattr(assembly, name)
+        if isinstance(comp, Driver):
+            names.extend(_workflow_blocks(assembly, comp))
+        else:
+            names.append(name)
+
+    return names
+
+
+def enable_checkpoint(assembly, checkpoint, names=None):
+    """record every run of the named blocks of an assembly driven by an optimizer
+
+    Optimizer drivers keep their iteration state internally (often in compiled code), so it
+    is not saved directly.  Instead a restarted optimization is run again from the same
+    starting point: because the optimizer is deterministic, it asks for the same designs in
+    the same order, every block run already in the checkpoint is restored instead of being
+    evaluated, and the optimization continues bit-for-bit from where it stopped.
+
+    Parameters
+    ----------
+    assembly : Assembly
+        e.g. an lcoe_se_assembly
+    checkpoint : Checkpoint
+    names : list(str)
+        blocks to checkpoint (defaults to every component run by the assembly's driver, including
+        those iterated by nested drivers such as the flexible blade fixed point iteration)
+    """
+
+    if names is None:
+        names = _workflow_blocks(assembly, assembly.driver)
+
+    for name in names:
+        if not hasattr(assembly, name):
+            continue
+        comp = getattr(assembly, name)
+        if find_wrapper(comp, CheckpointedExecute) is None:
+            wrap_execute(comp, CheckpointedExecute, name, checkpoint)
+
+
+def disable_checkpoint(assembly, names=None):
+    """restore the normal execute of the checkpointed blocks"""
+
+    if names is None:
+        names = _workflow_blocks(assembly, assembly.driver)
+
+    for name in names:
+        if hasattr(assembly, name):
+            unwrap_execute(getattr(assembly, name), CheckpointedExecute)
+
+
+if __name__ == '__main__':
+
+    import tempfile
+    from wisdem.lcoe.lcoe_doe import run_doe, full_factorial
+
+    filename = os.path.join(tempfile.gettempdir(), 'wisdem_doe.checkpoint')
+    cases = full_factorial(hub_height=[80.0, 90.0, 100.0], fixed_charge_rate=[0.095, 0.118])
+
+    # rerunning this script after an interruption only runs the cases not yet finished
+    tt = time.time()
+    results = run_doe(cases, builder_kwargs={'with_new_nacelle': True}, checkpoint_file=filename)
+    print '{0} cases in {1:.1f} s (checkpoint {2})'.format(len(results['coe']), time.time() - tt, filename)
+
+    tt = time.time()
+    resumed = run_doe(cases, builder_kwargs={'with_new_nacelle': True}, checkpoint_file=filename)
+    print 'resumed in {0:.2f} s, identical: {1}'.format(time.time() - tt, (resumed['coe'] == results['coe']).all())
@@ -101,6 +101,7 @@ class lcoe_csm_assembly(Assembly):
         # rotor
         self.connect('rotor_diameter', ['aep_a.rotor_diameter', 'tcc_a.rotor_diameter', 'bos_a.rotor_diameter'])
         self.connect('max_tip_speed', ['aep_a.max_tip_speed'])
+        self.connect('max_power_coefficient','aep_a.max_power_coefficient')
         self.connect('opt_tsr','aep_a.opt_tsr')
         self.connect('cut_in_wind_speed','aep_a.cut_in_wind_speed')
         self.connect('cut_out_wind_speed','aep_a.cut_out_wind_speed')
@@ -159,9 +160,8 @@ class lcoe_csm_assembly(Assembly):
         self.connect('fin_a.lcoe','lcoe')
 
 
-def example():
-
-    lcoe = lcoe_csm_assembly()
+def set_example_csm_inputs(lcoe):
+    """populate an lcoe_csm_assembly with the NREL 5 MW reference turbine in a 500 MW offshore plant"""
 
     lcoe.machine_rating = 5000.0 # Float(units = 'kW', iotype='in', desc= 'rated machine power in kW')
     lcoe.rotor_diameter = 126.0 # Float(units = 'm', iotype='in', desc= 'rotor diameter of the machine')
@@ -210,6 +210,12 @@ def example():
     lcoe.construction_time = 1.0 #Float(1.0, iotype = 'in', desc = 'number of years to complete project construction')
     lcoe.project_lifetime = 20.0 #Float(20.0, iotype = 'in', desc = 'project lifetime for LCOE calculation')
 
+
+def example():
+
+    lcoe = lcoe_csm_assembly()
+    set_example_csm_inputs(lcoe)
+
     lcoe.run()
 
     print "Cost of Energy results for a 500 MW offshore wind farm using the NREL 5 MW reference turbine"
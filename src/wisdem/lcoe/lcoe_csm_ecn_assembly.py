@@ -18,6 +18,7 @@ from fusedwind.interface import implement_base
 from turbine_costsse.nrel_csm_tcc.nrel_csm_tcc import tcc_csm_assembly
 from plant_costsse.nrel_csm_bos.nrel_csm_bos import bos_csm_assembly
 from plant_costsse.ecn_offshore_opex.ecn_offshore_opex  import opex_ecn_assembly
+from wisdem.lcoe.lcoe_ecn_opex import opex_ecn_native
 from plant_financese.nrel_csm_fin.nrel_csm_fin import fin_csm_assembly
 from plant_energyse.nrel_csm_aep.nrel_csm_aep import aep_csm_assembly
 
@@ -87,9 +88,11 @@ class lcoe_csm_ecn_assembly(Assembly):
     #Finance outputs
     lcoe = Float(iotype='out', desc='_cost of energy - unlevelized')  
 
-    def __init__(self, ssfile_1):
+    def __init__(self, ssfile_1, native=False, cells=None):
 
         self.ssfile_1 = ssfile_1
+        self.native = native # evaluate the ECN workbook in process rather than through Excel
+        self.cells = cells # workbook input and output cells, unless defined names (native only, see lcoe_ecn_opex.ECNOpexModel)
     
         super(lcoe_csm_ecn_assembly, self).__init__()
 
@@ -101,7 +104,12 @@ class lcoe_csm_ecn_assembly(Assembly):
         
         self.replace('tcc_a', tcc_csm_assembly())
         self.replace('bos_a', bos_csm_assembly())
-        self.replace('opex_a', opex_ecn_assembly(self.ssfile_1))
+        if self.native:
+            self.replace('opex_a', opex_ecn_native(self.ssfile_1, self.cells))
+        elif self.cells:
+            raise ValueError('ECN workbook cells can only be given to the native evaluator (native=True)')
+        else:
+            self.replace('opex_a', opex_ecn_assembly(self.ssfile_1))
         self.replace('aep_a', aep_csm_assembly())
         self.replace('fin_a', fin_csm_assembly())
 
@@ -110,6 +118,7 @@ class lcoe_csm_ecn_assembly(Assembly):
         # rotor
         self.connect('rotor_diameter', ['aep_a.rotor_diameter', 'tcc_a.rotor_diameter', 'bos_a.rotor_diameter'])
         self.connect('max_tip_speed', ['aep_a.max_tip_speed'])
+        self.connect('max_power_coefficient','aep_a.max_power_coefficient')
         self.connect('opt_tsr','aep_a.opt_tsr')
         self.connect('cut_in_wind_speed','aep_a.cut_in_wind_speed')
         self.connect('cut_out_wind_speed','aep_a.cut_out_wind_speed')
@@ -169,9 +178,9 @@ class lcoe_csm_ecn_assembly(Assembly):
         self.connect('fin_a.lcoe','lcoe')
 
 
-def example(ssfile_1):
+def set_example_csm_ecn_inputs(lcoe):
+    """populate an lcoe_csm_ecn_assembly with the NREL 5 MW reference turbine in a 500 MW offshore plant"""
 
-    lcoe = lcoe_csm_ecn_assembly(ssfile_1)
     lcoe.machine_rating = 5000.0 # Float(units = 'kW', iotype='in', desc= 'rated machine power in kW')
     lcoe.rotor_diameter = 126.0 # Float(units = 'm', iotype='in', desc= 'rotor diameter of the machine')
     lcoe.max_tip_speed = 80.0 # Float(units = 'm/s', iotype='in', desc= 'maximum allowable tip speed for the rotor')
@@ -219,6 +228,12 @@ def example(ssfile_1):
     lcoe.construction_time = 1.0 #Float(1.0, iotype = 'in', desc = 'number of years to complete project construction')
     lcoe.project_lifetime = 20.0 #Float(20.0, iotype = 'in', desc = 'project lifetime for LCOE calculation')
 
+
+def example(ssfile_1):
+
+    lcoe = lcoe_csm_ecn_assembly(ssfile_1)
+    set_example_csm_ecn_inputs(lcoe)
+
     lcoe.run()   
 
     print "Cost of Energy results for a 500 MW offshore wind farm using the NREL 5 MW reference turbine"
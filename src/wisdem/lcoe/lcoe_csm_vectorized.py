@@ -0,0 +1,620 @@
+"""
+lcoe_csm_vectorized.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+from math import pi, gamma
+from collections import OrderedDict
+
+import numpy as np
+
+from commonse.utilities import smooth_abs
+from commonse.csmPPI import PPI
+
+
+# inputs of lcoe_csm_assembly other than machine_rating, rotor_diameter, max_tip_speed, hub_height
+# and sea_depth, with the assembly defaults
+CSM_DEFAULTS = OrderedDict([
+    ('drivetrain_design', 'geared'),
+    ('altitude', 0.0),
+    ('turbine_number', 100),
+    ('year', 2009),
+    ('month', 12),
+    ('max_power_coefficient', 0.488),
+    ('opt_tsr', 7.525),
+    ('cut_in_wind_speed', 3.0),
+    ('cut_out_wind_speed', 25.0),
+    ('shear_exponent', 0.1),
+    ('wind_speed_50m', 8.35),
+    ('weibull_k', 2.1),
+    ('soiling_losses', 0.0),
+    ('array_losses', 0.06),
+    ('availability', 0.94287630736),
+    ('thrust_coefficient', 0.50),
+    ('blade_number', 3),
+    ('offshore', True),
+    ('advanced_blade', False),
+    ('crane', True),
+    ('advanced_bedplate', 0),
+    ('advanced_tower', False),
+    ('fixed_charge_rate', 0.12),
+    ('construction_finance_rate', 0.0),
+    ('tax_rate', 0.4),
+    ('discount_rate', 0.07),
+    ('construction_time', 1.0),
+    ('project_lifetime', 20.0),
+])
+
+CSM_REQUIRED = ('machine_rating', 'rotor_diameter', 'max_tip_speed', 'hub_height', 'sea_depth')
+
+DRIVETRAIN_DESIGNS = ('geared', 'single_stage', 'multi_drive', 'pm_direct_drive')
+
+BOS_BREAKDOWN = ('development_costs', 'preparation_and_staging_costs', 'transportation_costs',
+                 'foundation_and_substructure_costs', 'electrical_costs', 'assembly_and_installation_costs',
+                 'soft_costs', 'other_costs')
+
+OPEX_BREAKDOWN = ('preventative_opex', 'corrective_opex', 'lease_opex', 'other_opex')
+
+# outputs that have the same name (path) in lcoe_csm_assembly
+VALIDATED_OUTPUTS = ('coe', 'lcoe', 'net_aep', 'gross_aep', 'turbine_cost', 'turbine_mass', 'bos_costs',
+                     'avg_annual_opex', 'rated_wind_speed', 'rated_rotor_speed', 'rotor_thrust', 'rotor_torque') \
+    + tuple('bos_breakdown.' + name for name in BOS_BREAKDOWN) \
+    + tuple('opex_breakdown.' + name for name in OPEX_BREAKDOWN)
+
+# wind speed bins of the CSM power curve
+WIND_CURVE = 0.25*np.arange(161)
+
+# drivetrain loss coefficients (constant, linear, quadratic) in the order of DRIVETRAIN_DESIGNS
+_DRIVETRAIN_LOSSES = np.array([[0.01289, 0.08510, 0.0],
+                               [0.01331, 0.03655, 0.06107],
+                               [0.01547, 0.04463, 0.05790],
+                               [0.01007, 0.02000, 0.06899]])
+
+
+# --- PPI cost escalators ---
+
+_ppi = {'ppi': None, 'values': {}}
+
+
+def escalator(code, year, month, ref_yr=2002, ref_mon=9):
+    """PPI cost escalator code from (ref_yr, ref_mon) to (year, month)
+
+    year and month may be arrays; each distinct date is computed once per process.
+    """
+
+    year, month = np.broadcast_arrays(np.asarray(year, dtype=int), np.asarray(month, dtype=int))
+    dates, inverse = np.unique((100*year + month).ravel(), return_inverse=True)
+
+    values = _ppi['values']
+    for date in dates:
+        key = (code, date, ref_yr, ref_mon)
+        if key not in values:
+            curr_yr, curr_mon = int(date) // 100, int(date) % 100
+            if _ppi['ppi'] is None:
+                _ppi['ppi'] = PPI(ref_yr, ref_mon, curr_yr, curr_mon)
+            ppi = _ppi['ppi']
+            ppi.ref_yr, ppi.ref_mon, ppi.curr_yr, ppi.curr_mon = ref_yr, ref_mon, curr_yr, curr_mon
+            values[key] = ppi.compute(code)
+
+    esc = np.array([values[(code, date, ref_yr, ref_mon)] for date in dates])
+
+    return esc[inverse].reshape(year.shape)
+
+
+def _smooth_min(y, ymin, pct_offset=0.01):
+    """commonse.utilities.smooth_min without the derivatives (which are evaluated point by point)"""
+
+    y1 = (1 - pct_offset)*ymin
+    y2 = (1 + pct_offset)*ymin
+    h = y2 - y1
+
+    # cubic from (y1, y1) with slope 1 to (y2, ymin) with slope 0
+    t = (y - y1)/h
+    t2 = t*t
+    t3 = t2*t
+    spline = (2*t3 - 3*t2 + 1)*y1 + (t3 - 2*t2 + t)*h + (3*t2 - 2*t3)*ymin
+
+    return np.where(y <= y1, y, np.where(y >= y2, ymin, spline))
+
+
+# --- cost and scaling model ---
+# each function takes a dict of equally sized 1D input arrays
+
+def _aep(x, power_curve=False, max_efficiency=0.902):
+    """aerodynamics, drivetrain losses and annual energy production"""
+
+    rating = x['machine_rating']
+    D = x['rotor_diameter']
+    cp = x['max_power_coefficient']
+    tsr = x['opt_tsr']
+
+    # air density at hub height
+    ssl_pa = 101300.0
+    gas_const = 287.15
+    gravity = 9.80665
+    lapse_rate = 0.0065
+    ssl_temp = 288.15
+    z = x['altitude'] + x['hub_height']
+    rho = ssl_pa*(1 - lapse_rate*z/ssl_temp)**(gravity/(lapse_rate*gas_const)) / (gas_const*(ssl_temp - lapse_rate*z))
+
+    rated_hub_power = rating/max_efficiency
+    omegaM = x['max_tip_speed']/(D/2.0)
+    omega0 = omegaM/(1 + 0.05)
+    Tm = rated_hub_power*1000/omegaM
+    rated_rpm = (30.0/pi)*omegaM
+
+    # variable-speed torque constant and intersection of regions 2 and 2.5
+    kTorque = rho*pi*D**5*cp/(64*tsr**3)
+    b = -Tm/(omegaM - omega0)
+    c = Tm*omega0/(omegaM - omega0)
+    disc = b**2 - 4*kTorque*c
+    omegaTflag = disc > 0
+    omegaT = -(b/(2*kTorque)) - np.sqrt(np.where(omegaTflag, disc, 0.0))/(2*kTorque)
+    windOmegaT = np.where(omegaTflag, omegaT*D/(2*tsr), rated_rpm)
+    pwrOmegaT = np.where(omegaTflag, kTorque*omegaT**3/1000, rating)
+
+    d = rho*pi*D**2*0.25*cp
+    rated_wind_speed = 0.33*(2.0*rated_hub_power*1000.0/d)**(1.0/3.0) \
+        + 0.67*((rated_hub_power - pwrOmegaT)*1000.0/(1.5*d*windOmegaT**2) + windOmegaT)
+
+    # idealized power curve, capped at rated power
+    W = WIND_CURVE[np.newaxis, :]
+    region2 = (kTorque*(tsr/(D/2.0))**3/1000.0)[:, np.newaxis]*(WIND_CURVE**3)[np.newaxis, :]
+    region25 = ((rated_hub_power - pwrOmegaT)/(rated_wind_speed - windOmegaT))[:, np.newaxis] \
+        * (W - windOmegaT[:, np.newaxis]) + pwrOmegaT[:, np.newaxis]
+    power = np.where(omegaTflag[:, np.newaxis] & (W > windOmegaT[:, np.newaxis]), region25, region2)
+    power[(W >= x['cut_out_wind_speed'][:, np.newaxis]) | (W <= x['cut_in_wind_speed'][:, np.newaxis])] = 0.0
+    power = np.minimum(power, rating[:, np.newaxis])
+
+    # drivetrain losses
+    losses = _DRIVETRAIN_LOSSES[x['drivetrain_design']]
+    Pbar, _ = smooth_abs(power/rating[:, np.newaxis], dx=0.01)
+    Pbar = _smooth_min(Pbar, 1.0, pct_offset=0.01)
+    power *= 1.0 - (losses[:, 0:1]/Pbar + losses[:, 1:2] + losses[:, 2:3]*Pbar)
+
+    # energy production for a Weibull distribution at hub height
+    K = x['weibull_k']
+    unique_k, inverse = np.unique(K, return_inverse=True)
+    L = (x['hub_height']/50.0)**x['shear_exponent']*x['wind_speed_50m'] \
+        / np.array([gamma(1.0 + 1.0/k) for k in unique_k])[inverse]
+    Kc = K[:, np.newaxis]
+    Lc = L[:, np.newaxis]
+    # the first bin (0 m/s) never produces power
+    z = W[:, 1:]/Lc
+    zk = np.exp(Kc*np.log(z))
+    pdf = (Kc/Lc)*(zk/z)*np.exp(-zk)
+    turbine_energy = np.sum(power[:, 1:]*pdf, axis=1)
+
+    out = OrderedDict()
+    out['gross_aep'] = turbine_energy*8760.0*x['turbine_number']*(WIND_CURVE[1] - WIND_CURVE[0])
+    out['net_aep'] = out['gross_aep']*(1.0 - x['soiling_losses'])*(1.0 - x['array_losses'])*x['availability']
+    out['rated_wind_speed'] = rated_wind_speed
+    out['rated_rotor_speed'] = rated_rpm
+    out['rotor_torque'] = rated_hub_power/(rated_rpm*(pi/30.0))*1000.0
+    out['rotor_thrust'] = rho*x['thrust_coefficient']*pi*D**2*rated_wind_speed**2/8.0
+    out['max_efficiency'] = np.zeros_like(rating) + max_efficiency
+    if power_curve:
+        out['power_curve'] = power
+
+    return out
+
+
+def _tcc(x, rotor_thrust, rotor_torque):
+    """turbine component masses and capital costs"""
+
+    D = x['rotor_diameter']
+    R = D/2.0
+    rating = x['machine_rating']
+    B = x['blade_number']
+    year = x['year']
+    month = x['month']
+    dd = x['drivetrain_design']
+
+    def esc(code, ref_yr=2002):
+        return escalator(code, year, month, ref_yr, 9)
+
+    # blades
+    adv = x['advanced_blade']
+    blade_mass = np.where(adv, 0.4948*R**2.5300, 0.1452*R**2.9158)
+    ppi_mat = np.where(adv, esc('IPPI_BLA', 2003), esc('IPPI_BLD'))
+    intR3 = np.where(adv, -21051.045983, -955.24267)
+    blade_cost = ((0.4019376*R**3.0 + intR3)*ppi_mat + 2.7445*R**2.5025*esc('IPPI_BLL'))/(1.0 - 0.28)
+
+    # hub system
+    pitch_system_mass = (0.1295*blade_mass*B + 491.31)*(1 + 0.328) + 555.0
+    hub_mass = 0.95402537*blade_mass + 5680.272238
+    spinner_mass = 18.5*D - 520.5
+    hub_system_mass = hub_mass + pitch_system_mass + spinner_mass
+
+    bearingCost = 0.2106*D**2.6576
+    hub_system_cost = esc('IPPI_PMB')*(bearingCost + bearingCost*1.28) + 4.25*hub_mass*esc('IPPI_HUB') \
+        + esc('IPPI_NAC')*5.57*spinner_mass
+
+    rotor_mass = blade_mass*B + hub_system_mass
+    rotor_cost = blade_cost*B + hub_system_cost
+
+    # nacelle: low speed shaft
+    lenShaft = 0.03*D
+    bendMom = 1.25*9.81*rotor_mass*lenShaft/5
+    hFact = 0.1
+    outDiam = ((32.0/pi)*3.25/(1 - hFact**4)
+               * np.sqrt((rotor_torque*3.0/371000000.0)**2 + (bendMom/71070000)**2))**(1.0/3.0)
+    lss_mass = 1.25*(pi/4)*(outDiam**2)*(1 - hFact**2)*lenShaft*7860
+    lss_cost = 0.0998*D**2.8873*esc('IPPI_LSS')
+
+    # gearbox
+    gearbox_mass = np.array([65.601, 81.63967335, 129.1702924, 0.0])[dd] \
+        * (rotor_torque/1000)**np.array([0.759, 0.7738, 0.7738, 0.0])[dd]
+    gearbox_cost = np.array([16.45, 74.101, 15.25697015, 0.0])[dd] \
+        * rating**np.array([1.2491, 1.002, 1.2491, 0.0])[dd]*esc('IPPI_GRB')
+
+    # generator
+    generator_mass = np.where(dd < 3, np.array([6.4737, 10.50972, 5.343902, 0.0])[dd]*rating**0.9223,
+                              37.68400*rotor_torque)
+    generator_cost = np.array([65.000, 54.72533, 48.02963, 219.3333])[dd]*rating*esc('IPPI_GEN')
+
+    # bearings, brakes, yaw, hydraulics, cover
+    bearingMass = 0.00012266667*D**3.5 - 0.00030360*D**2.5
+    bearings_mass = 2*bearingMass
+    bearings_cost = 2*bearingMass*17.6*esc('IPPI_BRN')
+    mechBrakeCost2002 = 1.9894*rating - 0.1141
+    brakes_mass = 0.10*mechBrakeCost2002
+    brakes_cost = mechBrakeCost2002*esc('IPPI_BRK')
+    yaw_mass = 1.6*0.0009*D**3.314
+    yaw_cost = 2*0.0339*D**2.9637*esc('IPPI_YAW')
+    hvac_mass = 0.08*rating
+    hvac_cost = 12.0*rating*esc('IPPI_HYD')
+    nacelleCovCost2002 = 11.537*rating + 3849.7
+    cover_mass = 0.111111*nacelleCovCost2002
+    cover_cost = nacelleCovCost2002*esc('IPPI_NAC')
+    vselectronics_cost = 79.32*rating*esc('IPPI_VSE')
+    cabling_cost = 40.0*rating*esc('IPPI_ELC')
+    controls_cost = np.where(x['offshore'], 55900.0, 35000.0)*esc('IPPI_CTL')
+
+    # main frame
+    BedplateWeightFac = np.where(x['advanced_bedplate'] == 0, 2.86,
+                                 np.where(x['advanced_bedplate'] == 1, 2.40, 0.71))
+    TowerTopDiam = (12.29*D + 2648)/1000
+    BedplateLength = 1.5874*0.052*D
+    TotalMass = BedplateWeightFac*(0.00368*rotor_torque + 0.00158*rotor_thrust*TowerTopDiam
+                                   + 0.015*rotor_mass*TowerTopDiam + 100*0.5*BedplateLength**2)
+    bedplate_mass = np.where((dd == 0) | (dd == 3), TotalMass,
+                             np.array([22448, 1.29490, 1.72080, 22448])[dd]*D**np.array([0, 1.9525, 1.9525, 0])[dd])
+    NacellePlatformsMass = 0.125*bedplate_mass
+    crane_mass = np.where(x['crane'], 3000.0, 0.0)
+    crane_cost = np.where(x['crane'], 12000.0, 0.0)
+    mainframe_mass = bedplate_mass + NacellePlatformsMass + crane_mass
+    MainFrameCost2002 = np.array([9.4885, 303.96, 17.923, 627.28])[dd]*D**np.array([1.9525, 1.0669, 1.6716, 0.8500])[dd]
+    mainframe_cost = (1.7*MainFrameCost2002 + 8.7*NacellePlatformsMass + crane_cost)*esc('IPPI_MFM')
+
+    nacelle_mass = lss_mass + bearings_mass + gearbox_mass + brakes_mass + generator_mass + yaw_mass \
+        + mainframe_mass + hvac_mass + cover_mass
+    nacelle_cost = lss_cost + bearings_cost + gearbox_cost + brakes_cost + generator_cost + vselectronics_cost \
+        + yaw_cost + mainframe_cost + cabling_cost + hvac_cost + cover_cost + controls_cost
+
+    # tower
+    adv = x['advanced_tower']
+    tower_mass = np.where(adv, 0.269380169, 0.397251147546925)*pi*R**2*x['hub_height'] \
+        + np.where(adv, 1779.328183, -1414.381881)
+    tower_cost = 1.5*tower_mass*esc('IPPI_TWR')
+
+    out = OrderedDict()
+    out['turbine_cost'] = (rotor_cost + nacelle_cost + tower_cost)*np.where(x['offshore'], 1.1, 1.0)
+    out['turbine_mass'] = rotor_mass + nacelle_mass + tower_mass
+    out['blade_cost'] = blade_cost
+    out['blade_mass'] = blade_mass
+    out['hub_system_cost'] = hub_system_cost
+    out['hub_system_mass'] = hub_system_mass
+    out['rotor_cost'] = rotor_cost
+    out['rotor_mass'] = rotor_mass
+    out['nacelle_cost'] = nacelle_cost
+    out['nacelle_mass'] = nacelle_mass
+    out['tower_cost'] = tower_cost
+    out['tower_mass'] = tower_mass
+
+    return out
+
+
+def _bos(x, turbine_cost):
+    """balance of station costs; NaN for sea depths of 60 m and more, which the CSM does not cover"""
+
+    rating = x['machine_rating']
+    D = x['rotor_diameter']
+    H = x['hub_height']
+    year = x['year']
+    month = x['month']
+    depth = x['sea_depth']
+
+    def esc(code, ref_yr, ref_mon=9):
+        return escalator(code, year, month, ref_yr, ref_mon)
+
+    land = depth == 0
+    shallow = (depth > 0) & (depth < 30)
+    transitional = (depth >= 30) & (depth < 60)
+
+    tFact = 0.00001581*rating**2 - 0.0375*rating + 54.7
+    zero = np.zeros_like(rating)
+
+    # land (2002 reference)
+    land_costs = OrderedDict([
+        ('foundation', 303.23*(H*(D*0.5)**2*pi)**0.4037*esc('IPPI_FND', 2002)),
+        ('transportation', rating*tFact*esc('IPPI_TPT', 2002)),
+        ('roads', rating*(2.17e-06*rating**2 - 0.0145*rating + 69.54)*esc('IPPI_RDC', 2002)),
+        ('port', zero),
+        ('installation', 1.965*(H*D)**1.1736*esc('IPPI_LAI', 2002)),
+        ('electrical', rating*(3.49e-06*rating**2 - 0.0221*rating + 109.7)*esc('IPPI_LEL', 2002)),
+        ('permits', (9.94e-04*rating**2 + 20.31*rating)*esc('IPPI_LPM', 2002, 3)),
+        ('pai', zero),
+        ('scour', zero),
+    ])
+
+    # offshore (2003 reference, transportation 2002)
+    pai = 60000.0*esc('IPPI_PAE', 2003) + zero
+    port = 20.0*rating*esc('IPPI_STP', 2003)
+    permits = 37.0*rating*esc('IPPI_OPM', 2003)
+    scour = 55.0*rating*esc('IPPI_STP', 2003)
+
+    shallow_costs = OrderedDict([
+        ('foundation', 300.0*rating*esc('IPPI_MPF', 2003)),
+        ('transportation', rating*tFact*esc('IPPI_TPT', 2002)),
+        ('roads', zero),
+        ('port', port),
+        ('installation', 100.0*rating*esc('IPPI_OAI', 2003)),
+        ('electrical', 260.0*rating*esc('IPPI_OEL', 2003)),
+        ('permits', permits),
+        ('pai', pai),
+        ('scour', scour),
+    ])
+
+    transitional_costs = OrderedDict([
+        ('foundation', 450.0*rating*esc('IPPI_OAI', 2003)),
+        ('transportation', 77.0*rating*esc('IPPI_TPT', 2002) + 25.0*rating*esc('IPPI_OAI', 2003)),
+        ('roads', zero),
+        ('port', port),
+        ('installation', (100.0 + 330.0)*rating*esc('IPPI_OAI', 2003)),
+        ('electrical', 290.0*rating*esc('IPPI_OEL', 2003)),
+        ('permits', permits),
+        ('pai', pai),
+        ('scour', scour),
+    ])
+
+    c = OrderedDict()
+    for name in land_costs:
+        c[name] = np.select([land, shallow, transitional],
+                            [land_costs[name], shallow_costs[name], transitional_costs[name]], np.nan)
+
+    bos = sum(c.values())
+    suretyBond = np.where(depth > 0.0, 0.03*(turbine_cost + bos), 0.0)
+
+    N = x['turbine_number']
+    out = OrderedDict()
+    out['bos_costs'] = N*(bos + suretyBond)
+    out['bos_breakdown.development_costs'] = N*c['permits']
+    out['bos_breakdown.preparation_and_staging_costs'] = N*(c['roads'] + c['port'])
+    out['bos_breakdown.transportation_costs'] = N*c['transportation']
+    out['bos_breakdown.foundation_and_substructure_costs'] = N*c['foundation']
+    out['bos_breakdown.electrical_costs'] = N*c['electrical']
+    out['bos_breakdown.assembly_and_installation_costs'] = N*c['installation']
+    out['bos_breakdown.soft_costs'] = zero
+    out['bos_breakdown.other_costs'] = N*(c['pai'] + c['scour'] + suretyBond)
+
+    return out
+
+
+def _opex(x, net_aep):
+    """operating expenditures"""
+
+    offshore = x['sea_depth'] != 0
+    year = x['year']
+    month = x['month']
+
+    out = OrderedDict()
+    out['opex_breakdown.preventative_opex'] = net_aep*np.where(
+        offshore, 0.0200*escalator('IPPI_OOM', year, month, 2003, 9), 0.0070*escalator('IPPI_LOM', year, month))
+    out['opex_breakdown.corrective_opex'] = x['machine_rating']*x['turbine_number']*np.where(
+        offshore, 17.00*escalator('IPPI_OLR', year, month, 2003, 9), 10.70*escalator('IPPI_LLR', year, month))
+    out['opex_breakdown.lease_opex'] = net_aep*0.00108*escalator('IPPI_LSE', year, month)
+    out['opex_breakdown.other_opex'] = np.zeros_like(net_aep)
+    out['avg_annual_opex'] = out['opex_breakdown.preventative_opex'] + out['opex_breakdown.corrective_opex'] \
+        + out['opex_breakdown.lease_opex']
+
+    return out
+
+
+def _fin(x, turbine_cost, bos_costs, avg_annual_opex, net_aep):
+    """cost of energy"""
+
+    N = x['turbine_number']
+    warrantyPremium = np.where(x['sea_depth'] > 0.0, (turbine_cost*N/1.10)*0.15, 0.0)
+    icc = turbine_cost*N + warrantyPremium + bos_costs
+
+    r = x['discount_rate']
+    amortFactor = (1 + 0.5*((1 + r)**x['construction_time'] - 1)) * (r/(1 - (1 + r)**(-1.0*x['project_lifetime'])))
+
+    out = OrderedDict()
+    out['coe'] = icc*x['fixed_charge_rate']/net_aep + avg_annual_opex*(1 - x['tax_rate'])/net_aep
+    out['lcoe'] = (icc*amortFactor + avg_annual_opex)/net_aep
+
+    return out
+
+
+def _evaluate(x, power_curve=False):
+
+    aep = _aep(x, power_curve)
+    tcc = _tcc(x, aep['rotor_thrust'], aep['rotor_torque'])
+    bos = _bos(x, tcc['turbine_cost'])
+    opex = _opex(x, aep['net_aep'])
+    fin = _fin(x, tcc['turbine_cost'], bos['bos_costs'], opex['avg_annual_opex'], aep['net_aep'])
+
+    out = OrderedDict()
+    for results in (fin, aep, tcc, bos, opex):
+        out.update(results)
+
+    return out
+
+
+def _drivetrain_index(drivetrain_design):
+
+    designs = np.asarray(drivetrain_design)
+    index = np.zeros(designs.shape, dtype=int)
+    known = np.zeros(designs.shape, dtype=bool)
+    for i, name in enumerate(DRIVETRAIN_DESIGNS):
+        match = designs == name
+        index[match] = i
+        known |= match
+
+    if not np.all(known):
+        raise ValueError('unknown drivetrain_design %r (expected one of %s)'
+                         % (designs[~known].ravel()[0], ', '.join(DRIVETRAIN_DESIGNS)))
+
+    return index
+
+
+def lcoe_csm_vectorized(machine_rating, rotor_diameter, max_tip_speed, hub_height, sea_depth,
+                        chunksize=20000, power_curve=False, **kwargs):
+    """NREL cost and scaling model (as in lcoe_csm_assembly) evaluated over arrays of designs
+
+    All inputs of lcoe_csm_assembly are accepted, as scalars or arrays that broadcast against
+    each other; inputs that are not given take the assembly defaults (CSM_DEFAULTS).
+
+    Parameters
+    ----------
+    machine_rating, rotor_diameter, max_tip_speed, hub_height, sea_depth : array_like
+        as in lcoe_csm_assembly
+    chunksize : int
+        number of designs evaluated at once (bounds the memory used by the power curves)
+    power_curve : bool
+        also return the power curve after drivetrain losses of every design, at the wind
+        speeds WIND_CURVE (adds an axis of length 161)
+    kwargs : array_like
+        other inputs of lcoe_csm_assembly, e.g. wind_speed_50m, weibull_k, turbine_number, year.
+        construction_finance_rate must be zero: the CSM finance model has no construction
+        financing term (fin_csm_assembly ignores it).
+
+    Returns
+    -------
+    results : OrderedDict
+        output name -> array of the broadcast shape.  Contains the outputs of the assembly
+        (coe, lcoe, net_aep, turbine_cost, bos_costs, avg_annual_opex, ... and the
+        'bos_breakdown.*' and 'opex_breakdown.*' entries) and the turbine cost breakdown
+        (blade_cost, hub_system_cost, rotor_cost, nacelle_cost, tower_cost and the matching
+        masses, before the offshore cost multiplier)
+    """
+
+    unknown = [name for name in kwargs if name not in CSM_DEFAULTS]
+    if unknown:
+        raise TypeError('unknown lcoe_csm_assembly input(s): %s' % ', '.join(sorted(unknown)))
+
+    if np.any(np.asarray(kwargs.get('construction_finance_rate', 0.0)) != 0.0):
+        raise ValueError('construction_finance_rate is not used by the CSM finance model and must be zero')
+
+    inputs = OrderedDict(CSM_DEFAULTS)
+    inputs.update(kwargs)
+    inputs.update(zip(CSM_REQUIRED, (machine_rating, rotor_diameter, max_tip_speed, hub_height, sea_depth)))
+    inputs['drivetrain_design'] = _drivetrain_index(inputs['drivetrain_design'])
+
+    names = list(inputs.keys())
+    arrays = np.broadcast_arrays(*[np.asarray(inputs[name]) for name in names])
+    shape = arrays[0].shape
+    flat = OrderedDict()
+    for name, a in zip(names, arrays):
+        flat[name] = a.ravel()
+        if name not in ('drivetrain_design', 'year', 'month', 'turbine_number', 'blade_number', 'advanced_bedplate',
+                        'offshore', 'advanced_blade', 'crane', 'advanced_tower'):
+            flat[name] = flat[name].astype(float)
+
+    n = flat['machine_rating'].size
+    results = OrderedDict()
+
+    for start in range(0, max(n, 1), chunksize):
+        x = dict((name, a[start:start+chunksize]) for name, a in flat.iteritems())
+        out = _evaluate(x, power_curve)
+        for name, values in out.iteritems():
+            if name not in results:
+                results[name] = np.empty((n,) + values.shape[1:])
+            results[name][start:start+chunksize] = values
+
+    for name, values in results.iteritems():
+        results[name] = values.reshape(shape + values.shape[1:])
+
+    return results
+
+
+def validate_against_assembly(samples, assembly=None, outputs=VALIDATED_OUTPUTS):
+    """largest relative difference between lcoe_csm_vectorized and lcoe_csm_assembly
+
+    Parameters
+    ----------
+    samples : dict
+        input name -> 1D array of designs (scalars are applied to every design); must include
+        machine_rating, rotor_diameter, max_tip_speed, hub_height and sea_depth
+    assembly : lcoe_csm_assembly
+        assembly to run the designs with (a new one if None)
+    outputs : list(str)
+        output paths to compare
+
+    Returns
+    -------
+    errors : OrderedDict
+        output -> max over the designs of |vectorized - assembly| / max(|assembly|, 1e-12)
+    """
+
+    from wisdem.lcoe.lcoe_csm_assembly import lcoe_csm_assembly
+
+    if assembly is None:
+        assembly = lcoe_csm_assembly()
+
+    inputs = OrderedDict(CSM_DEFAULTS)
+    inputs.update(samples)
+    names = list(inputs.keys())
+    arrays = [np.atleast_1d(a) for a in np.broadcast_arrays(*[np.asarray(inputs[name]) for name in names])]
+    columns = OrderedDict(zip(names, arrays))
+
+    vectorized = lcoe_csm_vectorized(**columns)
+
+    errors = OrderedDict((name, 0.0) for name in outputs)
+    for i in range(len(arrays[0])):
+        for name, a in columns.iteritems():
+            assembly.set(name, a[i].item())
+        assembly.run()
+
+        for name in outputs:
+            expected = float(assembly.get(name))
+            error = abs(vectorized[name][i] - expected)/max(abs(expected), 1e-12)
+            errors[name] = max(errors[name], error)
+
+    return errors
+
+
+def example():
+
+    import time
+
+    n = 1000000
+    np.random.seed(0)
+    designs = dict(machine_rating=np.random.uniform(1500.0, 7500.0, n),
+                   rotor_diameter=np.random.uniform(70.0, 160.0, n),
+                   max_tip_speed=80.0,
+                   hub_height=np.random.uniform(60.0, 120.0, n),
+                   sea_depth=np.random.uniform(0.0, 50.0, n),
+                   wind_speed_50m=np.random.uniform(6.0, 10.0, n),
+                   weibull_k=2.15)
+
+    tt = time.time()
+    results = lcoe_csm_vectorized(**designs)
+    print '{0} designs in {1:.1f} s'.format(n, time.time() - tt)
+    print 'COE 5th / 50th / 95th percentile: {0:.4f} / {1:.4f} / {2:.4f} USD/kWh'.format(
+        *np.percentile(results['coe'], [5, 50, 95]))
+
+    samples = dict((name, value[:20] if np.ndim(value) else value) for name, value in designs.iteritems())
+    errors = validate_against_assembly(samples)
+    print 'largest relative difference to lcoe_csm_assembly:'
+    for name, error in errors.iteritems():
+        print '{0:45s} {1:.2e}'.format(name, error)
+
+
+if __name__ == "__main__":
+
+    example()
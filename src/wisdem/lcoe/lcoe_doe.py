@@ -0,0 +1,367 @@
+"""
+lcoe_doe.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import inspect
+import itertools
+import multiprocessing
+
+import numpy as np
+
+from wisdem.lcoe.lcoe_se_assembly import create_example_se_assembly
+from wisdem.lcoe.lcoe_cache import ResultCache, enable_result_cache
+from wisdem.lcoe.lcoe_snapshot import snapshot_assembly
+from wisdem.lcoe.lcoe_store import ResultsStore, assembly_record
+from wisdem.lcoe.lcoe_checkpoint import Checkpoint, work_key
+
+
+# default set of outputs collected for every case
+DOE_OUTPUTS = ['coe', 'net_aep', 'turbine_cost', 'bos_costs', 'avg_annual_opex',
+               'rotor.mass_all_blades', 'hub.hub_system_mass', 'nacelle.nacelle_mass', 'tower.mass']
+
+
+def full_factorial(**levels):
+    """build a columnar case table from the full factorial combination of levels
+
+    Parameters
+    ----------
+    levels : dict
+        variable path (or builder argument) -> sequence of levels
+
+    Returns
+    -------
+    cases : dict
+        variable path -> list of values, one entry per case
+    """
+
+    names = sorted(levels.keys())
+    combinations = list(itertools.product(*[levels[name] for name in names]))
+
+    cases = {}
+    for i, name in enumerate(names):
+        cases[name] = [combo[i] for combo in combinations]
+
+    return cases
+
+
+def _builder_args(builder):
+    """names of the keyword arguments accepted by the assembly builder"""
+
+    return inspect.getargspec(builder).args
+
+
+def _split_cases(cases, builder):
+    """separate configuration columns (builder arguments) from input overrides"""
+
+    names = sorted(cases.keys())
+    ncases = len(cases[names[0]]) if names else 0
+    for name in names:
+        if len(cases[name]) != ncases:
+            raise ValueError('case column %s has %d entries, expected %d' % (name, len(cases[name]), ncases))
+
+    config_names = [name for name in names if name in _builder_args(builder)]
+    input_names = [name for name in names if name not in config_names]
+
+    tasks = []
+    for i in range(ncases):
+        config = tuple((name, cases[name][i]) for name in config_names)
+        overrides = [(name, cases[name][i]) for name in input_names]
+        tasks.append((i, config, overrides))
+
+    return tasks
+
+
+# --- worker process state ---
+# each worker holds its own pre-configured assemblies, one per distinct configuration.
+# Functions run through a WorkerPool reach them with worker_assembly and worker_outputs.
+
+_worker = {}
+
+
+def _init_worker(builder, builder_kwargs, outputs, cache=False, cache_directory=None, snapshot_directory=None,
+                 store_directory=None):
+
+    _worker['builder'] = builder
+    _worker['builder_kwargs'] = builder_kwargs
+    _worker['outputs'] = outputs
+    _worker['assemblies'] = {}
+    _worker['cache'] = ResultCache(directory=cache_directory) if cache else None
+    _worker['snapshot_directory'] = snapshot_directory
+    _worker['store'] = ResultsStore(store_directory, chunk_rows=1) if store_directory is not None else None
+
+
+def worker_assembly(config=()):
+    """assembly of this worker for a configuration (tuple of builder argument name, value pairs),
+    built (or restored from a snapshot) on first use and reused afterwards"""
+
+    assemblies = _worker['assemblies']
+    if config not in assemblies:
+        kwargs = dict(_worker['builder_kwargs'])
+        kwargs.update(dict(config))
+        if _worker['snapshot_directory'] is None:
+            assemblies[config] = _worker['builder'](**kwargs)
+        else:
+            assemblies[config] = snapshot_assembly(_worker['builder'], _worker['snapshot_directory'], **kwargs)
+        if _worker['cache'] is not None:
+            enable_result_cache(assemblies[config], _worker['cache'])
+
+    return assemblies[config]
+
+
+def worker_outputs():
+    """output paths requested from the workers of the current pool"""
+
+    return _worker['outputs']
+
+
+def run_case(task):
+    """run one case in a worker
+
+    Parameters
+    ----------
+    task : tuple
+        (index, configuration, list of (path, value) input overrides)
+
+    Returns
+    -------
+    index, values, error : int, list(array), str
+        the values of the outputs (empty when the worker writes to a store), or None and the
+        error message when the case failed
+    """
+
+    index, config, overrides = task
+
+    try:
+        assembly = worker_assembly(config)
+        for name, value in overrides:
+            assembly.set(name, value)
+        assembly.run()
+        if _worker['store'] is None:
+            values = [np.array(assembly.get(name), dtype=float) for name in _worker['outputs']]
+        else:
+            # numeric inputs and all outputs go to the store, nothing is sent back
+            record = assembly_record(assembly, _worker['outputs'])
+            record['case'] = index
+            for name, value in overrides:
+                if np.asarray(value).dtype.kind in 'biuf':
+                    record['input:' + name] = value
+            _worker['store'].append(record)
+            values = []
+    except Exception as e:
+        return index, None, '%s: %s' % (e.__class__.__name__, e)
+
+    return index, values, None
+
+
+class WorkerPool(object):
+    """pool of worker processes that each build the assemblies they run only once
+
+    Functions mapped over the pool must be module level; they get their assembly from
+    worker_assembly and the requested outputs from worker_outputs.
+
+    Parameters
+    ----------
+    builder : callable
+        module-level function returning a configured and populated assembly
+    builder_kwargs : dict
+        fixed keyword arguments for the builder
+    outputs : list(str)
+        output paths made available to the workers
+    processes : int
+        number of worker processes (defaults to the number of cores).  With 1 the tasks are
+        run serially in the calling process.
+    cache, cache_directory, snapshot_directory, store_directory :
+        as for run_doe
+    """
+
+    def __init__(self, builder=create_example_se_assembly, builder_kwargs=None, outputs=DOE_OUTPUTS,
+                 processes=None, cache=False, cache_directory=None, snapshot_directory=None, store_directory=None):
+
+        if builder_kwargs is None:
+            builder_kwargs = {}
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+        self.processes = processes
+
+        initargs = (builder, builder_kwargs, list(outputs), cache, cache_directory, snapshot_directory, store_directory)
+        if processes == 1:
+            _init_worker(*initargs)
+            self._pool = None
+        else:
+            self._pool = multiprocessing.Pool(processes, initializer=_init_worker, initargs=initargs)
+
+    def imap(self, function, tasks, chunksize=1):
+        """iterator over function(task) for all tasks, in completion order"""
+
+        if self._pool is None:
+            return itertools.imap(function, tasks)
+
+        return self._pool.imap_unordered(function, tasks, chunksize)
+
+    def close(self):
+
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, *args):
+
+        self.close()
+
+
+def run_doe(cases, builder=create_example_se_assembly, builder_kwargs=None, outputs=None,
+            processes=None, chunksize=None, cache=False, cache_directory=None, snapshot_directory=None,
+            store_directory=None, checkpoint_file=None, retry_failed=True):
+    """run a design of experiments over a table of input overrides using a pool of worker processes
+
+    Parameters
+    ----------
+    cases : dict
+        columnar case table: variable path relative to the assembly (e.g. 'hub_height',
+        'rotor.bladeLength') -> sequence of values.  Columns whose name matches an argument of
+        the builder (e.g. 'wind_class', 'sea_depth') select the assembly configuration instead.
+    builder : callable
+        module-level function returning a configured and populated assembly.  Each worker
+        calls it once per distinct configuration and then reuses the assembly for all its cases.
+    builder_kwargs : dict
+        additional fixed keyword arguments for the builder
+    outputs : list(str)
+        variable paths to collect for each case (defaults to DOE_OUTPUTS)
+    processes : int
+        number of worker processes (defaults to the number of cores).  With 1 the cases
+        are run serially in the calling process.
+    chunksize : int
+        number of cases handed to a worker at a time
+    cache : bool
+        memoize the turbine, cost and opex blocks in each worker (see lcoe_cache) so that
+        cases differing only in downstream inputs skip the unchanged upstream blocks
+    cache_directory : str
+        optional on-disk store shared by all workers when cache is True
+    snapshot_directory : str
+        if given, workers restore their assemblies from snapshots in this directory
+        (see lcoe_snapshot) instead of configuring them from scratch
+    store_directory : str
+        if given, every worker appends each finished case to a ResultsStore in this directory
+        (see lcoe_store) instead of returning its outputs: the 'case' index, the numeric input
+        overrides (as 'input:<path>') and the outputs, with VarTree outputs such as
+        'opex_breakdown' expanded.  Nothing is accumulated in memory.
+    checkpoint_file : str
+        if given, every finished case (its outputs, or its error) is recorded in this journal
+        (see lcoe_checkpoint) as it arrives.  Running the same sweep again with the same file
+        skips the recorded successful cases and returns their results bit-for-bit, so an
+        interrupted sweep resumes where it stopped; failed cases are run again unless
+        retry_failed is False.  The journal is tied to the builder, its fixed
+        arguments, the outputs and the case table; it cannot be reused for a different sweep.
+        With store_directory, a case that finished just before an interruption may be stored
+        twice (keep the last row of each 'case').
+    retry_failed : bool
+        when resuming from checkpoint_file, run the cases recorded as failed again (e.g. after
+        a transient error) rather than reporting their recorded errors
+
+    Returns
+    -------
+    results : dict
+        one array per output with the case index along the first axis (NaN for failed cases;
+        no output arrays when store_directory is given), plus 'success' (bool array) and
+        'errors' (dict of case index -> message)
+    """
+
+    if builder_kwargs is None:
+        builder_kwargs = {}
+    if outputs is None:
+        outputs = DOE_OUTPUTS
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+
+    tasks = _split_cases(cases, builder)
+    ncases = len(tasks)
+
+    checkpoint = None
+    if checkpoint_file is not None:
+        key = work_key(builder.__module__, builder.__name__, builder_kwargs, list(outputs), tasks,
+                       store_directory is not None)
+        checkpoint = Checkpoint(checkpoint_file, key)
+
+    # group cases by configuration so each worker builds as few assemblies as possible
+    tasks.sort(key=lambda task: task[1])
+
+    if chunksize is None:
+        chunksize = max(1, ncases // (4*processes))
+
+    results = {}
+    success = np.zeros(ncases, dtype=bool)
+    errors = {}
+
+    def collect(index, values, error):
+        if error is not None:
+            errors[index] = error
+            return
+        for name, value in zip(outputs, values):
+            if name not in results:
+                results[name] = np.nan*np.ones((ncases,) + value.shape)
+            results[name][index] = value
+        success[index] = True
+
+    if checkpoint is not None:
+        for index, (values, error) in checkpoint.cases.iteritems():
+            if error is None or not retry_failed:
+                collect(index, values, error)
+        tasks = [task for task in tasks if not (success[task[0]] or task[0] in errors)]
+
+    if tasks:
+        pool = WorkerPool(builder, builder_kwargs, outputs, processes, cache, cache_directory,
+                          snapshot_directory, store_directory)
+        case_results = pool.imap(run_case, tasks, chunksize)
+    else:
+        case_results = []
+        pool = None
+
+    try:
+        for index, values, error in case_results:
+            collect(index, values, error)
+            if checkpoint is not None:
+                checkpoint.record_case(index, values, error)
+    finally:
+        if pool is not None:
+            pool.close()
+        if checkpoint is not None:
+            checkpoint.close()
+
+    # outputs never produced (every case failed) are reported as scalars NaN
+    for name in outputs:
+        if name not in results and store_directory is None:
+            results[name] = np.nan*np.ones(ncases)
+
+    results['success'] = success
+    results['errors'] = errors
+
+    return results
+
+
+def example():
+
+    cases = full_factorial(hub_height=[80.0, 90.0, 100.0],
+                           wind_class=['I', 'III'],
+                           fixed_charge_rate=[0.095, 0.118])
+
+    results = run_doe(cases, builder_kwargs={'with_new_nacelle': True})
+
+    print 'case  hub_height  wind_class  fixed_charge_rate  coe (USD/kWh)'
+    for i in range(len(results['coe'])):
+        print '{0:4d}  {1:10.1f}  {2:>10s}  {3:17.3f}  {4:.4f}'.format(i, cases['hub_height'][i],
+            cases['wind_class'][i], cases['fixed_charge_rate'][i], results['coe'][i])
+    for index in sorted(results['errors']):
+        print 'case {0} failed: {1}'.format(index, results['errors'][index])
+
+
+if __name__ == '__main__':
+
+    example()
@@ -0,0 +1,730 @@
+"""
+lcoe_ecn_opex.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import re
+import math
+from collections import OrderedDict
+
+import numpy as np
+
+from openmdao.main.api import Component
+from openmdao.main.datatypes.api import Int, Float, Str, VarTree
+
+from fusedwind.plant_cost.fused_opex import OPEXVarTree
+
+from wisdem.lcoe.lcoe_ecn_workbook import cell_index, load_ecn_workbook
+
+
+# inputs and outputs of the ECN O&M workbook; their cells are given explicitly (see ECNOpexModel)
+# or found through defined names of the same name
+ECN_INPUTS = ('turbine_number', 'machine_rating', 'turbine_cost', 'project_lifetime')
+ECN_OUTPUTS = ('availability', 'preventative_opex', 'corrective_opex', 'lease_opex', 'other_opex')
+
+
+# --- formula parsing ---
+
+_TOKEN = re.compile(r'''\s*(?:
+    (?P<string>"(?:[^"]|"")*")|
+    (?P<func>[A-Za-z_][A-Za-z0-9_.]*)\(|
+    (?P<ref>(?:(?:'(?:[^']|'')+'|[A-Za-z_][A-Za-z0-9_.]*)!)?
+        \$?[A-Za-z]{1,3}\$?[0-9]+(?::\$?[A-Za-z]{1,3}\$?[0-9]+)?)(?![A-Za-z0-9_(!])|
+    (?P<number>(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?)|
+    (?P<bool>TRUE|FALSE)(?![A-Za-z0-9_(])|
+    (?P<name>[A-Za-z_\\][A-Za-z0-9_.]*)|
+    (?P<op><>|<=|>=|[-+*/^&%=<>(),]))''', re.VERBOSE)
+
+
+def tokenize(formula):
+    """list of (kind, text) tokens of a formula (without its leading '=')"""
+
+    tokens = []
+    position = 0
+    formula = formula.rstrip()
+    while position < len(formula):
+        match = _TOKEN.match(formula, position)
+        if match is None or match.end() == position:
+            raise ValueError('cannot parse formula %r at %r' % (formula, formula[position:]))
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        position = match.end()
+
+    return tokens
+
+
+def _split_reference(text, sheet):
+    """sheet and cell part of a (possibly sheet qualified) reference"""
+
+    if '!' in text:
+        sheet, text = text.rsplit('!', 1)
+        if sheet.startswith("'"):
+            sheet = sheet[1:-1].replace("''", "'")
+
+    return sheet, text
+
+
+class _Parser(object):
+    """recursive descent parser of Excel formulas into tuples
+
+    Nodes: ('number', x), ('string', s), ('cell', sheet, row, column),
+    ('range', sheet, row0, column0, row1, column1), ('name', name), ('negate', a),
+    ('percent', a), ('binary', operator, a, b), ('function', NAME, [arguments])
+    """
+
+    def __init__(self, formula, sheet):
+
+        self.tokens = tokenize(formula[1:] if formula.startswith('=') else formula)
+        self.sheet = sheet
+        self.position = 0
+
+    def parse(self):
+
+        node = self.comparison()
+        if self.position != len(self.tokens):
+            raise ValueError('unexpected %r in formula' % self.tokens[self.position][1])
+
+        return node
+
+    def peek(self):
+
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def take(self, *operators):
+
+        kind, text = self.peek()
+        if kind == 'op' and text in operators:
+            self.position += 1
+            return text
+
+        return None
+
+    def binary(self, operators, operand):
+
+        node = operand()
+        while True:
+            operator = self.take(*operators)
+            if operator is None:
+                return node
+            node = ('binary', operator, node, operand())
+
+    def comparison(self):
+
+        return self.binary(('=', '<>', '<', '>', '<=', '>='), self.concatenation)
+
+    def concatenation(self):
+
+        return self.binary(('&',), self.additive)
+
+    def additive(self):
+
+        return self.binary(('+', '-'), self.multiplicative)
+
+    def multiplicative(self):
+
+        return self.binary(('*', '/'), self.power)
+
+    def power(self):
+
+        return self.binary(('^',), self.unary)
+
+    def unary(self):
+
+        operator = self.take('-', '+')
+        if operator == '-':
+            return ('negate', self.unary())
+        if operator == '+':
+            return self.unary()
+
+        node = self.primary()
+        while self.take('%'):
+            node = ('percent', node)
+
+        return node
+
+    def primary(self):
+
+        kind, text = self.peek()
+        if kind is None:
+            raise ValueError('formula ends unexpectedly')
+        self.position += 1
+
+        if kind == 'number':
+            return ('number', float(text))
+        if kind == 'string':
+            return ('string', text[1:-1].replace('""', '"'))
+        if kind == 'bool':
+            return ('number', 1.0 if text == 'TRUE' else 0.0)
+        if kind == 'name':
+            return ('name', text)
+        if kind == 'ref':
+            sheet, text = _split_reference(text, self.sheet)
+            if ':' in text:
+                first, last = text.split(':')
+                return ('range', sheet) + cell_index(first) + cell_index(last)
+            return ('cell', sheet) + cell_index(text)
+        if kind == 'func':
+            arguments = []
+            if not self.take(')'):
+                while True:
+                    if self.peek() in (('op', ','), ('op', ')')):
+                        arguments.append(('number', 0.0))  # omitted argument
+                    else:
+                        arguments.append(self.comparison())
+                    if self.take(')'):
+                        break
+                    if not self.take(','):
+                        raise ValueError('expected , or ) in arguments of %s' % text)
+            return ('function', text.upper().replace('_XLFN.', ''), arguments)
+        if kind == 'op' and text == '(':
+            node = self.comparison()
+            if not self.take(')'):
+                raise ValueError('missing )')
+            return node
+
+        raise ValueError('unexpected %r in formula' % text)
+
+
+def parse_formula(formula, sheet=None):
+    """syntax tree of an Excel formula, with unqualified references on sheet"""
+
+    return _Parser(formula, sheet).parse()
+
+
+# --- evaluation ---
+
+class FormulaError(ValueError):
+    """a cell formula the native evaluator cannot evaluate (the message names the cell)"""
+
+
+class _Range(object):
+    """rectangular block of cells, evaluated lazily"""
+
+    def __init__(self, engine, sheet, r0, c0, r1, c1):
+
+        self.engine = engine
+        self.sheet = sheet
+        self.r0, self.c0, self.r1, self.c1 = r0, c0, r1, c1
+        self.shape = (r1 - r0 + 1, c1 - c0 + 1)
+
+    def cell(self, i, j):
+
+        return self.engine.cell(self.sheet, self.r0 + i, self.c0 + j)
+
+    def cells(self):
+
+        return [self.cell(i, j) for i in range(self.shape[0]) for j in range(self.shape[1])]
+
+    def vector(self):
+        """cells of a single row or column"""
+
+        if self.shape[0] == 1:
+            return [self.cell(0, j) for j in range(self.shape[1])]
+        if self.shape[1] == 1:
+            return [self.cell(i, 0) for i in range(self.shape[0])]
+
+        raise ValueError('a single row or column is required')
+
+
+def _number(value):
+    """numeric value of a cell or argument: empty is 0, text is an error (NaN)"""
+
+    if value is None:
+        return 0.0
+    if isinstance(value, basestring):
+        try:
+            return float(value)
+        except ValueError:
+            return np.nan
+
+    return value
+
+
+def _is_number(value):
+
+    return value is not None and not isinstance(value, basestring)
+
+
+def _numbers(arguments):
+    """numeric values of function arguments, skipping empty and text cells of ranges"""
+
+    values = []
+    for argument in arguments:
+        if isinstance(argument, _Range):
+            values.extend(value for value in argument.cells() if _is_number(value))
+        else:
+            values.append(_number(argument))
+
+    return values
+
+
+def _text(value):
+
+    if value is None:
+        return ''
+    if isinstance(value, basestring):
+        return value
+    if np.ndim(value) > 0:
+        raise ValueError('text of an array valued cell is not supported')
+    if float(value) == int(value):
+        return str(int(value))
+
+    return repr(float(value))
+
+
+def _compare(operator, a, b):
+
+    if isinstance(a, basestring) or isinstance(b, basestring):
+        if a is None:
+            a = ''
+        if b is None:
+            b = ''
+        if isinstance(a, basestring) and isinstance(b, basestring):
+            a, b = a.lower(), b.lower()
+        else:  # text sorts after every number
+            a, b = (1.0, 0.0) if isinstance(a, basestring) else (0.0, 1.0)
+    else:
+        a, b = _number(a), _number(b)
+
+    result = {'=': lambda: a == b, '<>': lambda: a != b, '<': lambda: a < b, '>': lambda: a > b,
+              '<=': lambda: a <= b, '>=': lambda: a >= b}[operator]()
+
+    return np.asarray(result, dtype=float) if np.ndim(result) > 0 else float(result)
+
+
+def _round(x, digits, rounding):
+    """Excel rounding of x to digits, away from zero for halves"""
+
+    scale = 10.0**np.floor(digits)
+
+    return np.sign(x)*rounding(np.abs(x)*scale)/scale
+
+
+def _lookup_keys(column, key, approximate):
+    """positions (or -1 where not found) of key (scalar or array) in column (list of constant cells)"""
+
+    if isinstance(key, basestring):
+        for i, value in enumerate(column):
+            if isinstance(value, basestring) and value.lower() == key.lower():
+                return i
+        return -1
+
+    if any(np.ndim(value) > 0 for value in column):
+        raise ValueError('lookup in a range that depends on the inputs is not supported')
+    values = np.array([value if _is_number(value) else np.nan for value in column], dtype=float)
+
+    if approximate == 0:
+        match = np.asarray(key, dtype=float)[..., np.newaxis] == values
+        return np.where(match.any(axis=-1), np.argmax(match, axis=-1), -1)
+    if approximate > 0:  # largest value <= key, values ascending
+        return np.searchsorted(values, key, side='right') - 1
+
+    # smallest value >= key, values descending
+    return np.searchsorted(-values, -np.asarray(key, dtype=float), side='right') - 1
+
+
+def _gather(values, index):
+    """values[index] for a list of cells and a scalar or array index (-1: not found)"""
+
+    index = np.asarray(index)
+    if index.ndim == 0:
+        return values[int(index)] if 0 <= index < len(values) else np.nan
+
+    n = len(index)
+    table = np.array([np.zeros(n) + _number(value) for value in values] + [np.nan*np.ones(n)])
+    index = np.where((index >= 0) & (index < len(values)), index, len(values))
+
+    return table[index, np.arange(n)]
+
+
+def _pmt(rate, nper, pv, fv=0.0, when=0.0):
+
+    factor = (1.0 + rate)**nper
+    payment = -(pv*factor + fv)*rate/((1.0 + rate*when)*(factor - 1.0))
+
+    return np.where(rate == 0, -(pv + fv)/nper, payment)
+
+
+_ELEMENTWISE = {
+    'ABS': np.abs, 'SQRT': np.sqrt, 'EXP': np.exp, 'LN': np.log, 'LOG10': np.log10, 'INT': np.floor,
+    'NOT': lambda x: (np.asarray(x) == 0).astype(float), 'PI': lambda: math.pi,
+    'POWER': np.power, 'MOD': lambda a, b: a - b*np.floor(a/b),
+    'LOG': lambda x, base=10.0: np.log(x)/np.log(base),
+    'ROUND': lambda x, digits=0.0: _round(x, digits, lambda y: np.floor(y + 0.5)),
+    'ROUNDUP': lambda x, digits=0.0: _round(x, digits, np.ceil),
+    'ROUNDDOWN': lambda x, digits=0.0: _round(x, digits, np.floor),
+    'CEILING': lambda x, significance=1.0: np.ceil(x/significance)*significance,
+    'FLOOR': lambda x, significance=1.0: np.floor(x/significance)*significance,
+    'PMT': _pmt,
+}
+
+
+class FormulaEngine(object):
+    """evaluates the formulas of a WorkbookTable with numpy arrays in the input cells
+
+    Input cells (set with set_inputs) may hold arrays, so one evaluation computes the workbook
+    for many cases at once.  Every cell is evaluated at most once per set of inputs, and
+    cells that do not depend on any input are evaluated once for the life of the engine.
+    Formula errors (#DIV/0!, #N/A, #NUM!) become NaN or inf, which IFERROR replaces.  Only
+    the worksheet functions handled in _function are supported; anything else raises
+    FormulaError naming the cell and the function.
+
+    Parameters
+    ----------
+    table : WorkbookTable
+        workbook values, formulas and defined names
+    """
+
+    def __init__(self, table):
+
+        self.table = table
+        self._trees = {}
+        self._constants = {}
+        self._inputs = {}
+        self._values = {}
+        self._active = set()
+        self._depends = []
+
+    def set_inputs(self, inputs):
+        """set the input cells: dict (sheet, row, column) -> scalar or array"""
+
+        self._inputs = dict(inputs)
+        self._values = {}
+
+    def _tree(self, key, formula):
+
+        if key not in self._trees:
+            self._trees[key] = parse_formula(formula, key[0] if len(key) == 3 else None)
+
+        return self._trees[key]
+
+    def cell(self, sheet, row, column):
+        """value of a cell: a float or array, text, or None for an empty cell"""
+
+        key = (sheet, row, column)
+        if key in self._inputs:
+            self._mark_dependent()
+            return self._inputs[key]
+        if key in self._values:
+            self._mark_dependent()
+            return self._values[key]
+        if key in self._constants:
+            return self._constants[key]
+
+        formula = self.table.formulas.get(sheet, {}).get((row, column))
+        if formula is None:
+            if (row, column) in self.table.text[sheet]:
+                return self.table.text[sheet][(row, column)]
+            numbers = self.table.numbers[sheet]
+            if row >= numbers.shape[0] or column >= numbers.shape[1] or np.isnan(numbers[row, column]):
+                return None
+            return float(numbers[row, column])
+
+        if key in self._active:
+            raise ValueError('circular reference through %s!R%dC%d' % (sheet, row + 1, column + 1))
+
+        self._active.add(key)
+        self._depends.append(False)
+        try:
+            value = self.evaluate(self._tree(key, formula))
+            if isinstance(value, _Range):
+                raise ValueError('a range is not a value')
+        except FormulaError:
+            raise
+        except ValueError as e:
+            raise FormulaError('%s!R%dC%d: %s' % (sheet, row + 1, column + 1, e))
+        finally:
+            self._active.discard(key)
+            dependent = self._depends.pop()
+
+        if dependent:
+            self._values[key] = value
+            self._mark_dependent()
+        else:
+            self._constants[key] = value
+
+        return value
+
+    def _mark_dependent(self):
+
+        if self._depends:
+            self._depends[-1] = True
+
+    def name(self, name):
+        """value of a defined name (a cell, range or formula)"""
+
+        definition = self.table.names.get(name)
+        if definition is None:
+            raise KeyError('workbook has no defined name %s' % name)
+
+        return self.evaluate(self._tree(('name', name), definition))
+
+    def evaluate(self, node):
+
+        kind = node[0]
+
+        if kind == 'number' or kind == 'string':
+            return node[1]
+        if kind == 'cell':
+            return self.cell(*node[1:])
+        if kind == 'range':
+            return _Range(self, *node[1:])
+        if kind == 'name':
+            return self.name(node[1])
+        if kind == 'negate':
+            return -_number(self.evaluate(node[1]))
+        if kind == 'percent':
+            return _number(self.evaluate(node[1]))/100.0
+        if kind == 'binary':
+            return self._binary(node[1], self.evaluate(node[2]), self.evaluate(node[3]))
+        if kind == 'function':
+            return self._function(node[1], node[2])
+
+        raise ValueError('unknown node %r' % (kind,))
+
+    def _binary(self, operator, a, b):
+
+        if operator == '&':
+            return _text(a) + _text(b)
+        if operator in ('=', '<>', '<', '>', '<=', '>='):
+            return _compare(operator, a, b)
+
+        a, b = _number(a), _number(b)
+        if operator == '+':
+            return a + b
+        if operator == '-':
+            return a - b
+        if operator == '*':
+            return a*b
+        if operator == '/':
+            return np.divide(a, b)
+
+        return np.power(a, b)
+
+    def _function(self, name, nodes):
+
+        if name == 'IF':
+            condition = _number(self.evaluate(nodes[0]))
+            branches = nodes[1:] + [('number', 0.0)]*(3 - len(nodes))
+            if np.ndim(condition) == 0:
+                return self.evaluate(branches[0] if condition != 0 else branches[1])
+            return np.where(condition != 0, _number(self.evaluate(branches[0])), _number(self.evaluate(branches[1])))
+
+        if name == 'IFERROR':
+            value = self.evaluate(nodes[0])
+            if not _is_number(value):
+                return value
+            alternative = _number(self.evaluate(nodes[1]))
+            if np.ndim(value) == 0:
+                return value if np.isfinite(value) else alternative
+            return np.where(np.isfinite(value), value, alternative)
+
+        arguments = [self.evaluate(node) for node in nodes]
+
+        if name in _ELEMENTWISE:
+            return _ELEMENTWISE[name](*[_number(argument) for argument in arguments])
+
+        if name == 'SUM':
+            return sum(_numbers(arguments), 0.0)
+        if name == 'PRODUCT':
+            return reduce(lambda a, b: a*b, _numbers(arguments), 1.0)
+        if name in ('MIN', 'MAX'):
+            values = _numbers(arguments)
+            if not values:
+                return 0.0
+            return reduce(np.minimum if name == 'MIN' else np.maximum, values)
+        if name == 'AVERAGE':
+            values = _numbers(arguments)
+            return sum(values, 0.0)/len(values) if values else np.nan
+        if name == 'COUNT':
+            return float(len([value for value in _numbers(arguments) if _is_number(value)]))
+        if name in ('AND', 'OR'):
+            values = [np.asarray(value) != 0 for value in _numbers(arguments)]
+            result = reduce(np.logical_and if name == 'AND' else np.logical_or, values)
+            return np.asarray(result, dtype=float) if np.ndim(result) > 0 else float(result)
+        if name == 'SUMPRODUCT':
+            total = 0.0
+            for values in zip(*[argument.cells() for argument in arguments]):
+                total = total + reduce(lambda a, b: a*b, [_number(value) if _is_number(value) else 0.0
+                                                          for value in values])
+            return total
+        if name == 'NPV':
+            rate = _number(arguments[0])
+            values = _numbers(arguments[1:])
+            return sum([value/(1.0 + rate)**(i + 1) for i, value in enumerate(values)], 0.0)
+
+        if name in ('VLOOKUP', 'HLOOKUP'):
+            key, block, offset = arguments[0], arguments[1], int(_number(arguments[2]))
+            approximate = _number(arguments[3]) if len(arguments) > 3 else 1.0
+            if name == 'VLOOKUP':
+                keys = [block.cell(i, 0) for i in range(block.shape[0])]
+                values = [block.cell(i, offset - 1) for i in range(block.shape[0])]
+            else:
+                keys = [block.cell(0, j) for j in range(block.shape[1])]
+                values = [block.cell(offset - 1, j) for j in range(block.shape[1])]
+            return _gather(values, _lookup_keys(keys, key, approximate))
+        if name == 'MATCH':
+            approximate = _number(arguments[2]) if len(arguments) > 2 else 1.0
+            index = _lookup_keys(arguments[1].vector(), arguments[0], approximate)
+            return np.where(np.asarray(index) >= 0, np.asarray(index) + 1.0, np.nan) \
+                if np.ndim(index) > 0 else (index + 1.0 if index >= 0 else np.nan)
+        if name == 'INDEX':
+            block = arguments[0]
+            first = np.asarray(_number(arguments[1])).astype(int) - 1
+            if len(arguments) > 2:
+                second = np.asarray(_number(arguments[2])).astype(int) - 1
+                values = block.cells()
+                return _gather(values, np.where((second >= 0) & (second < block.shape[1]),
+                                                first*block.shape[1] + second, -1))
+            return _gather(block.vector() if 1 in block.shape else [block.cell(i, 0) for i in range(block.shape[0])],
+                           first)
+
+        raise ValueError('worksheet function %s is not supported by the native evaluator' % name)
+
+
+# --- ECN O&M model ---
+
+class ECNOpexModel(object):
+    """the ECN O&M workbook evaluated in process, for many plants per call
+
+    The workbook's own formulas are evaluated (see FormulaEngine) with the inputs written into
+    the input cells, so no spreadsheet application is involved and the model runs on any
+    platform.  The parts of the workbook that do not depend on the inputs are evaluated once.
+    Macros (VBA) are not run: outputs must be computed by cell formulas.
+
+    Parameters
+    ----------
+    workbook : str or WorkbookTable
+        the ECN O&M workbook (.xlsx, since only those carry formulas), or its parsed table
+    cells : dict
+        location of the inputs and outputs (ECN_INPUTS and ECN_OUTPUTS): variable -> cell
+        ('Sheet!B3') or defined name.  Variables not given are looked up as defined names of
+        the same name; a ValueError is raised when the workbook has no such name, since the
+        cells differ between versions of the workbook and are never guessed.
+    """
+
+    def __init__(self, workbook, cells=None):
+
+        table = load_ecn_workbook(workbook) if isinstance(workbook, basestring) else workbook
+        if not any(table.formulas.values()):
+            raise ValueError('workbook has no formulas: the native evaluator needs the workbook saved as .xlsx')
+
+        self.engine = FormulaEngine(table)
+        self.cells = OrderedDict((name, name) for name in ECN_INPUTS + ECN_OUTPUTS)
+        if cells is not None:
+            self.cells.update(cells)
+
+        self._locations = OrderedDict((name, self._locate(table, name, reference))
+                                      for name, reference in self.cells.iteritems())
+
+    @staticmethod
+    def _locate(table, variable, reference):
+
+        if '!' not in reference:
+            if reference not in table.names:
+                raise ValueError('%s: workbook has no defined name %s, give its cell in cells' % (variable, reference))
+            reference = table.names[reference]
+
+        sheet, reference = _split_reference(reference.lstrip('='), None)
+        if sheet not in table.numbers:
+            raise ValueError('%s: workbook has no sheet %s' % (variable, sheet))
+
+        return (sheet,) + cell_index(reference)
+
+    def evaluate(self, turbine_number, machine_rating, turbine_cost, project_lifetime):
+        """availability and OPEX of one or many plants
+
+        Parameters
+        ----------
+        turbine_number, machine_rating (kW), turbine_cost (USD), project_lifetime (yr) : float or array
+            broadcast against each other
+
+        Returns
+        -------
+        results : OrderedDict
+            ECN_OUTPUTS and avg_annual_opex (their sum of the four OPEX items), each an array
+            of the broadcast input shape
+        """
+
+        inputs = np.broadcast_arrays(*[np.asarray(value, dtype=float) for value in
+                                       (turbine_number, machine_rating, turbine_cost, project_lifetime)])
+        self.engine.set_inputs((self._locations[name], value) for name, value in zip(ECN_INPUTS, inputs))
+
+        results = OrderedDict()
+        with np.errstate(all='ignore'):
+            for name in ECN_OUTPUTS:
+                results[name] = np.zeros(inputs[0].shape) + _number(self.engine.cell(*self._locations[name]))
+        results['avg_annual_opex'] = results['preventative_opex'] + results['corrective_opex'] \
+            + results['lease_opex'] + results['other_opex']
+
+        return results
+
+
+class opex_ecn_native(Component):
+    """drop-in replacement of opex_ecn_assembly that evaluates the ECN O&M workbook in process
+
+    cells gives the locations of the inputs and outputs, unless the workbook defines names for
+    them (see ECNOpexModel).
+    """
+
+    ssfile = Str(iotype='in', desc='location of the ECN O&M workbook (.xlsx)')
+    machine_rating = Float(iotype='in', units='kW', desc='rated machine power in kW')
+    turbine_number = Int(iotype='in', desc='total number of wind turbines at the plant')
+    turbine_cost = Float(iotype='in', units='USD', desc='turbine system capital costs')
+    project_lifetime = Float(iotype='in', desc='project lifetime for wind plant')
+
+    avg_annual_opex = Float(iotype='out', desc='average annual operating expenditures')
+    opex_breakdown = VarTree(OPEXVarTree(), iotype='out')
+    availability = Float(iotype='out', desc='average annual availability of wind turbines at plant')
+
+    def __init__(self, ssfile='', cells=None):
+
+        super(opex_ecn_native, self).__init__()
+        self.ssfile = ssfile
+        self.cells = cells
+        self._model = None
+        self._model_file = None
+
+    def execute(self):
+
+        if self._model is None or self._model_file != self.ssfile:
+            self._model = ECNOpexModel(self.ssfile, self.cells)
+            self._model_file = self.ssfile
+
+        results = self._model.evaluate(self.turbine_number, self.machine_rating, self.turbine_cost,
+                                       self.project_lifetime)
+
+        self.availability = float(results['availability'])
+        self.opex_breakdown.preventative_opex = float(results['preventative_opex'])
+        self.opex_breakdown.corrective_opex = float(results['corrective_opex'])
+        self.opex_breakdown.lease_opex = float(results['lease_opex'])
+        self.opex_breakdown.other_opex = float(results['other_opex'])
+        self.avg_annual_opex = float(results['avg_annual_opex'])
+
+
+def example(ssfile):
+
+    import time
+
+    model = ECNOpexModel(ssfile)
+
+    # a 500 MW plant of NREL 5 MW turbines, then the same plant over a range of turbine costs
+    results = model.evaluate(100, 5000.0, 5.9e6, 20.0)
+    print 'availability {0:.4f}, average annual OPEX ${1:.0f}'.format(results['availability'][()],
+                                                                      results['avg_annual_opex'][()])
+
+    turbine_cost = np.linspace(4.0e6, 8.0e6, 1000)
+    tt = time.time()
+    results = model.evaluate(100, 5000.0, turbine_cost, 20.0)
+    print '{0} plants in {1:.3f} s'.format(len(turbine_cost), time.time() - tt)
+    for i in range(0, len(turbine_cost), 250):
+        print '    turbine cost ${0:.2e}: OPEX ${1:.0f}'.format(turbine_cost[i], results['avg_annual_opex'][i])
+
+
+if __name__ == '__main__':
+
+    ssfile = 'C:/Models/ECN Model/ECN O&M Model.xlsx' # insert your path to the ECN Model here
+
+    example(ssfile)
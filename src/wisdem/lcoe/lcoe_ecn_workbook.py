@@ -0,0 +1,288 @@
+"""
+lcoe_ecn_workbook.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import os
+import re
+import json
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+
+
+# --- cell references ---
+
+def cell_index(reference):
+    """zero based (row, column) of an A1 style cell reference, e.g. 'C12' -> (11, 2)"""
+
+    match = re.match(r'^\$?([A-Za-z]+)\$?(\d+)$', reference.strip())
+    if match is None:
+        raise ValueError('invalid cell reference %r' % reference)
+
+    column = 0
+    for letter in match.group(1).upper():
+        column = 26*column + ord(letter) - ord('A') + 1
+
+    return int(match.group(2)) - 1, column - 1
+
+
+class WorkbookTable(object):
+    """values of every sheet of a workbook, held as arrays
+
+    Parameters
+    ----------
+    numbers : OrderedDict
+        sheet name -> 2D float array of the cell values (NaN for empty and text cells)
+    text : OrderedDict
+        sheet name -> dict of (row, column) -> text of the text cells
+    formulas : OrderedDict
+        sheet name -> dict of (row, column) -> formula (e.g. '=B3*C3') of the formula cells
+        (only read from .xlsx workbooks)
+    names : dict
+        defined name -> reference, e.g. 'Input!$B$3'
+    """
+
+    def __init__(self, numbers, text=None, formulas=None, names=None):
+
+        self.numbers = numbers
+        self.text = text if text is not None else OrderedDict((name, {}) for name in numbers)
+        self.formulas = formulas if formulas is not None else OrderedDict((name, {}) for name in numbers)
+        self.names = names if names is not None else {}
+
+    def sheet_names(self):
+
+        return list(self.numbers.keys())
+
+    def value(self, sheet, reference):
+        """value of one cell: a float, the text of a text cell, or None for an empty cell"""
+
+        row, column = cell_index(reference)
+        if (row, column) in self.text[sheet]:
+            return self.text[sheet][(row, column)]
+
+        numbers = self.numbers[sheet]
+        if row >= numbers.shape[0] or column >= numbers.shape[1] or np.isnan(numbers[row, column]):
+            return None
+
+        return float(numbers[row, column])
+
+    def range(self, sheet, reference):
+        """float array of a rectangular range, e.g. 'B2:D10' (NaN for empty and text cells)"""
+
+        first, last = reference.split(':')
+        r0, c0 = cell_index(first)
+        r1, c1 = cell_index(last)
+
+        values = np.nan*np.ones((r1 - r0 + 1, c1 - c0 + 1))
+        numbers = self.numbers[sheet]
+        rows = min(r1 + 1, numbers.shape[0]) - r0
+        columns = min(c1 + 1, numbers.shape[1]) - c0
+        if rows > 0 and columns > 0:
+            values[:rows, :columns] = numbers[r0:r0+rows, c0:c0+columns]
+
+        return values
+
+
+def read_workbook(filename):
+    """parse an Excel workbook (.xls with xlrd, .xlsx with openpyxl) into a WorkbookTable
+
+    The values are the ones last calculated by Excel; no formula is evaluated.  The formulas
+    themselves and the defined names are only available from .xlsx workbooks.
+    """
+
+    numbers = OrderedDict()
+    text = OrderedDict()
+    formulas = OrderedDict()
+    names = {}
+
+    if filename.lower().endswith(('.xlsx', '.xlsm')):
+        import openpyxl
+
+        book = openpyxl.load_workbook(filename, read_only=True, data_only=True)
+        for sheet in book.worksheets:
+            rows = [list(row) for row in sheet.iter_rows(values_only=True)]
+            numbers[sheet.title], text[sheet.title] = _sheet_arrays(rows)
+
+        book = openpyxl.load_workbook(filename, read_only=True, data_only=False)
+        for sheet in book.worksheets:
+            formulas[sheet.title] = {}
+            for r, row in enumerate(sheet.iter_rows(values_only=True)):
+                for c, value in enumerate(row):
+                    if isinstance(value, basestring) and value.startswith('='):
+                        formulas[sheet.title][(r, c)] = value
+
+        defined = book.defined_names
+        items = defined.items() if hasattr(defined, 'items') else [(d.name, d) for d in defined.definedName]
+        for name, definition in items:
+            names[name] = definition.attr_text
+
+    else:
+        import xlrd
+
+        book = xlrd.open_workbook(filename, on_demand=True)
+        try:
+            for i in range(book.nsheets):
+                sheet = book.sheet_by_index(i)
+                rows = [sheet.row_values(r) for r in range(sheet.nrows)]
+                numbers[sheet.name], text[sheet.name] = _sheet_arrays(rows)
+                book.unload_sheet(i)
+        finally:
+            book.release_resources()
+
+    return WorkbookTable(numbers, text, formulas, names)
+
+
+def _sheet_arrays(rows):
+
+    ncolumns = max([len(row) for row in rows] + [0])
+    numbers = np.nan*np.ones((len(rows), ncolumns))
+    text = {}
+
+    for r, row in enumerate(rows):
+        for c, value in enumerate(row):
+            if isinstance(value, bool):
+                numbers[r, c] = float(value)
+            elif isinstance(value, (int, long, float)):
+                numbers[r, c] = value
+            elif isinstance(value, basestring) and value != '':
+                text[(r, c)] = value
+
+    return numbers, text
+
+
+# --- binary sidecar ---
+
+def sidecar_directory(filename):
+
+    return os.path.abspath(filename) + '.npcache'
+
+
+def _signature(filename):
+
+    stat = os.stat(filename)
+
+    return [stat.st_mtime, stat.st_size]
+
+
+def export_sidecar(table, filename):
+    """write table next to the workbook as .npy arrays (memory mapped by load_ecn_workbook) plus a
+    JSON index recording the workbook's modification time and size"""
+
+    directory = sidecar_directory(filename)
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    sheets = []
+    for i, name in enumerate(table.sheet_names()):
+        array_file = '%d.npy' % i
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, np.ascontiguousarray(table.numbers[name]))
+        os.rename(tmp, os.path.join(directory, array_file))
+        text = [[r, c, value] for (r, c), value in sorted(table.text[name].iteritems())]
+        formulas = [[r, c, value] for (r, c), value in sorted(table.formulas.get(name, {}).iteritems())]
+        sheets.append(OrderedDict([('name', name), ('numbers', array_file), ('text', text), ('formulas', formulas)]))
+
+    # the index is written last, so a sidecar is only used once complete
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        json.dump({'source': _signature(filename), 'sheets': sheets, 'names': table.names}, f)
+    if os.name == 'nt' and os.path.exists(os.path.join(directory, 'index.json')):
+        os.remove(os.path.join(directory, 'index.json'))
+    os.rename(tmp, os.path.join(directory, 'index.json'))
+
+
+def load_sidecar(filename):
+    """table from the sidecar of filename, with memory mapped sheets, or None if there is no
+    sidecar or the workbook changed since it was written"""
+
+    index_file = os.path.join(sidecar_directory(filename), 'index.json')
+    if not os.path.exists(index_file):
+        return None
+
+    with open(index_file) as f:
+        index = json.load(f, object_pairs_hook=OrderedDict)
+    if index['source'] != _signature(filename):
+        return None
+
+    numbers = OrderedDict()
+    text = OrderedDict()
+    formulas = OrderedDict()
+    for sheet in index['sheets']:
+        numbers[sheet['name']] = np.load(os.path.join(sidecar_directory(filename), sheet['numbers']), mmap_mode='r')
+        text[sheet['name']] = dict(((r, c), value) for r, c, value in sheet['text'])
+        formulas[sheet['name']] = dict(((r, c), value) for r, c, value in sheet.get('formulas', []))
+
+    return WorkbookTable(numbers, text, formulas, index.get('names', {}))
+
+
+# --- cached loading ---
+
+_workbooks = {}
+
+
+def load_ecn_workbook(filename, sidecar=False):
+    """contents of the ECN O&M workbook, parsed once per process
+
+    Tables are kept in memory keyed on the path and modification time of the workbook, so
+    every assembly built from the same file shares one parse, and an edited workbook is
+    read again.  A fresh binary sidecar (see export_sidecar) is memory mapped instead of
+    parsing the workbook.
+
+    Parameters
+    ----------
+    filename : str
+        workbook path
+    sidecar : bool
+        write a sidecar after parsing the workbook, for later processes
+
+    Returns
+    -------
+    table : WorkbookTable
+    """
+
+    key = (os.path.abspath(filename), os.path.getmtime(filename))
+    if key in _workbooks:
+        return _workbooks[key]
+
+    table = load_sidecar(filename)
+    if table is None:
+        table = read_workbook(filename)
+        if sidecar:
+            export_sidecar(table, filename)
+
+    # drop tables of older versions of the same workbook
+    for stale in [k for k in _workbooks if k[0] == key[0]]:
+        del _workbooks[stale]
+    _workbooks[key] = table
+
+    return table
+
+
+def clear_workbook_cache():
+
+    _workbooks.clear()
+
+
+if __name__ == '__main__':
+
+    import sys
+    import time
+
+    filename = sys.argv[1] if len(sys.argv) > 1 else 'C:/Models/ECN Model/ECN O&M Model.xls'
+
+    tt = time.time()
+    table = read_workbook(filename)
+    print 'parsed {0} sheets in {1:.2f} s'.format(len(table.sheet_names()), time.time() - tt)
+    export_sidecar(table, filename)
+
+    clear_workbook_cache()
+    tt = time.time()
+    table = load_ecn_workbook(filename)
+    print 'loaded from sidecar in {0:.4f} s'.format(time.time() - tt)
+    for name in table.sheet_names():
+        print '    {0}: {1} x {2} cells'.format(name, *table.numbers[name].shape)
@@ -0,0 +1,262 @@
+"""
+lcoe_fd.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import warnings
+from collections import OrderedDict
+
+import numpy as np
+
+from wisdem.lcoe.lcoe_se_assembly import create_example_se_assembly
+from wisdem.lcoe.lcoe_doe import WorkerPool, worker_assembly, worker_outputs
+from wisdem.lcoe.lcoe_gradients import COE_DESIGN_VARS
+from wisdem.lcoe.lcoe_checkpoint import work_key
+
+
+FD_FORMS = ('forward', 'central', 'complex')
+
+
+def _run_point(task):
+    """run one (possibly perturbed) design in a worker; values are the full design vector"""
+
+    key, values, perturbation = task
+
+    try:
+        assembly = worker_assembly()
+
+        with warnings.catch_warnings():
+            # a complex step that is silently truncated to real would give a zero derivative
+            warnings.simplefilter('error', np.ComplexWarning)
+
+            for name, value in values:
+                if perturbation is not None and perturbation[0] == name:
+                    index, delta = perturbation[1:]
+                    value = np.array(value, dtype=type(delta))
+                    value.flat[index] += delta
+                assembly.set(name, value if np.ndim(value) else value.item())
+
+            assembly.run()
+
+            dtype = complex if perturbation is not None and isinstance(perturbation[2], complex) else float
+            outputs = [np.array(assembly.get(name), dtype=dtype) for name in worker_outputs()]
+
+    except Exception as e:
+        return key, None, '%s: %s' % (e.__class__.__name__, e)
+
+    return key, outputs, None
+
+
+class ParallelFiniteDifference(object):
+    """finite difference gradients with all perturbed runs spread over a pool of worker processes
+
+    Each worker builds (or restores from a snapshot) its own assembly once and reuses it for
+    every run, so a gradient costs roughly the time of one or two assembly runs when there
+    are as many workers as perturbations.
+
+    Parameters
+    ----------
+    builder : callable
+        module-level function returning a configured and populated assembly
+    builder_kwargs : dict
+        keyword arguments for the builder
+    design_vars : list(str)
+        input paths to differentiate with respect to (scalars or arrays)
+    outputs : list(str)
+        output paths to differentiate
+    form : str
+        default difference form: 'forward', 'central' or 'complex' (complex step, which falls
+        back to central differences, with a warning, for variables whose evaluation does not
+        support complex values; those are kept in complex_fallbacks)
+    step : float
+        default step size
+    fallback_step : float
+        step size of the central differences used when a complex step is not possible
+    step_type : str
+        'relative' (step scaled by the magnitude of the variable, or step itself for zero
+        entries) or 'absolute'
+    var_options : dict
+        per variable overrides: path -> dict with any of 'form', 'step', 'fallback_step', 'step_type'
+    processes : int
+        number of worker processes (defaults to the number of cores).  With 1 the runs are
+        made serially in the calling process.
+    snapshot_directory : str
+        if given, workers restore their assembly from a snapshot (see lcoe_snapshot)
+    checkpoint : Checkpoint
+        if given, every gradient is recorded in this journal (see lcoe_checkpoint) and a gradient
+        requested again at the same design is read back instead of recomputed, so a restarted
+        optimization replays its finished iterations without running the assembly
+    """
+
+    def __init__(self, builder=create_example_se_assembly, builder_kwargs=None, design_vars=COE_DESIGN_VARS,
+                 outputs=('coe',), form='forward', step=1e-6, fallback_step=1e-6, step_type='relative',
+                 var_options=None, processes=None, snapshot_directory=None, checkpoint=None):
+
+        self.design_vars = list(design_vars)
+        self.outputs = list(outputs)
+        self.options = OrderedDict()
+        for name in self.design_vars:
+            options = {'form': form, 'step': step, 'fallback_step': fallback_step, 'step_type': step_type}
+            options.update((var_options or {}).get(name, {}))
+            if options['form'] not in FD_FORMS:
+                raise ValueError('unknown finite difference form %r for %s' % (options['form'], name))
+            self.options[name] = options
+
+        self._pool = WorkerPool(builder, builder_kwargs, self.outputs, processes,
+                                snapshot_directory=snapshot_directory)
+
+        # outputs at the design of the last gradient
+        self.values = None
+
+        # variables whose complex step failed and were differenced centrally instead
+        self.complex_fallbacks = set()
+
+        self.checkpoint = checkpoint
+
+    def close(self):
+
+        self._pool.close()
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, *args):
+
+        self.close()
+
+    def _steps(self, name, value, form):
+
+        options = self.options[name]
+        if options['form'] == 'complex' and form != 'complex':
+            h = options['fallback_step']*np.ones(np.size(value))
+        else:
+            h = options['step']*np.ones(np.size(value))
+        if options['step_type'] == 'relative':
+            magnitude = np.abs(np.ravel(value))
+            h[magnitude > 0] *= magnitude[magnitude > 0]
+
+        return h
+
+    def _tasks(self, values, forms):
+
+        tasks = [('base', values, None)]
+        for name, value in values:
+            h = self._steps(name, value, forms[name])
+            for i in range(np.size(value)):
+                if forms[name] == 'complex':
+                    tasks.append(((name, i, 'complex'), values, (name, i, 1j*h[i])))
+                else:
+                    tasks.append(((name, i, '+'), values, (name, i, h[i])))
+                    if forms[name] == 'central':
+                        tasks.append(((name, i, '-'), values, (name, i, -h[i])))
+
+        return tasks
+
+    def gradient(self, x):
+        """finite difference derivatives of the outputs at design x
+
+        Parameters
+        ----------
+        x : dict
+            design variable path -> value (every design variable)
+
+        Returns
+        -------
+        gradients : OrderedDict
+            output -> OrderedDict(design variable -> array shaped output shape + variable shape).
+            The outputs at x are stored in self.values.
+        """
+
+        values = [(name, np.array(x[name], dtype=float)) for name in self.design_vars]
+        forms = dict((name, self.options[name]['form']) for name in self.design_vars)
+        forms.update((name, 'central') for name in self.complex_fallbacks)
+
+        if self.checkpoint is not None:
+            key = work_key('gradient', self.outputs, values, sorted(forms.items()),
+                           [(name, sorted(options.items())) for name, options in self.options.iteritems()])
+            recorded = self.checkpoint.evaluation(key)
+            if recorded is not None:
+                self.values, gradients, fallbacks = recorded
+                self.complex_fallbacks.update(fallbacks)
+                return gradients
+
+        results, errors = self._evaluate(self._tasks(values, forms))
+
+        # complex step not supported by some component: redo those variables centrally
+        failed = set(key[0] for key in errors if key != 'base' and key[2] == 'complex')
+        if failed:
+            warnings.warn('complex step failed for %s, using central differences with step %s instead'
+                          % (', '.join(sorted(failed)),
+                             ', '.join(str(self.options[name]['fallback_step']) for name in sorted(failed))))
+            self.complex_fallbacks.update(failed)
+            forms.update((name, 'central') for name in failed)
+            retry = [task for task in self._tasks(values, forms) if task[0] != 'base' and task[0][0] in failed]
+            retried, retry_errors = self._evaluate(retry)
+            results.update(retried)
+            errors = dict((key, error) for key, error in errors.iteritems() if key == 'base' or key[0] not in failed)
+            errors.update(retry_errors)
+
+        if errors:
+            key = sorted(errors.keys())[0]
+            raise RuntimeError('finite difference run %s failed: %s' % (key, errors[key]))
+
+        base = results['base']
+        self.values = OrderedDict(zip(self.outputs, base))
+
+        gradients = OrderedDict((output, OrderedDict()) for output in self.outputs)
+        for name, value in values:
+            h = self._steps(name, value, forms[name])
+            for j, output in enumerate(self.outputs):
+                shape = np.shape(base[j])
+                d = np.zeros((int(np.prod(shape)), np.size(value)))
+                for i in range(np.size(value)):
+                    if forms[name] == 'complex':
+                        df = np.imag(results[(name, i, 'complex')][j])/h[i]
+                    elif forms[name] == 'central':
+                        df = (results[(name, i, '+')][j] - results[(name, i, '-')][j])/(2*h[i])
+                    else:
+                        df = (results[(name, i, '+')][j] - base[j])/h[i]
+                    d[:, i] = np.ravel(df)
+                gradients[output][name] = d.reshape(shape + np.shape(value))
+
+        if self.checkpoint is not None:
+            self.checkpoint.record_evaluation(key, (self.values, gradients, self.complex_fallbacks))
+
+        return gradients
+
+    def _evaluate(self, tasks):
+
+        results = {}
+        errors = {}
+        for key, outputs, error in self._pool.imap(_run_point, tasks):
+            if error is None:
+                results[key] = outputs
+            else:
+                errors[key] = error
+
+        return results, errors
+
+
+def example():
+
+    import time
+
+    lcoe_se = create_example_se_assembly(with_new_nacelle=True)
+    x = dict((name, lcoe_se.get(name)) for name in COE_DESIGN_VARS)
+
+    with ParallelFiniteDifference(builder_kwargs={'with_new_nacelle': True},
+                                  var_options={'hub_height': {'form': 'central', 'step': 1e-3, 'step_type': 'absolute'}}) as fd:
+        tt = time.time()
+        gradients = fd.gradient(x)
+        print 'gradient in {0:.1f} s, coe = {1:.4f} USD/kWh'.format(time.time() - tt, float(fd.values['coe']))
+
+    for name, d in gradients['coe'].iteritems():
+        print name, d
+
+
+if __name__ == '__main__':
+
+    example()
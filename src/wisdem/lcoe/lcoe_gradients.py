@@ -0,0 +1,159 @@
+"""
+lcoe_gradients.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import warnings
+from collections import OrderedDict
+
+import numpy as np
+
+from openmdao.main.api import Assembly, Driver
+
+
+# rotor and tower design variables of lcoe_se_assembly (paths relative to the assembly)
+COE_DESIGN_VARS = ('rotor.chord_sub', 'rotor.theta_sub', 'rotor.sparT', 'rotor.teT', 'tower_d', 'tower.t', 'hub_height')
+
+
+def _provides_derivatives(comp):
+
+    return hasattr(comp, 'provideJ') or hasattr(comp, 'apply_deriv') or hasattr(comp, 'apply_derivT')
+
+
+def _workflow_components(assembly, driver, prefix):
+
+    members = []
+    for name in driver.workflow.get_names():
+        comp = getattr(assembly, name)
+        if isinstance(comp, Driver):
+            members.extend(_workflow_components(assembly, comp, prefix))
+        else:
+            members.append((prefix + name, comp))
+
+    return members
+
+
+def finite_difference_components(assembly, prefix=''):
+    """paths of the workflow components (within sub-assemblies, recursively) that provide no
+    analytic derivatives, and that OpenMDAO therefore finite differences inside calc_gradient
+
+    The list is conservative: it includes components that are not between the design
+    variables and the outputs.
+    """
+
+    missing = []
+    for path, comp in _workflow_components(assembly, assembly.driver, prefix):
+        if isinstance(comp, Assembly):
+            missing.extend(finite_difference_components(comp, path + '.'))
+        elif not _provides_derivatives(comp):
+            missing.append(path)
+
+    return missing
+
+
+def total_derivatives(assembly, design_vars=COE_DESIGN_VARS, outputs=('coe',), mode='adjoint', run=True,
+                      missing_derivatives='warn'):
+    """total derivatives of assembly outputs with respect to design variables
+
+    In adjoint mode one linear solve is made per output, so the cost does not grow with the
+    number of design variables, provided that every component in the chain has analytic
+    derivatives (provideJ).  OpenMDAO finite differences the others; their cost then grows
+    with their number of inputs, which is checked with finite_difference_components.
+
+    Parameters
+    ----------
+    assembly : Assembly
+        e.g. an lcoe_se_assembly configured with flexible_blade=False
+    design_vars : list(str)
+        input paths to differentiate with respect to
+    outputs : list(str)
+        output paths to differentiate
+    mode : str
+        'adjoint', 'forward' or 'fd' (finite difference of the whole workflow, for checking)
+    run : bool
+        run the assembly first (derivatives are taken about its current state)
+    missing_derivatives : str
+        when components without analytic derivatives are found in adjoint or forward mode:
+        'warn', 'raise' (RuntimeError) or 'ignore'
+
+    Returns
+    -------
+    gradients : OrderedDict
+        output -> OrderedDict(design variable -> derivative array shaped like the variable)
+    """
+
+    if hasattr(assembly, 'fpi'):
+        raise RuntimeError('total derivatives are not available through the flexible blade fixed point '
+                           'iteration; configure the assembly with flexible_blade=False')
+
+    if mode != 'fd' and missing_derivatives != 'ignore':
+        missing = finite_difference_components(assembly)
+        if missing:
+            message = 'no analytic derivatives for %s; OpenMDAO finite differences them' % ', '.join(missing)
+            if missing_derivatives == 'raise':
+                raise RuntimeError(message)
+            warnings.warn(message)
+
+    if run:
+        assembly.run()
+
+    J = assembly.driver.workflow.calc_gradient(inputs=list(design_vars), outputs=list(outputs), mode=mode)
+    J = np.atleast_2d(J)
+
+    gradients = OrderedDict()
+    for i, output in enumerate(outputs):
+        gradients[output] = OrderedDict()
+        start = 0
+        for name in design_vars:
+            shape = np.shape(assembly.get(name))
+            size = int(np.prod(shape))
+            gradients[output][name] = np.reshape(J[i, start:start+size], shape)
+            start += size
+
+    return gradients
+
+
+def coe_gradient(assembly, design_vars=COE_DESIGN_VARS, run=True, missing_derivatives='warn'):
+    """gradient of coe with respect to the design variables (adjoint mode)
+
+    Returns
+    -------
+    gradient : OrderedDict
+        design variable -> d coe / d variable, shaped like the variable
+    """
+
+    return total_derivatives(assembly, design_vars, ('coe',), 'adjoint', run, missing_derivatives)['coe']
+
+
+def use_adjoint_gradients(driver):
+    """make a gradient-based optimizer compute its gradients in adjoint mode instead of
+    finite differencing the whole workflow"""
+
+    driver.gradient_options.force_fd = False
+    driver.gradient_options.derivative_direction = 'adjoint'
+
+
+if __name__ == '__main__':
+
+    import time
+    from wisdem.lcoe.lcoe_se_assembly import create_example_se_assembly
+
+    lcoe_se = create_example_se_assembly(with_new_nacelle=True)
+    lcoe_se.run()
+
+    print 'finite differenced by OpenMDAO:', ', '.join(finite_difference_components(lcoe_se)) or 'none'
+
+    tt = time.time()
+    adjoint = coe_gradient(lcoe_se, run=False)
+    print 'adjoint: {0:.1f} s'.format(time.time() - tt)
+
+    tt = time.time()
+    fd = total_derivatives(lcoe_se, mode='fd', run=False)['coe']
+    print 'finite difference: {0:.1f} s'.format(time.time() - tt)
+
+    for name in COE_DESIGN_VARS:
+        print name
+        print '    adjoint:', adjoint[name]
+        print '    fd:     ', fd[name]
@@ -0,0 +1,277 @@
+"""
+lcoe_multifidelity.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+from wisdem.lcoe.lcoe_se_assembly import create_example_se_assembly
+from wisdem.lcoe.lcoe_doe import run_doe
+from wisdem.lcoe.lcoe_csm_vectorized import lcoe_csm_vectorized
+from wisdem.lcoe.lcoe_sensitivity import CSM_EXAMPLE_INPUTS
+from wisdem.turbinese.rotor_surrogate import KrigingModel
+
+
+def csm_model(candidates, output='coe', columns=None, inputs=CSM_EXAMPLE_INPUTS):
+    """output of the vectorized cost and scaling model for every candidate
+
+    Parameters
+    ----------
+    candidates : OrderedDict
+        candidate table: name -> array (one entry per candidate)
+    output : str
+    columns : list(str)
+        candidate columns that are inputs of the cost and scaling model (defaults to all)
+    inputs : dict
+        values of the other inputs
+    """
+
+    x = OrderedDict(inputs)
+    x.update((name, np.asarray(candidates[name])) for name in (candidates.keys() if columns is None else columns))
+
+    return np.asarray(lcoe_csm_vectorized(**x)[output], dtype=float)
+
+
+def se_model(candidates, index, output='coe', columns=None, builder=create_example_se_assembly, **kwargs):
+    """output of lcoe_se_assembly (through run_doe) for the candidates in index
+
+    Parameters
+    ----------
+    candidates : OrderedDict
+        candidate table
+    index : array_like
+        candidates to evaluate
+    output : str
+    columns : list(str)
+        candidate columns that are inputs (variable paths) of the assembly (defaults to all)
+    builder : callable
+    kwargs : dict
+        passed to run_doe, e.g. builder_kwargs, processes, cache
+
+    Returns
+    -------
+    values : ndarray
+        one value per candidate in index (NaN where the run failed)
+    errors : dict
+        position in index -> error message
+    """
+
+    index = np.asarray(index)
+    cases = OrderedDict((name, np.asarray(candidates[name])[index])
+                        for name in (candidates.keys() if columns is None else columns))
+    kwargs.setdefault('cache', True)
+    results = run_doe(cases, builder, outputs=[output], **kwargs)
+
+    return np.asarray(results[output], dtype=float), results['errors']
+
+
+def _spread(X, first, k, exclude):
+    """k candidates spread over X (greedy farthest point from first), skipping exclude"""
+
+    chosen = [first]
+    d = np.sqrt(np.sum((X - X[first])**2, axis=1))
+    d[list(exclude)] = -1.0
+    while len(chosen) < k and np.max(d) > 0:
+        i = int(np.argmax(d))
+        chosen.append(i)
+        d = np.minimum(d, np.sqrt(np.sum((X - X[i])**2, axis=1)))
+        d[chosen] = -1.0
+
+    return chosen
+
+
+class FidelityCorrection(object):
+    """high fidelity output modelled as scale*low fidelity + offset + kriging discrepancy(x)"""
+
+    def __init__(self, min_kriging=5):
+
+        self.min_kriging = min_kriging
+        self.scale = 1.0
+        self.offset = 0.0
+        self.model = None
+        self.rms = np.inf
+
+    def fit(self, X, low, high):
+
+        A = np.column_stack([low, np.ones(len(low))])
+        if len(low) >= 3:
+            (self.scale, self.offset), _, _, _ = np.linalg.lstsq(A, high, rcond=-1)
+        elif len(low) > 0:
+            self.scale, self.offset = 1.0, np.mean(high - low)
+
+        residual = high - (self.scale*low + self.offset)
+        self.rms = np.sqrt(np.mean(residual**2)) if len(low) >= 3 else np.inf
+
+        self.model = None
+        if len(low) >= self.min_kriging:
+            try:
+                self.model = KrigingModel(nugget=1e-8)
+                self.model.fit(X, residual[:, np.newaxis])
+            except np.linalg.LinAlgError:
+                self.model = None
+
+    def predict(self, X, low):
+        """prediction and standard error for candidates X with low fidelity values low"""
+
+        mean = self.scale*low + self.offset
+        std = self.rms*np.ones(len(low))
+
+        if self.model is not None:
+            for i in range(len(low)):
+                delta, error = self.model.predict(X[i])
+                mean[i] += delta[0]
+                std[i] = error[0]
+
+        return mean, std
+
+
+def multi_fidelity_ranking(candidates, budget, output='coe', minimize=True, batch=None, initial=None, kappa=2.0,
+                           low=None, high=None):
+    """rank a set of candidates by screening all of them with a cheap model and spending a fixed
+    number of expensive runs on the most promising or most uncertain ones
+
+    Every candidate is evaluated with the low fidelity model.  An initial set of candidates
+    spread over the candidate space is then evaluated with the high fidelity model, and the
+    correction between fidelities (a linear map of the low fidelity output plus a kriging model
+    of the remaining discrepancy over the candidate columns) is learned.  The remaining budget
+    is spent in batches on the candidates with the best lower confidence bound (prediction
+    minus kappa standard errors, for minimization), refitting the correction after each batch.
+
+    Parameters
+    ----------
+    candidates : OrderedDict
+        candidate table: name -> array of numeric values, one entry per candidate
+    budget : int
+        number of high fidelity runs
+    output : str
+        output to rank by, e.g. 'coe'
+    minimize : bool
+        rank the lowest output first
+    batch : int
+        high fidelity runs per batch (defaults to a tenth of the budget); batches are run in
+        parallel by the default high fidelity model
+    initial : int
+        size of the initial space filling set (defaults to a third of the budget, at least 5)
+    kappa : float
+        weight of the uncertainty in the choice of candidates: 0 only exploits the prediction
+    low : callable
+        low(candidates) -> array of the output for every candidate.  Defaults to the cost and
+        scaling model (csm_model), with all candidate columns as its inputs.
+    high : callable
+        high(candidates, index) -> (values, errors) for the candidates in index.  Defaults to
+        lcoe_se_assembly through run_doe (se_model), with all candidate columns as its inputs.
+
+    Returns
+    -------
+    results : OrderedDict
+        'low' (low fidelity output), 'high' (high fidelity output, NaN where not run or failed),
+        'evaluated' (bool, high fidelity run), 'prediction' and 'std' (unified estimate: the high
+        fidelity value where available, the corrected low fidelity prediction elsewhere),
+        'ranking' (candidate indices, best first), 'scale' and 'offset' of the correction,
+        'rms' (residual of the linear correction) and 'errors' (candidate index -> message)
+    """
+
+    if low is None:
+        low = lambda candidates: csm_model(candidates, output)
+    if high is None:
+        high = lambda candidates, index: se_model(candidates, index, output)
+
+    names = list(candidates.keys())
+    X = np.column_stack([np.asarray(candidates[name], dtype=float) for name in names])
+    n = len(X)
+    budget = min(budget, n)
+    if batch is None:
+        batch = max(1, budget // 10)
+    if initial is None:
+        initial = max(5, budget // 3)
+    sign = 1.0 if minimize else -1.0
+
+    y_low = np.asarray(low(candidates), dtype=float)
+    y_high = np.nan*np.ones(n)
+    evaluated = np.zeros(n, dtype=bool)
+    errors = {}
+
+    # scaled candidate coordinates (with the low fidelity output) for the initial spread
+    Z = np.column_stack([X, y_low])
+    span = np.ptp(Z, axis=0)
+    span[span == 0] = 1.0
+    Z = (Z - np.min(Z, axis=0))/span
+
+    def evaluate(index):
+        values, failed = high(candidates, index)
+        for position, i in enumerate(index):
+            evaluated[i] = True
+            if position in failed:
+                errors[i] = failed[position]
+            else:
+                y_high[i] = values[position]
+
+    evaluate(_spread(Z, int(np.argmin(sign*y_low)), min(initial, budget), ()))
+
+    correction = FidelityCorrection()
+    while True:
+        ok = evaluated & ~np.isnan(y_high)
+        correction.fit(X[ok], y_low[ok], y_high[ok])
+
+        remaining = np.flatnonzero(~evaluated)
+        if evaluated.sum() >= budget or len(remaining) == 0:
+            break
+
+        mean, std = correction.predict(X[remaining], y_low[remaining])
+        bound = sign*mean - kappa*std
+        evaluate(remaining[np.argsort(bound)[:min(batch, budget - evaluated.sum())]])
+
+    prediction = np.copy(y_high)
+    std = np.zeros(n)
+    unknown = np.isnan(y_high)
+    if np.any(unknown):
+        prediction[unknown], std[unknown] = correction.predict(X[unknown], y_low[unknown])
+
+    results = OrderedDict()
+    results['low'] = y_low
+    results['high'] = y_high
+    results['evaluated'] = evaluated
+    results['prediction'] = prediction
+    results['std'] = std
+    results['ranking'] = np.argsort(sign*prediction, kind='mergesort')
+    results['scale'] = correction.scale
+    results['offset'] = correction.offset
+    results['rms'] = correction.rms
+    results['errors'] = errors
+
+    return results
+
+
+def example():
+
+    import time
+    from wisdem.lcoe.lcoe_sampling import latin_hypercube
+
+    # candidate plants: hub height and plant level inputs shared by both models
+    u = latin_hypercube(2000, 3, seed=1)
+    candidates = OrderedDict([('hub_height', 80.0 + 40.0*u[:, 0]),
+                              ('availability', 0.90 + 0.08*u[:, 1]),
+                              ('array_losses', 0.05 + 0.10*u[:, 2])])
+
+    tt = time.time()
+    high = lambda candidates, index: se_model(candidates, index, builder_kwargs={'with_new_nacelle': True})
+    results = multi_fidelity_ranking(candidates, budget=40, high=high)
+    print '{0} candidates, {1} SE runs in {2:.0f} s'.format(len(results['low']), results['evaluated'].sum(),
+                                                            time.time() - tt)
+    print 'correction: coe_se = {0:.3f} coe_csm + {1:.4f} (rms {2:.4f})'.format(results['scale'], results['offset'],
+                                                                             results['rms'])
+
+    print 'rank  hub_height  availability  array_losses  coe (USD/kWh)'
+    for rank, i in enumerate(results['ranking'][:10]):
+        print '{0:4d}  {1:10.1f}  {2:12.3f}  {3:12.3f}  {4:.4f} +/- {5:.4f}{6}'.format(rank + 1,
+            candidates['hub_height'][i], candidates['availability'][i], candidates['array_losses'][i],
+            results['prediction'][i], results['std'][i], ' (SE)' if results['evaluated'][i] else '')
+
+
+if __name__ == '__main__':
+
+    example()
@@ -0,0 +1,449 @@
+"""
+lcoe_openwind.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import os
+import json
+import hashlib
+import subprocess
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+
+from openmdao.main.api import Component
+from openmdao.main.datatypes.api import Int, Float, Array
+
+from wisdem.turbinese.execute_wrapper import _update_hash, find_wrapper
+from wisdem.lcoe.lcoe_cache import ResultCache, CachedExecute, SE_CACHED_BLOCKS, enable_result_cache, \
+    disable_result_cache
+from wisdem.lcoe.lcoe_wake_aep import thrust_curve, grid_layout, weibull_probability, WakeModel
+
+
+# --- requests ---
+
+class AEPRequest(object):
+    """one plant energy calculation: a turbine (hub height, rotor, power and thrust curves) in a layout
+
+    Parameters
+    ----------
+    hub_height, rotor_diameter : float (m)
+    machine_rating : float (kW)
+    V : array (m/s)
+        wind speeds of the curves
+    P : array (W)
+        power curve
+    Ct : array
+        thrust coefficient curve (estimated from P if empty)
+    turbine_number : int
+        number of turbines, for services that lay the plant out themselves
+    layout : array (n, 2) (m)
+        turbine positions (east, north), or None for the layout of the service
+    """
+
+    def __init__(self, hub_height, rotor_diameter, machine_rating, V, P, Ct=None, turbine_number=100, layout=None):
+
+        self.hub_height = float(hub_height)
+        self.rotor_diameter = float(rotor_diameter)
+        self.machine_rating = float(machine_rating)
+        self.V = np.asarray(V, dtype=float)
+        self.P = np.asarray(P, dtype=float)
+        if Ct is None or len(Ct) == 0:
+            Ct = thrust_curve(self.V, self.P, self.rotor_diameter)
+        self.Ct = np.asarray(Ct, dtype=float)
+        self.turbine_number = int(turbine_number)
+        self.layout = None if layout is None else np.asarray(layout, dtype=float)
+
+    def to_dict(self):
+
+        return OrderedDict([('hub_height', self.hub_height), ('rotor_diameter', self.rotor_diameter),
+                            ('machine_rating', self.machine_rating), ('V', self.V.tolist()), ('P', self.P.tolist()),
+                            ('Ct', self.Ct.tolist()), ('turbine_number', self.turbine_number),
+                            ('layout', None if self.layout is None else self.layout.tolist())])
+
+    def key(self, service_key=''):
+        """digest of the turbine curves and layout (and the service that evaluates them)"""
+
+        h = hashlib.sha1()
+        h.update(service_key)
+        _update_hash(h, [self.hub_height, self.rotor_diameter, self.machine_rating, self.V, self.P, self.Ct,
+                         self.turbine_number, self.layout], set())
+
+        return h.hexdigest()
+
+
+# --- services ---
+# A service evaluates a list of requests in one call: service.evaluate(requests) -> list of dicts
+# with 'gross_aep' (kWh, plant without wake losses) and 'array_aep' (kWh, with wake losses).
+# service.key identifies its fixed settings (site, wind data, workbook) in the result cache.
+
+class LocalWakeService(object):
+    """lightweight local stand-in for OpenWind, for testing and benchmarking offline
+
+    Plant energy from a wind rose (Weibull speed distribution per direction sector at hub
+    height) through the Jensen wake model of lcoe_wake_aep.  A screening estimate, not a
+    substitute for OpenWind's wake models.
+
+    Parameters
+    ----------
+    layout : array (n, 2) (m)
+        turbine positions (east, north); None for a square grid of the requested turbine number
+    spacing : float
+        grid spacing in rotor diameters when layout is None
+    directions : array (deg)
+        centres of the direction sectors (direction the wind comes from)
+    frequency : array
+        probability of each sector
+    weibull_A, weibull_k : array
+        Weibull scale (m/s) and shape of each sector
+    wake_decay : float
+        Jensen wake expansion coefficient (0.075 onshore, about 0.05 offshore)
+    """
+
+    def __init__(self, layout=None, spacing=7.0, directions=None, frequency=None, weibull_A=None, weibull_k=None,
+                 wake_decay=0.075, speed_step=0.5):
+
+        if directions is None:
+            directions = np.arange(0.0, 360.0, 30.0)
+        n = len(directions)
+        self.layout = None if layout is None else np.asarray(layout, dtype=float)
+        self.spacing = spacing
+        self.directions = np.asarray(directions, dtype=float)
+        self.frequency = np.ones(n)/n if frequency is None else np.asarray(frequency, dtype=float)
+        self.weibull_A = 9.0*np.ones(n) if weibull_A is None else np.asarray(weibull_A, dtype=float)*np.ones(n)
+        self.weibull_k = 2.0*np.ones(n) if weibull_k is None else np.asarray(weibull_k, dtype=float)*np.ones(n)
+        self.wake_decay = wake_decay
+        self.speed_step = speed_step
+        self._models = {}
+
+        h = hashlib.sha1()
+        _update_hash(h, ['local', self.layout, spacing, self.directions, self.frequency, self.weibull_A,
+                         self.weibull_k, wake_decay, speed_step], set())
+        self.key = h.hexdigest()
+
+    def _wake_model(self, layout, max_rotor_diameter):
+
+        key = layout.tostring()
+        if key not in self._models or self._models[key].max_rotor_diameter < max_rotor_diameter:
+            self._models[key] = WakeModel(layout, self.directions, self.wake_decay, max_rotor_diameter)
+
+        return self._models[key]
+
+    def evaluate(self, requests):
+
+        results = []
+        for request in requests:
+            layout = request.layout if request.layout is not None else self.layout
+            if layout is None:  # grid in rotor diameters
+                model, diameter = self._wake_model(grid_layout(request.turbine_number, 1.0, self.spacing), 1.0), 1.0
+            else:
+                model, diameter = self._wake_model(layout, max(250.0, 1.5*request.rotor_diameter)), \
+                    request.rotor_diameter
+
+            speeds = np.arange(self.speed_step, request.V[-1] + self.speed_step, self.speed_step)
+            probability = weibull_probability(speeds, self.weibull_A, self.weibull_k, self.frequency)
+            gross, array = model.aep(probability, speeds, diameter, request.V, request.P, request.Ct)
+            results.append({'gross_aep': gross, 'array_aep': array})
+
+        return results
+
+
+class OpenWindAssemblyService(object):
+    """runs OpenWind through plant_energyse's openwind_assembly, once per request
+
+    Each run launches OpenWind on the workbook (whose layout and wind data are used; the
+    request layout is ignored).  Batching still pays off: requests repeated within or across
+    batches are run only once.
+    """
+
+    def __init__(self, ow_file, ow_wkbook):
+
+        self.ow_file = ow_file
+        self.ow_wkbook = ow_wkbook
+        self.key = 'openwind:%s:%s' % (os.path.abspath(ow_wkbook), os.path.getmtime(ow_wkbook)
+                                       if os.path.exists(ow_wkbook) else '')
+        self._assembly = None
+
+    def evaluate(self, requests):
+
+        if self._assembly is None:
+            from plant_energyse.openwind.enterprise.openwind_assembly import openwind_assembly
+            self._assembly = openwind_assembly(self.ow_file, self.ow_wkbook)
+        ow = self._assembly
+
+        results = []
+        for request in requests:
+            ow.hub_height = request.hub_height
+            ow.rotor_diameter = request.rotor_diameter
+            ow.machine_rating = request.machine_rating
+            ow.power_curve = np.array([request.V, request.P])
+            ow.ct = np.array([request.V, request.Ct])
+            ow.availability = 1.0
+            ow.other_losses = 0.0
+            ow.run()
+            results.append({'gross_aep': ow.gross_aep, 'array_aep': ow.net_aep})
+
+        return results
+
+
+class CommandService(object):
+    """submits each batch to an external program in one launch
+
+    The requests are written to a JSON file ({"requests": [...]}, see AEPRequest.to_dict) and
+    the program is run as command + [request file, result file]; it must write
+    {"results": [{"gross_aep": ..., "array_aep": ...}, ...]} in the same order.
+
+    Parameters
+    ----------
+    command : list(str)
+        program and fixed arguments, e.g. a wrapper that drives OpenWind on a Windows host
+    directory : str
+        location of the exchange files (a temporary directory if None)
+    key : str
+        identifies the program's fixed settings (site, wind data) in the result cache
+    """
+
+    def __init__(self, command, directory=None, key=None):
+
+        self.command = list(command)
+        self.directory = directory if directory is not None else tempfile.mkdtemp(prefix='aep_batch_')
+        self.key = key if key is not None else ' '.join(self.command)
+        self._batches = 0
+
+    def evaluate(self, requests):
+
+        self._batches += 1
+        request_file = os.path.join(self.directory, 'batch_%d_%d.json' % (os.getpid(), self._batches))
+        result_file = request_file[:-5] + '_results.json'
+        with open(request_file, 'w') as f:
+            json.dump({'requests': [request.to_dict() for request in requests]}, f)
+
+        subprocess.check_call(self.command + [request_file, result_file])
+
+        with open(result_file) as f:
+            results = json.load(f)['results']
+        if len(results) != len(requests):
+            raise RuntimeError('%s returned %d results for %d requests' % (self.command[0], len(results),
+                                                                          len(requests)))
+
+        return results
+
+
+# --- batching ---
+
+class AEPBatcher(object):
+    """queues plant energy requests from many LCOE cases and submits them to a service in batches
+
+    Results are cached by turbine curves and layout, so a request is sent to the service at
+    most once.  With deferred set, requests that are not cached are only queued (see
+    aep_openwind_batched and run_batched_sweep); flush submits the queue.
+
+    Parameters
+    ----------
+    service : object
+        LocalWakeService, OpenWindAssemblyService, CommandService or any object with an
+        evaluate(requests) method and a key
+    batch_size : int
+        maximum number of requests per submission
+    cache : ResultCache
+        result store (a new in-memory cache if None); with a directory the results are shared
+        between processes and runs
+    """
+
+    def __init__(self, service, batch_size=50, cache=None):
+
+        self.service = service
+        self.batch_size = batch_size
+        self.cache = cache if cache is not None else ResultCache(maxsize=100000)
+        self.deferred = False
+        self.batches = 0
+        self.submitted = 0
+        self.requests = 0
+        self._queue = OrderedDict()
+
+    def submit(self, request):
+        """queue request unless its result is known; returns its key"""
+
+        self.requests += 1
+        key = request.key(getattr(self.service, 'key', self.service.__class__.__name__))
+        if key not in self._queue and self.cache.get(key) is None:
+            self._queue[key] = request
+
+        return key
+
+    def pending(self):
+
+        return len(self._queue)
+
+    def flush(self):
+        """submit every queued request"""
+
+        while self._queue:
+            keys = list(self._queue.keys())[:self.batch_size]
+            results = self.service.evaluate([self._queue[key] for key in keys])
+            for key, result in zip(keys, results):
+                self.cache.put(key, dict(result))
+                del self._queue[key]
+            self.batches += 1
+            self.submitted += len(keys)
+
+    def result(self, key):
+        """result of a submitted request, or None if it is queued and the batcher is deferred"""
+
+        result = self.cache.get(key)
+        if result is None and not self.deferred:
+            self.flush()
+            result = self.cache.get(key)
+
+        return result
+
+    def evaluate(self, requests):
+        """results of a list of requests, in batches"""
+
+        keys = [self.submit(request) for request in requests]
+        self.flush()
+
+        return [self.cache.get(key) for key in keys]
+
+
+class aep_openwind_batched(Component):
+    """plant energy production through an AEPBatcher, with the outputs of the OpenWind assembly"""
+
+    hub_height = Float(iotype='in', units='m', desc='hub height of wind turbine above ground / sea level')
+    rotor_diameter = Float(iotype='in', units='m', desc='rotor diameter of the machine')
+    machine_rating = Float(iotype='in', units='kW', desc='rated machine power in kW')
+    turbine_number = Int(100, iotype='in', desc='total number of wind turbines at the plant')
+    V = Array(iotype='in', units='m/s', desc='wind speeds of the power curve')
+    P = Array(iotype='in', units='W', desc='power curve')
+    Ct = Array(iotype='in', desc='thrust coefficient curve (estimated from the power curve if empty)')
+    availability = Float(0.94, iotype='in', desc='average annual availbility of wind turbines at plant')
+    other_losses = Float(0.0, iotype='in', desc='energy losses due to blade soiling, electrical, etc')
+
+    gross_aep = Float(iotype='out', units='kW*h', desc='gross annual energy production of the plant, without losses')
+    net_aep = Float(iotype='out', units='kW*h', desc='net annual energy production of the plant')
+    array_losses = Float(iotype='out', desc='energy losses due to turbine interactions - across entire plant')
+    capacity_factor = Float(iotype='out', desc='capacity factor of the plant')
+
+    def __init__(self, batcher, layout=None):
+
+        super(aep_openwind_batched, self).__init__()
+        self.batcher = batcher
+        self.layout = layout
+
+    def execute(self):
+
+        request = AEPRequest(self.hub_height, self.rotor_diameter, self.machine_rating, self.V, self.P, self.Ct,
+                             self.turbine_number, self.layout)
+        result = self.batcher.result(self.batcher.submit(request))
+
+        if result is None:  # queued by a deferred batcher
+            self.gross_aep = self.net_aep = self.array_losses = self.capacity_factor = np.nan
+            return
+
+        self.gross_aep = result['gross_aep']
+        self.array_losses = 1.0 - result['array_aep']/result['gross_aep']
+        self.net_aep = result['array_aep']*(1.0 - self.other_losses)*self.availability
+        self.capacity_factor = self.net_aep/(self.machine_rating*self.turbine_number*365.25*24.0)
+
+
+def run_batched_sweep(assembly, cases, batcher, outputs=('coe', 'net_aep')):
+    """run the cases of an assembly whose aep_a is an aep_openwind_batched in two passes, so that
+    the plant energy requests of all cases are submitted together in batches
+
+    The first pass runs every case with the batcher deferred, which only collects the requests;
+    the queue is then submitted in batches and the second pass runs every case again with the
+    results known.  The turbine, cost and opex blocks are memoized across the passes (see
+    lcoe_cache), so the second pass mostly reruns the energy and finance blocks; the memoization
+    is removed again on return.  In the first pass only failures after the energy request was
+    queued are ignored (blocks downstream of the provisional NaN energy); a case failing before
+    is recorded in 'errors' and not run again.
+
+    Parameters
+    ----------
+    assembly : Assembly
+        e.g. an lcoe_se_assembly configured with configure_lcoe_with_openwind(..., batcher=batcher)
+    cases : dict
+        columnar case table: variable path -> sequence of values
+    batcher : AEPBatcher
+    outputs : list(str)
+
+    Returns
+    -------
+    results : dict
+        one array per output (NaN for failed cases), plus 'errors' (case index -> message)
+    """
+
+    names = list(cases.keys())
+    n = len(cases[names[0]]) if names else 0
+
+    # memoize the blocks not memoized already, and only remove that memoization on return
+    cached = [name for name in SE_CACHED_BLOCKS
+              if hasattr(assembly, name) and find_wrapper(getattr(assembly, name), CachedExecute) is None]
+    enable_result_cache(assembly, ResultCache(maxsize=max(128, 8*n)), cached)
+
+    def run(i):
+        for name in names:
+            assembly.set(name, cases[name][i])
+        assembly.run()
+
+    results = OrderedDict((name, np.nan*np.ones(n)) for name in outputs)
+    results['errors'] = {}
+
+    try:
+        batcher.deferred = True
+        try:
+            for i in range(n):
+                requests = batcher.requests
+                try:
+                    run(i)
+                except Exception as e:
+                    # downstream blocks may fail on the provisional NaN energy, anything else is an error
+                    if batcher.requests == requests:
+                        results['errors'][i] = '%s: %s' % (e.__class__.__name__, e)
+        finally:
+            batcher.deferred = False
+        batcher.flush()
+
+        for i in range(n):
+            if i in results['errors']:
+                continue
+            try:
+                run(i)
+                for name in outputs:
+                    results[name][i] = assembly.get(name)
+            except Exception as e:
+                results['errors'][i] = '%s: %s' % (e.__class__.__name__, e)
+    finally:
+        disable_result_cache(assembly, cached)
+
+    return results
+
+
+def example():
+
+    import time
+
+    # a 5 MW turbine with a simple power curve, rotor diameters 110-140 m, repeated designs
+    V = np.linspace(3.0, 25.0, 45)
+    batcher = AEPBatcher(LocalWakeService(), batch_size=20)
+
+    requests = []
+    for diameter in np.tile(np.linspace(110.0, 140.0, 16), 4):
+        P = np.minimum(0.5*1.225*0.25*np.pi*diameter**2*0.45*V**3, 5e6)
+        requests.append(AEPRequest(90.0, diameter, 5000.0, V, P, turbine_number=100))
+
+    tt = time.time()
+    results = batcher.evaluate(requests)
+    print '{0} requests, {1} run in {2} batches, {3:.3f} s'.format(len(requests), batcher.submitted, batcher.batches,
+                                                                   time.time() - tt)
+    for request, result in zip(requests[:16:3], results[:16:3]):
+        print 'D = {0:.0f} m: gross AEP {1:.3e} kWh, array losses {2:.1%}'.format(
+            request.rotor_diameter, result['gross_aep'], 1.0 - result['array_aep']/result['gross_aep'])
+
+
+if __name__ == '__main__':
+
+    example()
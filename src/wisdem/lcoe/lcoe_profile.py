@@ -0,0 +1,207 @@
+"""
+lcoe_profile.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import json
+import time
+from collections import OrderedDict
+
+from openmdao.main.api import Assembly, Driver
+
+from wisdem.turbinese.execute_wrapper import ExecuteWrapper, wrap_execute, unwrap_execute, find_wrapper
+
+
+class Profiler(object):
+    """accumulates wall time, call counts and driver iteration counts along the call stack"""
+
+    def __init__(self):
+
+        self.records = OrderedDict()
+        self._stack = []
+
+    def reset(self):
+
+        self.records.clear()
+        self._stack = []
+
+    def enter(self, name):
+
+        path = (self._stack[-1]['path'] if self._stack else ()) + (name,)
+        if path not in self.records:
+            self.records[path] = {'calls': 0, 'time': 0.0, 'self_time': 0.0, 'iterations': []}
+        self._stack.append({'path': path, 'start': time.time(), 'child_time': 0.0, 'child_calls': {}})
+
+    def exit(self, is_driver=False):
+
+        frame = self._stack.pop()
+        elapsed = time.time() - frame['start']
+
+        record = self.records[frame['path']]
+        record['calls'] += 1
+        record['time'] += elapsed
+        record['self_time'] += elapsed - frame['child_time']
+
+        # a driver's iteration count is the number of times its workflow members ran
+        if is_driver:
+            record['iterations'].append(max(frame['child_calls'].values()) if frame['child_calls'] else 0)
+
+        if self._stack:
+            parent = self._stack[-1]
+            parent['child_time'] += elapsed
+            name = frame['path'][-1]
+            parent['child_calls'][name] = parent['child_calls'].get(name, 0) + 1
+
+    def report(self):
+        """structured summary: one entry per profiled component, in call order"""
+
+        components = []
+        for path, record in self.records.iteritems():
+            entry = OrderedDict()
+            entry['path'] = '.'.join(path)
+            entry['name'] = path[-1]
+            entry['calls'] = record['calls']
+            entry['time'] = record['time']
+            entry['self_time'] = record['self_time']
+            entry['mean_time'] = record['time']/record['calls'] if record['calls'] else 0.0
+            if record['iterations']:
+                entry['iterations'] = record['iterations']
+                entry['total_iterations'] = sum(record['iterations'])
+            components.append(entry)
+
+        roots = [record['time'] for path, record in self.records.iteritems() if len(path) == 1]
+
+        return OrderedDict([('total_time', sum(roots)), ('components', components)])
+
+    def write_json(self, filename):
+
+        with open(filename, 'w') as f:
+            json.dump(self.report(), f, indent=2)
+
+    def collapsed_stacks(self):
+        """flame graph input in the collapsed stack format: 'root;child;grandchild <self time in us>'"""
+
+        return ['%s %d' % (';'.join(path), int(round(1e6*record['self_time'])))
+                for path, record in self.records.iteritems()]
+
+    def write_collapsed(self, filename):
+
+        with open(filename, 'w') as f:
+            for line in self.collapsed_stacks():
+                f.write(line + '\n')
+
+
+class ProfiledExecute(ExecuteWrapper):
+    """stands in for a component's execute and times it"""
+
+    def __init__(self, component, inner, name, profiler):
+
+        super(ProfiledExecute, self).__init__(component, inner)
+        self.name = name
+        self.profiler = profiler
+
+    def __call__(self):
+
+        self.profiler.enter(self.name)
+        try:
+            self.run_inner()
+        finally:
+            self.profiler.exit(isinstance(self.component, Driver))
+
+
+def _workflow_members(assembly, driver, max_depth, depth=1):
+    """components run by driver (and by drivers and sub-assemblies nested within it)"""
+
+    members = []
+    for name in driver.workflow.get_names():
+        comp = getattr(assembly, name)
+        members.append((name, comp))
+        if isinstance(comp, Driver):
+            members.extend(_workflow_members(assembly, comp, max_depth, depth))
+        elif isinstance(comp, Assembly) and depth < max_depth:
+            members.append(('driver', comp.driver))
+            members.extend(_workflow_members(comp, comp.driver, max_depth, depth+1))
+
+    return members
+
+
+def enable_profiling(assembly, profiler=None, max_depth=1):
+    """record timing of every member of the assembly's workflow
+
+    Parameters
+    ----------
+    assembly : Assembly
+        e.g. an lcoe_se_assembly
+    profiler : Profiler
+        profiler to record into (a new one if None)
+    max_depth : int
+        number of assembly levels to profile: 1 profiles the top-level workflow members
+        (rotor, hub, nacelle, ..., fin_a) including the members of nested drivers such as fpi,
+        larger values also profile the contents of sub-assemblies
+
+    Returns
+    -------
+    profiler : Profiler
+    """
+
+    if profiler is None:
+        profiler = Profiler()
+
+    root = assembly.name or assembly.__class__.__name__
+    targets = [(root, assembly)] + _workflow_members(assembly, assembly.driver, max_depth)
+
+    for name, comp in targets:
+        if find_wrapper(comp, ProfiledExecute) is None:
+            wrap_execute(comp, ProfiledExecute, name, profiler)
+
+    return profiler
+
+
+def disable_profiling(assembly, max_depth=1):
+    """restore the normal execute of the profiled components"""
+
+    targets = [('', assembly)] + _workflow_members(assembly, assembly.driver, max_depth)
+    for name, comp in targets:
+        unwrap_execute(comp, ProfiledExecute)
+
+
+def compare_reports(baseline, current, threshold=0.2):
+    """components whose mean time grew by more than threshold (fraction) relative to a baseline report
+
+    Returns
+    -------
+    regressions : list
+        (path, baseline mean time, current mean time) for each slower component
+    """
+
+    before = dict((entry['path'], entry['mean_time']) for entry in baseline['components'])
+
+    regressions = []
+    for entry in current['components']:
+        t0 = before.get(entry['path'])
+        if t0 is not None and entry['mean_time'] > (1.0 + threshold)*t0:
+            regressions.append((entry['path'], t0, entry['mean_time']))
+
+    return regressions
+
+
+if __name__ == '__main__':
+
+    from wisdem.lcoe.lcoe_se_assembly import create_example_se_assembly
+
+    lcoe_se = create_example_se_assembly(with_new_nacelle=True, flexible_blade=True)
+    profiler = enable_profiling(lcoe_se)
+    lcoe_se.run()
+
+    report = profiler.report()
+    print 'total time: {0:.2f} s'.format(report['total_time'])
+    print '{0:30s} {1:>6s} {2:>10s} {3:>10s}'.format('component', 'calls', 'time (s)', 'self (s)')
+    for entry in report['components']:
+        print '{0:30s} {1:6d} {2:10.3f} {3:10.3f}'.format(entry['path'], entry['calls'], entry['time'], entry['self_time'])
+        if 'iterations' in entry:
+            print '{0:30s} iterations: {1}'.format('', entry['iterations'])
+
+    profiler.write_json('lcoe_se_profile.json')
+    profiler.write_collapsed('lcoe_se_profile.folded')
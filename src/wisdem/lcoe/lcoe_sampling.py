@@ -0,0 +1,235 @@
+"""
+lcoe_sampling.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+from scipy.special import ndtri
+
+
+# Sobol direction numbers (Joe and Kuo, new-joe-kuo-6.21201) for the first 64 dimensions:
+# (primitive polynomial with leading and trailing bits, initial direction integers m_1..m_s)
+SOBOL_DIRECTIONS = (
+    (1, (1,)),
+    (3, (1,)),
+    (7, (1, 3)),
+    (11, (1, 3, 1)),
+    (13, (1, 1, 1)),
+    (19, (1, 1, 3, 3)),
+    (25, (1, 3, 5, 13)),
+    (37, (1, 1, 5, 5, 17)),
+    (41, (1, 1, 5, 5, 5)),
+    (47, (1, 1, 7, 11, 19)),
+    (55, (1, 1, 5, 1, 1)),
+    (59, (1, 1, 1, 3, 11)),
+    (61, (1, 3, 5, 5, 31)),
+    (67, (1, 3, 3, 9, 7, 49)),
+    (91, (1, 1, 1, 15, 21, 21)),
+    (97, (1, 3, 1, 13, 27, 49)),
+    (103, (1, 1, 1, 15, 7, 5)),
+    (109, (1, 3, 1, 15, 13, 25)),
+    (115, (1, 1, 5, 5, 19, 61)),
+    (131, (1, 3, 7, 11, 23, 15, 103)),
+    (137, (1, 3, 7, 13, 13, 15, 69)),
+    (143, (1, 1, 3, 13, 7, 35, 63)),
+    (145, (1, 3, 5, 9, 1, 25, 53)),
+    (157, (1, 3, 1, 13, 9, 35, 107)),
+    (167, (1, 3, 1, 5, 27, 61, 31)),
+    (171, (1, 1, 5, 11, 19, 41, 61)),
+    (185, (1, 3, 5, 3, 3, 13, 69)),
+    (191, (1, 1, 7, 13, 1, 19, 1)),
+    (193, (1, 3, 7, 5, 13, 19, 59)),
+    (203, (1, 1, 3, 9, 25, 29, 41)),
+    (211, (1, 3, 5, 13, 23, 1, 55)),
+    (213, (1, 3, 7, 3, 13, 59, 17)),
+    (229, (1, 3, 1, 3, 5, 53, 69)),
+    (239, (1, 1, 5, 5, 23, 33, 13)),
+    (241, (1, 1, 7, 7, 1, 61, 123)),
+    (247, (1, 1, 7, 9, 13, 61, 49)),
+    (253, (1, 3, 3, 5, 3, 55, 33)),
+    (285, (1, 3, 1, 15, 31, 13, 49, 245)),
+    (299, (1, 3, 5, 15, 31, 59, 63, 97)),
+    (301, (1, 3, 1, 11, 11, 11, 77, 249)),
+    (333, (1, 3, 1, 11, 27, 43, 71, 9)),
+    (351, (1, 1, 7, 15, 21, 11, 81, 45)),
+    (355, (1, 3, 7, 3, 25, 31, 65, 79)),
+    (357, (1, 3, 1, 1, 19, 11, 3, 205)),
+    (361, (1, 1, 5, 9, 19, 21, 29, 157)),
+    (369, (1, 3, 7, 11, 1, 33, 89, 185)),
+    (391, (1, 3, 3, 3, 15, 9, 79, 71)),
+    (397, (1, 3, 7, 11, 15, 39, 119, 27)),
+    (425, (1, 1, 3, 1, 11, 31, 97, 225)),
+    (451, (1, 1, 1, 3, 23, 43, 57, 177)),
+    (463, (1, 3, 7, 7, 17, 17, 37, 71)),
+    (487, (1, 3, 1, 5, 27, 63, 123, 213)),
+    (501, (1, 1, 3, 5, 11, 43, 53, 133)),
+    (529, (1, 3, 5, 5, 29, 17, 47, 173, 479)),
+    (539, (1, 3, 3, 11, 3, 1, 109, 9, 69)),
+    (545, (1, 1, 1, 5, 17, 39, 23, 5, 343)),
+    (557, (1, 3, 1, 5, 25, 15, 31, 103, 499)),
+    (563, (1, 1, 1, 11, 11, 17, 63, 105, 183)),
+    (601, (1, 1, 5, 11, 9, 29, 97, 231, 363)),
+    (607, (1, 1, 5, 15, 19, 45, 41, 7, 383)),
+    (617, (1, 3, 7, 7, 31, 19, 83, 137, 221)),
+    (623, (1, 1, 1, 3, 23, 15, 111, 223, 83)),
+    (631, (1, 1, 5, 13, 31, 15, 55, 25, 161)),
+    (637, (1, 1, 3, 13, 25, 47, 39, 87, 257)),
+)
+
+SOBOL_BITS = 30
+
+
+def _sobol_directions(d, bits=SOBOL_BITS):
+    """direction numbers V (d, bits) as integers scaled by 2**bits"""
+
+    if d > len(SOBOL_DIRECTIONS):
+        raise ValueError('Sobol sequences are available for up to %d dimensions' % len(SOBOL_DIRECTIONS))
+
+    V = np.zeros((d, bits), dtype=np.int64)
+    for j in range(d):
+        poly, m_init = SOBOL_DIRECTIONS[j]
+        s = poly.bit_length() - 1
+        m = list(m_init) if s > 0 else [1]*bits
+        for k in range(len(m), bits):
+            # m_k = 2 a_1 m_{k-1} ^ 4 a_2 m_{k-2} ^ ... ^ 2**s m_{k-s} ^ m_{k-s}
+            value = m[k-s] ^ (m[k-s] << s)
+            for i in range(1, s):
+                if (poly >> (s - i)) & 1:
+                    value ^= m[k-i] << i
+            m.append(value)
+        V[j] = [m[k] << (bits - 1 - k) for k in range(bits)]
+
+    return V
+
+
+def sobol_sequence(n, d, start=0, scramble=True, seed=None):
+    """points start, ..., start+n-1 of the d-dimensional Sobol sequence
+
+    Parameters
+    ----------
+    n, d : int
+        number of points and dimensions
+    start : int
+        index of the first point, so that a long sequence can be generated in chunks
+    scramble : bool
+        apply a random digital shift, which keeps the low discrepancy of the sequence and avoids
+        points on the boundary of the unit cube.  Chunks of one sequence need the same shift, so
+        they must be given the same seed (not None, see sample_chunks).
+    seed : int
+
+    Returns
+    -------
+    u : ndarray (n, d)
+        points in [0, 1)
+    """
+
+    V = _sobol_directions(d)
+    index = np.arange(start, start + n, dtype=np.int64)
+    gray = index ^ (index >> 1)
+
+    x = np.zeros((n, d), dtype=np.int64)
+    for k in range(SOBOL_BITS):
+        bit = ((gray >> k) & 1).astype(bool)
+        x[bit] ^= V[:, k]
+
+    if scramble:
+        x ^= np.random.RandomState(seed).randint(0, 2**SOBOL_BITS, d).astype(np.int64)
+
+    return x / float(2**SOBOL_BITS)
+
+
+def latin_hypercube(n, d, seed=None):
+    """n by d Latin hypercube sample in [0, 1): one point in each of n equal strata per dimension"""
+
+    rng = np.random.RandomState(seed)
+    u = np.zeros((n, d))
+    for j in range(d):
+        u[:, j] = (rng.permutation(n) + rng.uniform(size=n)) / n
+
+    return u
+
+
+def sample_chunks(method, n, d, chunksize=1000, seed=None):
+    """generate the n by d unit sample of method ('lhs', 'sobol' or 'random') in chunks
+
+    Sobol and random chunks are generated on demand; a Latin hypercube needs its n strata
+    permutations up front (n integers per dimension).  All Sobol chunks share one digital shift,
+    drawn once when seed is None, so together they are a single scrambled sequence.
+    """
+
+    if method == 'sobol':
+        if seed is None:
+            seed = np.random.randint(2**31 - 1)
+        for start in range(0, n, chunksize):
+            yield sobol_sequence(min(chunksize, n - start), d, start, seed=seed)
+
+    elif method == 'lhs':
+        rng = np.random.RandomState(seed)
+        strata = np.column_stack([rng.permutation(n) for j in range(d)]) if d else np.zeros((n, 0), dtype=int)
+        for start in range(0, n, chunksize):
+            stop = min(n, start + chunksize)
+            yield (strata[start:stop] + rng.uniform(size=(stop - start, d))) / n
+
+    elif method == 'random':
+        rng = np.random.RandomState(seed)
+        for start in range(0, n, chunksize):
+            yield rng.uniform(size=(min(chunksize, n - start), d))
+
+    else:
+        raise ValueError('unknown sampling method %r' % method)
+
+
+# --- distributions ---
+# an uncertain input is described by a tuple (kind, parameters...):
+#   ('uniform', low, high)
+#   ('triangular', low, mode, high)
+#   ('normal', mean, std)
+#   ('lognormal', mu, sigma)     parameters of the underlying normal distribution
+
+def _inverse_cdf(u, distribution):
+
+    kind = distribution[0]
+    p = distribution[1:]
+
+    if kind == 'uniform':
+        return p[0] + (p[1] - p[0])*u
+
+    elif kind == 'triangular':
+        low, mode, high = p
+        c = (mode - low)/float(high - low)
+        return np.where(u < c, low + np.sqrt(u*(high - low)*(mode - low)),
+                        high - np.sqrt((1.0 - u)*(high - low)*(high - mode)))
+
+    elif kind == 'normal':
+        return p[0] + p[1]*ndtri(u)
+
+    elif kind == 'lognormal':
+        return np.exp(p[0] + p[1]*ndtri(u))
+
+    raise ValueError('unknown distribution %r' % kind)
+
+
+def scale_samples(u, distributions):
+    """map a unit sample (n, d) to the distributions of the d inputs
+
+    Parameters
+    ----------
+    u : ndarray (n, d)
+    distributions : OrderedDict
+        input path -> distribution tuple, in the column order of u
+
+    Returns
+    -------
+    samples : OrderedDict
+        input path -> ndarray (n,)
+    """
+
+    samples = OrderedDict()
+    for j, (name, distribution) in enumerate(distributions.iteritems()):
+        samples[name] = _inverse_cdf(u[:, j], distribution)
+
+    return samples
@@ -8,7 +8,7 @@ Copyright (c) NREL. All rights reserved.
 import numpy as np
 
 from openmdao.main.api import Assembly, Component
-from openmdao.main.datatypes.api import Int, Float, Enum, VarTree, Bool, Str, Array
+from openmdao.main.datatypes.api import Int, Float, Enum, VarTree, Bool, Str, Array, Dict
 
 
 from fusedwind.plant_cost.fused_finance import configure_extended_financial_analysis, ExtendedFinancialAnalysis
@@ -21,6 +21,9 @@ from turbine_costsse.turbine_costsse.turbine_costsse import Turbine_CostsSE
 from plant_costsse.nrel_csm_bos.nrel_csm_bos import bos_csm_assembly
 from plant_costsse.nrel_csm_opex.nrel_csm_opex import opex_csm_assembly
 from plant_costsse.ecn_offshore_opex.ecn_offshore_opex  import opex_ecn_assembly
+from wisdem.lcoe.lcoe_ecn_opex import opex_ecn_native
+from wisdem.lcoe.lcoe_wake_aep import aep_wake
+from wisdem.lcoe.lcoe_timeseries_aep import aep_timeseries
 from plant_financese.nrel_csm_fin.nrel_csm_fin import fin_csm_assembly
 from fusedwind.plant_flow.basic_aep import aep_assembly
 #from landbos import LandBOS
@@ -149,9 +152,14 @@ def configure_lcoe_with_csm_opex(assembly):
     assembly.connect('aep_a.net_aep', 'opex_a.net_aep')
 
 
-def configure_lcoe_with_ecn_opex(assembly,ecn_file):
+def configure_lcoe_with_ecn_opex(assembly,ecn_file,native=False,cells=None):
 
-    assembly.replace('opex_a', opex_ecn_assembly(ecn_file))
+    if native:
+        assembly.replace('opex_a', opex_ecn_native(ecn_file, cells))
+    elif cells:
+        raise ValueError('ECN workbook cells can only be given to the native evaluator (native=True)')
+    else:
+        assembly.replace('opex_a', opex_ecn_assembly(ecn_file))
 
     assembly.connect('machine_rating', 'opex_a.machine_rating')
     assembly.connect('turbine_number', 'opex_a.turbine_number')
@@ -180,6 +188,60 @@ def configure_lcoe_with_basic_aep(assembly):
     assembly.connect('other_losses','aep_a.other_losses')
 
 
+def configure_lcoe_with_wake_aep(assembly):
+    """
+    aep inputs:
+        other_losses = Float
+        availability = Float
+        layout, wind rose and wake_decay set on aep_a (array losses are an output of aep_a;
+        the gross energy is rotor.AEP per turbine, the wind rose only sets the array losses)
+    """
+
+    assembly.replace('aep_a', aep_wake())
+
+    assembly.add('other_losses',Float(0.0, iotype='in', desc='energy losses due to blade soiling, electrical, etc'))
+
+    # connections to aep
+    assembly.connect('hub_height', 'aep_a.hub_height')
+    assembly.connect('rotor.diameter', 'aep_a.rotor_diameter')
+    assembly.connect('rotor.V', 'aep_a.V')
+    assembly.connect('rotor.P', 'aep_a.P')
+    assembly.connect('rotor.AEP', 'aep_a.AEP_one_turbine')
+    assembly.connect('shear_exponent', 'aep_a.shear_exponent')
+    assembly.connect('turbine_number', 'aep_a.turbine_number')
+    assembly.connect('machine_rating','aep_a.machine_rating')
+    assembly.connect('other_losses','aep_a.other_losses')
+
+
+def configure_lcoe_with_timeseries_aep(assembly, wind_file, histogram=False, wake_model=False):
+    """
+    aep inputs:
+        array_losses = Float (unless wake_model)
+        other_losses = Float
+        availability = Float
+        data columns, measurement height and wake model settings set on aep_a
+    """
+
+    assembly.replace('aep_a', aep_timeseries(wind_file, histogram))
+    assembly.aep_a.wake_model = wake_model
+
+    if not wake_model:
+        assembly.add('array_losses',Float(0.059, iotype='in', desc='energy losses due to turbine interactions - across entire plant'))
+    assembly.add('other_losses',Float(0.0, iotype='in', desc='energy losses due to blade soiling, electrical, etc'))
+
+    # connections to aep
+    assembly.connect('hub_height', 'aep_a.hub_height')
+    assembly.connect('rotor.diameter', 'aep_a.rotor_diameter')
+    assembly.connect('rotor.V', 'aep_a.V')
+    assembly.connect('rotor.P', 'aep_a.P')
+    assembly.connect('shear_exponent', 'aep_a.shear_exponent')
+    assembly.connect('turbine_number', 'aep_a.turbine_number')
+    assembly.connect('machine_rating','aep_a.machine_rating')
+    if not wake_model:
+        assembly.connect('array_losses','aep_a.array_losses')
+    assembly.connect('other_losses','aep_a.other_losses')
+
+
 # Finance
 def configure_lcoe_with_csm_fin(assembly):
     """
@@ -231,9 +293,15 @@ class lcoe_se_assembly(Assembly):
     with_new_nacelle = Bool(False, iotype='in', desc='configure with DriveWPACT if false, else configure with DriveSE')
     with_landbose = Bool(False, iotype='in', desc='configure with CSM BOS if false, else configure with new LandBOS model')
     flexible_blade = Bool(False, iotype='in', desc='configure rotor with flexible blade if True')
+    fpi_acceleration = Enum('none', ('none', 'aitken', 'anderson'), iotype='in', desc='acceleration of the flexible blade fixed point iteration')
     with_3pt_drive = Bool(False, iotype='in', desc='only used if configuring DriveSE - selects 3 pt or 4 pt design option') # TODO: change nacelle selection to enumerated rather than nested boolean
     with_ecn_opex = Bool(False, iotype='in', desc='configure with CSM OPEX if flase, else configure with ECN OPEX model')
     ecn_file = Str(iotype='in', desc='location of ecn excel file if used')
+    ecn_native = Bool(False, iotype='in', desc='evaluate the ECN workbook in process (lcoe_ecn_opex) rather than through Excel')
+    ecn_cells = Dict(iotype='in', desc='ECN workbook input and output cells, unless defined names (native evaluator only, see lcoe_ecn_opex.ECNOpexModel)')
+    with_wake_aep = Bool(False, iotype='in', desc='configure with fixed array losses if false, else compute them with a wake model of the layout')
+    wind_file = Str(iotype='in', desc='wind time series or direction by speed histogram for the AEP (Weibull based rotor.AEP if empty)')
+    wind_histogram = Bool(False, iotype='in', desc='wind_file is a direction by speed histogram rather than a time series')
 
     # Other I/O needed at lcoe system level
     sea_depth = Float(0.0, units='m', iotype='in', desc='sea depth for offshore wind project')
@@ -241,17 +309,27 @@ class lcoe_se_assembly(Assembly):
     month = Int(12, iotype='in', desc='month of project start')
     project_lifetime = Float(20.0, iotype='in', desc = 'project lifetime for wind plant')
 
-    def __init__(self, with_new_nacelle=False, with_landbos=False, flexible_blade=False, with_3pt_drive=False, with_ecn_opex=False, ecn_file=None):
+    def __init__(self, with_new_nacelle=False, with_landbos=False, flexible_blade=False, with_3pt_drive=False, with_ecn_opex=False, ecn_file=None, fpi_acceleration='none', ecn_native=False, with_wake_aep=False, wind_file=None, wind_histogram=False, ecn_cells=None):
         
         self.with_new_nacelle = with_new_nacelle
         self.with_landbos = with_landbos
         self.flexible_blade = flexible_blade
+        self.fpi_acceleration = fpi_acceleration
         self.with_3pt_drive = with_3pt_drive
         self.with_ecn_opex = with_ecn_opex
         if ecn_file == None:
             self.ecn_file=''
         else:
             self.ecn_file = ecn_file
+        self.ecn_native = ecn_native
+        if ecn_cells is not None:
+            self.ecn_cells = ecn_cells
+        self.with_wake_aep = with_wake_aep
+        if wind_file == None:
+            self.wind_file = ''
+        else:
+            self.wind_file = wind_file
+        self.wind_histogram = wind_histogram
         
         super(lcoe_se_assembly,self).__init__()
 
@@ -298,7 +376,7 @@ class lcoe_se_assembly(Assembly):
 		    configure_extended_financial_analysis(self)
 		
 		    # add TurbineSE assembly
-		    configure_turbine(self, self.with_new_nacelle, self.flexible_blade, self.with_3pt_drive)
+		    configure_turbine(self, self.with_new_nacelle, self.flexible_blade, self.with_3pt_drive, self.fpi_acceleration)
 		
 		    # replace TCC with turbine_costs
 		    configure_lcoe_with_turb_costs(self)
@@ -309,13 +387,19 @@ class lcoe_se_assembly(Assembly):
 		    else:
 		        configure_lcoe_with_csm_bos(self)
 		    
-		    # replace OPEX with CSM or ECN opex and add AEP
-		    if self.with_ecn_opex:  
+		    # add AEP from the Weibull based rotor.AEP, a wake model or measured wind data
+		    if self.wind_file:
+		        configure_lcoe_with_timeseries_aep(self, self.wind_file, self.wind_histogram, self.with_wake_aep)
+		    elif self.with_wake_aep:
+		        configure_lcoe_with_wake_aep(self)
+		    else:
 		        configure_lcoe_with_basic_aep(self)
-		        configure_lcoe_with_ecn_opex(self,ecn_file)     
+		
+		    # replace OPEX with CSM or ECN opex
+		    if self.with_ecn_opex:  
+		        configure_lcoe_with_ecn_opex(self,self.ecn_file,self.ecn_native,self.ecn_cells)     
 		        self.connect('opex_a.availability','aep_a.availability') # connecting here due to aep / opex reversal depending on model 
 		    else:
-		        configure_lcoe_with_basic_aep(self)
 		        configure_lcoe_with_csm_opex(self)
 		        self.add('availability',Float(0.94, iotype='in', desc='average annual availbility of wind turbines at plant'))
 		        self.connect('availability','aep_a.availability') # connecting here due to aep / opex reversal depending on model
@@ -324,15 +408,36 @@ class lcoe_se_assembly(Assembly):
 		    configure_lcoe_with_csm_fin(self)
 
 
-def example(wind_class='I',sea_depth=0.0,with_new_nacelle=False,with_landbos=False,flexible_blade=False,with_3pt_drive=False, with_ecn_opex=False, ecn_file=None,with_openwind=False,ow_file=None,ow_wkbook=None):
+def create_example_se_assembly(wind_class='I',sea_depth=0.0,with_new_nacelle=False,with_landbos=False,flexible_blade=False,with_3pt_drive=False, with_ecn_opex=False, ecn_file=None,with_openwind=False,ow_file=None,ow_wkbook=None,fpi_acceleration='none',ecn_native=False,ecn_cells=None,with_wake_aep=False,wind_file=None,wind_histogram=False):
     """
     Inputs:
         wind_class : str ('I', 'III', 'Offshore' - selected wind class for project)
         sea_depth : float (sea depth if an offshore wind plant)
+        fpi_acceleration : str ('none', 'aitken', 'anderson' - acceleration of the flexible blade iteration)
+        ecn_native, ecn_cells, with_wake_aep, wind_file, wind_histogram : as for lcoe_se_assembly
+
+    Returns:
+        lcoe_se : lcoe_se_assembly configured with the NREL 5 MW reference turbine and plant inputs (not yet run)
     """
 
     # === Create LCOE SE assembly ========
-    lcoe_se = lcoe_se_assembly(with_new_nacelle,with_landbos,flexible_blade,with_3pt_drive,with_ecn_opex,ecn_file)
+    lcoe_se = lcoe_se_assembly(with_new_nacelle=with_new_nacelle,with_landbos=with_landbos,flexible_blade=flexible_blade,
+                               with_3pt_drive=with_3pt_drive,with_ecn_opex=with_ecn_opex,ecn_file=ecn_file,
+                               fpi_acceleration=fpi_acceleration,ecn_native=ecn_native,ecn_cells=ecn_cells,
+                               with_wake_aep=with_wake_aep,wind_file=wind_file,wind_histogram=wind_histogram)
+
+    configure_example_se_assembly(lcoe_se,wind_class,sea_depth,with_ecn_opex,with_openwind)
+
+    return lcoe_se
+
+
+def configure_example_se_assembly(lcoe_se,wind_class='I',sea_depth=0.0,with_ecn_opex=False,with_openwind=False):
+    """
+    Inputs:
+        lcoe_se : lcoe_se_assembly to populate with the NREL 5 MW reference turbine and plant inputs
+        wind_class : str ('I', 'III', 'Offshore' - selected wind class for project)
+        sea_depth : float (sea depth if an offshore wind plant)
+    """
 
     # === Set assembly variables and objects ===
     lcoe_se.sea_depth = sea_depth # 0.0 for land-based turbine
@@ -376,7 +481,7 @@ def example(wind_class='I',sea_depth=0.0,with_new_nacelle=False,with_landbos=Fal
     lcoe_se.soil = 'STANDARD' '''
 
     # aep ====
-    if not with_openwind:
+    if not with_openwind and not lcoe_se.with_wake_aep:
         lcoe_se.array_losses = 0.059
     lcoe_se.other_losses = 0.0
     if not with_ecn_opex:
@@ -393,7 +498,7 @@ def example(wind_class='I',sea_depth=0.0,with_new_nacelle=False,with_landbos=Fal
     # Set plant level inputs ===
     shearExp = 0.2 #TODO : should be an input to lcoe
     rotor.cdf_reference_height_wind_speed = 90.0
-    if not with_openwind:
+    if not with_openwind and not lcoe_se.with_wake_aep:
         lcoe_se.array_losses = 0.1
     lcoe_se.other_losses = 0.0
     if not with_ecn_opex:
@@ -406,7 +511,10 @@ def example(wind_class='I',sea_depth=0.0,with_new_nacelle=False,with_landbos=Fal
         # rotor.cdf_reference_height_wind_speed = 50.0
         # rotor.weibull_shape = 2.1
         shearExp = 0.14 # TODO : should be an input to lcoe
-        lcoe_se.array_losses = 0.15
+        if lcoe_se.with_wake_aep:
+            lcoe_se.aep_a.wake_decay = 0.05
+        else:
+            lcoe_se.array_losses = 0.15
         if not with_ecn_opex:
             lcoe_se.availability = 0.96
         lcoe_se.offshore = True
@@ -419,6 +527,16 @@ def example(wind_class='I',sea_depth=0.0,with_new_nacelle=False,with_landbos=Fal
 
     # ====
 
+
+def example(wind_class='I',sea_depth=0.0,with_new_nacelle=False,with_landbos=False,flexible_blade=False,with_3pt_drive=False, with_ecn_opex=False, ecn_file=None,with_openwind=False,ow_file=None,ow_wkbook=None):
+    """
+    Inputs:
+        wind_class : str ('I', 'III', 'Offshore' - selected wind class for project)
+        sea_depth : float (sea depth if an offshore wind plant)
+    """
+
+    lcoe_se = create_example_se_assembly(wind_class,sea_depth,with_new_nacelle,with_landbos,flexible_blade,with_3pt_drive,with_ecn_opex,ecn_file,with_openwind,ow_file,ow_wkbook)
+
     # === Run default assembly and print results
     lcoe_se.run()
     # ====
@@ -231,6 +231,7 @@ class lcoe_se_assembly(Assembly):
     with_new_nacelle = Bool(False, iotype='in', desc='configure with DriveWPACT if false, else configure with DriveSE')
     with_landbose = Bool(False, iotype='in', desc='configure with CSM BOS if false, else configure with new LandBOS model')
     flexible_blade = Bool(False, iotype='in', desc='configure rotor with flexible blade if True')
+    fpi_acceleration = Enum('none', ('none', 'aitken', 'anderson'), iotype='in', desc='acceleration of the flexible blade fixed point iteration')
     with_3pt_drive = Bool(False, iotype='in', desc='only used if configuring DriveSE - selects 3 pt or 4 pt design option') # TODO: change nacelle selection to enumerated rather than nested boolean
     with_ecn_opex = Bool(False, iotype='in', desc='configure with CSM OPEX if flase, else configure with ECN OPEX model')
     ecn_file = Str(iotype='in', desc='location of ecn excel file if used')
@@ -241,11 +242,12 @@ class lcoe_se_assembly(Assembly):
     month = Int(12, iotype='in', desc='month of project start')
     project_lifetime = Float(20.0, iotype='in', desc = 'project lifetime for wind plant')
 
-    def __init__(self, with_new_nacelle=False, with_landbos=False, flexible_blade=False, with_3pt_drive=False, with_ecn_opex=False, ecn_file=None):
+    def __init__(self, with_new_nacelle=False, with_landbos=False, flexible_blade=False, with_3pt_drive=False, with_ecn_opex=False, ecn_file=None, fpi_acceleration='none'):
         
         self.with_new_nacelle = with_new_nacelle
         self.with_landbos = with_landbos
         self.flexible_blade = flexible_blade
+        self.fpi_acceleration = fpi_acceleration
         self.with_3pt_drive = with_3pt_drive
         self.with_ecn_opex = with_ecn_opex
         if ecn_file == None:
@@ -298,7 +300,7 @@ class lcoe_se_assembly(Assembly):
 		    configure_extended_financial_analysis(self)
 		
 		    # add TurbineSE assembly
-		    configure_turbine_with_jacket(self, self.with_new_nacelle, self.flexible_blade, self.with_3pt_drive)
+		    configure_turbine_with_jacket(self, self.with_new_nacelle, self.flexible_blade, self.with_3pt_drive, self.fpi_acceleration)
 		
 		    # replace TCC with turbine_costs
 		    configure_lcoe_with_turb_costs(self)
@@ -312,7 +314,7 @@ class lcoe_se_assembly(Assembly):
 		    # replace OPEX with CSM or ECN opex and add AEP
 		    if self.with_ecn_opex:  
 		        configure_lcoe_with_basic_aep(self)
-		        configure_lcoe_with_ecn_opex(self,ecn_file)     
+		        configure_lcoe_with_ecn_opex(self,self.ecn_file)     
 		        self.connect('opex_a.availability','aep_a.availability') # connecting here due to aep / opex reversal depending on model 
 		    else:
 		        configure_lcoe_with_basic_aep(self)
@@ -22,6 +22,7 @@ from plant_costsse.ecn_offshore_opex.ecn_offshore_opex  import opex_ecn_assembly
 from plant_financese.nrel_csm_fin.nrel_csm_fin import fin_csm_assembly
 from plant_energyse.basic_aep.basic_aep import aep_assembly
 from plant_energyse.openwind.enterprise.openwind_assembly import openwind_assembly
+from wisdem.lcoe.lcoe_openwind import aep_openwind_batched
 #from landbos import LandBOS
 
 # Current configuration assembly options for LCOE SE
@@ -195,17 +196,26 @@ class zip_powercurve(Component):
     	  self.power_curve = np.array([self.V,self.P])
     	  self.rpm_curve = np.array([self.V,self.Omega])
 
-def configure_lcoe_with_openwind(assembly, ow_file='', ow_wkbook=''):
+def configure_lcoe_with_openwind(assembly, ow_file='', ow_wkbook='', batcher=None):
     """
     aep inputs
         power_curve    = Array([], iotype='in', desc='wind turbine power curve')
         rpm            = Array([], iotype='in', desc='wind turbine rpm curve')
         ct             = Array([], iotype='in', desc='wind turbine ct curve')
+
+    With a batcher (lcoe_openwind.AEPBatcher), aep_a queues its requests there instead of
+    launching OpenWind itself, and the rotor power curve is connected.
     """
 
     assembly.add('other_losses',Float(0.0, iotype='in', desc='energy losses due to blade soiling, electrical, etc'))
 
-    assembly.replace('aep_a', openwind_assembly(ow_file, ow_wkbook))
+    if batcher is not None:
+        assembly.replace('aep_a', aep_openwind_batched(batcher))
+        assembly.connect('turbine_number', 'aep_a.turbine_number')
+        assembly.connect('rotor.V', 'aep_a.V')
+        assembly.connect('rotor.P', 'aep_a.P')
+    else:
+        assembly.replace('aep_a', openwind_assembly(ow_file, ow_wkbook))
     
     assembly.connect('rotor.hubHt','aep_a.hub_height')
     assembly.connect('rotor.diameter','aep_a.rotor_diameter')
@@ -282,7 +292,7 @@ class lcoe_se_assembly(Assembly):
     month = Int(12, iotype='in', desc='month of project start')
     project_lifetime = Float(20.0, iotype='in', desc = 'project lifetime for wind plant')
 
-    def __init__(self, with_new_nacelle=False, with_landbos=False, flexible_blade=False, with_3pt_drive=False, with_ecn_opex=False, ecn_file=None,with_openwind=False,ow_file=None,ow_wkbook=None):
+    def __init__(self, with_new_nacelle=False, with_landbos=False, flexible_blade=False, with_3pt_drive=False, with_ecn_opex=False, ecn_file=None,with_openwind=False,ow_file=None,ow_wkbook=None,ow_batcher=None):
         
         self.with_new_nacelle = with_new_nacelle
         self.with_landbos = with_landbos
@@ -302,6 +312,7 @@ class lcoe_se_assembly(Assembly):
             self.ow_wkbook = ''
         else:
             self.ow_wkbook = ow_wkbook
+        self.ow_batcher = ow_batcher # lcoe_openwind.AEPBatcher that replaces the OpenWind assembly if given
         
         super(lcoe_se_assembly,self).__init__()
 
@@ -361,17 +372,17 @@ class lcoe_se_assembly(Assembly):
 		    
 		    # replace OPEX with CSM or ECN opex
 		    if self.with_ecn_opex and self.with_openwind:
-		        configure_lcoe_with_openwind(self,ow_file, ow_wkbook)
-		        configure_lcoe_with_ecn_opex(self,ecn_file)
+		        configure_lcoe_with_openwind(self,self.ow_file,self.ow_wkbook,self.ow_batcher)
+		        configure_lcoe_with_ecn_opex(self,self.ecn_file)
 		        self.connect('opex_a.availability','aep_a.availability') # connecting here due to aep / opex reversal depending on model 
 		    elif (not self.with_ecn_opex) and self.with_openwind:
-		        configure_lcoe_with_openwind(self,ow_file, ow_wkbook)
+		        configure_lcoe_with_openwind(self,self.ow_file,self.ow_wkbook,self.ow_batcher)
 		        configure_lcoe_with_csm_opex(self)
 		        self.add('availability',Float(0.94, iotype='in', desc='average annual availbility of wind turbines at plant'))
 		        self.connect('availability','aep_a.availability') # connecting here due to aep / opex reversal depending on model
 		    elif self.with_ecn_opex and (not self.with_openwind):  
 		        configure_lcoe_with_basic_aep(self)
-		        configure_lcoe_with_ecn_opex(self,ecn_file)     
+		        configure_lcoe_with_ecn_opex(self,self.ecn_file)     
 		        self.connect('opex_a.availability','aep_a.availability') # connecting here due to aep / opex reversal depending on model 
 		    else:
 		        configure_lcoe_with_basic_aep(self)
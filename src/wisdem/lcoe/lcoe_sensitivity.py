@@ -0,0 +1,329 @@
+"""
+lcoe_sensitivity.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+from wisdem.lcoe.lcoe_se_assembly import create_example_se_assembly
+from wisdem.lcoe.lcoe_doe import run_doe
+from wisdem.lcoe.lcoe_csm_vectorized import lcoe_csm_vectorized
+from wisdem.lcoe.lcoe_sampling import sobol_sequence, scale_samples
+from wisdem.lcoe.lcoe_uq import SE_PLANT_UNCERTAINTIES, SE_SITE_UNCERTAINTIES
+
+
+# nominal inputs of the vectorized cost and scaling model (as in set_example_csm_inputs)
+CSM_EXAMPLE_INPUTS = OrderedDict([
+    ('machine_rating', 5000.0),
+    ('rotor_diameter', 126.0),
+    ('max_tip_speed', 80.0),
+    ('hub_height', 90.0),
+    ('sea_depth', 20.0),
+    ('wind_speed_50m', 8.02),
+    ('weibull_k', 2.15),
+    ('array_losses', 0.10),
+    ('availability', 0.941),
+])
+
+CSM_UNCERTAINTIES = OrderedDict([
+    ('machine_rating', ('uniform', 4000.0, 6000.0)),
+    ('rotor_diameter', ('uniform', 110.0, 140.0)),
+    ('max_tip_speed', ('uniform', 75.0, 90.0)),
+    ('hub_height', ('uniform', 80.0, 110.0)),
+    ('sea_depth', ('uniform', 10.0, 40.0)),
+    ('wind_speed_50m', ('normal', 8.02, 0.4)),
+    ('weibull_k', ('uniform', 1.8, 2.4)),
+    ('shear_exponent', ('uniform', 0.07, 0.2)),
+    ('max_power_coefficient', ('uniform', 0.46, 0.50)),
+    ('opt_tsr', ('uniform', 7.0, 8.5)),
+    ('thrust_coefficient', ('uniform', 0.4, 0.6)),
+    ('soiling_losses', ('uniform', 0.0, 0.03)),
+    ('array_losses', ('triangular', 0.05, 0.10, 0.15)),
+    ('availability', ('triangular', 0.90, 0.941, 0.97)),
+    ('turbine_number', ('uniform', 60.0, 140.0)),
+    ('fixed_charge_rate', ('uniform', 0.08, 0.14)),
+    ('tax_rate', ('uniform', 0.3, 0.45)),
+    ('discount_rate', ('uniform', 0.05, 0.09)),
+    ('construction_time', ('uniform', 0.5, 2.0)),
+    ('project_lifetime', ('uniform', 15.0, 25.0)),
+])
+
+SA_METHODS = ('sobol', 'fast')
+
+
+# --- sampling ---
+
+def saltelli_sample(distributions, n, seed=None):
+    """sample for Sobol index estimation: matrices A and B from a 2k dimensional scrambled Sobol
+    sequence, followed by the k matrices AB_i (A with column i taken from B)
+
+    Returns
+    -------
+    samples : OrderedDict
+        input path -> ndarray (n*(k+2),) ordered as A, B, AB_1, ..., AB_k
+    """
+
+    k = len(distributions)
+    u = sobol_sequence(n, 2*k, seed=seed)
+    A = u[:, :k]
+    B = u[:, k:]
+
+    blocks = [A, B]
+    for i in range(k):
+        AB = A.copy()
+        AB[:, i] = B[:, i]
+        blocks.append(AB)
+
+    return scale_samples(np.vstack(blocks), distributions)
+
+
+def _fast_frequencies(n, k, M):
+
+    omega = np.zeros(k)
+    omega[0] = (n - 1) // (2*M)
+    m = omega[0] // (2*M)
+    if m < 1:
+        raise ValueError('FAST needs n > 4*M**2 samples per input (n=%d, M=%d)' % (n, M))
+    if m >= k - 1:
+        omega[1:] = np.floor(np.linspace(1, m, k - 1))
+    else:
+        omega[1:] = np.arange(k - 1) % m + 1
+
+    return omega
+
+
+def fast_sample(distributions, n, M=4, seed=None):
+    """extended FAST sample (Saltelli et al., 1999): for each input in turn a search curve on which
+    that input oscillates at the highest frequency
+
+    Returns
+    -------
+    samples : OrderedDict
+        input path -> ndarray (n*k,), one block of n points per input
+    """
+
+    k = len(distributions)
+    omega = _fast_frequencies(n, k, M)
+    rng = np.random.RandomState(seed)
+    s = 2*np.pi/n*np.arange(n)
+
+    u = np.zeros((n*k, k))
+    for i in range(k):
+        frequencies = np.concatenate([omega[1:i+1], [omega[0]], omega[i+1:]])
+        phi = 2*np.pi*rng.uniform(size=k)
+        u[i*n:(i+1)*n] = 0.5 + np.arcsin(np.sin(frequencies*s[:, np.newaxis] + phi))/np.pi
+
+    # keep away from the bounds of the unit cube (unbounded distributions)
+    u = np.clip(u, 0.5/n, 1.0 - 0.5/n)
+
+    return scale_samples(u, distributions)
+
+
+# --- index estimation (all inputs, outputs and bootstrap replicates at once) ---
+
+def _sobol_estimates(fA, fB, fAB):
+
+    # fA, fB: (..., n, m), fAB: (..., k, n, m)
+    V = np.var(np.concatenate([fA, fB], axis=-2), axis=-2)[..., np.newaxis, :]
+    S1 = np.mean(fB[..., np.newaxis, :, :]*(fAB - fA[..., np.newaxis, :, :]), axis=-2)/V  # Saltelli (2010)
+    ST = 0.5*np.mean((fA[..., np.newaxis, :, :] - fAB)**2, axis=-2)/V  # Jansen (1999)
+
+    return S1, ST
+
+
+def sobol_indices(Y, n, k, bootstrap=100, seed=None):
+    """first order and total Sobol indices from outputs on a saltelli_sample
+
+    Parameters
+    ----------
+    Y : ndarray (n*(k+2), m)
+        outputs, in the sample order.  Rows with a failed (non finite) output are dropped.
+    bootstrap : int
+        number of bootstrap resamples for the confidence intervals
+
+    Returns
+    -------
+    S1, ST, S1_conf, ST_conf : ndarray (k, m)
+        indices and 95% confidence half widths
+    valid : int
+        number of sample rows used
+    """
+
+    Y = np.asarray(Y, dtype=float).reshape(n*(k+2), -1)
+    fA = Y[:n]
+    fB = Y[n:2*n]
+    fAB = Y[2*n:].reshape(k, n, -1)
+
+    ok = np.all(np.isfinite(fA), axis=1) & np.all(np.isfinite(fB), axis=1) & np.all(np.isfinite(fAB), axis=(0, 2))
+    fA, fB, fAB = fA[ok], fB[ok], fAB[:, ok]
+    nv = int(np.sum(ok))
+    if nv < 2:
+        raise RuntimeError('too few successful evaluations to estimate Sobol indices')
+
+    S1, ST = _sobol_estimates(fA, fB, fAB)
+
+    S1_conf = np.zeros_like(S1)
+    ST_conf = np.zeros_like(ST)
+    if bootstrap > 0:
+        r = np.random.RandomState(seed).randint(0, nv, (bootstrap, nv))
+        S1b = np.zeros((bootstrap,) + S1.shape)
+        STb = np.zeros((bootstrap,) + ST.shape)
+        batch = max(1, int(2e6 // fAB.size))  # replicates estimated at once
+        for start in range(0, bootstrap, batch):
+            rb = r[start:start+batch]
+            S1b[start:start+batch], STb[start:start+batch] = _sobol_estimates(
+                fA[rb], fB[rb], fAB[:, rb].transpose(1, 0, 2, 3))
+        S1_conf = 1.96*np.std(S1b, axis=0, ddof=1)
+        ST_conf = 1.96*np.std(STb, axis=0, ddof=1)
+
+    return S1, ST, S1_conf, ST_conf, nv
+
+
+def fast_indices(Y, n, k, M=4):
+    """first order and total indices from outputs on a fast_sample
+
+    Returns
+    -------
+    S1, ST : ndarray (k, m)
+    """
+
+    Y = np.asarray(Y, dtype=float).reshape(k, n, -1)
+    if not np.all(np.isfinite(Y)):
+        raise RuntimeError('FAST needs every evaluation to succeed')
+
+    omega = int(_fast_frequencies(n, k, M)[0])
+
+    f = np.fft.fft(Y, axis=1)
+    Sp = (np.abs(f[:, 1:(n + 1)//2])/n)**2
+    V = 2*np.sum(Sp, axis=1)
+    D1 = 2*np.sum(Sp[:, np.arange(1, M + 1)*omega - 1], axis=1)
+    Dt = 2*np.sum(Sp[:, :omega//2], axis=1)
+
+    return D1/V, 1.0 - Dt/V
+
+
+# --- models ---
+
+def evaluate_csm(samples, outputs=('coe',), inputs=CSM_EXAMPLE_INPUTS):
+    """evaluate the cost and scaling model on all samples at once (lcoe_csm_vectorized)"""
+
+    x = OrderedDict(inputs)
+    x.update(samples)
+    results = lcoe_csm_vectorized(**x)
+
+    return np.column_stack([results[name] for name in outputs])
+
+
+def evaluate_se(samples, outputs=('coe',), builder=create_example_se_assembly, builder_kwargs=None, **kwargs):
+    """evaluate the samples with run_doe (parallel workers, upstream result cache on by default)"""
+
+    kwargs.setdefault('cache', True)
+    results = run_doe(samples, builder, builder_kwargs, list(outputs), **kwargs)
+
+    return np.column_stack([results[name] for name in outputs])
+
+
+def sensitivity_analysis(distributions, n=1024, method='sobol', model='se', outputs=('coe',), seed=None,
+                         bootstrap=100, M=4, **kwargs):
+    """variance based global sensitivity indices of assembly outputs
+
+    Parameters
+    ----------
+    distributions : OrderedDict
+        input path -> distribution tuple (see lcoe_sampling)
+    n : int
+        base sample size: n*(k+2) evaluations for 'sobol' (a power of 2 is best), n*k for 'fast'
+    method : str
+        'sobol' (Saltelli sampling with Sobol sequences) or 'fast' (extended FAST)
+    model : str or callable
+        'se' (lcoe_se_assembly through run_doe), 'csm' (vectorized cost and scaling model), or
+        a callable evaluate(samples, outputs) returning an array (evaluations, outputs)
+    outputs : list(str)
+        scalar outputs to analyze
+    seed : int
+    bootstrap : int
+        bootstrap resamples for the Sobol confidence intervals
+    M : int
+        interference factor of FAST
+    kwargs : dict
+        passed to the model evaluation (e.g. processes, builder_kwargs for 'se')
+
+    Returns
+    -------
+    indices : OrderedDict
+        output -> OrderedDict(input -> dict with S1, ST and, for 'sobol', S1_conf and ST_conf),
+        plus 'evaluations' and 'valid' (number of base samples used)
+    """
+
+    if method not in SA_METHODS:
+        raise ValueError('unknown sensitivity method %r' % method)
+
+    k = len(distributions)
+    if method == 'sobol':
+        samples = saltelli_sample(distributions, n, seed)
+    else:
+        samples = fast_sample(distributions, n, M, seed)
+
+    if model == 'se':
+        Y = evaluate_se(samples, outputs, **kwargs)
+    elif model == 'csm':
+        Y = evaluate_csm(samples, outputs, **kwargs)
+    else:
+        Y = model(samples, outputs, **kwargs)
+
+    if method == 'sobol':
+        S1, ST, S1_conf, ST_conf, valid = sobol_indices(Y, n, k, bootstrap, seed)
+    else:
+        S1, ST = fast_indices(Y, n, k, M)
+        valid = n
+
+    indices = OrderedDict()
+    for j, output in enumerate(outputs):
+        indices[output] = OrderedDict()
+        for i, name in enumerate(distributions):
+            index = OrderedDict([('S1', S1[i, j]), ('ST', ST[i, j])])
+            if method == 'sobol':
+                index['S1_conf'] = S1_conf[i, j]
+                index['ST_conf'] = ST_conf[i, j]
+            indices[output][name] = index
+    indices['evaluations'] = len(Y)
+    indices['valid'] = valid
+
+    return indices
+
+
+def print_indices(indices, output='coe'):
+
+    print '{0:28s} {1:>8s} {2:>8s}'.format('input', 'S1', 'ST')
+    for name, index in sorted(indices[output].iteritems(), key=lambda item: -item[1]['ST']):
+        line = '{0:28s} {1:8.3f} {2:8.3f}'.format(name, index['S1'], index['ST'])
+        if 'S1_conf' in index:
+            line += '   (+/- {0:.3f}, {1:.3f})'.format(index['S1_conf'], index['ST_conf'])
+        print line
+
+
+def example():
+
+    import time
+
+    tt = time.time()
+    indices = sensitivity_analysis(CSM_UNCERTAINTIES, n=4096, model='csm', outputs=('coe', 'net_aep'), seed=1)
+    print 'cost and scaling model: {0} evaluations in {1:.1f} s'.format(indices['evaluations'], time.time() - tt)
+    print_indices(indices)
+
+    distributions = OrderedDict(SE_PLANT_UNCERTAINTIES)
+    distributions.update(SE_SITE_UNCERTAINTIES)
+    tt = time.time()
+    indices = sensitivity_analysis(distributions, n=65, method='fast', model='se', seed=1,
+                                   builder_kwargs={'with_new_nacelle': True})
+    print 'lcoe_se_assembly (FAST): {0} evaluations in {1:.1f} s'.format(indices['evaluations'], time.time() - tt)
+    print_indices(indices)
+
+
+if __name__ == '__main__':
+
+    example()
@@ -0,0 +1,161 @@
+"""
+lcoe_snapshot.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import os
+import sys
+import imp
+import hashlib
+import tempfile
+import warnings
+import cPickle as pickle
+
+from openmdao.main.api import Container
+from openmdao.util.eggsaver import SAVE_CPICKLE
+
+from wisdem.lcoe.lcoe_se_assembly import create_example_se_assembly
+
+
+def save_snapshot(assembly, filename):
+    """write a configured and populated assembly (with all of its children and connections)
+    to a binary snapshot file"""
+
+    directory = os.path.dirname(os.path.abspath(filename))
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    # write then rename so concurrent readers never see a partial file
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    with os.fdopen(fd, 'wb') as f:
+        assembly.save(f, fmt=SAVE_CPICKLE, proto=-1)
+    os.rename(tmp, filename)
+
+
+def load_snapshot(filename):
+    """restore an assembly written by save_snapshot"""
+
+    with open(filename, 'rb') as f:
+        assembly = Container.load(f, fmt=SAVE_CPICKLE)
+
+    return assembly
+
+
+# packages whose sources and data files (e.g. the reference turbine blade and airfoil files)
+# define the assemblies that are snapshot
+SNAPSHOT_PACKAGES = ('wisdem', 'rotorse', 'ccblade', 'drivese', 'drivewpact', 'towerse', 'commonse',
+                     'turbine_costsse', 'plant_costsse', 'plant_financese', 'fusedwind')
+
+# files in the package directories that do not affect the assemblies
+_IGNORED_EXTENSIONS = ('.pyc', '.pyo', '.snapshot', '.tmp')
+
+
+def source_digest(packages=SNAPSHOT_PACKAGES):
+    """hex digest of the path, modification time and size of every source and data file
+    in the directories of the installed packages (packages that are not installed are skipped)"""
+
+    h = hashlib.sha1()
+
+    for name in packages:
+        try:
+            path = imp.find_module(name)[1]
+        except ImportError:
+            continue
+        h.update('package %s:%s;' % (name, path))
+
+        if not os.path.isdir(path):  # single module
+            st = os.stat(path)
+            h.update('%s:%r:%d;' % (path, st.st_mtime, st.st_size))
+            continue
+
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for fname in sorted(files):
+                if fname.endswith(_IGNORED_EXTENSIONS):
+                    continue
+                st = os.stat(os.path.join(root, fname))
+                h.update('%s:%r:%d;' % (os.path.relpath(os.path.join(root, fname), path), st.st_mtime, st.st_size))
+
+    return h.hexdigest()
+
+
+def snapshot_key(builder, kwargs, packages=SNAPSHOT_PACKAGES):
+    """name identifying the assembly produced by builder(**kwargs)
+
+    The key includes the modification time of the builder's source file and a digest of the
+    sources and data files of packages (see source_digest), so snapshots are rebuilt after the
+    model definition, the reference turbine files or any of the SE components change.
+    """
+
+    # the builder may be defined outside of packages (e.g. in a script)
+    source = getattr(sys.modules[builder.__module__], '__file__', '')
+    if source.endswith(('.pyc', '.pyo')):
+        source = source[:-1]
+    mtime = os.path.getmtime(source) if os.path.exists(source) else 0.0
+
+    h = hashlib.sha1()
+    h.update('%s.%s:%r:%s' % (builder.__module__, builder.__name__, mtime, source_digest(packages)))
+    for name in sorted(kwargs.keys()):
+        h.update('%s=%r;' % (name, kwargs[name]))
+
+    return '%s_%s' % (builder.__name__, h.hexdigest()[:16])
+
+
+def snapshot_assembly(builder=create_example_se_assembly, directory='.', **kwargs):
+    """return builder(**kwargs), restored from a snapshot in directory when one exists
+
+    The first call builds the assembly normally and saves it; later calls (typically in
+    fresh worker processes) load the snapshot instead of configuring the assembly again.
+    A snapshot that cannot be unpickled is rebuilt with a warning.
+
+    Parameters
+    ----------
+    builder : callable
+        module-level function returning a configured and populated assembly
+    directory : str
+        location of the snapshot files
+    kwargs : dict
+        keyword arguments for the builder
+
+    Returns
+    -------
+    assembly : Assembly
+    """
+
+    filename = os.path.join(directory, snapshot_key(builder, kwargs) + '.snapshot')
+
+    if os.path.exists(filename):
+        try:
+            return load_snapshot(filename)
+        except (EOFError, ImportError, AttributeError, pickle.UnpicklingError) as e:
+            # truncated, or refers to classes that no longer exist: rebuild below
+            warnings.warn('snapshot %s could not be loaded (%s: %s), rebuilding it'
+                          % (filename, e.__class__.__name__, e))
+
+    assembly = builder(**kwargs)
+    save_snapshot(assembly, filename)
+
+    return assembly
+
+
+if __name__ == '__main__':
+
+    import time
+
+    directory = os.path.join(tempfile.gettempdir(), 'wisdem_snapshots')
+
+    tt = time.time()
+    lcoe_se = create_example_se_assembly(with_new_nacelle=True)
+    print 'build from scratch: {0:.2f} s'.format(time.time() - tt)
+
+    filename = os.path.join(directory, 'lcoe_se.snapshot')
+    save_snapshot(lcoe_se, filename)
+
+    tt = time.time()
+    lcoe_se = load_snapshot(filename)
+    print 'restore from snapshot: {0:.2f} s'.format(time.time() - tt)
+
+    lcoe_se.run()
+    print 'COE ${0:.4f} USD/kWh'.format(lcoe_se.coe)
@@ -0,0 +1,286 @@
+"""
+lcoe_store.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import os
+import re
+import json
+from collections import OrderedDict
+
+import numpy as np
+
+from openmdao.main.api import VariableTree
+
+try:
+    import fcntl
+
+    def _lock(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _unlock(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+except ImportError:  # Windows
+    import msvcrt
+
+    def _lock(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _unlock(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+# outputs of lcoe_se_assembly recorded by default (VarTrees are expanded into one column per variable)
+SE_RECORDED_OUTPUTS = ('coe', 'net_aep', 'turbine_cost', 'bos_costs', 'avg_annual_opex',
+                       'rotor.mass_all_blades', 'hub.hub_system_mass', 'nacelle.nacelle_mass', 'tower.mass',
+                       'opex_breakdown', 'bos_breakdown', 'rotor.V', 'rotor.P')
+
+
+def assembly_record(assembly, outputs=SE_RECORDED_OUTPUTS):
+    """current values of outputs as a flat record: path -> scalar or array, with every
+    variable of a VarTree output as its own 'tree.variable' entry"""
+
+    record = OrderedDict()
+
+    def add(name, value):
+        if isinstance(value, VariableTree):
+            for child in sorted(value.list_vars()):
+                add(name + '.' + child, getattr(value, child))
+        else:
+            record[name] = value
+
+    for name in outputs:
+        add(name, assembly.get(name))
+
+    return record
+
+
+class ResultsStore(object):
+    """append-only columnar store of case results in a directory
+
+    Each column is a raw binary file holding one fixed-shape cell per row, so that a column of
+    any size can be read back as a memory map.  The column names, dtypes and cell shapes are
+    fixed by the first record written (schema.json).  Rows are written in chunks under an
+    exclusive file lock and only become visible once the row count (rows) is updated, so any
+    number of processes can append to the same store, and a writer that dies mid-chunk leaves
+    no partial rows behind.
+
+    Parameters
+    ----------
+    directory : str
+        store location (created if needed)
+    chunk_rows : int
+        number of records buffered before they are written
+    durable : bool
+        fsync the column files before committing each chunk
+    """
+
+    def __init__(self, directory, chunk_rows=64, durable=False):
+
+        self.directory = directory
+        self.chunk_rows = chunk_rows
+        self.durable = durable
+        self._buffer = []
+        self._schema = None
+
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:  # created concurrently by another writer
+                if not os.path.isdir(directory):
+                    raise
+
+    # --- files ---
+
+    def _path(self, name):
+
+        return os.path.join(self.directory, name)
+
+    def _read_rows(self):
+
+        try:
+            with open(self._path('rows')) as f:
+                return int(f.read())
+        except IOError:
+            return 0
+
+    def _replace(self, name, text):
+        """write a small file atomically, so that readers without the lock never see it half written"""
+
+        tmp = self._path('%s.%d.tmp' % (name, os.getpid()))
+        with open(tmp, 'w') as f:
+            f.write(text)
+        if os.name == 'nt' and os.path.exists(self._path(name)):
+            os.remove(self._path(name))
+        os.rename(tmp, self._path(name))
+
+    @property
+    def schema(self):
+
+        if self._schema is None and os.path.exists(self._path('schema.json')):
+            with open(self._path('schema.json')) as f:
+                columns = json.load(f, object_pairs_hook=OrderedDict)['columns']
+            self._schema = OrderedDict((c['name'], c) for c in columns)
+
+        return self._schema
+
+    def _create_schema(self, record):
+
+        columns = []
+        files = set()
+        for name, value in record.iteritems():
+            value = np.asarray(value)
+            if value.dtype.kind not in 'biuf':
+                raise TypeError('column %s: only numeric values can be stored (got %s)' % (name, value.dtype))
+            dtype = np.dtype(bool) if value.dtype.kind == 'b' else np.dtype(float) if value.dtype.kind == 'f' \
+                else np.dtype(np.int64)
+            filename = re.sub(r'[^\w.\-]', '_', name) + '.bin'
+            while filename in files:
+                filename = '_' + filename
+            files.add(filename)
+            columns.append(OrderedDict([('name', name), ('dtype', dtype.str), ('shape', list(value.shape)),
+                                        ('file', filename)]))
+
+        self._replace('schema.json', json.dumps({'columns': columns}, indent=1))
+        self._schema = None
+
+    # --- writing ---
+
+    def _check(self, record):
+
+        schema = self.schema
+        if set(record.keys()) != set(schema.keys()):
+            raise ValueError('record columns differ from the store schema: %s'
+                             % ', '.join(sorted(set(record.keys()) ^ set(schema.keys()))))
+        for name, column in schema.iteritems():
+            if np.shape(record[name]) != tuple(column['shape']):
+                raise ValueError('column %s: cell shape %s, expected %s'
+                                 % (name, np.shape(record[name]), tuple(column['shape'])))
+
+    def append(self, record):
+        """buffer one case (column name -> scalar or array), writing when chunk_rows are buffered"""
+
+        if self.schema is not None:
+            self._check(record)
+        self._buffer.append(record)
+        if len(self._buffer) >= self.chunk_rows:
+            self.flush()
+
+    def flush(self):
+
+        if not self._buffer:
+            return
+
+        with open(self._path('lock'), 'a+') as lock:
+            _lock(lock)
+            try:
+                if self.schema is None:
+                    self._create_schema(self._buffer[0])
+                    try:
+                        for record in self._buffer:
+                            self._check(record)
+                    except ValueError:
+                        self._buffer = []
+                        raise
+                schema = self.schema
+
+                rows = self._read_rows()
+                for name, column in schema.iteritems():
+                    dtype = np.dtype(column['dtype'])
+                    shape = tuple(column['shape'])
+                    cells = np.empty((len(self._buffer),) + shape, dtype=dtype)
+                    for i, record in enumerate(self._buffer):
+                        cells[i] = np.asarray(record[name], dtype=dtype)
+
+                    # overwrite anything beyond the committed rows (left by an interrupted writer)
+                    mode = 'r+b' if os.path.exists(self._path(column['file'])) else 'wb'
+                    with open(self._path(column['file']), mode) as f:
+                        f.seek(rows*dtype.itemsize*int(np.prod(shape)))
+                        f.write(cells.tostring())
+                        f.flush()
+                        if self.durable:
+                            os.fsync(f.fileno())
+
+                self._replace('rows', str(rows + len(self._buffer)))
+                self._buffer = []
+
+            finally:
+                _unlock(lock)
+
+    def close(self):
+
+        self.flush()
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, *args):
+
+        self.close()
+
+    # --- reading ---
+
+    def __len__(self):
+
+        return self._read_rows()
+
+    def columns(self):
+
+        return list(self.schema.keys()) if self.schema is not None else []
+
+    def column(self, name, mmap=True, rows=None):
+        """committed rows (or the first rows) of a column, shape (rows,) + cell shape, as a
+        read-only memory map (or an in-memory copy if mmap is False)"""
+
+        column = self.schema[name]
+        dtype = np.dtype(column['dtype'])
+        shape = (len(self) if rows is None else rows,) + tuple(column['shape'])
+        if shape[0] == 0:
+            return np.zeros(shape, dtype=dtype)
+        if mmap:
+            return np.memmap(self._path(column['file']), dtype=dtype, mode='r', shape=shape)
+
+        with open(self._path(column['file']), 'rb') as f:
+            return np.fromfile(f, dtype=dtype, count=int(np.prod(shape))).reshape(shape)
+
+    def __getitem__(self, name):
+
+        return self.column(name)
+
+    def read(self, names=None, mmap=True):
+        """dict of columns (all by default), all with the same committed rows"""
+
+        if names is None:
+            names = self.columns()
+        rows = len(self)
+
+        return OrderedDict((name, self.column(name, mmap, rows)) for name in names)
+
+
+def example():
+
+    import tempfile
+    from wisdem.lcoe.lcoe_doe import run_doe, full_factorial
+
+    directory = tempfile.mkdtemp(prefix='lcoe_store_')
+    cases = full_factorial(hub_height=[80.0, 90.0, 100.0], fixed_charge_rate=[0.095, 0.118])
+    results = run_doe(cases, builder_kwargs={'with_new_nacelle': True}, outputs=SE_RECORDED_OUTPUTS,
+                      store_directory=directory)
+
+    store = ResultsStore(directory)
+    print '{0} cases stored in {1} ({2} failed)'.format(len(store), directory, len(results['errors']))
+    columns = store.read()
+    for i in range(len(store)):
+        print 'case {0:2d}  hub height {1:5.1f}  coe {2:.4f}  rated power {3:.0f} kW'.format(
+            columns['case'][i], columns['input:hub_height'][i], columns['coe'][i], columns['rotor.P'][i].max()/1e3)
+
+
+if __name__ == '__main__':
+
+    example()
@@ -0,0 +1,316 @@
+"""
+lcoe_timeseries_aep.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import itertools
+
+import numpy as np
+
+from openmdao.main.api import Component
+from openmdao.main.datatypes.api import Int, Float, Array, Str, Bool
+
+from wisdem.lcoe.lcoe_wake_aep import HOURS_PER_YEAR, thrust_curve, grid_layout, WakeModel
+
+
+# --- wind data ---
+
+class WindTimeSeries(object):
+    """wind speed and direction records read from disk a chunk at a time
+
+    Parameters
+    ----------
+    filename : str
+        .npy file (read through a memory map) or delimited text file, one record per row
+    speed_column, direction_column : int
+        columns of the wind speed (m/s) and direction (deg); other columns (e.g. time stamps)
+        are not read
+    time_step : float
+        hours per record
+    delimiter : str
+        column separator of text files (None for whitespace)
+    skiprows : int
+        header lines of text files
+    chunk_rows : int
+        records per chunk
+    """
+
+    def __init__(self, filename, speed_column=0, direction_column=1, time_step=1.0, delimiter=',', skiprows=0,
+                 chunk_rows=8760*2):
+
+        self.filename = filename
+        self.speed_column = speed_column
+        self.direction_column = direction_column
+        self.time_step = time_step
+        self.delimiter = delimiter
+        self.skiprows = skiprows
+        self.chunk_rows = chunk_rows
+
+    def chunks(self):
+        """generator of (speed, direction) arrays of up to chunk_rows records"""
+
+        columns = (self.speed_column, self.direction_column)
+
+        if self.filename.lower().endswith('.npy'):
+            data = np.load(self.filename, mmap_mode='r')
+            for start in range(0, data.shape[0], self.chunk_rows):
+                chunk = np.array(data[start:start+self.chunk_rows][:, columns], dtype=float)
+                yield chunk[:, 0], chunk[:, 1]
+            return
+
+        with open(self.filename) as f:
+            for _ in range(self.skiprows):
+                next(f, None)
+            while True:
+                lines = list(itertools.islice(f, self.chunk_rows))
+                if not lines:
+                    return
+                chunk = np.loadtxt(lines, delimiter=self.delimiter, usecols=columns, ndmin=2)
+                yield chunk[:, 0], chunk[:, 1]
+
+
+def timeseries_to_npy(series, filename):
+    """copy the speed and direction columns of a WindTimeSeries into a two column .npy file,
+    chunk by chunk, so later passes read a memory map instead of parsing text"""
+
+    rows = sum(len(speed) for speed, _ in series.chunks())
+    data = np.lib.format.open_memmap(filename, mode='w+', dtype=float, shape=(rows, 2))
+
+    row = 0
+    for speed, direction in series.chunks():
+        data[row:row+len(speed), 0] = speed
+        data[row:row+len(speed), 1] = direction
+        row += len(speed)
+    data.flush()
+    del data
+
+    return WindTimeSeries(filename, 0, 1, series.time_step, chunk_rows=series.chunk_rows)
+
+
+def read_histogram(filename, delimiter=','):
+    """direction by speed histogram of a text file
+
+    The first line holds the wind speed bin centres (m/s) after a leading label, every other
+    line a direction sector centre (deg) followed by the counts (or frequencies) of each bin.
+
+    Returns
+    -------
+    directions : array (sectors,)
+    speeds : array (speeds,)
+    frequency : array (sectors, speeds), normalized to sum to one
+    """
+
+    with open(filename) as f:
+        header = f.readline().split(delimiter)
+        table = np.loadtxt(f, delimiter=delimiter, ndmin=2)
+
+    speeds = np.array([float(value) for value in header[1:]])
+    frequency = table[:, 1:]
+
+    return table[:, 0], speeds, frequency/np.sum(frequency)
+
+
+# --- energy ---
+
+def sector_index(direction, sectors):
+    """index of the sector (of equal width, the first centred on north) of each direction"""
+
+    return np.round(np.mod(direction, 360.0)/(360.0/sectors)).astype(int) % sectors
+
+
+def timeseries_energy(series, V, P, shear=1.0, sectors=12, speed_step=1.0, speed_max=30.0):
+    """energy of one turbine over a wind time series, with the power curve interpolated at
+    every record, and the direction by speed histogram of the series
+
+    Parameters
+    ----------
+    series : WindTimeSeries
+    V, P : array
+        power curve (m/s, W)
+    shear : float
+        ratio of hub height to measurement height wind speed
+    sectors : int
+        direction sectors of the histogram
+    speed_step, speed_max : float
+        speed bins of the histogram (centres speed_step, 2 speed_step, ... speed_max)
+
+    Returns
+    -------
+    energy : float
+        kWh per turbine over the valid records
+    hours : float
+        duration of the valid records
+    records : int
+        number of records (valid or not)
+    histogram : array (sectors, speeds)
+        hours of each direction sector and speed bin
+    """
+
+    speeds = np.arange(speed_step, speed_max + 0.5*speed_step, speed_step)
+    histogram = np.zeros(sectors*len(speeds))
+    energy = 0.0
+    hours = 0.0
+    records = 0
+
+    for speed, direction in series.chunks():
+        records += len(speed)
+        valid = np.isfinite(speed) & np.isfinite(direction) & (speed >= 0)
+        u = speed[valid]*shear
+
+        energy += np.sum(np.interp(u, V, P, left=0.0, right=0.0))*series.time_step/1e3
+        hours += np.count_nonzero(valid)*series.time_step
+
+        bins = np.clip(np.round(u/speed_step).astype(int) - 1, 0, len(speeds) - 1)
+        histogram += np.bincount(sector_index(direction[valid], sectors)*len(speeds) + bins,
+                                 minlength=len(histogram))*series.time_step
+
+    return energy, hours, records, histogram.reshape(sectors, len(speeds))
+
+
+class aep_timeseries(Component):
+    """plant energy production from measured wind data: a multi-year time series streamed from
+    disk, or a direction by speed histogram, in place of the Weibull based rotor.AEP
+
+    Time series are read in chunks, with the power curve interpolated at every record, so files
+    of any length are evaluated without being held in memory (convert text files with
+    timeseries_to_npy to avoid parsing them at every run).  Array losses are either the fixed
+    array_losses or, with wake_model, computed from the direction by speed distribution of the
+    data with the wake model of lcoe_wake_aep.
+    """
+
+    # wind data
+    wind_file = Str(iotype='in', desc='wind time series (.npy or text) or direction by speed histogram (text)')
+    histogram = Bool(False, iotype='in', desc='wind_file is a direction by speed histogram (see read_histogram)')
+    speed_column = Int(0, iotype='in', desc='column of the wind speed in a time series')
+    direction_column = Int(1, iotype='in', desc='column of the wind direction in a time series')
+    skiprows = Int(0, iotype='in', desc='header lines of a text time series')
+    time_step = Float(1.0, iotype='in', units='h', desc='time between records of the time series')
+    measurement_height = Float(90.0, iotype='in', units='m', desc='height of the wind data')
+    shear_exponent = Float(0.2, iotype='in', desc='power law shear exponent from the measurement height to the hub')
+    sectors = Int(12, iotype='in', desc='direction sectors of the time series histogram')
+
+    # turbine and plant
+    hub_height = Float(90.0, iotype='in', units='m', desc='hub height of wind turbine above ground / sea level')
+    rotor_diameter = Float(126.0, iotype='in', units='m', desc='rotor diameter of the machine')
+    machine_rating = Float(5000.0, iotype='in', units='kW', desc='rated machine power in kW')
+    V = Array(iotype='in', units='m/s', desc='wind speeds of the power curve')
+    P = Array(iotype='in', units='W', desc='power curve')
+    Ct = Array(iotype='in', desc='thrust coefficient curve at V (estimated from the power curve if empty)')
+    turbine_number = Int(100, iotype='in', desc='total number of wind turbines at the plant')
+    array_losses = Float(0.059, iotype='in', desc='energy losses due to turbine interactions, unless wake_model')
+    wake_model = Bool(False, iotype='in', desc='compute the array losses with a wake model of the layout')
+    layout = Array(iotype='in', units='m', desc='turbine positions (east, north); a square grid if empty')
+    spacing = Float(7.0, iotype='in', desc='grid spacing in rotor diameters when no layout is given')
+    wake_decay = Float(0.075, iotype='in', desc='wake expansion coefficient (about 0.05 offshore)')
+    availability = Float(0.94, iotype='in', desc='average annual availbility of wind turbines at plant')
+    other_losses = Float(0.0, iotype='in', desc='energy losses due to blade soiling, electrical, etc')
+
+    gross_aep = Float(iotype='out', units='kW*h', desc='gross annual energy production of the plant, without losses')
+    net_aep = Float(iotype='out', units='kW*h', desc='net annual energy production of the plant')
+    capacity_factor = Float(iotype='out', desc='capacity factor of the plant')
+    wake_losses = Float(iotype='out', desc='array losses applied (array_losses, or computed with wake_model)')
+    total_losses = Float(iotype='out', desc='fraction of the gross energy lost to wakes, availability and other losses')
+    data_recovery = Float(iotype='out', desc='fraction of time series records with valid speed and direction')
+
+    def __init__(self, wind_file='', histogram=False):
+
+        super(aep_timeseries, self).__init__()
+        self.wind_file = wind_file
+        self.histogram = histogram
+        self._model = None
+        self._model_key = None
+
+    def _wake_model(self, layout, directions, max_rotor_diameter):
+
+        key = (layout.tostring(), directions.tostring(), self.wake_decay)
+        if key != self._model_key or self._model.max_rotor_diameter < max_rotor_diameter:
+            self._model = WakeModel(layout, directions, self.wake_decay, max_rotor_diameter)
+            self._model_key = key
+
+        return self._model
+
+    def execute(self):
+
+        shear = (self.hub_height/self.measurement_height)**self.shear_exponent
+
+        if self.histogram:
+            directions, speeds, frequency = read_histogram(self.wind_file)
+            speeds = speeds*shear
+            energy_per_year = HOURS_PER_YEAR*np.sum(frequency*np.interp(speeds, self.V, self.P, left=0.0,
+                                                                        right=0.0))/1e3
+            self.data_recovery = 1.0
+        else:
+            series = WindTimeSeries(self.wind_file, self.speed_column, self.direction_column, self.time_step,
+                                    skiprows=self.skiprows)
+            energy, hours, records, hours_binned = timeseries_energy(series, self.V, self.P, shear, self.sectors)
+            if hours == 0:
+                raise ValueError('%s has no valid wind records' % self.wind_file)
+            energy_per_year = energy/hours*HOURS_PER_YEAR
+            directions = np.arange(self.sectors)*360.0/self.sectors
+            speeds = np.arange(1.0, hours_binned.shape[1] + 1.0)
+            frequency = hours_binned/hours
+            self.data_recovery = hours/(records*self.time_step)
+
+        self.gross_aep = self.turbine_number*energy_per_year
+
+        if self.wake_model:
+            Ct = self.Ct if len(self.Ct) > 0 else thrust_curve(self.V, self.P, self.rotor_diameter)
+            if len(self.layout) > 0:
+                layout, diameter = np.asarray(self.layout, dtype=float), self.rotor_diameter
+                model = self._wake_model(layout, directions, max(250.0, 1.5*diameter))
+            else:  # grid in rotor diameters
+                layout, diameter = grid_layout(self.turbine_number, 1.0, self.spacing), 1.0
+                model = self._wake_model(layout, directions, 1.0)
+            gross, array = model.aep(frequency, speeds, diameter, self.V, self.P, Ct)
+            self.wake_losses = 1.0 - array/gross if gross > 0 else 0.0
+        else:
+            self.wake_losses = self.array_losses
+
+        self.net_aep = self.gross_aep*(1.0 - self.wake_losses)*(1.0 - self.other_losses)*self.availability
+        self.total_losses = 1.0 - self.net_aep/self.gross_aep if self.gross_aep > 0 else 0.0
+        self.capacity_factor = self.net_aep/(self.machine_rating*self.turbine_number*HOURS_PER_YEAR)
+
+
+def example():
+
+    import os
+    import time
+    import tempfile
+
+    # twenty years of synthetic hourly data (Weibull speeds, westerly directions), written in chunks
+    filename = os.path.join(tempfile.gettempdir(), 'wisdem_wind_20yr.csv')
+    rng = np.random.RandomState(0)
+    with open(filename, 'w') as f:
+        f.write('speed,direction\n')
+        for year in range(20):
+            speed = 8.5*rng.weibull(2.1, 8766)
+            direction = np.mod(rng.normal(270.0, 60.0, 8766), 360.0)
+            np.savetxt(f, np.column_stack([speed, direction]), fmt='%.2f', delimiter=',')
+
+    V = np.linspace(3.0, 25.0, 45)
+    P = np.minimum(0.5*1.225*0.25*np.pi*126.0**2*0.45*V**3, 5e6)
+
+    aep = aep_timeseries(filename)
+    aep.skiprows = 1
+    aep.V, aep.P = V, P
+
+    tt = time.time()
+    aep.execute()
+    print 'text time series: net AEP {0:.4e} kWh, losses {1:.1%} ({2:.2f} s)'.format(aep.net_aep, aep.total_losses,
+                                                                                    time.time() - tt)
+
+    series = WindTimeSeries(filename, skiprows=1)
+    aep.wind_file = timeseries_to_npy(series, filename[:-4] + '.npy').filename
+    aep.skiprows = 0
+    aep.wake_model = True
+    tt = time.time()
+    aep.execute()
+    print '.npy time series with wakes: net AEP {0:.4e} kWh, wake losses {1:.1%}, total losses {2:.1%} ({3:.2f} s)'\
+        .format(aep.net_aep, aep.wake_losses, aep.total_losses, time.time() - tt)
+
+
+if __name__ == '__main__':
+
+    example()
@@ -0,0 +1,266 @@
+"""
+lcoe_uq.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import multiprocessing
+from collections import OrderedDict
+
+import numpy as np
+
+from wisdem.lcoe.lcoe_se_assembly import create_example_se_assembly
+from wisdem.lcoe.lcoe_doe import WorkerPool, run_case
+from wisdem.lcoe.lcoe_sampling import sample_chunks, scale_samples
+
+
+# plant and finance inputs of lcoe_se_assembly (turbine results are reused from the cache when only these vary)
+SE_PLANT_UNCERTAINTIES = OrderedDict([
+    ('availability', ('triangular', 0.90, 0.94, 0.98)),
+    ('array_losses', ('triangular', 0.04, 0.059, 0.15)),
+    ('fixed_charge_rate', ('uniform', 0.08, 0.12)),
+    ('bos_multiplier', ('triangular', 0.85, 1.0, 1.3)),
+    ('assemblyCostMultiplier', ('uniform', 0.2, 0.4)),
+    ('overheadCostMultiplier', ('uniform', 0.0, 0.1)),
+    ('profitMultiplier', ('uniform', 0.1, 0.3)),
+    ('transportMultiplier', ('uniform', 0.0, 0.1)),
+])
+
+# site inputs that change the turbine blocks (every sample reruns the rotor and tower)
+SE_SITE_UNCERTAINTIES = OrderedDict([
+    ('shear_exponent', ('uniform', 0.1, 0.25)),
+])
+
+UQ_PERCENTILES = (5.0, 25.0, 50.0, 75.0, 95.0)
+
+
+class P2Quantile(object):
+    """streaming estimate of one quantile with the P-square algorithm (Jain and Chlamtac, 1985):
+    five markers are kept whatever the number of observations
+
+    The estimate depends on the order of the observations and is poor when they arrive sorted
+    (e.g. a 5th percentile of -3.4 for sorted standard normal samples), so feed it a shuffled or
+    sampled stream such as the Monte Carlo samples of run_uq"""
+
+    def __init__(self, p):
+
+        self.p = p
+        self.q = []  # marker heights (the first five observations until initialized)
+        self.n = np.arange(5, dtype=float)
+        self.desired = np.array([0.0, 2*p, 4*p, 2 + 2*p, 4.0])
+        self.increment = np.array([0.0, p/2, p, (1 + p)/2, 1.0])
+
+    def update(self, x):
+
+        q = self.q
+        if len(q) < 5:
+            q.append(x)
+            q.sort()
+            return
+
+        n = self.n
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k+1]:
+                k += 1
+
+        n[k+1:] += 1
+        self.desired += self.increment
+
+        for i in (1, 2, 3):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i+1] - n[i] > 1) or (d <= -1 and n[i-1] - n[i] < -1):
+                d = 1.0 if d > 0 else -1.0
+                # piecewise parabolic prediction, linear if it would break the ordering
+                qp = q[i] + d/(n[i+1] - n[i-1])*((n[i] - n[i-1] + d)*(q[i+1] - q[i])/(n[i+1] - n[i])
+                                                  + (n[i+1] - n[i] - d)*(q[i] - q[i-1])/(n[i] - n[i-1]))
+                if not q[i-1] < qp < q[i+1]:
+                    j = i + int(d)
+                    qp = q[i] + d*(q[j] - q[i])/(n[j] - n[i])
+                q[i] = qp
+                n[i] += d
+
+    def value(self):
+
+        if not self.q:
+            return np.nan
+        if len(self.q) < 5:
+            return float(np.percentile(self.q, 100*self.p))
+
+        return self.q[2]
+
+
+class StreamingStatistics(object):
+    """count, mean, standard deviation, extremes and percentiles of a scalar stream in constant memory"""
+
+    def __init__(self, percentiles=UQ_PERCENTILES):
+
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.quantiles = OrderedDict((p, P2Quantile(p/100.0)) for p in percentiles)
+
+    def update(self, x):
+
+        x = float(x)
+
+        # Welford's update of mean and variance
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta/self.count
+        self._m2 += delta*(x - self.mean)
+
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+        for quantile in self.quantiles.itervalues():
+            quantile.update(x)
+
+    @property
+    def std(self):
+
+        return np.sqrt(self._m2/(self.count - 1)) if self.count > 1 else np.nan
+
+    def summary(self):
+
+        s = OrderedDict()
+        s['count'] = self.count
+        s['mean'] = self.mean if self.count else np.nan
+        s['std'] = self.std
+        s['min'] = self.min
+        s['max'] = self.max
+        s['percentiles'] = OrderedDict((p, quantile.value()) for p, quantile in self.quantiles.iteritems())
+
+        return s
+
+
+def _run_sample(task):
+
+    index, values, error = run_case(task)
+
+    return index, task[2], values, error
+
+
+def _tasks(distributions, n, method, seed, chunksize):
+
+    index = 0
+    for u in sample_chunks(method, n, len(distributions), chunksize, seed):
+        samples = scale_samples(u, distributions)
+        for i in range(len(u)):
+            yield index, (), [(name, float(samples[name][i])) for name in distributions]
+            index += 1
+
+
+def run_uq(distributions, n=1000, method='lhs', seed=None, builder=create_example_se_assembly, builder_kwargs=None,
+           outputs=('coe',), percentiles=UQ_PERCENTILES, processes=None, chunksize=None, cache=True,
+           cache_directory=None, snapshot_directory=None, callback=None):
+    """propagate input uncertainty to assembly outputs by Monte Carlo sampling
+
+    Samples are generated in chunks and run on a pool of worker processes, each reusing its own
+    pre-built assembly (see lcoe_doe.run_doe).  Results are folded into streaming statistics in
+    sample order and then dropped, so memory does not grow with the number of samples and the
+    statistics are the same whatever the number of processes.
+
+    Parameters
+    ----------
+    distributions : OrderedDict
+        input path -> distribution tuple (see lcoe_sampling), e.g. SE_PLANT_UNCERTAINTIES
+    n : int
+        number of samples
+    method : str
+        'lhs' (Latin hypercube), 'sobol' (scrambled Sobol sequence) or 'random'
+    seed : int
+    builder, builder_kwargs : callable, dict
+        assembly builder and its fixed keyword arguments
+    outputs : list(str)
+        scalar outputs to collect statistics for
+    percentiles : list(float)
+        percentiles (0-100) estimated for each output
+    processes : int
+        number of worker processes (defaults to the number of cores), 1 runs serially
+    chunksize : int
+        number of samples handed to a worker at a time
+    cache : bool
+        memoize the upstream blocks in each worker (see lcoe_cache): when only plant or
+        finance inputs are sampled, the rotor, hub, nacelle and tower are evaluated once
+    cache_directory, snapshot_directory : str
+        as in run_doe
+    callback : callable
+        optional callback(index, inputs, values) for every successful sample, in sample order,
+        with inputs a list of (path, value) and values a list of output arrays, e.g. to store the
+        raw samples
+
+    Returns
+    -------
+    results : OrderedDict
+        output -> summary (count, mean, std, min, max, percentiles) plus 'samples' (number run),
+        'failed' (number of failed samples) and 'errors' (sample index -> message)
+    """
+
+    if builder_kwargs is None:
+        builder_kwargs = {}
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    if chunksize is None:
+        chunksize = max(1, min(100, n // (4*processes)))
+
+    outputs = list(outputs)
+    statistics = OrderedDict((name, StreamingStatistics(percentiles)) for name in outputs)
+    errors = {}
+
+    tasks = _tasks(distributions, n, method, seed, max(chunksize, 1000))
+    pool = WorkerPool(builder, builder_kwargs, outputs, processes, cache, cache_directory, snapshot_directory)
+
+    # the workers finish out of order: results wait in pending until all earlier samples are in,
+    # so they are folded in sample order and the percentile estimates do not depend on scheduling
+    pending = {}
+    next_index = 0
+
+    try:
+        for result in pool.imap(_run_sample, tasks, chunksize):
+            pending[result[0]] = result
+            while next_index in pending:
+                index, inputs, values, error = pending.pop(next_index)
+                next_index += 1
+                if error is not None:
+                    errors[index] = error
+                    continue
+                for name, value in zip(outputs, values):
+                    statistics[name].update(value)
+                if callback is not None:
+                    callback(index, inputs, values)
+    finally:
+        pool.close()
+
+    results = OrderedDict((name, statistics[name].summary()) for name in outputs)
+    results['samples'] = n
+    results['failed'] = len(errors)
+    results['errors'] = errors
+
+    return results
+
+
+def example():
+
+    results = run_uq(SE_PLANT_UNCERTAINTIES, n=200, method='sobol', seed=1, builder_kwargs={'with_new_nacelle': True},
+                     outputs=('coe', 'net_aep'))
+
+    for name in ('coe', 'net_aep'):
+        s = results[name]
+        print '{0}: mean {1:.4g}, std {2:.4g} ({3} samples)'.format(name, s['mean'], s['std'], s['count'])
+        for p, value in s['percentiles'].iteritems():
+            print '    P{0:g}: {1:.4g}'.format(p, value)
+    print '{0} failed samples'.format(results['failed'])
+
+
+if __name__ == '__main__':
+
+    example()
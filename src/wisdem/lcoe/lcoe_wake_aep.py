@@ -0,0 +1,350 @@
+"""
+lcoe_wake_aep.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import numpy as np
+
+from openmdao.main.api import Component
+from openmdao.main.datatypes.api import Int, Float, Array
+
+
+HOURS_PER_YEAR = 365.25*24.0
+
+
+# --- turbine, layout and wind rose ---
+
+def thrust_curve(V, P, rotor_diameter, rho=1.225):
+    """thrust coefficient estimated from a power curve (P in W) by actuator disc theory
+
+    The axial induction is found from the power coefficient (Cp = 4a(1 - a)^2, a <= 1/3) and
+    the thrust coefficient is Ct = 4a(1 - a).  Used when no thrust curve is given.
+    """
+
+    V = np.asarray(V, dtype=float)
+    area = 0.25*np.pi*rotor_diameter**2
+    with np.errstate(all='ignore'):
+        Cp = np.where(V > 0, np.asarray(P, dtype=float)/(0.5*rho*area*V**3), 0.0)
+    Cp = np.clip(Cp, 0.0, 16.0/27.0)
+
+    # invert Cp(a) on a <= 1/3, where it is increasing
+    a = np.linspace(0.0, 1.0/3.0, 201)
+    induction = np.interp(Cp, 4.0*a*(1.0 - a)**2, a)
+
+    return 4.0*induction*(1.0 - induction)
+
+
+def grid_layout(turbine_number, rotor_diameter, spacing=7.0):
+    """turbine positions (m) on a square grid of spacing rotor diameters"""
+
+    columns = int(np.ceil(np.sqrt(turbine_number)))
+    index = np.arange(turbine_number)
+
+    return spacing*rotor_diameter*np.column_stack([index % columns, index // columns]).astype(float)
+
+
+def weibull_probability(speeds, weibull_A, weibull_k, frequency):
+    """probability of each (direction sector, wind speed bin)
+
+    Parameters
+    ----------
+    speeds : array (m/s)
+        centres of evenly spaced speed bins
+    weibull_A, weibull_k, frequency : array
+        Weibull scale (m/s) and shape, and probability, of each sector
+
+    Returns
+    -------
+    probability : array (sectors, speeds)
+    """
+
+    speeds = np.asarray(speeds, dtype=float)
+    step = speeds[1] - speeds[0] if len(speeds) > 1 else 1.0
+    edges = np.concatenate([[max(speeds[0] - 0.5*step, 0.0)], speeds + 0.5*step])
+
+    A = np.asarray(weibull_A, dtype=float)[:, np.newaxis]
+    k = np.asarray(weibull_k, dtype=float)[:, np.newaxis]
+    cdf = 1.0 - np.exp(-(edges/A)**k)
+
+    return np.diff(cdf, axis=1)*np.asarray(frequency, dtype=float)[:, np.newaxis]
+
+
+# --- wake model ---
+
+def _overlap(distance, r_wake, r_rotor):
+    """fraction of a rotor disc (radius r_rotor) inside a wake (radius r_wake) whose centre
+    is distance away"""
+
+    d = np.maximum(distance, 1e-12)
+    inside = d + r_rotor <= r_wake
+    outside = d >= r_wake + r_rotor
+
+    with np.errstate(all='ignore'):
+        c1 = np.clip((d**2 + r_rotor**2 - r_wake**2)/(2.0*d*r_rotor), -1.0, 1.0)
+        c2 = np.clip((d**2 + r_wake**2 - r_rotor**2)/(2.0*d*r_wake), -1.0, 1.0)
+        area = r_rotor**2*np.arccos(c1) + r_wake**2*np.arccos(c2) \
+            - 0.5*np.sqrt(np.maximum((-d + r_rotor + r_wake)*(d + r_rotor - r_wake)*(d - r_rotor + r_wake)
+                                     *(d + r_rotor + r_wake), 0.0))
+    fraction = area/(np.pi*r_rotor**2)
+
+    return np.where(inside, 1.0, np.where(outside, 0.0, fraction))
+
+
+class WakeModel(object):
+    """Jensen (top hat) wakes over a fixed layout, for all wind directions and speeds at once
+
+    The pairwise geometry is precomputed when the model is made: for every direction sector,
+    the turbine pairs that can interact (downstream distance and crosswind offset, kept only
+    within the widest wake of any rotor up to max_rotor_diameter) and a wake order of the
+    turbines.  Turbines of the same order do not wake each other, so an evaluation sweeps the
+    orders (a few tens, however large the plant) instead of the turbines, with every sector,
+    turbine and speed of an order updated in one array operation.  Each wake has the thrust of
+    its turbine at that turbine's own waked speed; deficits combine by root sum of squares.
+
+    Parameters
+    ----------
+    layout : array (n, 2) (m)
+        turbine positions (east, north)
+    directions : array (deg)
+        sector centres (direction the wind comes from)
+    wake_decay : float
+        wake expansion coefficient (0.075 onshore, about 0.05 offshore)
+    max_rotor_diameter : float (m)
+        largest rotor diameter the model will be evaluated for
+    """
+
+    def __init__(self, layout, directions, wake_decay=0.075, max_rotor_diameter=250.0):
+
+        self.layout = np.asarray(layout, dtype=float)
+        self.directions = np.asarray(directions, dtype=float)
+        self.wake_decay = wake_decay
+        self.max_rotor_diameter = max_rotor_diameter
+        self.nodes = len(self.directions)*len(self.layout)  # (sector, turbine) pairs
+
+        n = len(self.layout)
+        i, j = np.nonzero(~np.eye(n, dtype=bool))  # upstream i, downstream j
+        dx = self.layout[j, 0] - self.layout[i, 0]
+        dy = self.layout[j, 1] - self.layout[i, 1]
+
+        up, down, x, r = [], [], [], []
+        for d, direction in enumerate(np.radians(self.directions)):
+            # the wind blows towards -(sin, cos) of the direction it comes from
+            xd = -dx*np.sin(direction) - dy*np.cos(direction)
+            rd = np.abs(dx*np.cos(direction) - dy*np.sin(direction))
+            keep = (xd > 0) & (rd < max_rotor_diameter + wake_decay*xd)
+            up.append(d*n + i[keep])
+            down.append(d*n + j[keep])
+            x.append(xd[keep])
+            r.append(rd[keep])
+        up, down, x, r = [np.concatenate(values) for values in (up, down, x, r)]
+
+        order = self._wake_order(up, down)
+
+        # pairs grouped by the order of their downstream turbine, then by downstream turbine
+        sort = np.lexsort((down, order[down]))
+        self._up, self._down, self._x, self._r = up[sort], down[sort], x[sort], r[sort]
+        self._steps = []
+        pair_order = order[self._down]
+        for level in np.unique(pair_order):
+            start, end = np.searchsorted(pair_order, [level, level + 1])
+            targets, offsets = np.unique(self._down[start:end], return_index=True)
+            self._steps.append((start, end, targets, offsets))
+
+        self._diameter = None
+        self._factors = None
+
+    def _wake_order(self, up, down):
+        """0 for unwaked turbines, else 1 + the highest order among the turbines waking it"""
+
+        order = np.zeros(self.nodes, dtype=int)
+        if len(up) == 0:
+            return order
+
+        sort = np.argsort(down, kind='mergesort')
+        up, down = up[sort], down[sort]
+        targets, offsets = np.unique(down, return_index=True)
+        while True:
+            new = order.copy()
+            new[targets] = np.maximum.reduceat(order[up], offsets) + 1
+            if np.array_equal(new, order):
+                return order
+            order = new
+
+    def wake_factors(self, rotor_diameter):
+        """geometric deficit factor (wake expansion and rotor overlap) of every interacting pair"""
+
+        if rotor_diameter > self.max_rotor_diameter:
+            raise ValueError('rotor diameter %g m exceeds max_rotor_diameter (%g m) of the wake model'
+                             % (rotor_diameter, self.max_rotor_diameter))
+
+        if rotor_diameter != self._diameter:
+            R = 0.5*rotor_diameter
+            r_wake = R + self.wake_decay*self._x
+            self._factors = (R/r_wake)**2*_overlap(self._r, r_wake, R)
+            self._diameter = rotor_diameter
+
+        return self._factors
+
+    def effective_speeds(self, speeds, rotor_diameter, V, Ct):
+        """waked wind speed of every turbine
+
+        Parameters
+        ----------
+        speeds : array (m/s)
+            free stream speeds
+        rotor_diameter : float (m)
+        V, Ct : array
+            thrust coefficient curve
+
+        Returns
+        -------
+        u : array (sectors, turbines, speeds) (m/s)
+        """
+
+        speeds = np.asarray(speeds, dtype=float)
+        W = self.wake_factors(rotor_diameter)
+
+        u = np.empty((self.nodes, len(speeds)))
+        u[:] = speeds
+        for start, end, targets, offsets in self._steps:
+            Ct_up = np.clip(np.interp(u[self._up[start:end]], V, Ct, left=0.0, right=0.0), 0.0, 1.0)
+            deficit = ((1.0 - np.sqrt(1.0 - Ct_up))*W[start:end, np.newaxis])**2
+            u[targets] = speeds*np.maximum(1.0 - np.sqrt(np.add.reduceat(deficit, offsets, axis=0)), 0.0)
+
+        return u.reshape(len(self.directions), len(self.layout), len(speeds))
+
+    def aep(self, probability, speeds, rotor_diameter, V, P, Ct):
+        """gross (without wakes) and waked annual energy of the plant (kWh)
+
+        Parameters
+        ----------
+        probability : array (sectors, speeds)
+            probability of each sector and speed bin (see weibull_probability)
+        speeds : array (m/s)
+            speed bin centres
+        rotor_diameter : float (m)
+        V, P, Ct : array
+            power (W) and thrust coefficient curves
+        """
+
+        power = np.interp(speeds, V, P, left=0.0, right=0.0)/1e3
+        gross = len(self.layout)*HOURS_PER_YEAR*np.sum(probability*power)
+
+        waked = np.interp(self.effective_speeds(speeds, rotor_diameter, V, Ct), V, P, left=0.0, right=0.0)/1e3
+        array = HOURS_PER_YEAR*np.sum(probability[:, np.newaxis, :]*waked)
+
+        return gross, array
+
+
+# --- plant energy block ---
+
+class aep_wake(Component):
+    """plant energy production with array losses from a wake model of the layout (see WakeModel),
+    in place of the fixed array_losses of the basic AEP assembly
+
+    When AEP_one_turbine is given (in the lcoe assembly, the rotor's AEP for the site Weibull
+    distribution) the gross energy is AEP_one_turbine per turbine and the wind rose only sets
+    the array losses; otherwise the gross energy is computed from the wind rose too.
+    """
+
+    # turbine
+    hub_height = Float(90.0, iotype='in', units='m', desc='hub height of wind turbine above ground / sea level')
+    rotor_diameter = Float(126.0, iotype='in', units='m', desc='rotor diameter of the machine')
+    machine_rating = Float(5000.0, iotype='in', units='kW', desc='rated machine power in kW')
+    V = Array(iotype='in', units='m/s', desc='wind speeds of the power curve')
+    P = Array(iotype='in', units='W', desc='power curve')
+    Ct = Array(iotype='in', desc='thrust coefficient curve at V (estimated from the power curve if empty)')
+    AEP_one_turbine = Float(0.0, iotype='in', units='kW*h', desc='annual energy of one turbine without wakes (from the wind rose if 0)')
+
+    # plant and site
+    turbine_number = Int(100, iotype='in', desc='total number of wind turbines at the plant')
+    layout = Array(iotype='in', units='m', desc='turbine positions (east, north); a square grid if empty')
+    spacing = Float(7.0, iotype='in', desc='grid spacing in rotor diameters when no layout is given')
+    directions = Array(np.arange(0.0, 360.0, 30.0), iotype='in', units='deg', desc='wind rose sector centres')
+    frequency = Array(np.ones(12)/12.0, iotype='in', desc='probability of each wind rose sector')
+    weibull_A = Array(9.0*np.ones(12), iotype='in', units='m/s', desc='Weibull scale of each sector at the wind rose height')
+    weibull_k = Array(2.0*np.ones(12), iotype='in', desc='Weibull shape of each sector')
+    wind_rose_height = Float(90.0, iotype='in', units='m', desc='height of the wind rose')
+    shear_exponent = Float(0.2, iotype='in', desc='power law shear exponent from the wind rose height to the hub')
+    wake_decay = Float(0.075, iotype='in', desc='wake expansion coefficient (about 0.05 offshore)')
+    availability = Float(0.94, iotype='in', desc='average annual availbility of wind turbines at plant')
+    other_losses = Float(0.0, iotype='in', desc='energy losses due to blade soiling, electrical, etc')
+
+    gross_aep = Float(iotype='out', units='kW*h', desc='gross annual energy production of the plant, without losses')
+    net_aep = Float(iotype='out', units='kW*h', desc='net annual energy production of the plant')
+    array_losses = Float(iotype='out', desc='energy losses due to turbine interactions - across entire plant')
+    capacity_factor = Float(iotype='out', desc='capacity factor of the plant')
+
+    def __init__(self):
+
+        super(aep_wake, self).__init__()
+        self._model = None
+        self._model_key = None
+
+    def _wake_model(self, layout, max_rotor_diameter):
+
+        key = (layout.tostring(), np.asarray(self.directions, dtype=float).tostring(), self.wake_decay)
+        if key != self._model_key or self._model.max_rotor_diameter < max_rotor_diameter:
+            self._model = WakeModel(layout, self.directions, self.wake_decay, max_rotor_diameter)
+            self._model_key = key
+
+        return self._model
+
+    def execute(self):
+
+        if len(self.layout) > 0:
+            layout = np.asarray(self.layout, dtype=float)
+            model = self._wake_model(layout, max(250.0, 1.5*self.rotor_diameter))
+            diameter = self.rotor_diameter
+        else:
+            # wakes on a grid spaced in rotor diameters do not depend on the diameter: the model
+            # is made once, in units of rotor diameters
+            layout = grid_layout(self.turbine_number, 1.0, self.spacing)
+            model = self._wake_model(layout, 1.0)
+            diameter = 1.0
+        Ct = self.Ct if len(self.Ct) > 0 else thrust_curve(self.V, self.P, self.rotor_diameter)
+
+        speeds = np.arange(1.0, np.ceil(self.V[-1]) + 1.0)
+        shear = (self.hub_height/self.wind_rose_height)**self.shear_exponent
+        probability = weibull_probability(speeds, np.asarray(self.weibull_A)*shear, self.weibull_k, self.frequency)
+
+        gross, array = model.aep(probability, speeds, diameter, self.V, self.P, Ct)
+        self.array_losses = 1.0 - array/gross
+
+        if self.AEP_one_turbine > 0:
+            self.gross_aep = self.AEP_one_turbine*len(layout)
+        else:
+            self.gross_aep = gross
+        self.net_aep = self.gross_aep*(1.0 - self.array_losses)*(1.0 - self.other_losses)*self.availability
+        self.capacity_factor = self.net_aep/(self.machine_rating*len(layout)*HOURS_PER_YEAR)
+
+
+def example():
+
+    import time
+
+    # 500 NREL 5 MW-like turbines on a 7D grid, 36 sectors
+    V = np.linspace(3.0, 25.0, 45)
+    P = np.minimum(0.5*1.225*0.25*np.pi*126.0**2*0.45*V**3, 5e6)
+
+    aep = aep_wake()
+    aep.V, aep.P = V, P
+    aep.turbine_number = 500
+    aep.directions = np.arange(0.0, 360.0, 10.0)
+    aep.frequency = np.ones(36)/36.0
+    aep.weibull_A = 9.0*np.ones(36)
+    aep.weibull_k = 2.0*np.ones(36)
+
+    for diameter in [120.0, 126.0, 130.0]:
+        aep.rotor_diameter = diameter
+        tt = time.time()
+        aep.execute()
+        print 'D = {0:.0f} m: net AEP {1:.4e} kWh, array losses {2:.2%}, capacity factor {3:.3f} ({4:.3f} s)'.format(
+            diameter, aep.net_aep, aep.array_losses, aep.capacity_factor, time.time() - tt)
+
+
+if __name__ == '__main__':
+
+    example()
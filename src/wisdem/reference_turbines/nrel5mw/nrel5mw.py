@@ -2,7 +2,7 @@
 import numpy as np
 import os
 
-from rotorse.precomp import Profile, Orthotropic2DMaterial, CompositeSection  # TODO: can just pass file names and do this initialization inside of rotor
+from wisdem.reference_turbines.precomp_cache import load_precomp_blade
 from towerse.tower import TowerWithpBEAM
 from commonse.environment import PowerWind, TowerSoil, LinearWaves
 from commonse.utilities import cosd, sind
@@ -153,13 +153,8 @@ def configure_nrel5mw_turbine(turbine,wind_class='I',sea_depth = 0.0):
     #basepath = os.path.join('5MW_files', '5MW_PrecompFiles')
     basepath = os.path.join('..', 'reference_turbines','nrel5mw','blade')
 
-    materials = Orthotropic2DMaterial.listFromPreCompFile(os.path.join(basepath, 'materials.inp'))
-
     ncomp = len(turbine.rotor.initial_str_grid)
-    upper = [0]*ncomp
-    lower = [0]*ncomp
-    webs = [0]*ncomp
-    profile = [0]*ncomp
+    webLocs = [0]*ncomp
 
     turbine.rotor.leLoc = np.array([0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.498, 0.497, 0.465, 0.447, 0.43, 0.411,
         0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4,
@@ -186,8 +181,10 @@ def configure_nrel5mw_turbine(turbine,wind_class='I',sea_depth = 0.0):
         if web3[i] != -1:
             webLoc.append(web3[i])
 
-        upper[i], lower[i], webs[i] = CompositeSection.initFromPreCompLayupFile(os.path.join(basepath, 'layup_' + str(i+1) + '.inp'), webLoc, materials)
-        profile[i] = Profile.initFromPreCompFile(os.path.join(basepath, 'shape_' + str(i+1) + '.inp'))
+        webLocs[i] = webLoc
+
+    # parsed files are cached for the process (see precomp_cache)
+    materials, upper, lower, webs, profile = load_precomp_blade(basepath, webLocs)
 
     turbine.rotor.materials = materials  # (List): list of all Orthotropic2DMaterial objects used in defining the geometry
     turbine.rotor.upperCS = upper  # (List): list of CompositeSection objections defining the properties for upper surface
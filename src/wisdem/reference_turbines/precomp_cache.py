@@ -0,0 +1,158 @@
+"""
+precomp_cache.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import os
+import copy
+import tempfile
+import cPickle as pickle
+
+from rotorse.precomp import Profile, Orthotropic2DMaterial, CompositeSection
+
+
+# process-wide store of parsed PreComp objects keyed on (kind, file path, mtime, size, ...)
+_cache = {}
+
+# optional on-disk snapshot of _cache
+_snapshot = {'path': None, 'loaded': False, 'dirty': False}
+
+
+def set_precomp_snapshot(path):
+    """keep a binary snapshot of the parsed PreComp files at path (None to disable)
+
+    The snapshot is read on the next lookup and rewritten whenever new files are parsed,
+    so other processes (e.g. pool workers or later runs) can skip the text parsing.
+    Entries of files that have since been modified are ignored.
+    """
+
+    _snapshot['path'] = path
+    _snapshot['loaded'] = False
+    _snapshot['dirty'] = False
+
+
+def clear_precomp_cache():
+    """drop all parsed objects held by this process"""
+
+    _cache.clear()
+    _snapshot['loaded'] = False
+
+
+def _file_key(path):
+
+    path = os.path.abspath(path)
+    st = os.stat(path)
+
+    return (path, st.st_mtime, st.st_size)
+
+
+def _load_snapshot():
+
+    _snapshot['loaded'] = True
+    path = _snapshot['path']
+    if path is None or not os.path.exists(path):
+        return
+
+    try:
+        with open(path, 'rb') as f:
+            stored = pickle.load(f)
+    except Exception:
+        return  # unreadable or from another version: rebuild
+
+    for key, value in stored.iteritems():
+        _cache.setdefault(key, value)
+
+
+def _save_snapshot():
+
+    path = _snapshot['path']
+    directory = os.path.dirname(os.path.abspath(path))
+
+    # write then rename so concurrent readers never see a partial file
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    with os.fdopen(fd, 'wb') as f:
+        pickle.dump(_cache, f, pickle.HIGHEST_PROTOCOL)
+    os.rename(tmp, path)
+
+    _snapshot['dirty'] = False
+
+
+def _lookup(key, parse):
+
+    if _snapshot['path'] is not None and not _snapshot['loaded']:
+        _load_snapshot()
+
+    if key not in _cache:
+        _cache[key] = parse()
+        _snapshot['dirty'] = True
+
+    return _cache[key]
+
+
+def load_materials(fname):
+    """cached Orthotropic2DMaterial.listFromPreCompFile (shared objects, treat as read-only)"""
+
+    key = ('materials',) + _file_key(fname)
+
+    return _lookup(key, lambda: Orthotropic2DMaterial.listFromPreCompFile(fname))
+
+
+def load_layup(fname, webLoc, materials_fname):
+    """cached CompositeSection.initFromPreCompLayupFile (shared objects, treat as read-only)
+
+    materials_fname is the materials file the layup indices refer to.
+    """
+
+    materials = load_materials(materials_fname)
+    key = ('layup',) + _file_key(fname) + (tuple(webLoc),) + _file_key(materials_fname)
+
+    return _lookup(key, lambda: CompositeSection.initFromPreCompLayupFile(fname, webLoc, materials))
+
+
+def load_profile(fname):
+    """cached Profile.initFromPreCompFile (shared objects, treat as read-only)"""
+
+    key = ('profile',) + _file_key(fname)
+
+    return _lookup(key, lambda: Profile.initFromPreCompFile(fname))
+
+
+def load_precomp_blade(basepath, webLocs):
+    """parsed PreComp description of a blade, read from materials.inp, layup_i.inp and
+    shape_i.inp (i = 1..len(webLocs)) in basepath
+
+    Parameters
+    ----------
+    basepath : str
+        directory of the PreComp files
+    webLocs : list(list(float))
+        web locations for each section
+
+    Returns
+    -------
+    materials, upper, lower, webs, profile : list
+        new copies of the cached objects, ready to assign to the corresponding RotorSE inputs
+    """
+
+    materials_fname = os.path.join(basepath, 'materials.inp')
+
+    materials = load_materials(materials_fname)
+    upper = []
+    lower = []
+    webs = []
+    profile = []
+
+    for i, webLoc in enumerate(webLocs):
+        u, l, w = load_layup(os.path.join(basepath, 'layup_' + str(i+1) + '.inp'), webLoc, materials_fname)
+        upper.append(u)
+        lower.append(l)
+        webs.append(w)
+        profile.append(load_profile(os.path.join(basepath, 'shape_' + str(i+1) + '.inp')))
+
+    if _snapshot['path'] is not None and _snapshot['dirty']:
+        _save_snapshot()
+
+    # a single deep copy keeps the sections pointing at the copied materials
+    return copy.deepcopy((materials, upper, lower, webs, profile))
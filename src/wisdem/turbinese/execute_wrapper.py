@@ -0,0 +1,151 @@
+"""
+execute_wrapper.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import hashlib
+
+import numpy as np
+
+from openmdao.main.api import VariableTree
+
+
+# --- wrapping of component execute methods ---
+
+def wrap_execute(component, wrapper_class, *args):
+    """replace component.execute (on this instance only) with wrapper_class(component, inner, *args)
+    where inner is the execute being wrapped, or None for the class method"""
+
+    inner = component.__dict__.get('execute')
+    component.execute = wrapper_class(component, inner, *args)
+
+    return component.execute
+
+
+def unwrap_execute(component, wrapper_class):
+    """remove every wrapper of type wrapper_class from the chain of execute wrappers"""
+
+    chain = []
+    wrapper = component.__dict__.get('execute')
+    while wrapper is not None:
+        if not isinstance(wrapper, wrapper_class):
+            chain.append(wrapper)
+        wrapper = getattr(wrapper, 'inner', None)
+
+    inner = None
+    for wrapper in reversed(chain):
+        wrapper.inner = inner
+        inner = wrapper
+
+    if inner is None:
+        component.__dict__.pop('execute', None)
+    else:
+        component.execute = inner
+
+
+def find_wrapper(component, wrapper_class):
+    """return the first execute wrapper of type wrapper_class, or None"""
+
+    wrapper = component.__dict__.get('execute')
+    while wrapper is not None and not isinstance(wrapper, wrapper_class):
+        wrapper = getattr(wrapper, 'inner', None)
+
+    return wrapper
+
+
+class ExecuteWrapper(object):
+    """base for objects that stand in for a component's execute method"""
+
+    def __init__(self, component, inner):
+
+        self.component = component
+        self.inner = inner
+
+    def run_inner(self):
+
+        if self.inner is None:
+            type(self.component).execute(self.component)
+        else:
+            self.inner()
+
+
+# --- hashing of inputs ---
+
+def _update_hash(h, value, seen):
+
+    if isinstance(value, np.ndarray):
+        h.update('a%s%s' % (value.dtype.str, value.shape))
+        if value.dtype == object:
+            for item in value.flat:
+                _update_hash(h, item, seen)
+        else:
+            h.update(np.ascontiguousarray(value).tostring())
+
+    elif value is None or isinstance(value, (bool, int, long, float, complex, basestring, np.generic)):
+        h.update('s%s%r' % (type(value).__name__, value))
+
+    elif isinstance(value, (list, tuple)):
+        h.update('l%d' % len(value))
+        for item in value:
+            _update_hash(h, item, seen)
+
+    elif isinstance(value, dict):
+        h.update('d%d' % len(value))
+        for key in sorted(value.keys()):
+            h.update(repr(key))
+            _update_hash(h, value[key], seen)
+
+    elif isinstance(value, VariableTree):
+        h.update('v' + value.__class__.__name__)
+        for name in sorted(value.list_vars()):
+            h.update(name)
+            _update_hash(h, getattr(value, name), seen)
+
+    elif hasattr(value, '__dict__'):
+        # plain python objects (e.g. PreComp materials and profiles) hash on their attributes
+        if id(value) in seen:
+            h.update('r')
+            return
+        seen.add(id(value))
+        h.update('o' + value.__class__.__name__)
+        _update_hash(h, vars(value), seen)
+
+    else:
+        h.update(repr(value))
+
+
+def input_hash(component, name='', exclude=()):
+    """hex digest identifying the component type and the current values of all of its inputs
+
+    Inputs (or variables within input VarTrees, e.g. 'control.tsr') whose path is in exclude
+    are left out.
+    """
+
+    h = hashlib.sha1()
+    h.update('%s.%s:%s' % (component.__class__.__module__, component.__class__.__name__, name))
+
+    seen = set()
+
+    def add(obj, names, prefix):
+        for var in sorted(names):
+            path = prefix + var
+            if path in exclude:
+                continue
+            h.update(path)
+            value = getattr(obj, var)
+            if isinstance(value, VariableTree) and any(other.startswith(path + '.') for other in exclude):
+                add(value, value.list_vars(), path + '.')
+            else:
+                _update_hash(h, value, seen)
+
+    add(component, component.list_inputs(), '')
+
+    return h.hexdigest()
+
+
+def design_vector(component, names):
+    """current values of the named inputs (paths relative to the component) as one flat float array"""
+
+    return np.concatenate([np.atleast_1d(np.asarray(component.get(name), dtype=float)).flatten() for name in names])
@@ -0,0 +1,140 @@
+"""
+fixed_point.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import numpy as np
+
+from openmdao.main.api import Driver
+from openmdao.main.datatypes.api import Float, Int, Enum, Array, Bool
+from openmdao.main.exceptions import RunStopped
+from openmdao.main.hasparameters import HasParameters
+from openmdao.main.hasconstraints import HasEqConstraints
+from openmdao.main.interfaces import IHasParameters, IHasEqConstraints, ISolver, implements
+from openmdao.util.decorators import add_delegate
+
+
+def constraint_residuals(driver):
+    """residuals (lhs - rhs) of the equality constraints of a driver, flattened into one array
+
+    Constraint.evaluate returns the residual of the constraint as a sequence (the flattened
+    array for array constraints), not the two sides of the equation.
+    """
+
+    return np.concatenate([np.asarray(con.evaluate(driver.parent), dtype=float).flatten()
+                           for con in driver.get_eq_constraints().values()])
+
+
+@add_delegate(HasParameters, HasEqConstraints)
+class AcceleratedFixedPointIterator(Driver):
+    """fixed point iteration with Aitken or Anderson acceleration
+
+    Drop-in alternative to FixedPointIterator for the flexible blade coupling.  Each
+    equality constraint is written as ``parameter = output`` so that its residual
+    (lhs - rhs) is x - g(x) for the fixed point map g.  Every iteration is one run of
+    the workflow; the residual norm and parameter values of each run are recorded in
+    residual_history and parameter_history.
+    """
+
+    implements(IHasParameters, IHasEqConstraints, ISolver)
+
+    max_iteration = Int(20, iotype='in', desc='maximum number of workflow evaluations')
+    tolerance = Float(1e-8, iotype='in', desc='absolute convergence tolerance on the infinity norm of the residual')
+    acceleration = Enum('anderson', ('none', 'aitken', 'anderson'), iotype='in',
+        desc='none: plain (relaxed) substitution, aitken: dynamic relaxation, anderson: Anderson mixing')
+    relaxation = Float(1.0, iotype='in', desc='relaxation factor (initial factor for Aitken, mixing factor for Anderson)')
+    history_size = Int(5, iotype='in', desc='number of previous iterates used by Anderson acceleration')
+
+    iterations = Int(0, iotype='out', desc='number of workflow evaluations in the last execution')
+    converged = Bool(False, iotype='out', desc='True if the tolerance was met in the last execution')
+    residual_history = Array(iotype='out', desc='residual norm after each workflow evaluation')
+    parameter_history = Array(iotype='out', desc='parameter values of each workflow evaluation (one row per evaluation)')
+
+
+    def _residuals(self):
+
+        return constraint_residuals(self)
+
+
+    def _anderson_step(self, x, f, dX, dF):
+        """Anderson mixing over the stored differences of iterates (dX) and of fixed point residuals (dF)"""
+
+        if len(dF) == 0:
+            return x + self.relaxation*f
+
+        DX = np.array(dX).T
+        DF = np.array(dF).T
+        gamma = np.linalg.lstsq(DF, f, rcond=-1)[0]
+
+        return x - np.dot(DX, gamma) + self.relaxation*(f - np.dot(DF, gamma))
+
+
+    def execute(self):
+
+        x = np.array(self.eval_parameters(self.parent), dtype=float)
+
+        omega = self.relaxation
+        x_prev = f_prev = None
+        dX = []
+        dF = []
+        norms = []
+        xs = []
+        self.converged = False
+
+        for k in range(self.max_iteration):
+
+            if self._stop:
+                raise RunStopped('Stop requested')
+
+            self.set_parameters(x)
+            self.run_iteration()
+
+            r = self._residuals()
+            if len(r) != len(x):
+                self.raise_exception('number of constraint residuals (%d) does not match number of parameters (%d)'
+                                     % (len(r), len(x)), RuntimeError)
+
+            norms.append(np.max(np.abs(r)))
+            xs.append(x)
+
+            if norms[-1] < self.tolerance:
+                self.converged = True
+                break
+
+            if k == self.max_iteration - 1:
+                break
+
+            f = -r  # g(x) - x
+
+            if self.acceleration == 'anderson':
+                if f_prev is not None:
+                    dX.append(x - x_prev)
+                    dF.append(f - f_prev)
+                    if len(dF) > self.history_size:
+                        dX.pop(0)
+                        dF.pop(0)
+                x_new = self._anderson_step(x, f, dX, dF)
+
+            elif self.acceleration == 'aitken':
+                if f_prev is not None:
+                    df = f - f_prev
+                    denom = np.dot(df, df)
+                    if denom > 0.0:
+                        omega = -omega*np.dot(f_prev, df)/denom
+                x_new = x + omega*f
+
+            else:
+                x_new = x + self.relaxation*f
+
+            x_prev, f_prev = x, f
+            x = x_new
+
+        self.iterations = len(norms)
+        self.residual_history = np.array(norms)
+        self.parameter_history = np.array(xs)
+
+        if not self.converged:
+            self._logger.warning('fixed point iteration did not converge in %d iterations (residual %g)'
+                                 % (self.iterations, norms[-1]))
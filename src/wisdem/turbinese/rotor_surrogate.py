@@ -0,0 +1,464 @@
+"""
+rotor_surrogate.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+from openmdao.main.api import VariableTree, Driver
+
+from wisdem.turbinese.execute_wrapper import ExecuteWrapper, wrap_execute, unwrap_execute, find_wrapper, input_hash, \
+    design_vector
+
+
+# RotorSE inputs the surrogate is a function of (paths relative to the rotor)
+SURROGATE_DESIGN_VARS = ('chord_sub', 'theta_sub', 'precurve_sub', 'sparT', 'teT', 'bladeLength', 'precone', 'tilt',
+                         'hubHt', 'control.tsr', 'control.ratedPower', 'shearExp', 'rho',
+                         'cdf_reference_height_wind_speed')
+
+# RotorSE outputs consumed by the rest of the turbine and lcoe assemblies
+SURROGATE_OUTPUTS = ('mass_one_blade', 'mass_all_blades', 'I_all_blades', 'ratedConditions', 'T_extreme', 'Q_extreme',
+                     'AEP', 'root_bending_moment', 'Rtip', 'precurveTip', 'diameter', 'hub_diameter', 'V_extreme')
+
+
+class KrigingModel(object):
+    """ordinary kriging (Gaussian process regression with a constant mean) of several outputs
+    sharing one Gaussian correlation function
+
+    Inputs are scaled to the unit box of the training data and outputs are standardized.  The
+    correlation length of each input is chosen by maximizing the likelihood with a coordinate
+    search in log space.
+
+    Parameters
+    ----------
+    nugget : float
+        added to the diagonal of the correlation matrix for conditioning
+    """
+
+    def __init__(self, nugget=1e-10):
+
+        self.nugget = nugget
+        self.theta = None
+
+    def _correlation(self, theta):
+
+        d = self._X[:, np.newaxis, :] - self._X[np.newaxis, :, :]
+        R = np.exp(-np.sum(theta*d**2, axis=2))
+        R[np.diag_indices_from(R)] += self.nugget
+
+        return R
+
+    def _factor(self, theta):
+        """Cholesky factor and generalized least squares quantities for theta, or None if R is singular"""
+
+        try:
+            L = np.linalg.cholesky(self._correlation(theta))
+        except np.linalg.LinAlgError:
+            return None
+
+        n = len(self._X)
+        Linv_one = np.linalg.solve(L, np.ones(n))
+        Linv_Y = np.linalg.solve(L, self._Y)
+        beta = np.dot(Linv_one, Linv_Y)/np.dot(Linv_one, Linv_one)
+        Linv_resid = Linv_Y - np.outer(Linv_one, beta)
+        sigma2 = np.sum(Linv_resid**2, axis=0)/n
+
+        return L, Linv_one, beta, Linv_resid, sigma2
+
+    def _neg_log_likelihood(self, log_theta):
+
+        factors = self._factor(10**log_theta)
+        if factors is None:
+            return np.inf
+        L, sigma2 = factors[0], factors[-1]
+
+        n, m = self._Y.shape
+        return 0.5*n*np.sum(np.log(np.maximum(sigma2, 1e-300))) + m*np.sum(np.log(np.diag(L)))
+
+    def _optimize_theta(self, active, bounds=(-3.0, 2.0), max_iterations=40):
+
+        log_theta = np.zeros(self._X.shape[1])
+        best = self._neg_log_likelihood(log_theta)
+        step = 1.0
+
+        for iteration in range(max_iterations):
+            improved = False
+            for k in np.flatnonzero(active):
+                for direction in (1.0, -1.0):
+                    trial = np.copy(log_theta)
+                    trial[k] = np.clip(trial[k] + direction*step, bounds[0], bounds[1])
+                    f = self._neg_log_likelihood(trial)
+                    if f < best:
+                        best, log_theta, improved = f, trial, True
+                        break
+            if not improved:
+                step /= 2.0
+                if step < 0.05:
+                    break
+
+        return 10**log_theta
+
+    def fit(self, X, Y, theta=None):
+        """fit to samples X (n, d) and outputs Y (n, m), optimizing the correlation lengths unless
+        theta is given"""
+
+        X = np.asarray(X, dtype=float)
+        Y = np.asarray(Y, dtype=float)
+
+        self.lower = np.min(X, axis=0)
+        self.upper = np.max(X, axis=0)
+        self._range = self.upper - self.lower
+        active = self._range > 0
+        self._range[~active] = 1.0
+
+        self.mean = np.mean(Y, axis=0)
+        self.scale = np.std(Y, axis=0)
+        self.scale[self.scale == 0] = 1.0
+
+        self._X = (X - self.lower)/self._range
+        self._Y = (Y - self.mean)/self.scale
+
+        if theta is None or len(theta) != X.shape[1]:
+            theta = self._optimize_theta(active)
+        self.theta = theta
+
+        factors = self._factor(theta)
+        if factors is None:
+            raise np.linalg.LinAlgError('singular correlation matrix (duplicate samples?)')
+        L, self._Linv_one, self._beta, Linv_resid, self._sigma2 = factors
+        self._Linv = np.linalg.inv(L)
+        self._gamma = np.dot(self._Linv.T, Linv_resid)  # R^-1 (Y - beta)
+        self._one_Rinv_one = np.dot(self._Linv_one, self._Linv_one)
+
+    def predict(self, x):
+        """prediction at x (d,) and its standard error, both of shape (m,)"""
+
+        u = (np.asarray(x, dtype=float) - self.lower)/self._range
+        r = np.exp(-np.sum(self.theta*(self._X - u)**2, axis=1))
+
+        y = self._beta + np.dot(r, self._gamma)
+
+        Linv_r = np.dot(self._Linv, r)
+        mse = 1.0 - np.dot(Linv_r, Linv_r) + (1.0 - np.dot(self._Linv_one, Linv_r))**2/self._one_Rinv_one
+        std = np.sqrt(np.maximum(mse, 0.0)*self._sigma2)
+
+        return self.mean + self.scale*y, self.scale*std
+
+
+# --- rotor outputs as a flat vector ---
+
+def _output_layout(component, outputs):
+    """(path, shape) of every numeric value of the outputs, with VarTrees expanded"""
+
+    layout = []
+
+    def add(path, value):
+        if isinstance(value, VariableTree):
+            for name in sorted(value.list_vars()):
+                add(path + '.' + name, getattr(value, name))
+        elif np.asarray(value).dtype.kind == 'f':
+            layout.append((path, np.shape(value)))
+
+    for name in outputs:
+        add(name, getattr(component, name))
+
+    return layout
+
+
+def _get_path(component, path):
+
+    obj = component
+    for part in path.split('.'):
+        obj = getattr(obj, part)
+
+    return obj
+
+
+def _set_path(component, path, value):
+
+    parts = path.split('.')
+    obj = component
+    for part in parts[:-1]:
+        obj = getattr(obj, part)
+    setattr(obj, parts[-1], value)
+
+
+def _output_vector(component, layout):
+
+    return np.concatenate([np.atleast_1d(np.asarray(_get_path(component, path), dtype=float)).flatten()
+                           for path, shape in layout])
+
+
+def _set_outputs(component, layout, y):
+
+    start = 0
+    for path, shape in layout:
+        size = int(np.prod(shape))
+        if shape == ():
+            _set_path(component, path, float(y[start]))
+        else:
+            _set_path(component, path, np.reshape(y[start:start+size], shape))
+        start += size
+
+
+class RotorSurrogate(object):
+    """kriging surrogate of RotorSE, trained on full rotor runs and refined as it is used
+
+    Parameters
+    ----------
+    design_vars : list(str)
+        rotor inputs (paths relative to the rotor) the outputs are modelled as a function of.
+        A separate model is kept for every combination of values of all the other inputs
+        (e.g. turbine_class, nBlades or the airfoil and material data).
+    outputs : list(str)
+        rotor outputs predicted by the surrogate
+    tolerance : float
+        largest acceptable estimated relative error (standard error over the magnitude of the
+        prediction) of any output; above it the full rotor is run instead
+    min_samples : int
+        number of full runs needed before the surrogate is used for a combination of the
+        other inputs
+    update : bool
+        add the result of every fall-back run to the training data and refit
+    retrain_every : int
+        the correlation lengths are re-optimized after this many new samples (in between,
+        refits reuse the previous ones)
+    """
+
+    def __init__(self, design_vars=SURROGATE_DESIGN_VARS, outputs=SURROGATE_OUTPUTS, tolerance=0.02, min_samples=10,
+                 update=True, retrain_every=20):
+
+        self.design_vars = design_vars
+        self.outputs = outputs
+        self.tolerance = tolerance
+        self.min_samples = min_samples
+        self.update = update
+        self.retrain_every = retrain_every
+
+        self.layout = None
+        self.predictions = 0
+        self.fallbacks = 0
+        self._samples = {}  # model key -> ([x], [y])
+        self._models = {}   # model key -> (model, number of samples at last optimization)
+
+    def __len__(self):
+
+        return sum(len(X) for X, Y in self._samples.itervalues())
+
+    def add(self, key, x, y):
+
+        X, Y = self._samples.setdefault(key, ([], []))
+        X.append(np.array(x, dtype=float))
+        Y.append(np.array(y, dtype=float))
+
+    def fit(self, key=None):
+        """fit the model of one model key (all of them if None)"""
+
+        keys = self._samples.keys() if key is None else [key]
+        for key in keys:
+            X, Y = self._samples[key]
+            if len(X) < self.min_samples:
+                continue
+            model, optimized_at = self._models.get(key, (KrigingModel(), 0))
+            theta = model.theta if len(X) - optimized_at < self.retrain_every else None
+            try:
+                model.fit(X, Y, theta)
+            except np.linalg.LinAlgError:
+                self._models.pop(key, None)  # the full rotor is run until a fit succeeds
+                continue
+            self._models[key] = (model, len(X) if theta is None else optimized_at)
+
+    def predict(self, key, x):
+        """outputs predicted at x and the largest estimated relative error, or (None, inf) when no
+        model exists or x lies outside the training data"""
+
+        if key not in self._models:
+            return None, np.inf
+
+        model = self._models[key][0]
+        x = np.asarray(x, dtype=float)
+        if len(x) != len(model.lower) or np.any(x < model.lower) or np.any(x > model.upper):
+            return None, np.inf  # never extrapolate
+
+        y, std = model.predict(x)
+        magnitude = np.maximum(np.abs(y), 1e-3*np.max(np.abs(self._samples[key][1]), axis=0))
+        magnitude[magnitude == 0] = 1.0
+
+        return y, np.max(std/magnitude)
+
+    def model_key(self, component):
+        """digest of the component inputs other than the design variables"""
+
+        return input_hash(component, exclude=self.design_vars)
+
+
+class SurrogateExecute(ExecuteWrapper):
+    """stands in for the rotor's execute: sets the outputs from the surrogate when its error
+    estimate is small enough, otherwise runs the full rotor (and learns from it)"""
+
+    def __init__(self, component, inner, surrogate):
+
+        super(SurrogateExecute, self).__init__(component, inner)
+        self.surrogate = surrogate
+        self.training = False
+
+    def __call__(self):
+
+        surrogate = self.surrogate
+        key = surrogate.model_key(self.component)
+        x = design_vector(self.component, surrogate.design_vars)
+
+        if not self.training:
+            y, error = surrogate.predict(key, x)
+            if error <= surrogate.tolerance:
+                _set_outputs(self.component, surrogate.layout, y)
+                surrogate.predictions += 1
+                return
+            surrogate.fallbacks += 1
+
+        self.run_inner()
+
+        if surrogate.layout is None:
+            surrogate.layout = _output_layout(self.component, surrogate.outputs)
+        surrogate.add(key, x, _output_vector(self.component, surrogate.layout))
+        if not self.training and surrogate.update:
+            surrogate.fit(key)
+
+
+def _iterating_driver(driver, scope, name):
+    """name of the driver nested in the workflow of driver whose workflow contains name, or None"""
+
+    for member in driver.workflow.get_names():
+        obj = getattr(scope, member)
+        if isinstance(obj, Driver):
+            if name in obj.workflow.get_names():
+                return member
+            nested = _iterating_driver(obj, scope, name)
+            if nested is not None:
+                return nested
+
+    return None
+
+
+def enable_rotor_surrogate(assembly, surrogate=None, name='rotor'):
+    """replace the rotor of a turbine or lcoe assembly by a surrogate, keeping all connections
+
+    The surrogate is only used once it has been trained (see train_rotor_surrogate); until
+    then, and whenever its error estimate exceeds its tolerance or the design lies outside
+    the training data, the full rotor is run.  Only for rigid blades (flexible_blade=False):
+    a rotor iterated on by a driver (the fpi of flexible blades) is refused, since the
+    surrogate does not model the outputs the iteration converges.
+
+    Returns
+    -------
+    surrogate : RotorSurrogate
+    """
+
+    driver = _iterating_driver(assembly.driver, assembly, name)
+    if driver is not None:
+        raise ValueError('%s is iterated on by the %s driver; the rotor surrogate is for rigid blades only'
+                         % (name, driver))
+
+    if surrogate is None:
+        surrogate = RotorSurrogate()
+
+    rotor = getattr(assembly, name)
+    if find_wrapper(rotor, SurrogateExecute) is None:
+        wrap_execute(rotor, SurrogateExecute, surrogate)
+
+    return surrogate
+
+
+def disable_rotor_surrogate(assembly, name='rotor'):
+    """restore the full rotor"""
+
+    unwrap_execute(getattr(assembly, name), SurrogateExecute)
+
+
+def train_rotor_surrogate(assembly, bounds, n=100, seed=None, surrogate=None, name='rotor'):
+    """run an assembly on a Latin hypercube sample and fit a rotor surrogate to the rotor runs
+
+    Parameters
+    ----------
+    assembly : Assembly
+        turbine or lcoe assembly (each sample runs the whole assembly; the rotor dominates the cost)
+    bounds : OrderedDict
+        input path relative to the assembly -> (lower, upper), scalars or arrays shaped like the
+        input.  The paths should cover the surrogate design variables expected to vary, e.g.
+        'rotor.bladeLength', 'hub_height' or 'machine_rating'.
+    n : int
+        number of samples
+    seed : int
+    surrogate : RotorSurrogate
+        surrogate to train (a new one if None), enabled on the assembly
+
+    Returns
+    -------
+    surrogate : RotorSurrogate
+    failed : int
+        number of samples whose run failed
+    """
+
+    from wisdem.lcoe.lcoe_sampling import latin_hypercube  # only needed for training
+
+    surrogate = enable_rotor_surrogate(assembly, surrogate, name)
+    wrapper = find_wrapper(getattr(assembly, name), SurrogateExecute)
+
+    lower = OrderedDict((path, np.asarray(low, dtype=float)) for path, (low, high) in bounds.iteritems())
+    upper = OrderedDict((path, np.asarray(high, dtype=float)) for path, (low, high) in bounds.iteritems())
+    sizes = [max(lower[path].size, upper[path].size) for path in bounds]
+    u = latin_hypercube(n, sum(sizes), seed)
+
+    original = OrderedDict((path, np.copy(assembly.get(path))) for path in bounds)
+    failed = 0
+    wrapper.training = True
+    try:
+        for i in range(n):
+            start = 0
+            for path, size in zip(bounds, sizes):
+                value = lower[path] + u[i, start:start+size]*(upper[path] - lower[path])
+                assembly.set(path, float(value) if np.ndim(original[path]) == 0 else value.reshape(original[path].shape))
+                start += size
+            try:
+                assembly.run()
+            except Exception:
+                failed += 1
+    finally:
+        wrapper.training = False
+        for path, value in original.iteritems():
+            assembly.set(path, value)
+
+    surrogate.fit()
+
+    return surrogate, failed
+
+
+def example():
+
+    import time
+    from wisdem.lcoe.lcoe_se_assembly import create_example_se_assembly
+
+    lcoe_se = create_example_se_assembly(with_new_nacelle=True)
+    bounds = OrderedDict([('rotor.bladeLength', (58.0, 65.0)), ('hub_height', (80.0, 100.0)),
+                          ('rotor.control.tsr', (7.0, 8.5))])
+
+    tt = time.time()
+    surrogate, failed = train_rotor_surrogate(lcoe_se, bounds, n=60, seed=1)
+    print 'trained on {0} rotor runs in {1:.0f} s ({2} failed)'.format(len(surrogate), time.time() - tt, failed)
+
+    for blade_length in [59.0, 61.5, 64.0]:
+        lcoe_se.rotor.bladeLength = blade_length
+        tt = time.time()
+        lcoe_se.run()
+        print 'blade length {0:.1f} m: coe {1:.4f} USD/kWh ({2:.2f} s)'.format(blade_length, lcoe_se.coe, time.time() - tt)
+
+    print '{0} surrogate predictions, {1} full rotor runs'.format(surrogate.predictions, surrogate.fallbacks)
+
+
+if __name__ == '__main__':
+
+    example()
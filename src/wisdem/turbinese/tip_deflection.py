@@ -0,0 +1,164 @@
+"""
+tip_deflection.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+import numpy as np
+
+
+def interp_bracket(x, xp, yp):
+    """linear interpolation (with extrapolation) of a scalar x and its derivatives, as in
+    commonse.utilities.interp_with_deriv, but only returning the derivatives with respect
+    to the two bracketing points xp[j], xp[j+1] (all others are zero)
+
+    Returns
+    -------
+    y : float
+    dydx : float
+    j : int
+        index of the lower bracketing point
+    dydxp : ndarray (2,)
+        derivatives with respect to xp[j], xp[j+1]
+    dydyp : ndarray (2,)
+        derivatives with respect to yp[j], yp[j+1]
+    """
+
+    xp = np.asarray(xp, dtype=float)
+    if np.any(np.diff(xp) < 0):
+        raise TypeError('xp must be in ascending order')
+
+    j = int(np.sum(xp[1:-1] <= x))
+    x1, x2 = xp[j], xp[j+1]
+    y1, y2 = yp[j], yp[j+1]
+
+    t = (x - x1)/(x2 - x1)
+    slope = (y2 - y1)/(x2 - x1)
+
+    y = y1 + (y2 - y1)*t
+    dydxp = np.array([slope*(x - x2)/(x2 - x1), -slope*(x - x1)/(x2 - x1)])
+    dydyp = np.array([1.0 - t, t])
+
+    return y, slope, j, dydxp, dydyp
+
+
+class TipDeflectionJacobian(object):
+    """sparse Jacobian of [max_tip_deflection, ground_clearance] of a MaxTipDeflection component
+
+    The nonzero pattern is declared once: the scalar inputs, hub_tt[0], hub_tt[2] and the two
+    tower nodes that bracket the blade tip height.  Only the tower columns move (with the
+    bracket); values are filled in place in data, one row per output.  apply/applyT give the
+    Jacobian-vector products used for matrix-free derivatives, and dense() the full matrix in
+    the column order of list_deriv_vars.
+
+    Parameters
+    ----------
+    inputs : list(str)
+        derivative inputs of the component (list_deriv_vars order)
+    m : int
+        number of tower nodes
+    """
+
+    outputs = ('max_tip_deflection', 'ground_clearance')
+
+    def __init__(self, inputs, m):
+
+        self.inputs = tuple(inputs)
+        self.m = m
+
+        sizes = {'hub_tt': 3, 'tower_z': m, 'tower_d': m}
+        offsets = {}
+        n = 0
+        for name in self.inputs:
+            offsets[name] = n
+            n += sizes.get(name, 1)
+        self.shape = (2, n)
+
+        slots = [('Rtip', 0), ('precurveTip', 0), ('presweepTip', 0), ('precone', 0), ('tilt', 0),
+                 ('hub_tt', 0), ('hub_tt', 2), ('tower_z', 0), ('tower_z', 1), ('tower_d', 0), ('tower_d', 1),
+                 ('towerHt', 0)]
+        self.slots = [(name, index) for name, index in slots if name in offsets]
+
+        # index into the input of each slot (tower slots are relative to the bracket) and its column
+        self._offset = np.array([index for name, index in self.slots])
+        self._tower = np.array([name in ('tower_z', 'tower_d') for name, index in self.slots])
+        self._base = np.array([offsets[name] for name, index in self.slots])
+        self.index = self._offset.copy()
+        self.cols = self._base + self.index
+
+        self.data = np.zeros((2, len(self.slots)))
+        self._slot = dict((slot, k) for k, slot in enumerate(self.slots))
+
+    def set_bracket(self, j):
+        """move the tower columns to nodes j, j+1"""
+
+        self.index[self._tower] = self._offset[self._tower] + j
+        self.cols[:] = self._base + self.index
+
+    def fill(self, blade_yaw, precone, hub_tt, towerHt, drtower_dztower, drtower_dtowerz, drtower_dtowerd):
+        """fill data in place from the tip position derivatives and the tower radius interpolation"""
+
+        dbyx = blade_yaw.dx
+        dbyz = blade_yaw.dz
+        sign = -1.0 if precone >= 0 else 1.0  # upwind / downwind
+
+        data = self.data
+        slot = self._slot
+        data[:] = 0.0
+
+        for name, key in (('Rtip', 'dz'), ('precurveTip', 'dx'), ('presweepTip', 'dy'),
+                          ('precone', 'dprecone'), ('tilt', 'dtilt')):
+            k = slot[(name, 0)]
+            data[0, k] = sign*dbyx[key] - drtower_dztower*dbyz[key]/towerHt
+            data[1, k] = dbyz[key]
+
+        data[0, slot[('hub_tt', 0)]] = -1.0
+        k = slot[('hub_tt', 2)]
+        data[0, k] = -drtower_dztower/towerHt
+        data[1, k] = 1.0
+
+        for name, deriv in (('tower_z', drtower_dtowerz), ('tower_d', drtower_dtowerd)):
+            if (name, 0) in slot:
+                data[0, slot[(name, 0)]] = -deriv[0]
+                data[0, slot[(name, 1)]] = -deriv[1]
+
+        k = slot[('towerHt', 0)]
+        data[0, k] = drtower_dztower*(hub_tt[2] + blade_yaw.z)/towerHt**2
+        data[1, k] = 1.0
+
+    def dense(self):
+
+        J = np.zeros(self.shape)
+        J[:, self.cols] = self.data
+
+        return J
+
+    def apply(self, arg, result):
+        """result[output] += J*arg (forward mode)"""
+
+        dx = np.zeros(len(self.slots))
+        for k, (name, index) in enumerate(self.slots):
+            if name in arg:
+                dx[k] = np.ravel(arg[name])[self.index[k]]
+
+        for i, output in enumerate(self.outputs):
+            if output in result:
+                result[output] += np.dot(self.data[i], dx)
+
+    def applyT(self, arg, result):
+        """result[input] += J^T*arg (adjoint mode)"""
+
+        df = np.zeros(2)
+        for i, output in enumerate(self.outputs):
+            if output in arg:
+                df[i] = np.ravel(arg[output])[0]
+
+        dx = np.dot(df, self.data)
+        for k, (name, index) in enumerate(self.slots):
+            if name not in result:
+                continue
+            if name in ('hub_tt', 'tower_z', 'tower_d'):
+                result[name][self.index[k]] += dx[k]
+            else:
+                result[name] += dx[k]
@@ -18,10 +18,11 @@ from commonse.rna import RNAMass, RotorLoads
 from drivewpact.drive import DriveWPACT
 from drivewpact.hub import HubWPACT
 from commonse.csystem import DirectionVector
-from commonse.utilities import interp_with_deriv, hstack, vstack
 from drivese.drive_smooth import NacelleTS
 from drivese.drive import Drive4pt, Drive3pt
 from drivese.hub import HubSE
+from wisdem.turbinese.fixed_point import AcceleratedFixedPointIterator
+from wisdem.turbinese.tip_deflection import interp_bracket, TipDeflectionJacobian
 
 
 class MaxTipDeflection(Component):
@@ -48,10 +49,10 @@ class MaxTipDeflection(Component):
         # find corresponding radius of tower
         ztower = (self.towerHt + self.hub_tt[2] + blade_yaw.z)/self.towerHt  # nondimensional location
         # rtower = np.interp(ztower, self.tower_z, self.tower_d) / 2.0
-        dtower, ddtower_dztower, ddtower_dtowerz, ddtower_dtowerd = interp_with_deriv(ztower, self.tower_z, self.tower_d)
+        dtower, ddtower_dztower, j, ddtower_dtowerz, ddtower_dtowerd = interp_bracket(ztower, self.tower_z, self.tower_d)
         rtower = dtower / 2.0
         self.drtower_dztower = ddtower_dztower / 2.0
-        self.drtower_dtowerz = ddtower_dtowerz / 2.0
+        self.drtower_dtowerz = ddtower_dtowerz / 2.0  # bracketing nodes j, j+1 only
         self.drtower_dtowerd = ddtower_dtowerd / 2.0
 
         # max deflection before strike
@@ -67,6 +68,12 @@ class MaxTipDeflection(Component):
         # save for derivs
         self.blade_yaw = blade_yaw
 
+        # sparse Jacobian: pattern declared once per tower discretization, values filled in place when needed
+        if getattr(self, 'J', None) is None or self.J.m != len(self.tower_z):
+            self.J = TipDeflectionJacobian(self.list_deriv_vars()[0], len(self.tower_z))
+        self.J.set_bracket(j)
+        self.J_current = False
+
 
     def list_deriv_vars(self):
 
@@ -76,84 +83,149 @@ class MaxTipDeflection(Component):
 
         return inputs, outputs
 
-    def provideJ(self):
-
-        dbyx = self.blade_yaw.dx
-        # dbyy = self.blade_yaw.dy
-        dbyz = self.blade_yaw.dz
-
-        # Rtip
-        drtower_dRtip = self.drtower_dztower * dbyz['dz']/self.towerHt
-        if self.precone >= 0:
-            dtd_dRtip = -dbyx['dz'] - drtower_dRtip
-        else:
-            dtd_dRtip = dbyx['dz'] - drtower_dRtip
-        dgc_dRtip = dbyz['dz']
-
-        # precurveTip
-        drtower_dprecurveTip = self.drtower_dztower * dbyz['dx']/self.towerHt
-        if self.precone >= 0:
-            dtd_dprecurveTip = -dbyx['dx'] - drtower_dprecurveTip
-        else:
-            dtd_dprecurveTip = dbyx['dx'] - drtower_dprecurveTip
-        dgc_dprecurveTip = dbyz['dx']
-
-        # presweep
-        drtower_dpresweepTip = self.drtower_dztower * dbyz['dy']/self.towerHt
-        if self.precone >= 0:
-            dtd_dpresweepTip = -dbyx['dy'] - drtower_dpresweepTip
-        else:
-            dtd_dpresweepTip = dbyx['dy'] - drtower_dpresweepTip
-        dgc_dpresweepTip = dbyz['dy']
+    def _fill_jacobian(self):
 
+        if self.J_current:
+            return
+        self.J_current = True
+        self.J.fill(self.blade_yaw, self.precone, self.hub_tt, self.towerHt,
+            self.drtower_dztower, self.drtower_dtowerz, self.drtower_dtowerd)
 
-        # precone
-        drtower_dprecone = self.drtower_dztower * dbyz['dprecone']/self.towerHt
-        if self.precone >= 0:
-            dtd_dprecone = -dbyx['dprecone'] - drtower_dprecone
-        else:
-            dtd_dprecone = dbyx['dprecone'] - drtower_dprecone
-        dgc_dprecone = dbyz['dprecone']
+    def provideJ(self):
 
-        # tilt
-        drtower_dtilt = self.drtower_dztower * dbyz['dtilt']/self.towerHt
-        if self.precone >= 0:
-            dtd_dtilt = -dbyx['dtilt'] - drtower_dtilt
-        else:
-            dtd_dtilt = dbyx['dtilt'] - drtower_dtilt
-        dgc_dtilt = dbyz['dtilt']
+        self._fill_jacobian()
 
-        # hubtt
-        drtower_dhubtt = self.drtower_dztower * np.array([0.0, 0.0, 1.0/self.towerHt])
-        dtd_dhubtt = np.array([-1.0, 0.0, 0.0]) - drtower_dhubtt
-        dgc_dhubtt = np.array([0.0, 0.0, 1.0])
+        return self.J.dense()
 
-        # tower_z
-        dtd_dtowerz = -self.drtower_dtowerz
-        dgc_dtowerz = np.zeros_like(self.tower_z)
+    def apply_deriv(self, arg, result):
 
-        # tower_d
-        dtd_dtowerd = -self.drtower_dtowerd
-        dgc_dtowerd = np.zeros_like(self.tower_d)
+        self._fill_jacobian()
+        self.J.apply(arg, result)
 
-        # towerHt
-        drtower_dtowerHt = self.drtower_dztower * -(self.hub_tt[2] + self.blade_yaw.z)/self.towerHt**2
-        dtd_dtowerHt = -drtower_dtowerHt
-        dgc_dtowerHt = 1.0
+    def apply_derivT(self, arg, result):
 
-        dtd = hstack([dtd_dRtip, dtd_dprecurveTip, dtd_dpresweepTip, dtd_dprecone, dtd_dtilt,
-            dtd_dhubtt, dtd_dtowerz, dtd_dtowerd, dtd_dtowerHt])
-        dgc = np.concatenate([[dgc_dRtip], [dgc_dprecurveTip], [dgc_dpresweepTip], [dgc_dprecone],
-            [dgc_dtilt], dgc_dhubtt, dgc_dtowerz, dgc_dtowerd, [dgc_dtowerHt]])
+        self._fill_jacobian()
+        self.J.applyT(arg, result)
 
-        J = vstack([dtd, dgc])
 
-        return J
 
+def max_tip_deflection_batch(Rtip, precurveTip, presweepTip, precone, tilt, hub_tt, tower_z, tower_d, towerHt):
+    """vectorized version of MaxTipDeflection for screening many designs at once
 
+    Parameters
+    ----------
+    Rtip, precurveTip, presweepTip, precone, tilt, towerHt : float or array_like (N,)
+        same meaning and units as the MaxTipDeflection inputs, one entry per design
+        (scalars are broadcast)
+    hub_tt : array_like (3,) or (N, 3)
+        location of hub relative to tower-top in yaw-aligned c.s.
+    tower_z, tower_d : array_like (M,) or (N, M)
+        tower stations and diameters, shared by all designs or given per design
+
+    Returns
+    -------
+    max_tip_deflection : ndarray (N,)
+        clearance between undeflected blade and tower
+    ground_clearance : ndarray (N,)
+        distance between blade tip and ground
+    J : ndarray (N, 2, 9+2M)
+        Jacobian of [max_tip_deflection, ground_clearance] for each design with columns
+        ordered as in MaxTipDeflection.provideJ: Rtip, precurveTip, presweepTip, precone,
+        tilt, hub_tt (3), tower_z (M), tower_d (M), towerHt
 
+    """
 
-def configure_turbine(assembly, with_new_nacelle=True, flexible_blade=False, with_3pt_drive=False):
+    Rtip, precurveTip, presweepTip, precone, tilt, towerHt = np.broadcast_arrays(
+        *[np.atleast_1d(np.asarray(v, dtype=float)) for v in (Rtip, precurveTip, presweepTip, precone, tilt, towerHt)])
+    n = len(Rtip)
+    hub_tt = np.asarray(hub_tt, dtype=float) * np.ones((n, 1))
+    tower_z = np.asarray(tower_z, dtype=float) * np.ones((n, 1))
+    tower_d = np.asarray(tower_d, dtype=float) * np.ones((n, 1))
+    m = tower_z.shape[1]
+
+    if np.any(np.diff(tower_z, axis=1) < 0):
+        raise TypeError('tower_z must be in ascending order')
+
+    # --- coordinates of blade tip in yaw c.s. (same rotations as DirectionVector) ---
+    # blade -> azimuth (rotation about y by precone)
+    r = np.radians(1.0)
+    c1 = np.cos(np.radians(precone))
+    s1 = np.sin(np.radians(precone))
+    az_z = Rtip*c1 + precurveTip*s1
+    az_x = -Rtip*s1 + precurveTip*c1
+
+    # azimuth -> hub (rotation about x by 180 deg)
+    c2 = np.cos(np.radians(-180.0))
+    s2 = np.sin(np.radians(-180.0))
+    hub_x = az_x
+    hub_z = -presweepTip*s2 + az_z*c2
+
+    # hub -> yaw (rotation about y by tilt)
+    c3 = np.cos(np.radians(-tilt))
+    s3 = np.sin(np.radians(-tilt))
+    byz = hub_z*c3 + hub_x*s3
+    byx = -hub_z*s3 + hub_x*c3
+
+    # derivatives of the tip coordinates w.r.t. [Rtip, precurveTip, presweepTip, precone, tilt]
+    zero = np.zeros(n)
+    dhubx = np.array([-s1, c1, zero, -az_z*r, zero])
+    dhubz = np.array([c2*c1, c2*s1, -s2*np.ones(n), c2*az_x*r, zero])
+    dbyz = dhubz*c3 + dhubx*s3
+    dbyx = -dhubz*s3 + dhubx*c3
+    dbyz[4] = -byx*r
+    dbyx[4] = byz*r
+
+    # --- corresponding radius of tower ---
+    ztower = (towerHt + hub_tt[:, 2] + byz)/towerHt  # nondimensional location
+
+    # linear interpolation (with extrapolation) as in interp_with_deriv
+    j = np.sum(tower_z[:, 1:-1] <= ztower[:, np.newaxis], axis=1)
+    i = np.arange(n)
+    x1 = tower_z[i, j]
+    x2 = tower_z[i, j+1]
+    y1 = tower_d[i, j]
+    y2 = tower_d[i, j+1]
+    t = (ztower - x1)/(x2 - x1)
+    slope = (y2 - y1)/(x2 - x1)
+
+    rtower = (y1 + (y2 - y1)*t) / 2.0
+    drtower_dztower = slope / 2.0
+    drtower_dtowerz = np.zeros((n, m))
+    drtower_dtowerz[i, j] = slope*(ztower - x2)/(x2 - x1) / 2.0
+    drtower_dtowerz[i, j+1] = -slope*(ztower - x1)/(x2 - x1) / 2.0
+    drtower_dtowerd = np.zeros((n, m))
+    drtower_dtowerd[i, j] = (1.0 - t) / 2.0
+    drtower_dtowerd[i, j+1] = t / 2.0
+
+    # --- max deflection before strike ---
+    sign = np.where(precone >= 0, -1.0, 1.0)  # upwind / downwind
+    max_tip_deflection = -hub_tt[:, 0] + sign*byx - rtower
+
+    # --- ground clearance ---
+    ground_clearance = towerHt + hub_tt[:, 2] + byz
+
+    # --- Jacobian ---
+    J = np.zeros((n, 2, 9 + 2*m))
+
+    J[:, 0, 0:5] = (sign*dbyx - drtower_dztower*dbyz/towerHt).T
+    J[:, 1, 0:5] = dbyz.T
+
+    J[:, 0, 5] = -1.0
+    J[:, 0, 7] = -drtower_dztower/towerHt
+    J[:, 1, 7] = 1.0
+
+    J[:, 0, 8:8+m] = -drtower_dtowerz
+    J[:, 0, 8+m:8+2*m] = -drtower_dtowerd
+
+    J[:, 0, -1] = drtower_dztower*(hub_tt[:, 2] + byz)/towerHt**2
+    J[:, 1, -1] = 1.0
+
+    return max_tip_deflection, ground_clearance, J
+
+
+
+
+def configure_turbine(assembly, with_new_nacelle=True, flexible_blade=False, with_3pt_drive=False, fpi_acceleration='none'):
     """a stand-alone configure method to allow for flatter assemblies
 
     Parameters
@@ -168,6 +240,10 @@ def configure_turbine(assembly, with_new_nacelle=True, flexible_blade=False, wit
         Note that the coupling is currently only in the flapwise deflection, and is primarily
         only important for highly flexible blades.  If False, the aero loads are passed
         to the structure but there is no further iteration.
+    fpi_acceleration : str
+        only used if flexible_blade is True.  'none' uses the standard FixedPointIterator,
+        'aitken' or 'anderson' use an AcceleratedFixedPointIterator with that acceleration
+        (typically a few rotor evaluations instead of up to max_iteration)
     """
 
     # --- general turbine configuration inputs---
@@ -202,7 +278,11 @@ def configure_turbine(assembly, with_new_nacelle=True, flexible_blade=False, wit
     assembly.add('maxdeflection', MaxTipDeflection())
 
     if flexible_blade:
-        assembly.add('fpi', FixedPointIterator())
+        if fpi_acceleration == 'none':
+            assembly.add('fpi', FixedPointIterator())
+        else:
+            assembly.add('fpi', AcceleratedFixedPointIterator())
+            assembly.fpi.acceleration = fpi_acceleration
 
         assembly.fpi.workflow.add(['rotor'])
         assembly.fpi.add_parameter('rotor.delta_precurve_sub', low=-1.e99, high=1.e99)
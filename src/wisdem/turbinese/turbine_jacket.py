@@ -23,10 +23,11 @@ from commonse.Tube import Tube
 from drivewpact.drive import DriveWPACT
 from drivewpact.hub import HubWPACT
 from commonse.csystem import DirectionVector
-from commonse.utilities import interp_with_deriv, hstack, vstack
 from drivese.drive_smooth import NacelleTS
 from drivese.drive import Drive4pt, Drive3pt
 from drivese.hub import HubSE
+from wisdem.turbinese.fixed_point import AcceleratedFixedPointIterator
+from wisdem.turbinese.tip_deflection import interp_bracket, TipDeflectionJacobian
 
 
 class MaxTipDeflection(Component):
@@ -54,10 +55,10 @@ class MaxTipDeflection(Component):
         # find corresponding radius of tower
         ztower = (self.towerHt + self.hub_tt[2] + blade_yaw.z)/self.towerHt  # nondimensional location
         # rtower = np.interp(ztower, self.tower_z, self.tower_d) / 2.0
-        dtower, ddtower_dztower, ddtower_dtowerz, ddtower_dtowerd = interp_with_deriv(ztower, self.tower_z, self.Twrouts.TwrObj.D)
+        dtower, ddtower_dztower, j, ddtower_dtowerz, ddtower_dtowerd = interp_bracket(ztower, self.tower_z, self.Twrouts.TwrObj.D)
         rtower = dtower / 2.0
         self.drtower_dztower = ddtower_dztower / 2.0
-        self.drtower_dtowerz = ddtower_dtowerz / 2.0
+        self.drtower_dtowerz = ddtower_dtowerz / 2.0  # bracketing nodes j, j+1 only
         self.drtower_dtowerd = ddtower_dtowerd / 2.0
 
         # max deflection before strike
@@ -73,93 +74,50 @@ class MaxTipDeflection(Component):
         # save for derivs
         self.blade_yaw = blade_yaw
 
+        # sparse Jacobian: pattern declared once per tower discretization, values filled in place when needed
+        if getattr(self, 'J', None) is None or self.J.m != len(self.tower_z):
+            self.J = TipDeflectionJacobian(self.list_deriv_vars()[0], len(self.tower_z))
+        self.J.set_bracket(j)
+        self.J_current = False
+
 
     def list_deriv_vars(self):
 
+        # the tower diameters come in through the Twrouts tower object, which is not differentiable
         inputs = ('Rtip', 'precurveTip', 'presweepTip', 'precone', 'tilt', 'hub_tt',
-            'tower_z', 'tower_d', 'towerHt')
+            'tower_z', 'towerHt')
         outputs = ('max_tip_deflection', 'ground_clearance')
 
         return inputs, outputs
 
-    def provideJ(self):
-
-        dbyx = self.blade_yaw.dx
-        # dbyy = self.blade_yaw.dy
-        dbyz = self.blade_yaw.dz
-
-        # Rtip
-        drtower_dRtip = self.drtower_dztower * dbyz['dz']/self.towerHt
-        if self.precone >= 0:
-            dtd_dRtip = -dbyx['dz'] - drtower_dRtip
-        else:
-            dtd_dRtip = dbyx['dz'] - drtower_dRtip
-        dgc_dRtip = dbyz['dz']
-
-        # precurveTip
-        drtower_dprecurveTip = self.drtower_dztower * dbyz['dx']/self.towerHt
-        if self.precone >= 0:
-            dtd_dprecurveTip = -dbyx['dx'] - drtower_dprecurveTip
-        else:
-            dtd_dprecurveTip = dbyx['dx'] - drtower_dprecurveTip
-        dgc_dprecurveTip = dbyz['dx']
+    def _fill_jacobian(self):
 
-        # presweep
-        drtower_dpresweepTip = self.drtower_dztower * dbyz['dy']/self.towerHt
-        if self.precone >= 0:
-            dtd_dpresweepTip = -dbyx['dy'] - drtower_dpresweepTip
-        else:
-            dtd_dpresweepTip = dbyx['dy'] - drtower_dpresweepTip
-        dgc_dpresweepTip = dbyz['dy']
+        if self.J_current:
+            return
+        self.J_current = True
+        self.J.fill(self.blade_yaw, self.precone, self.hub_tt, self.towerHt,
+            self.drtower_dztower, self.drtower_dtowerz, self.drtower_dtowerd)
 
+    def provideJ(self):
 
-        # precone
-        drtower_dprecone = self.drtower_dztower * dbyz['dprecone']/self.towerHt
-        if self.precone >= 0:
-            dtd_dprecone = -dbyx['dprecone'] - drtower_dprecone
-        else:
-            dtd_dprecone = dbyx['dprecone'] - drtower_dprecone
-        dgc_dprecone = dbyz['dprecone']
-
-        # tilt
-        drtower_dtilt = self.drtower_dztower * dbyz['dtilt']/self.towerHt
-        if self.precone >= 0:
-            dtd_dtilt = -dbyx['dtilt'] - drtower_dtilt
-        else:
-            dtd_dtilt = dbyx['dtilt'] - drtower_dtilt
-        dgc_dtilt = dbyz['dtilt']
-
-        # hubtt
-        drtower_dhubtt = self.drtower_dztower * np.array([0.0, 0.0, 1.0/self.towerHt])
-        dtd_dhubtt = np.array([-1.0, 0.0, 0.0]) - drtower_dhubtt
-        dgc_dhubtt = np.array([0.0, 0.0, 1.0])
-
-        # tower_z
-        dtd_dtowerz = -self.drtower_dtowerz
-        dgc_dtowerz = np.zeros_like(self.tower_z)
+        self._fill_jacobian()
 
-        # tower_d
-        dtd_dtowerd = -self.drtower_dtowerd
-        dgc_dtowerd = np.zeros_like(self.tower_d)
+        return self.J.dense()
 
-        # towerHt
-        drtower_dtowerHt = self.drtower_dztower * -(self.hub_tt[2] + self.blade_yaw.z)/self.towerHt**2
-        dtd_dtowerHt = -drtower_dtowerHt
-        dgc_dtowerHt = 1.0
+    def apply_deriv(self, arg, result):
 
-        dtd = hstack([dtd_dRtip, dtd_dprecurveTip, dtd_dpresweepTip, dtd_dprecone, dtd_dtilt,
-            dtd_dhubtt, dtd_dtowerz, dtd_dtowerd, dtd_dtowerHt])
-        dgc = np.concatenate([[dgc_dRtip], [dgc_dprecurveTip], [dgc_dpresweepTip], [dgc_dprecone],
-            [dgc_dtilt], dgc_dhubtt, dgc_dtowerz, dgc_dtowerd, [dgc_dtowerHt]])
+        self._fill_jacobian()
+        self.J.apply(arg, result)
 
-        J = vstack([dtd, dgc])
+    def apply_derivT(self, arg, result):
 
-        return J
+        self._fill_jacobian()
+        self.J.applyT(arg, result)
 
 
 
 
-def configure_turbine_with_jacket(assembly, with_new_nacelle=True, flexible_blade=False, with_3pt_drive=False):
+def configure_turbine_with_jacket(assembly, with_new_nacelle=True, flexible_blade=False, with_3pt_drive=False, fpi_acceleration='none'):
     """a stand-alone configure method to allow for flatter assemblies
 
     Parameters
@@ -174,6 +132,10 @@ def configure_turbine_with_jacket(assembly, with_new_nacelle=True, flexible_blad
         Note that the coupling is currently only in the flapwise deflection, and is primarily
         only important for highly flexible blades.  If False, the aero loads are passed
         to the structure but there is no further iteration.
+    fpi_acceleration : str
+        only used if flexible_blade is True.  'none' uses the standard FixedPointIterator,
+        'aitken' or 'anderson' use an AcceleratedFixedPointIterator with that acceleration
+        (typically a few rotor evaluations instead of up to max_iteration)
     """
 
     # --- general turbine configuration inputs---
@@ -208,7 +170,11 @@ def configure_turbine_with_jacket(assembly, with_new_nacelle=True, flexible_blad
     assembly.add('maxdeflection', MaxTipDeflection())
 
     if flexible_blade:
-        assembly.add('fpi', FixedPointIterator())
+        if fpi_acceleration == 'none':
+            assembly.add('fpi', FixedPointIterator())
+        else:
+            assembly.add('fpi', AcceleratedFixedPointIterator())
+            assembly.fpi.acceleration = fpi_acceleration
 
         assembly.fpi.workflow.add(['rotor'])
         assembly.fpi.add_parameter('rotor.delta_precurve_sub', low=-1.e99, high=1.e99)
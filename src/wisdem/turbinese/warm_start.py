@@ -0,0 +1,210 @@
+"""
+warm_start.py
+
+Created by NWTC Systems Engineering Sub-Task on 2026-10-17.
+Copyright (c) NREL. All rights reserved.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+from wisdem.turbinese.execute_wrapper import ExecuteWrapper, wrap_execute, unwrap_execute, find_wrapper, design_vector
+from wisdem.turbinese.fixed_point import constraint_residuals
+
+
+# rotor inputs that define a design for the nearest-neighbour lookup (paths relative to the assembly)
+WARM_START_DESIGN_VARS = ('rotor.chord_sub', 'rotor.theta_sub', 'rotor.precurve_sub', 'rotor.sparT', 'rotor.teT',
+                          'rotor.bladeLength', 'rotor.precone', 'rotor.tilt', 'rotor.hubHt', 'rotor.control.tsr')
+
+# coupling variables iterated by the flexible blade fixed point iteration
+WARM_START_STATE_VARS = ('rotor.delta_precurve_sub', 'rotor.delta_bladeLength')
+
+
+class WarmStartStore(object):
+    """bounded store of converged coupling states for nearest-neighbour warm starts
+
+    Parameters
+    ----------
+    maxsize : int
+        maximum number of designs kept; the least recently used design is dropped first
+    max_distance : float
+        if given, a stored state is only returned when its design lies within this
+        (normalized) distance of the requested one
+    scales : array_like
+        scale of each design coordinate used to normalize distances.  If None, each
+        coordinate is scaled by the range of the stored designs.
+    """
+
+    def __init__(self, maxsize=64, max_distance=None, scales=None):
+
+        self.maxsize = maxsize
+        self.max_distance = max_distance
+        self.scales = None if scales is None else np.asarray(scales, dtype=float)
+        self.hits = 0
+        self.misses = 0
+        self._store = OrderedDict()
+        self._next_key = 0
+
+    def __len__(self):
+
+        return len(self._store)
+
+    def _normalization(self, X):
+
+        if self.scales is not None:
+            return self.scales
+
+        scale = np.max(X, axis=0) - np.min(X, axis=0)
+        scale[scale == 0.0] = 1.0
+
+        return scale
+
+    def lookup(self, x):
+        """state stored for the design nearest to x
+
+        Returns
+        -------
+        state : dict or None
+            variable path -> value, None if the store is empty or no design is within max_distance
+        distance : float
+            normalized distance to the nearest design (inf if none)
+        """
+
+        x = np.asarray(x, dtype=float)
+        keys = [key for key, (xs, state) in self._store.iteritems() if len(xs) == len(x)]
+
+        if len(keys) == 0:
+            self.misses += 1
+            return None, np.inf
+
+        X = np.array([self._store[key][0] for key in keys])
+        d = np.sqrt(np.sum(((X - x)/self._normalization(X))**2, axis=1))
+        i = np.argmin(d)
+
+        if self.max_distance is not None and d[i] > self.max_distance:
+            self.misses += 1
+            return None, d[i]
+
+        # most recently used
+        key = keys[i]
+        item = self._store.pop(key)
+        self._store[key] = item
+        self.hits += 1
+
+        return item[1], d[i]
+
+    def add(self, x, state):
+        """store the converged state of design x"""
+
+        self._store[self._next_key] = (np.array(x, dtype=float), state)
+        self._next_key += 1
+        while len(self._store) > self.maxsize:
+            self._store.popitem(last=False)
+
+    def clear(self):
+
+        self._store.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def _converged(driver):
+
+    converged = getattr(driver, 'converged', None)
+    if converged is not None:
+        return converged
+
+    # FixedPointIterator does not report convergence; check the residuals directly
+    return np.max(np.abs(constraint_residuals(driver))) <= driver.tolerance
+
+
+class WarmStartExecute(ExecuteWrapper):
+    """stands in for the fixed point driver's execute: seeds the coupling variables from the
+    nearest converged design before iterating and records the result afterwards"""
+
+    def __init__(self, component, inner, assembly, store, design_vars, state_vars):
+
+        super(WarmStartExecute, self).__init__(component, inner)
+        self.assembly = assembly
+        self.store = store
+        self.design_vars = design_vars
+        self.state_vars = state_vars
+
+        # starting point used when no stored design is close enough
+        self.cold_state = dict((name, np.copy(assembly.get(name))) for name in state_vars)
+
+    def __call__(self):
+
+        x = design_vector(self.assembly, self.design_vars)
+
+        state, distance = self.store.lookup(x)
+        if state is None:
+            state = self.cold_state
+        for name in self.state_vars:
+            self.assembly.set(name, np.copy(state[name]))
+
+        self.run_inner()
+
+        if _converged(self.component):
+            self.store.add(x, dict((name, np.copy(self.assembly.get(name))) for name in self.state_vars))
+
+
+def enable_warm_start(assembly, store=None, design_vars=WARM_START_DESIGN_VARS, state_vars=WARM_START_STATE_VARS,
+                      driver_name='fpi'):
+    """seed the flexible blade fixed point iteration from the nearest design already solved
+
+    Parameters
+    ----------
+    assembly : Assembly
+        a turbine or lcoe assembly configured with flexible_blade=True
+    store : WarmStartStore
+        store to use (a new one if None); may be shared between assemblies with the same design_vars
+    design_vars : list(str)
+        variable paths defining the design space for the nearest-neighbour lookup
+    state_vars : list(str)
+        coupling variables that are seeded and stored
+    driver_name : str
+        name of the fixed point driver in the assembly
+
+    Returns
+    -------
+    store : WarmStartStore
+    """
+
+    if not hasattr(assembly, driver_name):
+        raise RuntimeError('assembly has no %s driver (configure with flexible_blade=True)' % driver_name)
+
+    if store is None:
+        store = WarmStartStore()
+
+    driver = getattr(assembly, driver_name)
+    if find_wrapper(driver, WarmStartExecute) is None:
+        wrap_execute(driver, WarmStartExecute, assembly, store, design_vars, state_vars)
+
+    return store
+
+
+def disable_warm_start(assembly, driver_name='fpi'):
+    """restore the normal execute of the fixed point driver"""
+
+    if hasattr(assembly, driver_name):
+        unwrap_execute(getattr(assembly, driver_name), WarmStartExecute)
+
+
+if __name__ == '__main__':
+
+    import time
+    from wisdem.lcoe.lcoe_se_assembly import create_example_se_assembly
+
+    lcoe_se = create_example_se_assembly(with_new_nacelle=True, flexible_blade=True, fpi_acceleration='anderson')
+    store = enable_warm_start(lcoe_se)
+
+    for bladeLength in [61.5, 61.6, 61.7, 61.8]:
+        lcoe_se.rotor.bladeLength = bladeLength
+        tt = time.time()
+        lcoe_se.run()
+        print 'blade length {0:.1f} m: {1} rotor evaluations, COE ${2:.4f} USD/kWh in {3:.1f} s'.format(
+            bladeLength, lcoe_se.fpi.iterations, lcoe_se.coe, time.time() - tt)
+
+    print 'warm start hits: {0}, misses: {1}'.format(store.hits, store.misses)